@@ -0,0 +1,218 @@
+"""
+Prueba de carga de la API de preguntas (`main.py serve`).
+
+Por defecto genera un banco sintético en un directorio temporal, levanta la API
+en un subproceso sobre ese banco (repositorio JSON) y lanza peticiones
+concurrentes con una mezcla de rutas: pregunta por ID, listados paginados,
+listados por categoría y búsquedas. Con `--url` se ataca un servidor ya
+levantado (por ejemplo uno respaldado por un mongod local).
+
+Reporta peticiones/s y latencias p50/p95/p99, y devuelve código 1 si el p99
+supera el objetivo.
+
+Uso:
+    python -m benchmarks.bench_api [--questions 5000] [--requests 5000]
+        [--concurrency 16] [--target-p99-ms 50] [--url http://127.0.0.1:8000]
+"""
+
+import argparse
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from benchmarks.common import CATEGORIES, make_synthetic_records, write_json_store
+
+DEFAULT_TARGET_P99_MS = 50.0
+SEARCH_TERMS = ["antena", "frecuencia potencia", "licencia", "onda", "reglamento"]
+
+
+def free_port() -> int:
+    """Puerto TCP libre en localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(data_dir: str, port: int) -> subprocess.Popen:
+    """Levanta `main.py serve` en un subproceso y espera a que responda."""
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "main.py",
+            "serve",
+            "--data-dir",
+            data_dir,
+            "--port",
+            str(port),
+            "--refresh-interval",
+            "0",
+        ],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).ok:
+                return process
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("La API no arrancó a tiempo")
+
+
+def collect_ids(base_url: str, limit: int = 2000) -> List[str]:
+    """Obtiene IDs de preguntas recorriendo el listado paginado."""
+    ids = []
+    page = 1
+    while len(ids) < limit:
+        response = requests.get(
+            f"{base_url}/questions", params={"page": page, "page_size": 100}
+        )
+        response.raise_for_status()
+        data = response.json()
+        ids.extend(item["id"] for item in data["items"])
+        if not data["pagination"]["has_next"]:
+            break
+        page += 1
+    return ids
+
+
+def make_request_plan(
+    n: int, ids: List[str], categories: List[str], seed: int = 0
+) -> List[tuple]:
+    """Lista de (etiqueta, ruta, parámetros) con la mezcla de rutas."""
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(n):
+        roll = rng.random()
+        if roll < 0.5:
+            plan.append(("by_id", f"/questions/{rng.choice(ids)}", {}))
+        elif roll < 0.75:
+            plan.append(("list", "/questions", {"page": rng.randint(1, 20)}))
+        elif roll < 0.9:
+            category = rng.choice(categories)
+            plan.append(
+                (
+                    "category",
+                    f"/categories/{category}/questions",
+                    {"page": rng.randint(1, 10)},
+                )
+            )
+        else:
+            plan.append(("search", "/search", {"q": rng.choice(SEARCH_TERMS)}))
+    return plan
+
+
+def run_load(base_url: str, plan: List[tuple], concurrency: int) -> Dict:
+    """Ejecuta el plan con `concurrency` hilos y mide cada petición."""
+    local = threading.local()
+    latencies: Dict[str, List[float]] = {}
+    errors = 0
+    lock = threading.Lock()
+
+    def session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.session.headers["Accept-Encoding"] = "gzip"
+        return local.session
+
+    def fire(item):
+        nonlocal errors
+        label, path, params = item
+        start = time.perf_counter()
+        response = session().get(f"{base_url}{path}", params=params)
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.setdefault(label, []).append(elapsed)
+            if response.status_code >= 500:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(fire, plan))
+    wall = time.perf_counter() - start
+    return {"wall_s": wall, "latencies": latencies, "errors": errors}
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Percentil `q` (0-100) de una lista de valores."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+
+def print_report(result: Dict, target_p99_ms: float) -> bool:
+    """Imprime el informe y devuelve True si se cumple el objetivo de p99."""
+    all_latencies = [v for values in result["latencies"].values() for v in values]
+    print(
+        f"\n📊 {len(all_latencies)} peticiones en {result['wall_s']:.2f}s "
+        f"({len(all_latencies) / result['wall_s']:.0f} req/s, {result['errors']} errores 5xx)"
+    )
+    print(f"{'ruta':<12}{'n':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    rows = sorted(result["latencies"].items()) + [("total", all_latencies)]
+    for label, values in rows:
+        print(
+            f"{label:<12}{len(values):>7}{percentile(values, 50):>10.2f}"
+            f"{percentile(values, 95):>10.2f}{percentile(values, 99):>10.2f}"
+        )
+
+    p99 = percentile(all_latencies, 99)
+    ok = p99 <= target_p99_ms and result["errors"] == 0
+    print(
+        f"\n{'✅' if ok else '❌'} p99 {p99:.2f} ms (objetivo {target_p99_ms:.0f} ms)"
+    )
+    return ok
+
+
+def main() -> int:
+    """Ejecuta la prueba de carga."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default=None, help="API ya levantada a atacar")
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--target-p99-ms", type=float, default=DEFAULT_TARGET_P99_MS)
+    args = parser.parse_args()
+
+    process: Optional[subprocess.Popen] = None
+    with tempfile.TemporaryDirectory() as data_dir:
+        base_url = args.url
+        if base_url is None:
+            records = make_synthetic_records(args.questions)
+            for category in CATEGORIES:
+                write_json_store(
+                    [r for r in records if r["category"] == category],
+                    os.path.join(data_dir, f"questions_{category}.json"),
+                )
+            port = free_port()
+            process = start_server(data_dir, port)
+            base_url = f"http://127.0.0.1:{port}"
+
+        try:
+            ids = collect_ids(base_url)
+            categories = list(requests.get(f"{base_url}/categories").json())
+            plan = make_request_plan(args.requests, ids, categories)
+            # Calentamiento: llena la caché de respuestas y las conexiones
+            run_load(base_url, plan[: min(500, len(plan))], args.concurrency)
+            result = run_load(base_url, plan, args.concurrency)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=10)
+
+    return 0 if print_report(result, args.target_p99_ms) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
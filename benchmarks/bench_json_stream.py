@@ -0,0 +1,87 @@
+"""
+Benchmark: lectura completa de un fichero de preguntas frente a streaming.
+
+Para cada tamaño de `--sizes` escribe un banco sintético y recorre todas sus
+preguntas en un proceso hijo (para que el pico de RSS sea comparable):
+
+    - load:   `get_serializer().load_file` (documento entero en memoria)
+    - stream: `iter_json_array` (un elemento cada vez)
+
+Con streaming el pico de memoria (VmHWM) debe quedarse plano al crecer el
+fichero; con la carga completa crece con él.
+
+Uso:
+    python -m benchmarks.bench_json_stream [--sizes 10000 100000 500000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import current_rss_breakdown_mb, print_table, stopwatch
+from benchmarks.synthetic_bank import BankSpec, SyntheticBank, write_bank
+
+
+def run_child(mode: str, path: str) -> None:
+    """Recorre el fichero en el proceso actual e imprime JSON."""
+    from src.infrastructure.serialization.json_serializer import get_serializer
+    from src.infrastructure.serialization.json_stream import iter_json_array
+
+    timings = {}
+    with stopwatch(timings, "read_s"):
+        if mode == "load":
+            records = get_serializer().load_file(path)
+        else:
+            records = iter_json_array(path)
+        count = sum(1 for record in records if record["id"])
+
+    result = {"records": count, "read_s": round(timings["read_s"], 3)}
+    result.update(
+        {key: round(value, 1) for key, value in current_rss_breakdown_mb().items()}
+    )
+    print(json.dumps(result))
+
+
+def measure(mode: str, path: str) -> dict:
+    """Lanza un proceso hijo y devuelve sus métricas."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_json_stream", "--child", mode],
+        env={**os.environ, "BENCH_PATH": path},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Genera los bancos, ejecuta las mediciones e imprime la tabla."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--child", choices=["load", "stream"])
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, os.environ["BENCH_PATH"])
+        return
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            bank = SyntheticBank(BankSpec(size=size, categories=["bench"]))
+            write_bank(bank, tmp)
+            path = os.path.join(tmp, "data", "questions_bench.json")
+            megabytes = os.path.getsize(path) / 1e6
+            for mode in ("load", "stream"):
+                row = measure(mode, path)
+                row.update({"size": size, "file_mb": f"{megabytes:.1f}", "mode": mode})
+                rows.append(row)
+
+    print_table(rows, ["size", "file_mb", "mode", "read_s", "VmHWM", "RssAnon"])
+
+
+if __name__ == "__main__":
+    main()
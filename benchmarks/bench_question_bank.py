@@ -0,0 +1,136 @@
+"""
+Benchmark: carga de preguntas desde JSON frente al banco binario con `mmap`.
+
+Cada medición se ejecuta en un proceso hijo para que el RSS sea comparable.
+En modo "cold" se descartan antes las páginas cacheadas del fichero.
+
+Uso:
+    python -m benchmarks.bench_question_bank [--questions 100000] [--lookups 1000]
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import (
+    current_rss_breakdown_mb,
+    drop_page_cache,
+    make_synthetic_records,
+    print_table,
+    stopwatch,
+    write_json_store,
+)
+
+
+def run_child(fmt: str, path: str, ids_path: str) -> None:
+    """Mide apertura y búsquedas por ID en el proceso actual e imprime JSON."""
+    with open(ids_path, "r", encoding="utf-8") as f:
+        lookup_ids = json.load(f)
+
+    from src.domain.quiz.quiz_question_model import QuizQuestionModel
+    from src.infrastructure.outbound.local.question_bank import QuestionBankReader
+
+    timings = {}
+    if fmt == "json":
+        with stopwatch(timings, "open_s"):
+            with open(path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+            by_id = {record["id"]: record for record in records}
+        with stopwatch(timings, "lookups_s"):
+            for question_id in lookup_ids:
+                QuizQuestionModel(**by_id[question_id])
+    else:
+        with stopwatch(timings, "open_s"):
+            bank = QuestionBankReader(path)
+        with stopwatch(timings, "lookups_s"):
+            for question_id in lookup_ids:
+                bank.get_by_id(question_id)
+
+    # ru_maxrss hereda el pico del proceso padre tras exec: usar VmHWM
+    result = {key: round(value, 4) for key, value in timings.items()}
+    result.update(
+        {key: round(value, 1) for key, value in current_rss_breakdown_mb().items()}
+    )
+    print(json.dumps(result))
+
+
+def measure(fmt: str, path: str, ids_path: str, cold: bool) -> dict:
+    """Lanza un proceso hijo y devuelve sus métricas."""
+    if cold and not drop_page_cache(path):
+        return {"error": "posix_fadvise no disponible"}
+
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_question_bank", "--child", fmt],
+        env={**os.environ, "BENCH_PATH": path, "BENCH_IDS": ids_path},
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Genera los datos, ejecuta las mediciones e imprime la tabla."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--child", choices=["json", "bank"])
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, os.environ["BENCH_PATH"], os.environ["BENCH_IDS"])
+        return
+
+    from src.infrastructure.outbound.local.question_bank import write_question_bank
+
+    with tempfile.TemporaryDirectory() as tmp:
+        records = make_synthetic_records(args.questions)
+        json_path = os.path.join(tmp, "questions_bench.json")
+        bank_path = os.path.join(tmp, "questions_bench.qbank")
+        ids_path = os.path.join(tmp, "ids.json")
+
+        write_json_store(records, json_path)
+        write_question_bank(records, bank_path)
+        lookup_ids = [
+            record["id"]
+            for record in random.Random(1).sample(
+                records, min(args.lookups, len(records))
+            )
+        ]
+        with open(ids_path, "w", encoding="utf-8") as f:
+            json.dump(lookup_ids, f)
+        del records
+
+        print(
+            f"📊 {args.questions} preguntas | JSON {os.path.getsize(json_path) / 1e6:.1f} MB"
+            f" | banco {os.path.getsize(bank_path) / 1e6:.1f} MB"
+            f" | {len(lookup_ids)} búsquedas por ID\n"
+        )
+
+        rows = []
+        for fmt, path in (("json", json_path), ("bank", bank_path)):
+            for cold in (True, False):
+                row = measure(fmt, path, ids_path, cold)
+                row.update({"format": fmt, "cache": "cold" if cold else "warm"})
+                rows.append(row)
+
+        print_table(
+            rows,
+            [
+                "format",
+                "cache",
+                "open_s",
+                "lookups_s",
+                "VmHWM",
+                "RssAnon",
+                "RssFile",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark del control de ritmo AIMD contra un servidor que limita peticiones.
+
+Levanta `ThrottlingStubServer` y lanza `--rounds` rondas simuladas (una página
+con `HttpExamFetcher.fetch` y `--images` imágenes con `download_image`) desde
+`--concurrency` hilos, como el modo HTTP del scraping:
+
+    - fixed: concurrencia fija, sin control de ritmo (comportamiento actual)
+    - aimd:  mismo número de hilos con `RateController` compartido por páginas
+             e imágenes
+
+Cada petición rechazada se repite (hasta `--attempts` veces), como harían el
+planificador con las rondas y `retry_downloads` con las imágenes. Reporta
+rondas completas por segundo, peticiones enviadas, 429/503 recibidos,
+back-offs y los límites finales alcanzados por el controlador.
+
+Uso:
+    python -m benchmarks.bench_rate_control [--rounds 200] [--concurrency 16]
+        [--capacity 40] [--server-concurrency 4] [--error-rate 0.01]
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict
+
+from benchmarks.common import print_table
+from benchmarks.throttle_stub_server import ThrottlingStubServer
+from src.infrastructure.scraping.http_exam_fetcher import HttpExamFetcher
+from src.infrastructure.scraping.image_downloader import (
+    download_image,
+    drain_failed_downloads,
+)
+from src.infrastructure.scraping.rate_controller import (
+    RateController,
+    RatePolicy,
+    set_rate_controller,
+)
+from src.shared.metrics import MetricsRegistry, set_metrics
+
+
+def with_retries(request: Callable[[], bool], attempts: int) -> bool:
+    """Repite una petición hasta que vaya bien o se agoten los intentos."""
+    return any(request() for _ in range(attempts))
+
+
+def fetch_page(fetcher: HttpExamFetcher, url: str) -> bool:
+    """Descarga la página de examen. True si fue bien."""
+    try:
+        fetcher.fetch(url)
+        return True
+    except Exception:
+        return False
+
+
+def run_round(
+    fetcher: HttpExamFetcher, base_url: str, args: argparse.Namespace, target: Path
+) -> bool:
+    """Una ronda simulada: la página y sus imágenes. True si se completó."""
+    if not with_retries(
+        lambda: fetch_page(fetcher, f"{base_url}/examen"), args.attempts
+    ):
+        return False
+    return all(
+        with_retries(
+            lambda: download_image(
+                f"{base_url}/img/{index}.png", f"{index}.png", target
+            ),
+            args.attempts,
+        )
+        for index in range(args.images)
+    )
+
+
+def run_mode(mode: str, args: argparse.Namespace) -> Dict:
+    """Ejecuta las rondas en un modo contra un servidor nuevo."""
+    metrics = MetricsRegistry(f"rate_{mode}")
+    controller = None
+    if mode == "aimd":
+        controller = RateController(
+            RatePolicy(initial_rate=args.initial_rate, max_concurrency=args.concurrency)
+        )
+    previous_metrics = set_metrics(metrics)
+    previous_controller = set_rate_controller(controller)
+    server = ThrottlingStubServer(
+        capacity_rps=args.capacity,
+        max_concurrent=args.server_concurrency,
+        error_rate=args.error_rate,
+    )
+    try:
+        with server, tempfile.TemporaryDirectory() as workdir:
+            with HttpExamFetcher(concurrency=args.concurrency) as fetcher:
+                start = time.perf_counter()
+                with (
+                    ThreadPoolExecutor(args.concurrency) as executor,
+                    contextlib.redirect_stdout(io.StringIO()),
+                ):
+                    results = list(
+                        executor.map(
+                            lambda _: run_round(
+                                fetcher, server.base_url, args, Path(workdir)
+                            ),
+                            range(args.rounds),
+                        )
+                    )
+                wall = time.perf_counter() - start
+        drain_failed_downloads()
+    finally:
+        set_rate_controller(previous_controller)
+        set_metrics(previous_metrics)
+
+    ok_rounds = sum(results)
+    row = {
+        "mode": mode,
+        "rounds_ok": f"{ok_rounds}/{args.rounds}",
+        "rounds_ok/s": f"{ok_rounds / wall:.1f}",
+        "wall_s": f"{wall:.2f}",
+        "requests": sum(server.stats[key] for key in ("ok", "throttled", "errors")),
+        "429": server.stats["throttled"],
+        "503": server.stats["errors"],
+        "peak_conc": server.stats["peak_concurrent"],
+        "backoffs": int(metrics.counters.get("rate_backoffs", 0)),
+        "final_rps": "-",
+        "final_conc": "-",
+    }
+    if controller is not None:
+        for state in controller.snapshot():
+            row["final_rps"] = state["rate_rps"]
+            row["final_conc"] = state["concurrency"]
+        print(controller.format_report())
+    return row
+
+
+def main() -> None:
+    """Compara concurrencia fija con control AIMD."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--images", type=int, default=2, help="Imágenes por ronda")
+    parser.add_argument("--concurrency", type=int, default=16, help="Hilos cliente")
+    parser.add_argument(
+        "--capacity", type=float, default=40.0, help="Peticiones/s del servidor"
+    )
+    parser.add_argument(
+        "--server-concurrency", type=int, default=4, help="Simultáneas del servidor"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.01)
+    parser.add_argument(
+        "--attempts", type=int, default=20, help="Intentos por petición"
+    )
+    parser.add_argument("--initial-rate", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rows = [run_mode(mode, args) for mode in ("fixed", "aimd")]
+    print_table(rows, list(rows[0].keys()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Conformidad y latencia de los repositorios de preguntas.
+
+Carga el mismo banco sintético en cada backend del protocolo
+`QuestionRepository` y:
+
+    1. Comprueba que todos responden igual (recuentos, IDs, lecturas por ID,
+       lotes, muestreo, búsqueda sin tildes ni mayúsculas, altas idempotentes)
+       comparando con lo esperado a partir de los registros.
+    2. Mide la latencia de las consultas que hace la API: pregunta por ID,
+       página de 20 preguntas, IDs de una categoría y búsqueda.
+
+Backends: `memory` (InMemoryQuestionRepository), `json` (QuestionIndex sobre
+ficheros en un directorio temporal), `sqlite` (SqliteQuestionRepository en el
+mismo directorio) y, con `--mongo`, `mongo` y `mongo-replica` sobre una
+colección temporal que se borra al terminar.
+
+Devuelve código 1 si algún backend no es conforme o si el p99 de la lectura por
+ID de un backend local supera el objetivo (1 ms por defecto).
+
+Uso:
+    python -m benchmarks.bench_repositories [--questions 5000] [--lookups 20000]
+        [--target-p99-us 1000] [--mongo] [--mongo-collection bench_questions]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import CATEGORIES, make_synthetic_records, write_json_store
+from src.domain.quiz.question_repository import QuestionRepository
+from src.domain.quiz.question_search import (
+    matches_terms,
+    search_terms,
+    searchable_text,
+)
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.outbound.local.question_index import QuestionIndex
+from src.infrastructure.outbound.memory.in_memory_question_repository import (
+    InMemoryQuestionRepository,
+)
+from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+    SqliteQuestionRepository,
+)
+
+DEFAULT_TARGET_P99_US = 1000.0
+LOCAL_BACKENDS = ("memory", "json", "sqlite", "mongo-replica")
+SEARCH_QUERIES = [
+    "antena",
+    "FRECUENCIA potencia",
+    "tension",
+    "Tensión",
+    "ON",
+    "licencia xyz",
+]
+
+
+# =================================
+# BACKENDS
+# =================================
+def build_backends(
+    records: List[dict], work_dir: str, mongo_collection: Optional[str]
+) -> Dict[str, QuestionRepository]:
+    """Crea cada backend con los registros dados."""
+    backends: Dict[str, QuestionRepository] = {
+        "memory": InMemoryQuestionRepository(records)
+    }
+
+    for category in CATEGORIES:
+        write_json_store(
+            [r for r in records if r["category"] == category],
+            os.path.join(work_dir, f"questions_{category}.json"),
+        )
+    backends["json"] = QuestionIndex.build(Path(work_dir))
+
+    sqlite = SqliteQuestionRepository(Path(work_dir) / "questions.sqlite3")
+    sqlite.add_records(records)
+    backends["sqlite"] = sqlite
+
+    if mongo_collection:
+        mongo = open_mongo_backend(mongo_collection)
+        mongo.add_questions(QuizQuestionModel(**record) for record in records)
+        backends["mongo"] = mongo
+        backends["mongo-replica"] = InMemoryQuestionRepository.from_repository(mongo)
+    return backends
+
+
+def open_mongo_backend(collection: str) -> QuestionRepository:
+    """Repositorio MongoDB sobre una colección temporal vacía."""
+    from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+    from src.infrastructure.outbound.mongo.mongo_question_repository import (
+        MongoQuestionRepository,
+    )
+
+    connection = MongoConnection(mongo_collection=collection)
+    if not connection.test_connection():
+        raise ConnectionError("No se pudo conectar a MongoDB")
+    connection.connect()
+    connection.get_collection().drop()
+    repository = MongoQuestionRepository(connection)
+    repository.create_indexes()
+    return repository
+
+
+def drop_mongo_backend(repository: QuestionRepository) -> None:
+    """Borra la colección temporal y cierra la conexión."""
+    repository.mongo_connection.get_collection().drop()
+    repository.mongo_connection.disconnect()
+
+
+# =================================
+# CONFORMIDAD
+# =================================
+def expected_search(records: List[dict], query: str, category=None) -> set:
+    """Conjunto de IDs esperados para una búsqueda, calculados por fuerza bruta."""
+    terms = search_terms(query)
+    return {
+        record["id"]
+        for record in records
+        if terms
+        and (category is None or record["category"] == category)
+        and matches_terms(searchable_text(record), terms)
+    }
+
+
+def check_reads(repository: QuestionRepository, records: List[dict]) -> List[str]:
+    """Comprueba las consultas de lectura. Devuelve los fallos."""
+    failures = []
+
+    def check(condition: bool, message: str) -> None:
+        if not condition:
+            failures.append(message)
+
+    by_id = {record["id"]: record for record in records}
+    check(isinstance(repository, QuestionRepository), "no cumple el protocolo")
+    check(len(repository) == len(records), "len() distinto")
+    check(set(repository.categories) == set(CATEGORIES), "categorías distintas")
+    check(repository.ids() == repository.ids(), "ids() no es estable")
+    check(set(repository.ids()) == set(by_id), "ids() distintos")
+    for category in CATEGORIES:
+        expected = {r["id"] for r in records if r["category"] == category}
+        check(repository.count(category) == len(expected), f"count({category})")
+        check(set(repository.ids(category)) == expected, f"ids({category})")
+    check(repository.count("no-existe") == 0, "count() de categoría inexistente")
+    check(repository.ids("no-existe") == [], "ids() de categoría inexistente")
+
+    sample = random.Random(1).sample(records, 50)
+    for record in sample:
+        question = repository.get(record["id"])
+        check(
+            question is not None and question.model_dump() == record,
+            f"get({record['id']}) distinto",
+        )
+        check(record["id"] in repository, f"{record['id']} no está en el repositorio")
+    check(repository.get("no-existe") is None, "get() de ID inexistente")
+    check("no-existe" not in repository, "__contains__ de ID inexistente")
+
+    requested = [r["id"] for r in sample[:10]] + ["no-existe"]
+    check(
+        [q.id for q in repository.get_many(requested)] == requested[:-1],
+        "get_many() no respeta el orden o no ignora los desconocidos",
+    )
+
+    ids = repository.sample_ids(CATEGORIES[0], 30, random.Random(7))
+    check(len(set(ids)) == len(ids) == 30, "sample_ids() con repetidos")
+    check(set(ids) <= set(repository.ids(CATEGORIES[0])), "sample_ids() fuera")
+    check(
+        ids == repository.sample_ids(CATEGORIES[0], 30, random.Random(7)),
+        "sample_ids() no reproducible con la misma semilla",
+    )
+    check(
+        len(repository.sample_ids(CATEGORIES[0], len(records) * 2))
+        == repository.count(CATEGORIES[0]),
+        "sample_ids() con k mayor que la categoría",
+    )
+
+    for query in SEARCH_QUERIES:
+        check(
+            set(repository.search_ids(query)) == expected_search(records, query),
+            f"search_ids({query!r})",
+        )
+        check(
+            set(repository.search_ids(query, CATEGORIES[1]))
+            == expected_search(records, query, CATEGORIES[1]),
+            f"search_ids({query!r}, {CATEGORIES[1]})",
+        )
+    check(repository.search_ids("   ") == [], "search_ids() vacía")
+    return failures
+
+
+def check_writes(repository: QuestionRepository, records: List[dict]) -> List[str]:
+    """Comprueba `add_questions` y `version`. Devuelve los fallos."""
+    failures = []
+    version = repository.version
+    existing = QuizQuestionModel(**records[0])
+    if repository.add_questions([existing]) != 0:
+        failures.append("add_questions() duplica una pregunta existente")
+
+    new_record = {**records[1], "id": "f" * 32, "category": CATEGORIES[0]}
+    if repository.add_questions([QuizQuestionModel(**new_record)]) != 1:
+        failures.append("add_questions() no añade una pregunta nueva")
+    if repository.get(new_record["id"]) is None:
+        failures.append("la pregunta añadida no se puede leer")
+    if repository.version == version:
+        failures.append("version no cambia al añadir")
+    return failures
+
+
+# =================================
+# LATENCIA
+# =================================
+def measure(operation: Callable[[], object], repeat: int) -> List[float]:
+    """Latencias en microsegundos de `repeat` ejecuciones."""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+
+def percentiles(values: List[float]) -> Tuple[float, float]:
+    """p50 y p99 de una lista de latencias."""
+    quantiles = statistics.quantiles(values, n=100, method="inclusive")
+    return quantiles[49], quantiles[98]
+
+
+def bench_latency(
+    repository: QuestionRepository, records: List[dict], lookups: int
+) -> Dict[str, Tuple[float, float]]:
+    """Latencias p50/p99 (µs) de las consultas que hace la API."""
+    rng = random.Random(3)
+    ids = [record["id"] for record in records]
+    page = ids[:20]
+    light = max(20, lookups // 100)
+    return {
+        "get": percentiles(measure(lambda: repository.get(rng.choice(ids)), lookups)),
+        "get_many(20)": percentiles(
+            measure(lambda: repository.get_many(page), lookups // 10)
+        ),
+        "ids(category)": percentiles(
+            measure(lambda: repository.ids(rng.choice(CATEGORIES)), light)
+        ),
+        "search_ids": percentiles(
+            measure(lambda: repository.search_ids(rng.choice(SEARCH_QUERIES)), light)
+        ),
+    }
+
+
+def print_latencies(results: Dict[str, Dict[str, Tuple[float, float]]]) -> None:
+    """Tabla de latencias por backend y consulta."""
+    operations = list(next(iter(results.values())))
+    print(f"\n{'backend':<15}" + "".join(f"{op:>24}" for op in operations))
+    print(f"{'':<15}" + "".join(f"{'p50 / p99 µs':>24}" for _ in operations))
+    for name, latencies in results.items():
+        cells = "".join(
+            f"{f'{p50:.1f} / {p99:.1f}':>24}" for p50, p99 in latencies.values()
+        )
+        print(f"{name:<15}{cells}")
+
+
+def main() -> int:
+    """Ejecuta las comprobaciones y las mediciones en todos los backends."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--target-p99-us", type=float, default=DEFAULT_TARGET_P99_US)
+    parser.add_argument("--mongo", action="store_true", help="Incluye MongoDB")
+    parser.add_argument("--mongo-collection", default="bench_questions")
+    args = parser.parse_args()
+
+    records = make_synthetic_records(args.questions)
+    ok = True
+    with tempfile.TemporaryDirectory() as work_dir:
+        backends = build_backends(
+            records, work_dir, args.mongo_collection if args.mongo else None
+        )
+        try:
+            print("🔎 Conformidad")
+            for name, repository in backends.items():
+                failures = check_reads(repository, records)
+                print(f"  {'✅' if not failures else '❌'} {name}")
+                for failure in failures:
+                    print(f"      - {failure}")
+                ok = ok and not failures
+
+            results = {
+                name: bench_latency(repository, records, args.lookups)
+                for name, repository in backends.items()
+            }
+            print_latencies(results)
+
+            for name, repository in backends.items():
+                failures = check_writes(repository, records)
+                for failure in failures:
+                    print(f"  ❌ {name}: {failure}")
+                ok = ok and not failures
+        finally:
+            if "mongo" in backends:
+                drop_mongo_backend(backends["mongo"])
+
+    for name in LOCAL_BACKENDS:
+        if name in results:
+            p99 = results[name]["get"][1]
+            passed = p99 <= args.target_p99_us
+            ok = ok and passed
+            print(
+                f"{'✅' if passed else '❌'} {name}: get p99 {p99:.1f} µs "
+                f"(objetivo {args.target_p99_us:.0f} µs)"
+            )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Benchmark de extremo a extremo del scraper contra fixtures grabados.
+
+Levanta `FixtureReplayServer` sobre un directorio grabado con
+`python main.py scraping --record DIR`, ejecuta `ScrapingUseCase` en un
+directorio de trabajo temporal (banco vacío) y reporta rondas/s, preguntas/s y
+el tiempo por etapa. Cada ejecución se añade a un historial JSONL junto con el
+commit actual y se compara con la anterior para detectar regresiones.
+
+Requiere Chrome (igual que el scraping real), pero ninguna conexión externa.
+Con `--fetch-mode http` no hace falta ni Chrome. Con `--extraction network`
+las preguntas se leen de las respuestas de red de Chrome (CDP) y con
+`--image-source browser` las imágenes se leen de la caché de Chrome.
+
+Uso:
+    python -m benchmarks.bench_scraping_replay fixtures/ure [--runs 3] [--fetch-mode http]
+        [--extraction network] [--image-source browser]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_HISTORY = os.path.join("benchmarks", "results", "scraping_replay.jsonl")
+REGRESSION_THRESHOLD = 0.10
+
+
+@contextmanager
+def working_directory(path: str) -> Iterator[None]:
+    """Cambia temporalmente el directorio de trabajo."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def git_commit() -> Optional[str]:
+    """Hash corto del commit actual (None fuera de un repositorio git)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_once(
+    fixtures_dir: str,
+    fetch_mode: Optional[str] = None,
+    extraction: str = "dom",
+    image_source: str = "http",
+) -> Dict:
+    """Ejecuta una pasada completa del scraper contra los fixtures."""
+    from src.application.scraping.scraping_use_case import ScrapingUseCase
+    from src.infrastructure.scraping.fixture_server import FixtureReplayServer
+    from src.shared.metrics import MetricsRegistry
+
+    metrics = MetricsRegistry("scraping_replay")
+    with tempfile.TemporaryDirectory() as workdir, working_directory(workdir):
+        with FixtureReplayServer(fixtures_dir) as server:
+            use_case = ScrapingUseCase(
+                metrics=metrics,
+                metrics_dir=None,
+                extraction=extraction,
+                image_source=image_source,
+            )
+            start = time.perf_counter()
+            use_case.execute(server.target_configs(fetch_mode))
+            elapsed = time.perf_counter() - start
+
+    data = metrics.to_dict()
+    rounds = len(data["rounds"])
+    questions = data["counters"].get("questions_extracted", 0)
+    return {
+        "elapsed_s": elapsed,
+        "rounds": rounds,
+        "questions": questions,
+        "rounds_per_s": rounds / elapsed if elapsed else 0.0,
+        "questions_per_s": questions / elapsed if elapsed else 0.0,
+        "stages": {
+            stage: stats["total_s"] / rounds if rounds else 0.0
+            for stage, stats in data["stages"].items()
+        },
+    }
+
+
+def summarize(runs: List[Dict]) -> Dict:
+    """Mediana de las ejecuciones."""
+    stages = sorted({stage for run in runs for stage in run["stages"]})
+    return {
+        "rounds_per_s": statistics.median(run["rounds_per_s"] for run in runs),
+        "questions_per_s": statistics.median(run["questions_per_s"] for run in runs),
+        "stage_s_per_round": {
+            stage: statistics.median(run["stages"].get(stage, 0.0) for run in runs)
+            for stage in stages
+        },
+    }
+
+
+# Modos de ejecución comparables y su valor en entradas antiguas del historial
+MODE_DEFAULTS = {"fetch_mode": "selenium", "extraction": "dom", "image_source": "http"}
+
+
+def load_last_entry(history_path: str, modes: Dict[str, str]) -> Optional[Dict]:
+    """Última entrada del historial con los mismos modos (None si no hay)."""
+    if not os.path.exists(history_path):
+        return None
+    with open(history_path, "r", encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    entries = [
+        e
+        for e in entries
+        if all(e.get(key, MODE_DEFAULTS[key]) == value for key, value in modes.items())
+    ]
+    return entries[-1] if entries else None
+
+
+def main() -> int:
+    """Ejecuta el benchmark, imprime el resultado y lo añade al historial."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("fixtures_dir")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--history", default=DEFAULT_HISTORY)
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--fetch-mode", choices=("selenium", "http"), default=None)
+    parser.add_argument("--extraction", choices=("dom", "network"), default="dom")
+    parser.add_argument("--image-source", choices=("http", "browser"), default="http")
+    args = parser.parse_args()
+
+    fixtures_dir = os.path.abspath(args.fixtures_dir)
+    runs = [
+        run_once(fixtures_dir, args.fetch_mode, args.extraction, args.image_source)
+        for _ in range(args.runs)
+    ]
+    summary = summarize(runs)
+
+    print(f"\n📊 Replay de {fixtures_dir} ({args.runs} ejecuciones, mediana)")
+    print(f"   rondas/s:    {summary['rounds_per_s']:.3f}")
+    print(f"   preguntas/s: {summary['questions_per_s']:.2f}")
+    print("   segundos por ronda y etapa:")
+    for stage, seconds in sorted(
+        summary["stage_s_per_round"].items(), key=lambda item: -item[1]
+    ):
+        print(f"     {stage:<28}{seconds:>9.3f}")
+
+    modes = {
+        "fetch_mode": args.fetch_mode or "selenium",
+        "extraction": args.extraction,
+        "image_source": args.image_source,
+    }
+    previous = load_last_entry(args.history, modes)
+    entry = {
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        **modes,
+        **summary,
+    }
+    os.makedirs(os.path.dirname(args.history) or ".", exist_ok=True)
+    with open(args.history, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    if previous and previous.get("rounds_per_s"):
+        change = summary["rounds_per_s"] / previous["rounds_per_s"] - 1
+        print(f"\n🔁 Frente a {previous.get('commit')}: {change * 100:+.1f}% rondas/s")
+        if change < -args.threshold:
+            print("❌ Regresión de rendimiento por encima del umbral")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
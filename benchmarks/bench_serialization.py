@@ -0,0 +1,122 @@
+"""
+Benchmark de la capa de serialización JSON con 1k/10k/100k preguntas.
+
+Compara, para cada backend disponible, codificación compacta e indentada y
+decodificación de registros, además de la ruta antigua del saver
+(`model_dump()` por pregunta + `json.dump(indent=2)`) frente a la codificación
+en bloque con `TypeAdapter.dump_json`.
+
+Uso:
+    python -m benchmarks.bench_serialization [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.common import make_synthetic_records, print_table
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """Mejor tiempo de `repeat` ejecuciones."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_size(size: int, repeat: int) -> List[Dict]:
+    """Ejecuta todas las mediciones para un tamaño de banco."""
+    from src.domain.quiz.quiz_question_model import QuizQuestionModel
+    from src.infrastructure.serialization.json_serializer import (
+        available_backends,
+        dump_questions,
+        get_serializer,
+    )
+
+    records = make_synthetic_records(size)
+    questions = [QuizQuestionModel(**record) for record in records]
+    rows = []
+
+    for backend in available_backends():
+        serializer = get_serializer(backend)
+        compact = serializer.dumps(records)
+        rows.append(
+            {
+                "size": size,
+                "case": f"{backend}.dumps",
+                "seconds": best_of(lambda: serializer.dumps(records), repeat),
+                "bytes": len(compact),
+            }
+        )
+        rows.append(
+            {
+                "size": size,
+                "case": f"{backend}.dumps(pretty)",
+                "seconds": best_of(lambda: serializer.dumps(records, True), repeat),
+                "bytes": len(serializer.dumps(records, True)),
+            }
+        )
+        rows.append(
+            {
+                "size": size,
+                "case": f"{backend}.loads",
+                "seconds": best_of(lambda: serializer.loads(compact), repeat),
+                "bytes": len(compact),
+            }
+        )
+
+    def legacy_encode():
+        return json.dumps(
+            [question.model_dump() for question in questions],
+            ensure_ascii=False,
+            indent=2,
+        ).encode("utf-8")
+
+    rows.append(
+        {
+            "size": size,
+            "case": "legacy model_dump+json(indent=2)",
+            "seconds": best_of(legacy_encode, repeat),
+            "bytes": len(legacy_encode()),
+        }
+    )
+    rows.append(
+        {
+            "size": size,
+            "case": "TypeAdapter.dump_json",
+            "seconds": best_of(lambda: dump_questions(questions, False), repeat),
+            "bytes": len(dump_questions(questions, False)),
+        }
+    )
+    return rows
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        rows.extend(bench_size(size, args.repeat))
+
+    for row in rows:
+        row["seconds"] = f"{row['seconds']:.4f}"
+        row["MB/s"] = (
+            f"{row['bytes'] / 1e6 / float(row['seconds']):.1f}"
+            if float(row["seconds"])
+            else "-"
+        )
+    print_table(rows, ["size", "case", "seconds", "bytes", "MB/s"])
+
+
+if __name__ == "__main__":
+    main()
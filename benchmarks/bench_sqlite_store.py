@@ -0,0 +1,196 @@
+"""
+Benchmark del almacén SQLite frente al saver JSON actual.
+
+Simula una sesión de scraping: cada ronda trae `--round-size` preguntas
+muestreadas de un banco de `--bank` preguntas, de modo que la proporción de
+duplicados crece como en una ejecución real. Cada ronda se guarda:
+
+    - json:   `save_quiz_data_to_json` (carga fingerprints + append al array)
+    - sqlite: `SqliteQuestionRepository.add_questions` (una transacción,
+              duplicados descartados por la restricción UNIQUE)
+
+Mientras tanto `--readers` hilos leen el almacén como lo haría la API (una
+pregunta por ID y una búsqueda); con JSON cada lectura tiene que decodificar el
+fichero entero y puede encontrarlo a medio escribir. Al final se mide la
+importación única del JSON resultante a SQLite.
+
+Uso:
+    python -m benchmarks.bench_sqlite_store [--bank 3000] [--rounds 200]
+        [--round-size 30] [--readers 2]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.common import make_synthetic_records, print_table
+from src.domain.quiz.question_search import search_terms
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+    SqliteQuestionRepository,
+)
+from src.infrastructure.scraping.data_saver import save_quiz_data_to_json
+from src.infrastructure.serialization.json_serializer import get_serializer
+
+CATEGORY = "radioelectricidad"
+SEARCH_QUERY = "antena potencia"
+
+
+def make_rounds(bank: int, rounds: int, round_size: int) -> List[List[dict]]:
+    """Rondas de preguntas muestreadas (con reemplazo entre rondas) del banco."""
+    records = [
+        {**record, "category": CATEGORY} for record in make_synthetic_records(bank)
+    ]
+    rng = random.Random(5)
+    return [rng.sample(records, round_size) for _ in range(rounds)]
+
+
+def json_reader(path: str, ids: List[str]) -> Callable[[], None]:
+    """Lectura tipo API sobre el fichero JSON: decodificar, buscar por ID y texto."""
+    terms = search_terms(SEARCH_QUERY)
+
+    def read() -> None:
+        records = get_serializer().load_file(path)
+        by_id = {record["id"]: record for record in records}
+        by_id.get(random.choice(ids))
+        [r for r in records if all(t in r["title"]["titleText"] for t in terms)]
+
+    return read
+
+
+def sqlite_reader(store: SqliteQuestionRepository, ids: List[str]):
+    """Lectura tipo API sobre SQLite: pregunta por ID y búsqueda FTS5."""
+
+    def read() -> None:
+        store.get(random.choice(ids))
+        store.search_ids(SEARCH_QUERY)
+
+    return read
+
+
+def run_session(
+    save: Callable[[List[QuizQuestionModel]], int],
+    read: Callable[[], None],
+    rounds: List[List[QuizQuestionModel]],
+    readers: int,
+    ready: Callable[[], bool],
+) -> Dict:
+    """Guarda todas las rondas con `readers` hilos leyendo en paralelo."""
+    stop = threading.Event()
+    reads = [0] * readers
+    errors = [0] * readers
+
+    def reader(slot: int) -> None:
+        while not stop.is_set():
+            if not ready():
+                time.sleep(0.001)
+                continue
+            try:
+                read()
+                reads[slot] += 1
+            except Exception:
+                errors[slot] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+
+    latencies, saved = [], 0
+    start = time.perf_counter()
+    try:
+        for questions in rounds:
+            round_start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                saved += save(questions)
+            latencies.append((time.perf_counter() - round_start) * 1000)
+    finally:
+        wall = time.perf_counter() - start
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "saved": saved,
+        "total_s": f"{wall:.2f}",
+        "round_p50_ms": f"{quantiles[49]:.2f}",
+        "round_p99_ms": f"{quantiles[98]:.2f}",
+        "last_round_ms": f"{latencies[-1]:.2f}",
+        "reads_s": f"{sum(reads) / wall:.0f}",
+        "read_errors": sum(errors),
+    }
+
+
+def main() -> None:
+    """Ejecuta la sesión con cada almacén e imprime la tabla."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bank", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--round-size", type=int, default=30)
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+
+    rounds = [
+        [QuizQuestionModel(**record) for record in questions]
+        for questions in make_rounds(args.bank, args.rounds, args.round_size)
+    ]
+    ids = list({question.id for questions in rounds for question in questions})
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, f"questions_{CATEGORY}.json")
+        row = run_session(
+            lambda questions: save_quiz_data_to_json(questions, CATEGORY, json_path),
+            json_reader(json_path, ids),
+            rounds,
+            args.readers,
+            lambda: os.path.exists(json_path),
+        )
+        rows.append({"store": "json", **row})
+
+        store = SqliteQuestionRepository(Path(tmp) / "questions.sqlite3")
+        row = run_session(
+            store.add_questions,
+            sqlite_reader(store, ids),
+            rounds,
+            args.readers,
+            lambda: True,
+        )
+        rows.append({"store": "sqlite", **row})
+
+        imported = SqliteQuestionRepository(Path(tmp) / "imported.sqlite3")
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            count = sum(imported.import_json_stores(Path(tmp)).values())
+        import_s = time.perf_counter() - start
+
+    print(
+        f"📊 {args.rounds} rondas de {args.round_size} preguntas sobre un banco de "
+        f"{args.bank} | {args.readers} lectores concurrentes\n"
+    )
+    print_table(
+        rows,
+        [
+            "store",
+            "saved",
+            "total_s",
+            "round_p50_ms",
+            "round_p99_ms",
+            "last_round_ms",
+            "reads_s",
+            "read_errors",
+        ],
+    )
+    print(f"\n📦 Importación JSON -> SQLite: {count} preguntas en {import_s:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
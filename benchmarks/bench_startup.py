@@ -0,0 +1,121 @@
+"""
+Benchmark del tiempo de arranque de la CLI con `python -X importtime`.
+
+Mide `python main.py help` (y cualquier otro comando indicado), suma el tiempo
+acumulado de los imports de primer nivel que no forman parte del arranque del
+propio intérprete y comprueba que:
+    - no se importa ningún módulo pesado (selenium, pydantic, pymongo...)
+    - el tiempo de import propio de la CLI no supera el presupuesto
+
+Sale con código 1 si se incumple el presupuesto, por lo que sirve como
+comprobación en pre-commit/CI.
+
+Uso:
+    python -m benchmarks.bench_startup [--budget-ms 15] [--runs 5] [-- scraping --help]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Módulos que nunca deben cargarse para mostrar la ayuda
+FORBIDDEN_MODULES = (
+    "selenium",
+    "webdriver_manager",
+    "requests",
+    "pydantic",
+    "pymongo",
+    "dotenv",
+    "numpy",
+    "bs4",
+)
+
+DEFAULT_BUDGET_MS = 15.0
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Devuelve {módulo: (profundidad, microsegundos acumulados)}."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name_field = line.split(":", 1)[1].split("|")
+        # Los imports anidados se indentan dos espacios por nivel
+        name = name_field.strip()
+        depth = (len(name_field) - len(name_field.lstrip()) - 1) // 2
+        modules[name] = (depth, int(cumulative_us))
+    return modules
+
+
+def run_importtime(args: List[str]) -> Tuple[Dict[str, Tuple[int, int]], float]:
+    """Ejecuta la CLI con -X importtime y devuelve (imports, segundos de pared)."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    return parse_importtime(result.stderr), time.perf_counter() - start
+
+
+def main() -> int:
+    """Ejecuta las mediciones y aplica el presupuesto."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "command", nargs="*", default=["help"], help="Comando de main.py a medir"
+    )
+    args = parser.parse_args()
+
+    baseline_modules, _ = run_importtime(["-c", "pass"])
+    interpreter_modules = set(baseline_modules)
+
+    cli_import_ms = []
+    wall_ms = []
+    imported = set()
+    for _ in range(args.runs):
+        modules, wall = run_importtime(["main.py", *args.command])
+        # Solo los imports de primer nivel que no hace ya el intérprete
+        own_us = sum(
+            cumulative_us
+            for name, (depth, cumulative_us) in modules.items()
+            if depth == 0 and name not in interpreter_modules
+        )
+        imported.update(modules)
+        cli_import_ms.append(own_us / 1000)
+        wall_ms.append(wall * 1000)
+
+    forbidden = sorted(
+        name for name in imported if name.split(".")[0] in FORBIDDEN_MODULES
+    )
+
+    median_import = statistics.median(cli_import_ms)
+    print(f"⏱️ main.py {' '.join(args.command)} ({args.runs} ejecuciones)")
+    print(f"   imports propios de la CLI: {median_import:.1f} ms (mediana)")
+    print(
+        f"   tiempo de pared:           {statistics.median(wall_ms):.1f} ms (mediana)"
+    )
+    print(f"   presupuesto:               {args.budget_ms:.1f} ms")
+
+    ok = True
+    if forbidden:
+        print(f"❌ Módulos pesados importados: {', '.join(forbidden)}")
+        ok = False
+    if median_import > args.budget_ms:
+        print("❌ Presupuesto de arranque superado")
+        ok = False
+
+    if ok:
+        print("✅ Arranque dentro del presupuesto")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Comprobación de extremo a extremo del volcado/restauración paralelos de MongoDB.
+
+Contra un mongod local (o el de `MONGODB_URI`) carga un banco sintético en una
+colección temporal, con una parte de los documentos con `_id` ObjectId como
+los que guarda `save_question`, y:
+
+    1. Vuelca la colección con `--partitions` particiones y comprueba que la
+       unión de las particiones es la colección completa, sin repetidos.
+    2. Restaura el volcado en otra colección (`drop`) y comprueba que los
+       documentos y los índices son idénticos.
+    3. Vuelve a restaurar sin `drop` (upserts) y comprueba que no cambia nada.
+
+Reporta el rendimiento de cada paso y devuelve código 1 si algo no coincide.
+Las colecciones temporales se borran al terminar.
+
+Estado: todavía no se ha ejecutado contra un mongod real. Con mongomock, sobre
+3001 documentos con `_id` de texto, ObjectId y entero y los índices del
+repositorio, se verificaron los pasos 1 y 2 (particiones disjuntas que cubren
+la colección; documentos e índices restaurados idénticos). El paso 3 queda sin
+verificar: el bulk de mongomock no admite el `ReplaceOne` del pymongo actual.
+
+Uso:
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.check_mongo_dump
+        [--questions 100000] [--partitions 8] [--workers 8]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+from bson import ObjectId
+
+from benchmarks.common import make_synthetic_records
+from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+from src.infrastructure.outbound.mongo.mongo_dump import (
+    dump_collection,
+    restore_collection,
+)
+from src.infrastructure.outbound.mongo.mongo_question_repository import (
+    MongoQuestionRepository,
+    question_document,
+)
+
+OBJECT_ID_RATIO = 0.1
+
+
+def load_collection(repository: MongoQuestionRepository, questions: int) -> int:
+    """Carga el banco sintético en la colección. Devuelve los documentos."""
+    documents = [
+        question_document(record) for record in make_synthetic_records(questions)
+    ]
+    for index, document in enumerate(documents):
+        if index % int(1 / OBJECT_ID_RATIO) == 0:
+            document["_id"] = ObjectId()
+    collection = repository.mongo_connection.get_collection()
+    start = time.perf_counter()
+    collection.insert_many(documents, ordered=False)
+    print(
+        f"📥 Cargados {len(documents)} documentos en {time.perf_counter() - start:.2f} s"
+    )
+    repository.create_indexes()
+    return len(documents)
+
+
+def snapshot(collection) -> dict:
+    """Documentos por `_id` e índices de una colección."""
+    return {
+        "documents": {document["_id"]: document for document in collection.find()},
+        "indexes": {
+            name: {key: value for key, value in spec.items() if key != "ns"}
+            for name, spec in collection.index_information().items()
+        },
+    }
+
+
+def main() -> int:
+    """Ejecuta la comprobación y devuelve el código de salida."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--collection", default="bench_dump_questions")
+    args = parser.parse_args()
+
+    source_connection = MongoConnection(args.collection)
+    target_connection = MongoConnection(f"{args.collection}_restored")
+    if not source_connection.test_connection():
+        print("❌ No se pudo conectar a MongoDB")
+        return 1
+
+    failures = []
+    with source_connection, target_connection, tempfile.TemporaryDirectory() as tmp:
+        source = source_connection.get_collection()
+        target = target_connection.get_collection()
+        source.drop()
+        try:
+            total = load_collection(
+                MongoQuestionRepository(source_connection), args.questions
+            )
+
+            manifest = dump_collection(source, tmp, args.partitions, args.workers)
+            counts = [partition["documents"] for partition in manifest["partitions"]]
+            print(f"🧩 Documentos por partición: {counts}")
+            if manifest["documents"] != total:
+                failures.append(f"volcado: {manifest['documents']} de {total}")
+
+            expected = snapshot(source)
+            restore_collection(target, tmp, args.workers, drop=True)
+            if snapshot(target) != expected:
+                failures.append("restauración con drop: la colección no coincide")
+
+            restore_collection(target, tmp, args.workers)
+            if snapshot(target) != expected:
+                failures.append("restauración con upserts: la colección no coincide")
+        finally:
+            source.drop()
+            target.drop()
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Volcado y restauración coinciden con la colección original")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Comprobación de extremo a extremo de la cola de rondas con leases en MongoDB.
+
+Contra un mongod local (o el de `MONGODB_URI`) y en una colección temporal:
+
+    1. `claim` reparte rondas distintas a dos workers y `heartbeat` alarga el
+       lease del dueño.
+    2. Si el lease caduca, otro worker reclama la ronda; el dueño anterior ya no
+       puede renovarla ni terminarla.
+    3. `fail` devuelve la ronda a la cola y `complete` la cierra; los valores
+       del llamador con `$` (worker, error, resultado) se guardan tal cual.
+    4. Una ronda sin intentos con el lease caducado se la lleva `reap_expired`.
+
+Los plazos usan la hora del servidor (`$$NOW`), así que la comprobación espera
+de verdad a que caduquen (`--lease-s`). Devuelve código 1 si algo no coincide.
+
+Uso:
+    MONGODB_URI=mongodb://localhost:27017 python -m benchmarks.check_mongo_round_queue
+        [--lease-s 1.0]
+"""
+
+import argparse
+import sys
+import time
+from typing import List
+
+from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+from src.infrastructure.outbound.mongo.mongo_round_queue import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    MongoRoundQueue,
+)
+
+RUN_ID = "check"
+# Valores que en un pipeline de agregación se leerían como rutas de campo
+WORKER_A = "$worker-a"
+WORKER_B = "$worker-b"
+ERROR = "$error: fallo {$x}"
+RESULT = {"sampled": 3, "new": 1, "worker": "$worker-b"}
+
+
+def check(failures: List[str], condition: bool, message: str) -> None:
+    """Anota un fallo si la condición no se cumple."""
+    print(f"{'✅' if condition else '❌'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def check_claims(queue: MongoRoundQueue, lease_s: float, failures: List[str]) -> str:
+    """Pasos 1 y 2. Devuelve la ronda que acaba en manos de `WORKER_B`."""
+    first = queue.claim(WORKER_A, lease_s, RUN_ID)
+    second = queue.claim(WORKER_B, lease_s, RUN_ID)
+    check(
+        failures,
+        first["_id"] != second["_id"],
+        "claim reparte rondas distintas a cada worker",
+    )
+    check(failures, first["lease_owner"] == WORKER_A, "lease_owner se guarda tal cual")
+    check(failures, queue.claim(WORKER_B, lease_s, RUN_ID) is None, "no quedan rondas")
+
+    time.sleep(lease_s / 2)
+    before = first["lease_expires_at"]
+    renewed = queue.heartbeat(first["_id"], WORKER_A, lease_s)
+    after = queue.collection.find_one({"_id": first["_id"]})["lease_expires_at"]
+    check(failures, renewed and after > before, "heartbeat alarga el lease")
+
+    # Sin heartbeat el lease caduca y la ronda puede reclamarse de nuevo
+    queue.complete(second["_id"], WORKER_B, RESULT)
+    time.sleep(lease_s * 1.5)
+    reclaimed = queue.claim(WORKER_B, lease_s, RUN_ID)
+    check(
+        failures,
+        reclaimed is not None
+        and reclaimed["_id"] == first["_id"]
+        and reclaimed["attempts"] == 2,
+        "otro worker reclama la ronda con el lease caducado",
+    )
+    check(
+        failures,
+        not queue.heartbeat(first["_id"], WORKER_A, lease_s)
+        and not queue.complete(first["_id"], WORKER_A, RESULT),
+        "el dueño anterior ya no puede renovarla ni terminarla",
+    )
+    return first["_id"]
+
+
+def check_finish(queue: MongoRoundQueue, job: str, failures: List[str]) -> None:
+    """Paso 3: `fail` y `complete` con valores del llamador con `$`."""
+    queue.fail(job, WORKER_B, ERROR)
+    document = queue.collection.find_one({"_id": job})
+    check(
+        failures,
+        document["status"] == STATUS_PENDING and document["error"] == ERROR,
+        "fail devuelve la ronda a la cola y guarda el error tal cual",
+    )
+
+    queue.claim(WORKER_B, run_id=RUN_ID)
+    queue.complete(job, WORKER_B, RESULT)
+    document = queue.collection.find_one({"_id": job})
+    check(
+        failures,
+        document["status"] == STATUS_DONE and document["result"] == RESULT,
+        "complete cierra la ronda y guarda el resultado tal cual",
+    )
+
+
+def check_reap(queue: MongoRoundQueue, lease_s: float, failures: List[str]) -> None:
+    """Paso 4: rondas sin intentos y con el lease caducado."""
+    job = queue.enqueue(RUN_ID, "reap", "https://example.com/reap", 1)
+    for _ in range(queue.max_attempts):
+        queue.claim(WORKER_A, lease_s, RUN_ID)
+        time.sleep(lease_s * 1.5)
+    check(failures, queue.claim(WORKER_B, lease_s, RUN_ID) is None, "sin más intentos")
+    reaped = queue.reap_expired(RUN_ID)
+    document = queue.collection.find_one({"_id": job})
+    check(
+        failures,
+        reaped == 1 and document["status"] == STATUS_FAILED,
+        "reap_expired da por fallida la ronda caducada sin intentos",
+    )
+
+
+def main() -> int:
+    """Ejecuta la comprobación y devuelve el código de salida."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lease-s", type=float, default=1.0)
+    parser.add_argument("--collection", default="check_scraping_jobs")
+    args = parser.parse_args()
+
+    connection = MongoConnection(args.collection)
+    if not connection.test_connection():
+        print("❌ No se pudo conectar a MongoDB")
+        return 1
+
+    failures: List[str] = []
+    with connection:
+        queue = MongoRoundQueue(connection, max_attempts=3)
+        queue.collection.drop()
+        try:
+            queue.create_indexes()
+            for round_number in (1, 2):
+                queue.enqueue(RUN_ID, "cola", "https://example.com/cola", round_number)
+            job = check_claims(queue, args.lease_s, failures)
+            check_finish(queue, job, failures)
+            check_reap(queue, args.lease_s, failures)
+        finally:
+            queue.collection.drop()
+
+    if not failures:
+        print("✅ La cola de rondas se comporta como se espera")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Valida la extracción por red (CDP) contra fixtures grabados.
+
+Levanta `FixtureReplayServer` sobre un directorio grabado con
+`python main.py scraping --record DIR` y abre Chrome con el log de red
+activado. En cada ronda carga el examen y extrae las preguntas dos veces sobre
+la misma página:
+
+    - network: respuestas de red capturadas (`capture_from_network`)
+    - dom:     recorrido del DOM con Selenium (`capture_quiz_data` en modo dom)
+
+y compara los fingerprints de los modelos resultantes. Reporta por ronda si
+coinciden, el tiempo de cada extracción y las rondas que volvieron al DOM.
+
+Requiere Chrome. Devuelve código 1 si alguna ronda extraída por red no
+coincide con el DOM.
+
+Uso:
+    python -m benchmarks.check_network_extraction fixtures/ure [--rounds 10]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.bench_scraping_replay import working_directory
+from benchmarks.common import print_table
+
+
+def fingerprints(service, raw_questions: Optional[List[dict]], category: str):
+    """Fingerprints de los modelos construidos a partir de datos en bruto."""
+    if not raw_questions:
+        return None
+    quiz_data = service.build_quiz_data(raw_questions, category) or []
+    return [question.fingerprint for question in quiz_data]
+
+
+def check_round(driver, url: str, category: str) -> Dict:
+    """Carga una ronda y compara la extracción por red con la del DOM."""
+    from src.application.scraping.quiz_extractor import (
+        EXTRACTION_DOM,
+        QuizExtractionService,
+    )
+
+    service = QuizExtractionService(extraction=EXTRACTION_DOM)
+    driver.get(url)
+    expected = len(service.web_extractor.get_question_elements(driver))
+
+    start = time.perf_counter()
+    network_raw = service.capture_from_network(driver, expected, category, [])
+    network_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dom_raw = service.capture_quiz_data(driver, category, [])
+    dom_s = time.perf_counter() - start
+
+    network = fingerprints(service, network_raw, category)
+    dom = fingerprints(service, dom_raw, category)
+    return {
+        "category": category,
+        "questions": expected,
+        "source": "network" if network else "fallback",
+        "match": "-" if network is None else ("sí" if network == dom else "NO"),
+        "network_ms": f"{network_s * 1000:.1f}",
+        "dom_ms": f"{dom_s * 1000:.1f}",
+    }
+
+
+def main() -> int:
+    """Recorre las rondas grabadas e imprime la comparación."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("fixtures_dir")
+    parser.add_argument(
+        "--rounds", type=int, default=None, help="Rondas por categoría (def. todas)"
+    )
+    args = parser.parse_args()
+
+    from src.infrastructure.scraping.driver_config import setup_driver
+    from src.infrastructure.scraping.fixture_server import FixtureReplayServer
+
+    fixtures_dir = os.path.abspath(args.fixtures_dir)
+    rows = []
+    with tempfile.TemporaryDirectory() as workdir, working_directory(workdir):
+        with FixtureReplayServer(fixtures_dir) as server:
+            driver = setup_driver(network_capture=True)
+            try:
+                for config in server.target_configs():
+                    category = config["category"]
+                    rounds = server.manifest["categories"][category]["rounds"]
+                    for _ in range(args.rounds or len(rounds)):
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            rows.append(check_round(driver, config["url"], category))
+            finally:
+                driver.quit()
+
+    print_table(
+        rows, ["category", "questions", "source", "match", "network_ms", "dom_ms"]
+    )
+    mismatches = sum(row["match"] == "NO" for row in rows)
+    fallbacks = sum(row["source"] == "fallback" for row in rows)
+    print(
+        f"\n📊 {len(rows)} rondas: {len(rows) - fallbacks} por red "
+        f"({mismatches} distintas del DOM), {fallbacks} con vuelta al DOM"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Utilidades compartidas por los benchmarks.
+
+Los benchmarks se ejecutan desde la raíz del proyecto como módulos:
+    python -m benchmarks.bench_question_bank
+"""
+
+import json
+import os
+import resource
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+CATEGORIES = ["radioelectricidad", "normativa"]
+# PNG de 1x1 píxel
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000154a24f5d0000000049454e44ae426082"
+)
+
+
+def make_synthetic_records(n: int, seed: int = 0) -> List[Dict]:
+    """
+    Genera `n` registros con el esquema de `QuizQuestionModel.model_dump()`.
+
+    Preguntas base sin duplicados ni opciones con imagen; para bancos con
+    duplicados, sesiones o escritura en streaming ver `benchmarks.synthetic_bank`.
+    """
+    from benchmarks.synthetic_bank import BankSpec, SyntheticBank
+
+    return SyntheticBank(
+        BankSpec(size=n, seed=seed, option_image_ratio=0.0)
+    ).questions()
+
+
+def write_json_store(records: List[Dict], path: str) -> None:
+    """Escribe los registros como lo hace el saver (JSON indentado)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+
+def drop_page_cache(path: str) -> bool:
+    """
+    Pide al sistema operativo que descarte las páginas cacheadas del fichero.
+
+    Returns:
+        bool: True si la plataforma lo soporta
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    finally:
+        os.close(fd)
+
+
+def peak_rss_mb() -> float:
+    """Pico de memoria residente del proceso actual en MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_breakdown_mb() -> Dict[str, float]:
+    """RSS actual (y pico VmHWM) separado en anónima y de fichero (solo Linux)."""
+    breakdown = {}
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(("RssAnon", "RssFile", "VmRSS", "VmHWM")):
+                    key, value = line.split(":", 1)
+                    breakdown[key] = int(value.split()[0]) / 1024
+    except OSError:
+        pass
+    return breakdown
+
+
+@contextmanager
+def stopwatch(results: Dict[str, float], key: str) -> Iterator[None]:
+    """Mide el tiempo de pared del bloque y lo guarda en `results[key]`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        results[key] = time.perf_counter() - start
+
+
+def print_table(rows: List[Dict], columns: List[str]) -> None:
+    """Imprime una tabla alineada a partir de una lista de diccionarios."""
+    widths = {
+        column: max(len(column), *(len(str(row.get(column, ""))) for row in rows))
+        for column in columns
+    }
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    print("  ".join("-" * widths[column] for column in columns))
+    for row in rows:
+        print(
+            "  ".join(
+                str(row.get(column, "")).ljust(widths[column]) for column in columns
+            )
+        )
@@ -0,0 +1,251 @@
+"""
+Benchmarks de los caminos calientes sobre bancos sintéticos, con línea base.
+
+Genera con `benchmarks.synthetic_bank` un banco de cada tamaño de `--sizes`
+(con duplicados y casi duplicados) en un directorio temporal y mide, con el
+mejor de `--repeat` repeticiones:
+
+    - fingerprint:   construir `QuizQuestionModel` y calcular su fingerprint
+                     para todas las preguntas del banco
+    - dedup_load:    `DuplicateDetector` sobre el JSON de una categoría
+    - dedup_filter:  `filter_duplicates` de una ronda de 30 preguntas (un
+                     tercio ya existentes)
+    - save_round:    `save_quiz_data_to_json` de esa ronda sobre una copia del
+                     JSON de la categoría (carga, filtrado y escritura)
+    - mongo_*:       con `--mongo`, alta en bloque, lectura por ID, IDs de una
+                     categoría y búsqueda en una colección temporal
+
+Los resultados se comparan con la línea base JSON (`--baseline`); si algún
+caso es más lento que la base por encima de `--threshold` (y de 5 ms, para no
+confundir ruido con regresiones en los casos muy rápidos), devuelve código 1.
+Con `--save-baseline` (o si aún no hay base) los resultados pasan a ser la
+nueva línea base.
+
+Uso:
+    python -m benchmarks.run_benchmarks [--sizes 10000 100000] [--repeat 5]
+        [--seed 0] [--baseline benchmarks/results/baseline.json]
+        [--save-baseline] [--threshold 0.10] [--mongo]
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.bench_scraping_replay import REGRESSION_THRESHOLD, git_commit
+from benchmarks.common import print_table
+from benchmarks.synthetic_bank import BankSpec, SyntheticBank, write_bank
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.scraping.data_saver import save_quiz_data_to_json
+from src.infrastructure.scraping.duplicate_detector import DuplicateDetector
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "results", "baseline.json")
+ROUND_SIZE = 30
+MONGO_LOOKUPS = 1000
+# Diferencias absolutas menores no cuentan como regresión (ruido del reloj)
+MIN_REGRESSION_S = 0.005
+
+
+def best_of(repeat: int, action: Callable[[], None]) -> float:
+    """Mejor tiempo de pared de `repeat` ejecuciones (sin su salida)."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            action()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def make_round(bank: SyntheticBank, category: str) -> List[QuizQuestionModel]:
+    """Ronda con un tercio de preguntas ya guardadas y el resto nuevas."""
+    existing = [r for r in bank.sample if r["category"] == category][: ROUND_SIZE // 3]
+    fresh = SyntheticBank(
+        BankSpec(size=ROUND_SIZE * 2, seed=bank.spec.seed + 1, categories=[category])
+    ).questions()
+    records = existing + fresh[: ROUND_SIZE - len(existing)]
+    return [QuizQuestionModel(**record) for record in records]
+
+
+# =================================
+# CASOS
+# =================================
+def run_file_cases(bank: SyntheticBank, work_dir: Path, repeat: int) -> Dict:
+    """Casos sobre los JSON del banco. Devuelve {caso: segundos}."""
+    category = bank.spec.categories[0]
+    data_path = str(work_dir / "data" / f"questions_{category}.json")
+    records = [
+        record
+        for category_name in bank.spec.categories
+        for record in json.loads(
+            (work_dir / "data" / f"questions_{category_name}.json").read_text(
+                encoding="utf-8"
+            )
+        )
+    ]
+    round_questions = make_round(bank, category)
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector = DuplicateDetector(data_path)
+    copy_path = str(work_dir / "save_round.json")
+    # La copia del fichero no cuenta: se mide solo el guardado
+    timings: List[float] = []
+
+    def save_round() -> None:
+        shutil.copyfile(data_path, copy_path)
+        start = time.perf_counter()
+        save_quiz_data_to_json(round_questions, category, copy_path)
+        timings.append(time.perf_counter() - start)
+
+    best_of(repeat, save_round)
+
+    return {
+        "fingerprint": best_of(
+            repeat,
+            lambda: [QuizQuestionModel(**record).fingerprint for record in records],
+        ),
+        "dedup_load": best_of(repeat, lambda: DuplicateDetector(data_path)),
+        "dedup_filter": best_of(
+            repeat, lambda: detector.filter_duplicates(round_questions)
+        ),
+        "save_round": min(timings),
+    }
+
+
+def run_mongo_cases(bank: SyntheticBank, collection: str, repeat: int) -> Dict:
+    """Casos sobre MongoDB en una colección temporal que se borra al terminar."""
+    from benchmarks.bench_repositories import drop_mongo_backend, open_mongo_backend
+
+    questions = [QuizQuestionModel(**record) for record in bank.iter_questions()]
+    category = bank.spec.categories[0]
+    lookup_ids = [record["id"] for record in bank.sample[:MONGO_LOOKUPS]]
+    repository = open_mongo_backend(collection)
+    try:
+        start = time.perf_counter()
+        repository.add_questions(questions)
+        results = {"mongo_insert": time.perf_counter() - start}
+        results["mongo_get"] = best_of(
+            repeat, lambda: [repository.get(question_id) for question_id in lookup_ids]
+        )
+        results["mongo_ids"] = best_of(repeat, lambda: repository.ids(category))
+        results["mongo_search"] = best_of(
+            repeat, lambda: repository.search_ids("antena frecuencia")
+        )
+        return results
+    finally:
+        drop_mongo_backend(repository)
+
+
+def run_size(size: int, args: argparse.Namespace) -> Dict[str, float]:
+    """Genera el banco de un tamaño y ejecuta los casos. {caso@tamaño: s}."""
+    bank = SyntheticBank(
+        BankSpec(
+            size=size,
+            seed=args.seed,
+            duplicate_ratio=args.duplicates,
+            near_duplicate_ratio=args.near_duplicates,
+        )
+    )
+    print(f"🧪 Banco sintético de {size} preguntas...")
+    with tempfile.TemporaryDirectory() as work_dir:
+        write_bank(bank, work_dir)
+        results = run_file_cases(bank, Path(work_dir), args.repeat)
+    if args.mongo:
+        results.update(run_mongo_cases(bank, args.mongo_collection, args.repeat))
+    return {f"{case}@{size}": seconds for case, seconds in results.items()}
+
+
+# =================================
+# LÍNEA BASE
+# =================================
+def load_baseline(path: str) -> Optional[Dict]:
+    """Línea base guardada (None si no existe)."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: Dict[str, float], args: argparse.Namespace):
+    """Guarda los resultados como nueva línea base."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    baseline = {
+        "commit": git_commit(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "duplicates": args.duplicates,
+        "near_duplicates": args.near_duplicates,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2)
+    print(f"💾 Línea base guardada en {path}")
+
+
+def compare(
+    results: Dict[str, float], baseline: Optional[Dict], threshold: float
+) -> List[str]:
+    """Imprime la tabla frente a la base. Devuelve los casos que empeoran."""
+    previous = baseline["results"] if baseline else {}
+    rows = []
+    regressions = []
+    for key, seconds in results.items():
+        case, size = key.split("@")
+        row = {"case": case, "size": size, "seconds": f"{seconds:.4f}"}
+        if previous.get(key):
+            change = seconds / previous[key] - 1
+            row["baseline"] = f"{previous[key]:.4f}"
+            row["change"] = f"{change * 100:+.1f}%"
+            if change > threshold and seconds - previous[key] > MIN_REGRESSION_S:
+                regressions.append(key)
+                row["change"] += " ❌"
+        rows.append(row)
+    print_table(rows, ["case", "size", "seconds", "baseline", "change"])
+    return regressions
+
+
+def main() -> int:
+    """Ejecuta los benchmarks y los compara con la línea base."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--duplicates", type=float, default=0.05)
+    parser.add_argument("--near-duplicates", type=float, default=0.02)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--mongo", action="store_true", help="Incluye MongoDB")
+    parser.add_argument("--mongo-collection", default="bench_synthetic_questions")
+    args = parser.parse_args()
+
+    results: Dict[str, float] = {}
+    for size in args.sizes:
+        results.update(run_size(size, args))
+
+    baseline = load_baseline(args.baseline)
+    if baseline:
+        print(f"\n📊 Frente a la línea base de {baseline.get('commit')}")
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save_baseline or baseline is None:
+        save_baseline(args.baseline, results, args)
+    if regressions:
+        print(f"❌ Regresión por encima del {args.threshold:.0%}: {regressions}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
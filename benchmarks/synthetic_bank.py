@@ -0,0 +1,547 @@
+"""
+Generador de bancos de preguntas sintéticos para benchmarks a escala.
+
+Produce preguntas con el esquema exacto de `QuizQuestionModel.model_dump()`
+(`id`, `title{titleText,titleImage}`, `options[{optionText,optionImage}]`,
+`correct_option`, `category`) y sesiones con el de `ExamSessionModel`, de forma
+reproducible a partir de una semilla:
+
+    - enunciados y opciones con aspecto de examen de radioaficionado en español
+      (plantillas técnicas con valores y unidades, o normativas)
+    - mezcla de preguntas de texto y con imágenes en el título o en las
+      opciones, con las rutas `assets/images/...` que guarda el scraper
+    - duplicados: copias de una pregunta ya generada con otro ID, tal cual o
+      con mayúsculas y espacios distintos (mismo fingerprint, como al ver la
+      misma pregunta en otra ronda)
+    - casi duplicados: mismo enunciado con una opción distinta (fingerprint
+      distinto, mismo `title_hash`)
+
+Las preguntas se generan en streaming, así que un banco de 1M de preguntas se
+escribe sin tenerlo entero en memoria; los duplicados y las sesiones salen de
+una muestra acotada de las preguntas base.
+
+Uso:
+    python -m benchmarks.synthetic_bank OUT_DIR [--size 100000] [--seed 0]
+        [--categories radioelectricidad normativa] [--duplicates 0.05]
+        [--near-duplicates 0.02] [--sessions 1000] [--images]
+"""
+
+import argparse
+import json
+import os
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from benchmarks.common import CATEGORIES, PNG_BYTES
+
+SAMPLE_SIZE = 10_000
+OPTIONS_PER_QUESTION = 4
+SESSION_QUESTIONS = 30
+
+KIND_BASE = "base"
+KIND_DUPLICATE = "duplicate"
+KIND_NEAR_DUPLICATE = "near_duplicate"
+
+# =================================
+# VOCABULARIO
+# =================================
+TECHNICAL_TEMPLATES = [
+    "¿Cuál es {magnitude} de {device} {context}?",
+    "¿Qué valor tiene {magnitude} de {device} {context}?",
+    "Si se duplica {magnitude} de {device} {context}, ¿qué valor se obtiene?",
+    "Calcule {magnitude} de {device} {context}.",
+    "¿Qué {magnitude_bare} presenta {device} {context}?",
+]
+MAGNITUDES = [
+    ("la impedancia", "impedancia", "Ω"),
+    ("la frecuencia de resonancia", "frecuencia", "kHz"),
+    ("la potencia radiada", "potencia", "W"),
+    ("la tensión de pico", "tensión", "V"),
+    ("la corriente de placa", "corriente", "mA"),
+    ("la longitud de onda", "longitud de onda", "m"),
+    ("la ganancia", "ganancia", "dB"),
+    ("la capacidad equivalente", "capacidad", "pF"),
+    ("la inductancia", "inductancia", "µH"),
+    ("la atenuación", "atenuación", "dB"),
+]
+DEVICES = [
+    "una antena dipolo de media onda",
+    "una antena Yagi de tres elementos",
+    "una vertical de cuarto de onda",
+    "un filtro paso bajo",
+    "un filtro paso banda",
+    "una línea coaxial de 50 ohmios",
+    "un amplificador lineal",
+    "un oscilador de cuarzo",
+    "un circuito tanque LC",
+    "una bobina de carga",
+    "un acoplador de antena",
+    "un mezclador equilibrado",
+]
+# Todos los contextos llevan un valor para que los enunciados rara vez coincidan
+CONTEXTS = [
+    "en la banda de {band} metros",
+    "a {value} MHz",
+    "con una carga de {value} ohmios",
+    "alimentada con {value} V",
+    "en modo SSB a {value} MHz",
+    "en modo FM de banda estrecha en la banda de {band} metros",
+    "a plena potencia en la banda de {band} metros",
+    "con una ROE de {ratio}:1",
+    "a una temperatura de {value} °C",
+]
+BANDS = [160, 80, 60, 40, 30, 20, 17, 15, 12, 10, 6, 4, 2]
+
+REGULATORY_TEMPLATES = [
+    "Según el artículo {article} del reglamento, ¿qué debe hacer {subject} {situation}?",
+    "¿Qué obligación impone el artículo {article} a {subject} {situation}?",
+    "De acuerdo con el artículo {article}, ¿qué está permitido a {subject} {situation}?",
+    "¿Qué indica el apartado {article}.{paragraph} sobre {subject} {situation}?",
+]
+SUBJECTS = [
+    "una estación de radioaficionado",
+    "el titular de una licencia de clase A",
+    "el operador de una estación portable",
+    "una estación repetidora",
+    "el responsable de una radiobaliza",
+    "un operador invitado",
+    "una estación de concurso",
+]
+SITUATIONS = [
+    "antes de transmitir",
+    "durante un concurso internacional",
+    "al operar desde otro país de la CEPT",
+    "al recibir una llamada de socorro",
+    "en una emergencia",
+    "al instalar una antena en la vía pública",
+    "al cambiar de domicilio",
+    "fuera de las bandas atribuidas",
+    "durante una prueba de equipos",
+]
+REGULATORY_OPTIONS = [
+    "Identificarse con su indicativo al inicio y al final de cada comunicado",
+    "Solicitar autorización previa a la administración",
+    "Anotar el comunicado en el libro de guardia",
+    "Reducir la potencia al mínimo necesario",
+    "Cesar la emisión inmediatamente",
+    "Transmitir únicamente en telegrafía",
+    "Notificarlo en el plazo de un mes",
+    "Utilizar el prefijo del país visitado",
+    "No está permitido en ningún caso",
+    "Atender con prioridad el tráfico de socorro",
+    "Emplear lenguaje claro sin cifrar",
+    "Limitar la emisión a 10 W",
+    "Comunicarlo a la asociación de radioaficionados",
+    "Mantener la escucha en la frecuencia de llamada",
+    "Solicitar una licencia temporal",
+    "Ninguna de las anteriores",
+    "Pedir permiso al propietario del inmueble",
+    "Desconectar la antena de la red eléctrica",
+    "Usar solo frecuencias de la banda de 2 metros",
+    "Transmitir un indicativo especial",
+]
+
+
+# =================================
+# GENERADOR
+# =================================
+@dataclass
+class BankSpec:
+    """Parámetros de un banco sintético."""
+
+    size: int = 10_000
+    seed: int = 0
+    categories: List[str] = field(default_factory=lambda: list(CATEGORIES))
+    duplicate_ratio: float = 0.0
+    near_duplicate_ratio: float = 0.0
+    title_image_ratio: float = 0.15
+    option_image_ratio: float = 0.05
+
+
+class SyntheticBank:
+    """
+    Banco de preguntas sintético y reproducible.
+
+    Cada llamada a `iter_questions` vuelve a empezar desde la semilla, así que
+    genera siempre las mismas preguntas en el mismo orden.
+    """
+
+    def __init__(self, spec: Optional[BankSpec] = None):
+        """Prepara el banco con los parámetros dados (o los de por defecto)."""
+        self.spec = spec or BankSpec()
+        self.sample: List[Dict] = []
+        self.stats: Dict[str, int] = {}
+
+    # =================================
+    # PREGUNTAS
+    # =================================
+    def iter_questions(self) -> Iterator[Dict]:
+        """Genera las preguntas del banco una a una."""
+        spec = self.spec
+        rng = random.Random(spec.seed)
+        self.sample = []
+        self.stats = {KIND_BASE: 0, KIND_DUPLICATE: 0, KIND_NEAR_DUPLICATE: 0}
+        bases_seen = 0
+        for index in range(spec.size):
+            kind = self._pick_kind(rng)
+            if kind == KIND_BASE:
+                category = spec.categories[index % len(spec.categories)]
+                record = self._base_question(rng, category)
+                bases_seen += 1
+                self._keep_in_sample(rng, record, bases_seen)
+            elif kind == KIND_DUPLICATE:
+                record = self._duplicate(rng, rng.choice(self.sample))
+            else:
+                record = self._near_duplicate(rng, rng.choice(self.sample))
+            self.stats[kind] += 1
+            yield record
+
+    def questions(self) -> List[Dict]:
+        """Todas las preguntas del banco en una lista."""
+        return list(self.iter_questions())
+
+    def _pick_kind(self, rng: random.Random) -> str:
+        """Tipo de la siguiente pregunta según las proporciones del banco."""
+        if not self.sample:
+            return KIND_BASE
+        draw = rng.random()
+        if draw < self.spec.duplicate_ratio:
+            return KIND_DUPLICATE
+        if draw < self.spec.duplicate_ratio + self.spec.near_duplicate_ratio:
+            return KIND_NEAR_DUPLICATE
+        return KIND_BASE
+
+    def _keep_in_sample(self, rng: random.Random, record: Dict, seen: int) -> None:
+        """Muestreo por reservorio de las preguntas base (tamaño acotado)."""
+        if len(self.sample) < SAMPLE_SIZE:
+            self.sample.append(record)
+            return
+        slot = rng.randrange(seen)
+        if slot < SAMPLE_SIZE:
+            self.sample[slot] = record
+
+    def _base_question(self, rng: random.Random, category: str) -> Dict:
+        """Pregunta nueva de la categoría con el estilo que le corresponde."""
+        question_id = new_question_id(rng)
+        if category == "normativa":
+            title, options = regulatory_question(rng)
+        else:
+            title, options = technical_question(rng)
+
+        title_image = None
+        if rng.random() < self.spec.title_image_ratio:
+            title_image = question_image_path(category, question_id)
+        option_images = [None] * len(options)
+        if rng.random() < self.spec.option_image_ratio:
+            option_images = [
+                option_image_path(category, question_id, index)
+                for index in range(len(options))
+            ]
+
+        return {
+            "id": question_id,
+            "title": {"titleText": title, "titleImage": title_image},
+            "options": [
+                # Las opciones con imagen no traen texto, como en la web
+                {"optionText": None if image else text, "optionImage": image}
+                for text, image in zip(options, option_images)
+            ],
+            "correct_option": rng.randrange(len(options)),
+            "category": category,
+        }
+
+    def _duplicate(self, rng: random.Random, original: Dict) -> Dict:
+        """Copia con otro ID; a veces con mayúsculas o espacios distintos."""
+        record = with_new_id(rng, original)
+        if rng.random() < 0.5:
+            text = record["title"]["titleText"]
+            record["title"]["titleText"] = rng.choice(
+                (text.upper(), text.lower(), f"  {text} ")
+            )
+        return record
+
+    def _near_duplicate(self, rng: random.Random, original: Dict) -> Dict:
+        """Mismo enunciado con una opción incorrecta distinta."""
+        record = with_new_id(rng, original)
+        options = record["options"]
+        wrong = [
+            index
+            for index, option in enumerate(options)
+            if index != record["correct_option"] and option["optionText"]
+        ]
+        if not wrong:
+            # Opciones solo con imagen: cambia la respuesta correcta
+            record["correct_option"] = (record["correct_option"] + 1) % len(options)
+            return record
+        option = options[rng.choice(wrong)]
+        if record["category"] == "normativa":
+            texts = {option["optionText"] for option in options}
+            option["optionText"] = rng.choice(
+                [text for text in REGULATORY_OPTIONS if text not in texts]
+            )
+        else:
+            value, unit = option["optionText"].rsplit(" ", 1)
+            scaled = float(value.replace(",", ".")) * rng.uniform(0.5, 1.5)
+            option["optionText"] = f"{format_number(scaled)} {unit}"
+        return record
+
+    # =================================
+    # SESIONES
+    # =================================
+    def iter_sessions(
+        self, count: int, questions_per_session: int = SESSION_QUESTIONS
+    ) -> Iterator[Dict]:
+        """
+        Genera sesiones de examen sobre la muestra de preguntas base.
+
+        Necesita haber recorrido antes `iter_questions`. Cada usuario tiene una
+        habilidad fija; las sesiones incompletas dejan preguntas sin responder
+        y no tienen nota.
+        """
+        if not self.sample:
+            raise ValueError("Genera primero las preguntas del banco")
+        rng = random.Random(self.spec.seed + 1)
+        users = [new_question_id(rng) for _ in range(max(1, count // 10))]
+        skills = {user: rng.uniform(0.3, 0.95) for user in users}
+        started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for _ in range(count):
+            user_id = rng.choice(users)
+            questions = rng.sample(
+                self.sample, min(questions_per_session, len(self.sample))
+            )
+            is_completed = rng.random() < 0.8
+            answered = (
+                questions
+                if is_completed
+                else questions[: rng.randrange(len(questions))]
+            )
+            answers = {
+                question["id"]: answer_for(rng, question, skills[user_id])
+                for question in answered
+            }
+            created_at = started + timedelta(seconds=rng.randrange(365 * 86400))
+            yield {
+                "id": new_question_id(rng),
+                "user_id": user_id,
+                "questions": questions,
+                "answers": answers,
+                "score": score_of(questions, answers) if is_completed else None,
+                "is_completed": is_completed,
+                "created_at": created_at.isoformat(),
+                "completed_at": (
+                    (created_at + timedelta(minutes=rng.randrange(5, 60))).isoformat()
+                    if is_completed
+                    else None
+                ),
+            }
+
+
+# =================================
+# TEXTOS
+# =================================
+def new_question_id(rng: random.Random) -> str:
+    """ID hexadecimal de 32 caracteres."""
+    return f"{rng.getrandbits(128):032x}"
+
+
+def format_number(value: float) -> str:
+    """Número con coma decimal, como en los enunciados en español."""
+    text = f"{value:.3g}" if value < 1000 else f"{value:.0f}"
+    return text.replace(".", ",")
+
+
+def technical_question(rng: random.Random):
+    """Enunciado técnico y cuatro valores numéricos con unidad."""
+    magnitude, magnitude_bare, unit = rng.choice(MAGNITUDES)
+    context = rng.choice(CONTEXTS).format(
+        band=rng.choice(BANDS),
+        value=format_number(rng.uniform(1, 500)),
+        ratio=format_number(rng.uniform(1, 3)),
+    )
+    title = rng.choice(TECHNICAL_TEMPLATES).format(
+        magnitude=magnitude,
+        magnitude_bare=magnitude_bare,
+        device=rng.choice(DEVICES),
+        context=context,
+    )
+    center = rng.uniform(0.5, 5000)
+    values = set()
+    while len(values) < OPTIONS_PER_QUESTION:
+        values.add(format_number(center * rng.uniform(0.2, 3)))
+    options = [f"{value} {unit}" for value in sorted(values)]
+    rng.shuffle(options)
+    return title, options
+
+
+def regulatory_question(rng: random.Random):
+    """Enunciado normativo y cuatro respuestas distintas."""
+    title = rng.choice(REGULATORY_TEMPLATES).format(
+        article=rng.randint(1, 300),
+        paragraph=rng.randint(1, 9),
+        subject=rng.choice(SUBJECTS),
+        situation=rng.choice(SITUATIONS),
+    )
+    return title, rng.sample(REGULATORY_OPTIONS, OPTIONS_PER_QUESTION)
+
+
+def question_image_path(category: str, question_id: str) -> str:
+    """Ruta de la imagen del título tal como la guarda el scraper."""
+    return f"assets/images/questions/{category}/pregunta_{question_id}.png"
+
+
+def option_image_path(category: str, question_id: str, index: int) -> str:
+    """Ruta de la imagen de una opción tal como la guarda el scraper."""
+    return (
+        f"assets/images/options/{category}/"
+        f"pregunta_{question_id}_opcion_{index + 1}.png"
+    )
+
+
+def image_paths(record: Dict) -> List[str]:
+    """Rutas de todas las imágenes que referencia una pregunta."""
+    paths = [record["title"]["titleImage"]]
+    paths.extend(option["optionImage"] for option in record["options"])
+    return [path for path in paths if path]
+
+
+def with_new_id(rng: random.Random, original: Dict) -> Dict:
+    """Copia profunda de la pregunta con otro ID (y sus rutas de imagen)."""
+    question_id = new_question_id(rng)
+    record = json.loads(json.dumps(original))
+    record["id"] = question_id
+    if record["title"]["titleImage"]:
+        record["title"]["titleImage"] = question_image_path(
+            record["category"], question_id
+        )
+    for index, option in enumerate(record["options"]):
+        if option["optionImage"]:
+            option["optionImage"] = option_image_path(
+                record["category"], question_id, index
+            )
+    return record
+
+
+def answer_for(rng: random.Random, question: Dict, skill: float) -> int:
+    """Respuesta de un usuario con la habilidad dada."""
+    if rng.random() < skill:
+        return question["correct_option"]
+    return rng.randrange(len(question["options"]))
+
+
+def score_of(questions: List[Dict], answers: Dict[str, int]) -> int:
+    """Aciertos de una sesión."""
+    return sum(
+        answers.get(question["id"]) == question["correct_option"]
+        for question in questions
+    )
+
+
+# =================================
+# ESCRITURA
+# =================================
+def write_bank(
+    bank: SyntheticBank,
+    out_dir: str,
+    sessions: int = 0,
+    images: bool = False,
+) -> Dict:
+    """
+    Escribe el banco con la estructura del proyecto bajo `out_dir`.
+
+    - `data/questions_<categoría>.json`: un array JSON por categoría, escrito
+      en streaming
+    - `data/exam_sessions.json`: `sessions` sesiones de examen
+    - `assets/images/...`: un PNG mínimo por imagen referenciada (`images`)
+    - `manifest.json`: parámetros y recuentos por tipo de pregunta
+
+    Returns:
+        Dict: El manifiesto escrito
+    """
+    root = Path(out_dir)
+    data_dir = root / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    files = {
+        category: open(data_dir / f"questions_{category}.json", "w", encoding="utf-8")
+        for category in bank.spec.categories
+    }
+    counts = dict.fromkeys(files, 0)
+    image_count = 0
+    try:
+        for handle in files.values():
+            handle.write("[")
+        for record in bank.iter_questions():
+            category = record["category"]
+            separator = ",\n" if counts[category] else "\n"
+            files[category].write(separator + json.dumps(record, ensure_ascii=False))
+            counts[category] += 1
+            if images:
+                image_count += write_image_stubs(root, image_paths(record))
+        for handle in files.values():
+            handle.write("\n]\n")
+    finally:
+        for handle in files.values():
+            handle.close()
+
+    if sessions:
+        with open(data_dir / "exam_sessions.json", "w", encoding="utf-8") as f:
+            json.dump(list(bank.iter_sessions(sessions)), f, ensure_ascii=False)
+
+    manifest = {
+        "spec": asdict(bank.spec),
+        "questions_by_kind": bank.stats,
+        "questions_by_category": counts,
+        "sessions": sessions,
+        "images": image_count,
+    }
+    with open(root / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def write_image_stubs(root: Path, paths: List[str]) -> int:
+    """Escribe un PNG mínimo en cada ruta. Devuelve cuántos escribió."""
+    for path in paths:
+        target = root / path
+        os.makedirs(target.parent, exist_ok=True)
+        target.write_bytes(PNG_BYTES)
+    return len(paths)
+
+
+def main() -> None:
+    """Genera un banco sintético en disco."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("out_dir")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--categories", nargs="+", default=list(CATEGORIES))
+    parser.add_argument("--duplicates", type=float, default=0.05)
+    parser.add_argument("--near-duplicates", type=float, default=0.02)
+    parser.add_argument("--title-images", type=float, default=0.15)
+    parser.add_argument("--option-images", type=float, default=0.05)
+    parser.add_argument("--sessions", type=int, default=0)
+    parser.add_argument(
+        "--images", action="store_true", help="Escribir un PNG por imagen"
+    )
+    args = parser.parse_args()
+
+    bank = SyntheticBank(
+        BankSpec(
+            size=args.size,
+            seed=args.seed,
+            categories=args.categories,
+            duplicate_ratio=args.duplicates,
+            near_duplicate_ratio=args.near_duplicates,
+            title_image_ratio=args.title_images,
+            option_image_ratio=args.option_images,
+        )
+    )
+    manifest = write_bank(bank, args.out_dir, args.sessions, args.images)
+    print(f"✅ Banco sintético escrito en {args.out_dir}")
+    print(json.dumps(manifest, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Servidor HTTP local que simula un sitio con limitación de peticiones.
+
+Sirve una página de examen mínima en cualquier ruta y una imagen PNG en las
+rutas bajo `/img/`, con el comportamiento típico de un sitio protegido:
+
+    - capacidad de `capacity_rps` peticiones/s (token bucket) y como mucho
+      `max_concurrent` a la vez; por encima responde 429 con `Retry-After`
+    - latencia que crece con las peticiones en curso (cola del servidor)
+    - una fracción `error_rate` de respuestas 503
+
+Uso típico:
+    with ThrottlingStubServer(capacity_rps=20, max_concurrent=4) as server:
+        fetcher.fetch(server.base_url + "/examen")
+"""
+
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.common import PNG_BYTES
+
+PAGE_HTML = (
+    b"<html><body><div class='quiz-question'><p>Pregunta de prueba</p>"
+    b"<img src='/img/pregunta.png'></div></body></html>"
+)
+
+
+class ThrottlingStubServer:
+    """Servidor en segundo plano que limita ritmo y concurrencia como un sitio real."""
+
+    def __init__(
+        self,
+        capacity_rps: float = 20.0,
+        max_concurrent: int = 4,
+        base_latency_s: float = 0.02,
+        error_rate: float = 0.0,
+        retry_after_s: int = 1,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Prepara el servidor; `port=0` elige un puerto libre."""
+        self.capacity_rps = capacity_rps
+        self.max_concurrent = max_concurrent
+        self.base_latency_s = base_latency_s
+        self.error_rate = error_rate
+        self.retry_after_s = retry_after_s
+        self.stats = {"ok": 0, "throttled": 0, "errors": 0, "peak_concurrent": 0}
+        self._rng = random.Random(seed)
+        self._tokens = 1.0
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """URL base del servidor."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ThrottlingStubServer":
+        """Arranca el servidor en un hilo daemon."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="throttle-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        """Arranca el servidor al entrar en el contexto."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Detiene el servidor al salir del contexto."""
+        self.stop()
+
+    def admit(self):
+        """
+        Decide la respuesta de una petición nueva.
+
+        Returns:
+            tuple: (código de estado, latencia simulada en segundos)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity_rps,
+                self._tokens + (now - self._refilled_at) * self.capacity_rps,
+            )
+            self._refilled_at = now
+            if self._in_flight >= self.max_concurrent or self._tokens < 1.0:
+                self.stats["throttled"] += 1
+                return 429, 0.0
+            if self._rng.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return 503, 0.0
+            self._tokens -= 1.0
+            self._in_flight += 1
+            self.stats["peak_concurrent"] = max(
+                self.stats["peak_concurrent"], self._in_flight
+            )
+            load = self._in_flight / self.max_concurrent
+            return 200, self.base_latency_s * (1 + 3 * load)
+
+    def finish(self) -> None:
+        """Marca una petición admitida como terminada."""
+        with self._lock:
+            self._in_flight -= 1
+            self.stats["ok"] += 1
+
+    def _make_handler(self):
+        """Crea la clase handler con acceso a este servidor."""
+        server = self
+
+        class ThrottleHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, latency = server.admit()
+                if status != 200:
+                    self.send_response(status)
+                    if status == 429:
+                        self.send_header("Retry-After", str(server.retry_after_s))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                try:
+                    time.sleep(latency)
+                    is_image = self.path.startswith("/img/")
+                    body = PNG_BYTES if is_image else PAGE_HTML
+                    self.send_response(200)
+                    self.send_header(
+                        "Content-Type",
+                        "image/png" if is_image else "text/html; charset=utf-8",
+                    )
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    server.finish()
+
+            def log_message(self, format, *args):
+                pass
+
+        return ThrottleHandler
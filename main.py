@@ -1,52 +1,154 @@
 """
 Punto de entrada de la aplicación que usa casos de uso.
+
+Los subcomandos se cargan de forma perezosa: cada uno vive en un módulo de
+`src.framework.cli` que solo importa la librería estándar a nivel de módulo, de
+modo que `python main.py help` no importa selenium, pydantic, pymongo, etc.
+
+Todos los subcomandos aceptan `--profile` (y `--profile-mode cprofile`) para
+perfilar la ejecución (CPU, asignaciones y memoria por ronda, ver
+`src.shared.profiling`).
 """
 
 import sys
 
+# nombre -> (módulo del subcomando, descripción corta)
+COMMANDS = {
+    "scraping": (
+        "src.framework.cli.scraping_command",
+        "Ejecuta el scraping del cuestionario (URL opcional, usa .env si no se especifica)",
+    ),
+    "migrate": (
+        "src.framework.cli.migrate_command",
+        "Migra los ficheros JSON de preguntas a MongoDB",
+    ),
+    "distributed": (
+        "src.framework.cli.distributed_command",
+        "Scraping repartido entre máquinas con una cola de rondas en MongoDB",
+    ),
+    "backup": (
+        "src.framework.cli.backup_command",
+        "Vuelca o restaura en paralelo la colección de preguntas de MongoDB",
+    ),
+    "bank": (
+        "src.framework.cli.bank_command",
+        "Exporta los ficheros JSON de preguntas al banco binario (mmap)",
+    ),
+    "sqlite": (
+        "src.framework.cli.sqlite_command",
+        "Importa los ficheros JSON de preguntas a la base SQLite (WAL + FTS5)",
+    ),
+    "export": (
+        "src.framework.cli.export_command",
+        "Exporta las preguntas a Parquet, Arrow o CSV de forma incremental",
+    ),
+    "images": (
+        "src.framework.cli.images_command",
+        "Recodifica, deduplica y genera miniaturas de las imágenes (extra 'images')",
+    ),
+    "serve": (
+        "src.framework.cli.serve_command",
+        "Sirve el banco de preguntas por HTTP (requiere el extra 'api')",
+    ),
+}
+
+
+def print_usage():
+    """Muestra el uso básico."""
+    print("🚀 Radio Amateur Quiz Scraper - Clean Architecture")
+    print("\nUso:")
+    print("  python main.py scraping [url]    # Ejecutar scraping")
+    print("  python main.py <comando> --help  # Ayuda de un comando")
+    print("  python main.py help              # Mostrar ayuda")
+
+
+def print_help():
+    """Muestra la ayuda con todos los comandos disponibles."""
+    print("📖 Ayuda de Radio Amateur Quiz Scraper")
+    print("\nComandos disponibles:")
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name.ljust(width)} - {description}")
+    print(f"  {'help'.ljust(width)} - Muestra esta ayuda")
 
-def main():
-    """Función principal que orquesta la aplicación."""
 
-    if len(sys.argv) < 2:
-        print("🚀 Radio Amateur Quiz Scraper - Clean Architecture")
-        print("\nUso:")
-        print("  python main.py scraping [url]    # Ejecutar scraping")
-        print("  python main.py help              # Mostrar ayuda")
-        return
+def add_profile_arguments(parser) -> None:
+    """Registra los argumentos de perfilado comunes a todos los subcomandos."""
+    group = parser.add_argument_group("perfilado")
+    group.add_argument(
+        "--profile",
+        action="store_true",
+        help="Perfilar la ejecución (CPU, asignaciones y memoria por ronda)",
+    )
+    group.add_argument(
+        "--profile-mode",
+        choices=("sampling", "cprofile"),
+        default="sampling",
+        help="Perfilador de CPU: muestreo de pilas de todos los hilos o cProfile",
+    )
+    group.add_argument(
+        "--profile-dir",
+        default="data/profiles",
+        help="Directorio donde crear la carpeta de cada ejecución perfilada",
+    )
+    group.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="Entradas de las tablas de CPU y de asignaciones",
+    )
 
-    command = sys.argv[1]
 
-    if command == "scraping":
-        print("🕷️ Ejecutando caso de uso de scraping...")
+def run_command(command: str, args: list) -> int:
+    """Importa el módulo del subcomando, parsea sus argumentos y lo ejecuta."""
+    import argparse
+    import importlib
 
-        # Usar el Use Case de la capa de aplicación
-        from src.application.scraping.scraping_use_case import ScrapingUseCase
+    module_name, description = COMMANDS[command]
+    module = importlib.import_module(module_name)
 
-        # URL opcional como parámetro
-        url = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(prog=f"main.py {command}", description=description)
+    module.add_arguments(parser)
+    add_profile_arguments(parser)
+    parsed = parser.parse_args(args)
+    if not parsed.profile:
+        return module.run(parsed) or 0
 
-        # Ejecutar caso de uso
-        use_case = ScrapingUseCase()
-        target_configs = [] if url is None else [{"url": url}]
-        success = use_case.execute(target_configs)
+    from src.shared.profiling import profile_run
 
-        if success:
-            print("🎉 ¡Scraping completado exitosamente!")
-        else:
-            print("❌ El scraping falló. Revisa los logs para más detalles.")
+    return (
+        profile_run(
+            lambda: module.run(parsed),
+            command,
+            parsed.profile_mode,
+            parsed.profile_dir,
+            parsed.profile_top,
+        )
+        or 0
+    )
 
-    elif command == "help":
-        print("📖 Ayuda de Radio Amateur Quiz Scraper")
-        print("\nComandos disponibles:")
-        print("  scraping [url] - Ejecuta el scraping del cuestionario")
-        print("                   URL es opcional (usa .env si no se especifica)")
-        print("  help          - Muestra esta ayuda")
 
-    else:
+def main(argv=None) -> int:
+    """Función principal que orquesta la aplicación."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv:
+        print_usage()
+        return 0
+
+    command, args = argv[0], argv[1:]
+
+    if command in ("help", "-h", "--help"):
+        print_help()
+        return 0
+
+    if command not in COMMANDS:
         print(f"❌ Comando '{command}' no reconocido")
         print("Usa 'python main.py help' para ver comandos disponibles")
+        return 1
+
+    return run_command(command, args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
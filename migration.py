@@ -2,14 +2,103 @@
 Handle quiz  questions migration from JSON to MongoAtlas.
 """
 
+import sys
+from itertools import batched
+from pathlib import Path
+from typing import Iterable
+
+from pymongo.errors import BulkWriteError
+
+from src.infrastructure.outbound.local.question_index import (
+    LEGACY_QUESTIONS_FILE_NAME,
+    QuestionIndex,
+)
 from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
 from src.infrastructure.outbound.mongo.mongo_question_repository import (
     MongoQuestionRepository,
+    only_duplicate_keys,
+    question_document,
 )
+from src.infrastructure.serialization.json_serializer import get_serializer
+from src.infrastructure.serialization.json_stream import (
+    iter_json_array,
+    iter_question_records,
+)
+
+BATCH_SIZE = 500
+
+
+def migrate_json_to_mongo(
+    repository: MongoQuestionRepository, data_dir: Path = Path("data")
+) -> int:
+    """
+    Migra los ficheros `questions_<categoria>.json` a MongoDB.
+
+    Usa `_id` = id de la pregunta y upserts, por lo que se puede repetir sin
+    duplicar documentos (y rellena `search_text` y `fingerprint` en documentos
+    antiguos). Las preguntas con el mismo contenido que otra ya guardada con
+    otro ID las rechaza el índice único de fingerprint y no se cuentan.
+
+    Si existe `questions_legacy.json` también se migra, convirtiendo sus
+    registros al esquema actual. Los ficheros se leen en streaming, así que en
+    memoria solo está el lote que se está enviando.
+
+    Returns:
+        int: Número de preguntas migradas
+    """
+    migrated = 0
+    for file_path in QuestionIndex(data_dir).question_files():
+        migrated += migrate_records(
+            repository, iter_json_array(str(file_path)), file_path
+        )
+
+    legacy_path = data_dir / LEGACY_QUESTIONS_FILE_NAME
+    if legacy_path.exists():
+        records = iter_question_records(str(legacy_path), legacy=True)
+        migrated += migrate_records(repository, records, legacy_path)
+
+    return migrated
+
+
+def migrate_records(
+    repository: MongoQuestionRepository, records: Iterable[dict], file_path: Path
+) -> int:
+    """
+    Migra los registros de un fichero por lotes.
+
+    Returns:
+        int: Número de preguntas migradas
+    """
+    migrated = 0
+    read = 0
+    for records_batch in batched(records, BATCH_SIZE):
+        read += len(records_batch)
+        batch = [question_document(record) for record in records_batch]
+        try:
+            repository.upsert_question_batch(batch)
+            migrated += len(batch)
+        except BulkWriteError as e:
+            if not only_duplicate_keys(e):
+                raise
+            migrated += len(batch) - len(e.details["writeErrors"])
+    print(f"📦 {file_path}: {read} preguntas")
+    return migrated
+
+
+def main():
+    """Comprueba la conexión y migra las preguntas locales a MongoDB."""
+    mongo_connection = MongoConnection()
+    mongo_question_repository = MongoQuestionRepository(mongo_connection)
+
+    print(mongo_question_repository)
+    if not mongo_connection.test_connection():
+        print("❌ No se pudo conectar a MongoDB")
+        sys.exit(1)
+
+    migrated = migrate_json_to_mongo(mongo_question_repository)
+    mongo_question_repository.create_indexes()
+    print(f"✅ Migradas {migrated} preguntas ({get_serializer().name})")
 
-mongo_connection = MongoConnection()
-mongo_question_repository = MongoQuestionRepository(mongo_connection)
 
-print(mongo_connection.test_connection())
-print()
-print(mongo_question_repository)
+if __name__ == "__main__":
+    main()
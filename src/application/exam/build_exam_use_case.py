@@ -0,0 +1,54 @@
+"""
+Caso de uso para montar un examen aleatorio a partir del índice de preguntas.
+"""
+
+import random
+from typing import Dict, Optional
+from uuid import uuid4
+
+from src.domain.exam.exam_model import ExamSessionModel
+from src.domain.quiz.question_repository import QuestionRepository
+
+
+class BuildExamUseCase:
+    """Monta sesiones de examen muestreando IDs del repositorio por categoría."""
+
+    def __init__(self, repository: QuestionRepository):
+        """Inicializa el caso de uso con el repositorio de preguntas."""
+        self.repository = repository
+
+    def execute(
+        self,
+        questions_per_category: Dict[str, int],
+        user_id: Optional[str] = None,
+        seed: Optional[int] = None,
+    ) -> ExamSessionModel:
+        """
+        Crea una sesión de examen nueva.
+
+        Args:
+            questions_per_category: Número de preguntas a elegir por categoría
+            user_id: Usuario que realiza el examen (opcional)
+            seed: Semilla para obtener exámenes reproducibles (opcional)
+
+        Returns:
+            ExamSessionModel: Sesión sin respuestas con las preguntas elegidas
+        """
+        rng = random.Random(seed)
+
+        questions = []
+        for category, amount in questions_per_category.items():
+            available = self.repository.count(category)
+            if available < amount:
+                print(
+                    f"⚠️ Categoría '{category}' solo tiene {available} preguntas (pedidas {amount})"
+                )
+            question_ids = self.repository.sample_ids(category, amount, rng)
+            questions.extend(self.repository.get_many(question_ids))
+
+        return ExamSessionModel(
+            id=str(uuid4()),
+            user_id=user_id,
+            questions=questions,
+            answers={},
+        )
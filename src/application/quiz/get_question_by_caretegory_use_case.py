@@ -1,3 +1,48 @@
 """
 This module contains the use case for retrieving quiz questions by category.
 """
+
+from typing import Dict, Optional
+
+from src.application.quiz.question_page import (
+    DEFAULT_PAGE_SIZE,
+    QuestionPage,
+    clamp_pagination,
+    page_slice,
+)
+from src.domain.quiz.question_repository import QuestionRepository
+
+
+class GetQuestionsByCategoryUseCase:
+    """Lista paginada de las preguntas de una categoría."""
+
+    def __init__(self, repository: QuestionRepository):
+        """Inicializa el caso de uso con el repositorio de preguntas."""
+        self.repository = repository
+
+    def categories(self) -> Dict[str, int]:
+        """Categorías disponibles y su número de preguntas."""
+        return {
+            category: self.repository.count(category)
+            for category in self.repository.categories
+        }
+
+    def execute(
+        self, category: str, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Optional[QuestionPage]:
+        """
+        Devuelve una página de preguntas de la categoría.
+
+        Returns:
+            QuestionPage: Página de preguntas (None si la categoría no existe)
+        """
+        if category not in self.repository.categories:
+            return None
+        page, page_size = clamp_pagination(page, page_size)
+        ids = self.repository.ids(category)
+        return QuestionPage(
+            items=self.repository.get_many(page_slice(ids, page, page_size)),
+            total=len(ids),
+            page=page,
+            page_size=page_size,
+        )
@@ -1,3 +1,20 @@
 """
 This module contains the use case for retrieving a quiz question by its ID.
 """
+
+from typing import Optional
+
+from src.domain.quiz.question_repository import QuestionRepository
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+
+class GetQuestionByIdUseCase:
+    """Obtiene una pregunta por su ID."""
+
+    def __init__(self, repository: QuestionRepository):
+        """Inicializa el caso de uso con el repositorio de preguntas."""
+        self.repository = repository
+
+    def execute(self, question_id: str) -> Optional[QuizQuestionModel]:
+        """Devuelve la pregunta o None si el ID no existe."""
+        return self.repository.get(question_id)
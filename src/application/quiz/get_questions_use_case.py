@@ -1,3 +1,47 @@
 """
 This module contains the use case for retrieving quiz questions.
 """
+
+from typing import Optional
+
+from src.application.quiz.question_page import (
+    DEFAULT_PAGE_SIZE,
+    QuestionPage,
+    clamp_pagination,
+    page_slice,
+)
+from src.domain.quiz.question_repository import QuestionRepository
+
+
+class GetQuestionsUseCase:
+    """Lista paginada de todas las preguntas del banco."""
+
+    def __init__(self, repository: QuestionRepository):
+        """Inicializa el caso de uso con el repositorio de preguntas."""
+        self.repository = repository
+
+    def execute(
+        self,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        category: Optional[str] = None,
+    ) -> QuestionPage:
+        """
+        Devuelve una página de preguntas.
+
+        Args:
+            page: Número de página (empieza en 1)
+            page_size: Preguntas por página (máximo MAX_PAGE_SIZE)
+            category: Limita el listado a una categoría (opcional)
+
+        Returns:
+            QuestionPage: Preguntas de la página y datos de paginación
+        """
+        page, page_size = clamp_pagination(page, page_size)
+        ids = self.repository.ids(category)
+        return QuestionPage(
+            items=self.repository.get_many(page_slice(ids, page, page_size)),
+            total=len(ids),
+            page=page,
+            page_size=page_size,
+        )
@@ -0,0 +1,53 @@
+"""
+Paginación de listados de preguntas para los casos de uso de consulta.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class QuestionPage:
+    """Una página de preguntas y los datos de paginación."""
+
+    items: List[QuizQuestionModel]
+    total: int
+    page: int
+    page_size: int
+
+    @property
+    def pages(self) -> int:
+        """Número total de páginas."""
+        return math.ceil(self.total / self.page_size) if self.total else 0
+
+    @property
+    def has_next(self) -> bool:
+        """Indica si hay una página siguiente."""
+        return self.page < self.pages
+
+    def metadata(self) -> dict:
+        """Datos de paginación serializables."""
+        return {
+            "total": self.total,
+            "page": self.page,
+            "page_size": self.page_size,
+            "pages": self.pages,
+            "has_next": self.has_next,
+        }
+
+
+def clamp_pagination(page: int, page_size: int) -> tuple:
+    """Normaliza página y tamaño de página a rangos válidos."""
+    return max(1, page), min(max(1, page_size), MAX_PAGE_SIZE)
+
+
+def page_slice(ids: Sequence[str], page: int, page_size: int) -> Sequence[str]:
+    """Lista de IDs de una página dentro de la lista completa."""
+    start = (page - 1) * page_size
+    return ids[start : start + page_size]
@@ -1,3 +1,46 @@
 """
-This module contains the use case for retrieving quiz questions.
+This module contains the use case for searching quiz questions.
+
+La búsqueda no distingue mayúsculas ni tildes y exige que todos los términos
+aparezcan en el enunciado o en alguna opción (ver `question_search`). Cada
+repositorio resuelve la búsqueda con sus propios índices.
 """
+
+from typing import List, Optional
+
+from src.application.quiz.question_page import (
+    DEFAULT_PAGE_SIZE,
+    QuestionPage,
+    clamp_pagination,
+    page_slice,
+)
+from src.domain.quiz.question_repository import QuestionRepository
+
+
+class SearchQuestionsUseCase:
+    """Búsqueda de texto sobre enunciados y opciones."""
+
+    def __init__(self, repository: QuestionRepository):
+        """Inicializa el caso de uso con el repositorio de preguntas."""
+        self.repository = repository
+
+    def matching_ids(self, query: str, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs de las preguntas que contienen todos los términos de la búsqueda."""
+        return self.repository.search_ids(query, category)
+
+    def execute(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        page: int = 1,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> QuestionPage:
+        """Devuelve una página de resultados de la búsqueda."""
+        page, page_size = clamp_pagination(page, page_size)
+        ids = self.matching_ids(query, category)
+        return QuestionPage(
+            items=self.repository.get_many(page_slice(ids, page, page_size)),
+            total=len(ids),
+            page=page,
+            page_size=page_size,
+        )
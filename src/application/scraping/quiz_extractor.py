@@ -1,22 +1,98 @@
 """
 Servicio de aplicación para extraer datos del cuestionario.
 Orquesta la extracción web y la creación de modelos de dominio.
+
+Con extracción "network" las preguntas se leen primero de las respuestas de
+red que Chrome ya recibió (CDP); si no traen la ronda completa se vuelve
+automáticamente a la extracción del DOM.
+
+Con imágenes "browser" los bytes se leen de la sesión de Chrome (que ya las
+descargó para pintar la página) y solo las que fallan se descargan por HTTP.
 """
 
 from typing import List, Optional
 
 from ...domain.quiz.quiz_question_factory import QuizQuestionFactory
 from ...domain.quiz.quiz_question_model import QuizQuestionModel
+from ...infrastructure.scraping.browser_images import save_browser_images
+from ...infrastructure.scraping.html_element_extractor import (
+    AnswersNotRevealedError,
+    HtmlElementExtractor,
+)
+from ...infrastructure.scraping.image_downloader import download_jobs
+from ...infrastructure.scraping.network_capture import NetworkCapture
+from ...infrastructure.scraping.network_question_extractor import (
+    NetworkQuestionExtractor,
+)
 from ...infrastructure.scraping.web_element_extractor import WebElementExtractor
+from ...shared.metrics import MetricsRegistry, get_metrics
+
+# Fuentes de las preguntas en modo Selenium
+EXTRACTION_DOM = "dom"
+EXTRACTION_NETWORK = "network"
+EXTRACTION_MODES = (EXTRACTION_DOM, EXTRACTION_NETWORK)
+
+# Origen de los bytes de las imágenes en modo Selenium
+IMAGE_SOURCE_HTTP = "http"
+IMAGE_SOURCE_BROWSER = "browser"
+IMAGE_SOURCES = (IMAGE_SOURCE_HTTP, IMAGE_SOURCE_BROWSER)
 
 
 class QuizExtractionService:
     """Servicio de aplicación para extraer y procesar cuestionarios."""
 
-    def __init__(self):
-        """Inicializa el servicio con los componentes necesarios."""
+    def __init__(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        extraction: str = EXTRACTION_DOM,
+        image_source: str = IMAGE_SOURCE_HTTP,
+    ):
+        """
+        Inicializa el servicio con los componentes necesarios.
+
+        Args:
+            metrics: Registro de métricas (el actual del proceso si no se da)
+            extraction: "dom" o "network" (respuestas de red con vuelta al DOM;
+                el driver debe crearse con `setup_driver(network_capture=True)`)
+            image_source: "http" (descarga con requests) o "browser" (bytes de
+                la sesión de Chrome, con HTTP para las que fallen)
+        """
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(
+                f"Extracción desconocida '{extraction}' (opciones: {', '.join(EXTRACTION_MODES)})"
+            )
+        if image_source not in IMAGE_SOURCES:
+            raise ValueError(
+                f"Origen de imágenes desconocido '{image_source}' (opciones: {', '.join(IMAGE_SOURCES)})"
+            )
         self.web_extractor = WebElementExtractor()
+        self.html_extractor = HtmlElementExtractor()
+        self.network_extractor = NetworkQuestionExtractor()
         self.question_factory = QuizQuestionFactory()
+        self.extraction = extraction
+        self.image_source = image_source
+        self._metrics = metrics
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Registro de métricas (el inyectado o el actual del proceso)."""
+        return self._metrics or get_metrics()
+
+    def build_question(
+        self, raw_data: dict, category: str = "default"
+    ) -> QuizQuestionModel:
+        """Crea el modelo de dominio a partir de los datos en bruto de una pregunta."""
+        with self.metrics.timer("build_model"):
+            return self.question_factory.create_quiz_question(
+                question_title=raw_data["question_title"],
+                question_image=raw_data["question_image"],
+                answers=raw_data["answers"],
+                answer_images=raw_data["answer_images"],
+                correct_index=raw_data["correct_index"],
+                is_img_question=raw_data["is_img_question"],
+                question_index=raw_data["question_index"],
+                category=category,
+            )
 
     def extract_single_question_data(
         self, question_element, question_index, driver, category: str = "default"
@@ -31,16 +107,7 @@ class QuizExtractionService:
         )
 
         # 2. Crear modelo de dominio usando factory
-        quiz_question = self.question_factory.create_quiz_question(
-            question_title=raw_data["question_title"],
-            question_image=raw_data["question_image"],
-            answers=raw_data["answers"],
-            answer_images=raw_data["answer_images"],
-            correct_index=raw_data["correct_index"],
-            is_img_question=raw_data["is_img_question"],
-            question_index=raw_data["question_index"],
-            category=category,
-        )
+        quiz_question = self.build_question(raw_data, category)
 
         # 3. Log de progreso
         # question_type = "Imágenes" if raw_data["is_img_question"] else "Texto"
@@ -60,6 +127,39 @@ class QuizExtractionService:
         Extrae todos los datos del cuestionario de la página.
         Punto de entrada principal del servicio.
         """
+        raw_questions = self.capture_quiz_data(driver, category)
+        if not raw_questions:
+            return None
+        return self.build_quiz_data(raw_questions, category)
+
+    def capture_quiz_data(
+        self, driver, category: str = "default", image_jobs: Optional[list] = None
+    ) -> Optional[List[dict]]:
+        """
+        Captura los datos en bruto del cuestionario mientras la página está viva.
+
+        Es la única parte que necesita el navegador: con `image_jobs` las
+        descargas de imágenes se aplazan y el driver puede pasar al siguiente
+        examen en cuanto termina la captura. Con imágenes "browser" los bytes
+        se leen aquí de la página y solo se aplazan (o descargan) las que fallan.
+        """
+        if self.image_source != IMAGE_SOURCE_BROWSER:
+            return self._capture_raw_questions(driver, category, image_jobs)
+
+        round_jobs: List[dict] = []
+        raw_questions = self._capture_raw_questions(driver, category, round_jobs)
+        if raw_questions:
+            remaining = save_browser_images(driver, round_jobs)
+            if image_jobs is not None:
+                image_jobs.extend(remaining)
+            else:
+                download_jobs(remaining)
+        return raw_questions
+
+    def _capture_raw_questions(
+        self, driver, category: str, image_jobs: Optional[list]
+    ) -> Optional[List[dict]]:
+        """Datos en bruto de la página: de la red si se puede y si no del DOM."""
         try:
             # 1. Obtener elementos web
             question_elements = self.web_extractor.get_question_elements(driver)
@@ -68,23 +168,110 @@ class QuizExtractionService:
                 print("❌ No se encontraron elementos de pregunta")
                 return None
 
-            # 2. Procesar cada pregunta
-            quiz_data = []
-            for i, question_element in enumerate(question_elements):
-                question_data = self.extract_single_question_data(
-                    question_element, i, driver, category
+            if self.extraction == EXTRACTION_NETWORK:
+                raw_questions = self.capture_from_network(
+                    driver, len(question_elements), category, image_jobs
                 )
-                quiz_data.append(question_data)
+                if raw_questions:
+                    return raw_questions
 
-            print(
-                f"\n✅ Extracción completada: {len(quiz_data)} preguntas procesadas para categoría '{category}'"
-            )
-            return quiz_data
+            # 2. Leer cada pregunta del DOM
+            raw_questions = []
+            for i, question_element in enumerate(question_elements):
+                with self.metrics.timer("extract_question"):
+                    raw_questions.append(
+                        self.web_extractor.extract_raw_question_data(
+                            question_element, i, driver, category, image_jobs
+                        )
+                    )
+            return raw_questions
 
         except Exception as e:
             print(f"❌ Error al extraer las preguntas: {e}")
             return None
 
+    def capture_from_network(
+        self,
+        driver,
+        expected: int,
+        category: str = "default",
+        image_jobs: Optional[list] = None,
+    ) -> Optional[List[dict]]:
+        """
+        Lee la ronda de las respuestas de red recibidas por el driver.
+
+        Solo se acepta si trae tantas preguntas como hay en la página, todas
+        con la respuesta correcta; si no, devuelve None para seguir con el DOM.
+        Las imágenes se anotan aparte y solo al aceptar la ronda se añaden a
+        `image_jobs` (o, sin `image_jobs`, se descargan).
+        """
+        jobs: List[dict] = []
+        try:
+            with self.metrics.timer("network_extract"):
+                responses = NetworkCapture(driver).drain()
+                raw_questions = self.network_extractor.extract_raw_questions(
+                    responses, category, jobs
+                )
+        except Exception as e:
+            print(f"⚠️ No se pudieron leer las respuestas de red: {e}")
+            raw_questions = None
+
+        if raw_questions and len(raw_questions) == expected:
+            self.metrics.increment("network_rounds")
+            if image_jobs is None:
+                download_jobs(jobs)
+            else:
+                image_jobs.extend(jobs)
+            return raw_questions
+
+        self.metrics.increment("network_fallbacks")
+        print("↩️ Las respuestas de red no traen la ronda completa: se usa el DOM")
+        return None
+
+    def build_quiz_data(
+        self, raw_questions: List[dict], category: str = "default"
+    ) -> Optional[List[QuizQuestionModel]]:
+        """Crea y valida los modelos de dominio de una ronda capturada."""
+        try:
+            quiz_data = [self.build_question(raw, category) for raw in raw_questions]
+        except Exception as e:
+            print(f"❌ Error al crear los modelos de las preguntas: {e}")
+            return None
+        self.metrics.increment("questions_extracted", len(quiz_data))
+
+        print(
+            f"\n✅ Extracción completada: {len(quiz_data)} preguntas procesadas para categoría '{category}'"
+        )
+        return quiz_data
+
+    def extract_quiz_data_from_html(
+        self, html: str, page_url: str, category: str = "default"
+    ) -> Optional[List[QuizQuestionModel]]:
+        """
+        Extrae el cuestionario de una página descargada por HTTP.
+
+        Raises:
+            AnswersNotRevealedError: Si el HTML no trae las respuestas correctas
+                (hay que usar Selenium para revelarlas)
+        """
+        soup = self.html_extractor.parse(html)
+        question_elements = self.html_extractor.get_question_elements(soup)
+        if not question_elements:
+            print("❌ No se encontraron elementos de pregunta en el HTML")
+            return None
+        if not self.html_extractor.answers_revealed(question_elements):
+            raise AnswersNotRevealedError("El HTML no incluye las respuestas correctas")
+
+        quiz_data = []
+        for i, question_element in enumerate(question_elements):
+            with self.metrics.timer("extract_question"):
+                raw_data = self.html_extractor.extract_raw_question_data(
+                    question_element, i, page_url, category
+                )
+                quiz_data.append(self.build_question(raw_data, category))
+        self.metrics.increment("questions_extracted", len(quiz_data))
+        return quiz_data
+
 
 # Función de conveniencia para mantener compatibilidad con código existente
 def extract_quiz_data(
@@ -0,0 +1,182 @@
+"""
+Pipeline productor/consumidor para solapar las rondas de scraping.
+
+El hilo principal (productor) captura el DOM de una ronda y pasa enseguida a
+cargar el siguiente examen; un hilo trabajador (consumidor) procesa la ronda
+capturada: validación con la factoría, deduplicación, descarga de imágenes y
+persistencia. La cola es acotada: si el trabajador se retrasa, `submit` bloquea
+al productor (backpressure) en lugar de acumular rondas en memoria.
+
+Basta un hilo: el trabajo del consumidor es sobre todo E/S (disco, base de
+datos, descargas) y necesita el estado compartido de la categoría
+(planificador, diario, índice), que con procesos habría que serializar.
+
+Solapamiento: el productor solo espera al trabajador cuando la cola está llena
+o al vaciarla al final, así que del tiempo de procesado todo lo que no fue
+espera del productor se hizo en paralelo con el navegador:
+
+    overlap_s = busy_s - (backpressure_s + drain_s)
+"""
+
+import queue
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Optional
+
+from ...shared.metrics import MetricsRegistry, get_metrics
+
+DEFAULT_PIPELINE_DEPTH = 1
+
+_STOP = object()
+
+
+class RoundPipeline:
+    """Cola acotada de rondas capturadas con un hilo trabajador."""
+
+    def __init__(
+        self,
+        process: Callable[[Any], None],
+        depth: int = DEFAULT_PIPELINE_DEPTH,
+        metrics: Optional[MetricsRegistry] = None,
+        scope: Optional[Callable[[Any], ContextManager]] = None,
+    ):
+        """
+        Inicializa el pipeline.
+
+        Args:
+            process: Función que procesa una ronda capturada (en el trabajador)
+            depth: Rondas capturadas que pueden esperar en la cola
+            metrics: Registro de métricas (el actual del proceso si no se da)
+            scope: Contexto por ronda que envuelve su procesado y la medida de
+                `pipeline_process` (p. ej. `round_scope` de su ronda de métricas)
+        """
+        if depth < 1:
+            raise ValueError("La profundidad del pipeline debe ser al menos 1")
+        self.process = process
+        self.scope = scope or (lambda item: nullcontext())
+        self.depth = depth
+        self.metrics = metrics or get_metrics()
+        self.busy_s = 0.0
+        self.backpressure_s = 0.0
+        self.drain_s = 0.0
+        self.processed = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._failed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # =================================
+    # PRODUCTOR
+    # =================================
+    def start(self) -> "RoundPipeline":
+        """Arranca el hilo trabajador."""
+        self._thread = threading.Thread(
+            target=self._work, name="round-pipeline", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def submit(self, item: Any) -> None:
+        """
+        Encola una ronda capturada; bloquea si la cola está llena.
+
+        Raises:
+            Exception: El error del trabajador, si falló al procesar una ronda
+        """
+        self._raise_worker_error()
+        start = time.perf_counter()
+        self._queue.put(item)
+        waited = time.perf_counter() - start
+        self.backpressure_s += waited
+        self.metrics.observe("pipeline_backpressure", waited)
+
+    def close(self) -> None:
+        """
+        Espera a que el trabajador procese las rondas pendientes y lo detiene.
+
+        Raises:
+            Exception: El error del trabajador, si falló al procesar una ronda
+        """
+        if self._thread is None:
+            return
+        start = time.perf_counter()
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+        waited = time.perf_counter() - start
+        self.drain_s += waited
+        self.metrics.observe("pipeline_drain", waited)
+        self._raise_worker_error()
+
+    def __enter__(self) -> "RoundPipeline":
+        """Permite usar el pipeline como context manager (arranca el trabajador)."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        """Espera a las rondas pendientes al salir del contexto."""
+        if exc_type is None:
+            self.close()
+            return
+        # No ocultar el error del productor con uno del trabajador
+        try:
+            self.close()
+        except Exception as e:
+            print(f"⚠️ Error del pipeline de rondas tras otro error: {e}")
+
+    # =================================
+    # TRABAJADOR
+    # =================================
+    def _work(self) -> None:
+        """Procesa rondas en orden hasta recibir la señal de parada."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if self._failed:
+                # Tras un fallo se descartan las rondas pendientes
+                continue
+            with self.scope(item):
+                self._process(item)
+
+    def _process(self, item: Any) -> None:
+        """Procesa una ronda y mide su tiempo; guarda el error si falla."""
+        start = time.perf_counter()
+        try:
+            self.process(item)
+            self.processed += 1
+        except Exception as e:
+            self._error = e
+            self._failed = True
+        finally:
+            elapsed = time.perf_counter() - start
+            self.busy_s += elapsed
+            self.metrics.observe("pipeline_process", elapsed)
+
+    def _raise_worker_error(self) -> None:
+        """Propaga en el productor el error del trabajador, si lo hubo."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    # =================================
+    # SOLAPAMIENTO
+    # =================================
+    @property
+    def overlap_s(self) -> float:
+        """Tiempo de procesado que corrió en paralelo con el productor."""
+        return max(0.0, self.busy_s - self.backpressure_s - self.drain_s)
+
+    @property
+    def overlap_ratio(self) -> float:
+        """Fracción del tiempo de procesado oculta tras el productor."""
+        return self.overlap_s / self.busy_s if self.busy_s else 0.0
+
+    def format_report(self) -> str:
+        """Línea con el solapamiento conseguido."""
+        return (
+            f"🔀 Pipeline de rondas: {self.processed} rondas procesadas, "
+            f"{self.overlap_s:.2f}s de {self.busy_s:.2f}s solapados "
+            f"({self.overlap_ratio:.0%}), esperas por cola llena "
+            f"{self.backpressure_s:.2f}s, vaciado final {self.drain_s:.2f}s"
+        )
@@ -0,0 +1,259 @@
+"""
+Planificador adaptativo de rondas de scraping.
+
+Sustituye la regla fija de "3 rondas seguidas sin preguntas nuevas" por una
+estimación del tamaño del banco de preguntas de la categoría. Cada ronda es
+una muestra del banco: las preguntas ya conocidas son "recapturas" y las nuevas
+son "marcadas" por primera vez. Con el estimador de Schnabel (captura-recaptura
+con varias muestras) se estima el tamaño total N y la cobertura actual
+(preguntas conocidas / N), y se sigue scrapeando hasta alcanzar la cobertura
+objetivo, agotar el presupuesto de tiempo o el máximo de rondas.
+
+Con la estimación también se calcula, al estilo del coleccionista de cupones,
+cuántas rondas faltan para la cobertura objetivo suponiendo muestreo uniforme:
+tras k rondas de tamaño C la fracción no vista es (1 - C/N)^k.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+DEFAULT_COVERAGE_TARGET = 0.98
+DEFAULT_MIN_ROUNDS = 3
+DEFAULT_MAX_ROUNDS = 500
+DEFAULT_MAX_FAILED_ROUNDS = 3
+
+
+@dataclass
+class RoundObservation:
+    """Resultado de una ronda para el planificador."""
+
+    round_number: int
+    sampled: int  # preguntas vistas en la ronda
+    new: int  # preguntas nuevas guardadas
+    known_before: int  # preguntas conocidas antes de la ronda
+    elapsed_s: float
+
+    @property
+    def recaptured(self) -> int:
+        """Preguntas de la ronda que ya se conocían."""
+        return self.sampled - self.new
+
+
+@dataclass
+class AdaptiveRoundScheduler:
+    """Decide cuándo dejar de scrapear una categoría."""
+
+    category: str
+    known_questions: int = 0
+    coverage_target: float = DEFAULT_COVERAGE_TARGET
+    time_budget_s: Optional[float] = None
+    min_rounds: int = DEFAULT_MIN_ROUNDS
+    max_rounds: int = DEFAULT_MAX_ROUNDS
+    max_failed_rounds: int = DEFAULT_MAX_FAILED_ROUNDS
+
+    observations: List[RoundObservation] = field(default_factory=list)
+    consecutive_failures: int = 0
+    rounds_started: int = 0
+    stop_reason: Optional[str] = None
+    started_at: float = field(default_factory=time.monotonic)
+
+    # Sumas del estimador de Schnabel: N = sum(C_t * M_t) / (sum(R_t) + 1)
+    _sum_sampled_times_known: float = field(default=0.0, init=False, repr=False)
+    _sum_recaptured: int = field(default=0, init=False, repr=False)
+    _last_round_start: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        """Valida la cobertura objetivo (con 1 el objetivo nunca se alcanza)."""
+        if not 0 < self.coverage_target < 1:
+            raise ValueError(
+                f"La cobertura objetivo debe estar entre 0 y 1 (sin incluirlos): "
+                f"{self.coverage_target}"
+            )
+
+    # =================================
+    # REGISTRO DE RONDAS
+    # =================================
+    def start_round(self) -> int:
+        """Marca el inicio de una ronda y devuelve su número."""
+        self.rounds_started += 1
+        self._last_round_start = time.monotonic()
+        return self.rounds_started
+
+    def record_round(
+        self,
+        sampled: int,
+        new: int,
+        round_number: Optional[int] = None,
+        round_started: Optional[float] = None,
+    ) -> RoundObservation:
+        """
+        Registra una ronda extraída y guardada correctamente.
+
+        Con rondas en pipeline la ronda registrada no es la última empezada:
+        `round_number` y `round_started` (time.monotonic) la identifican.
+        """
+        new = max(0, min(new, sampled))
+        started = round_started or self._last_round_start or self.started_at
+        observation = RoundObservation(
+            round_number=round_number or self.rounds_started,
+            sampled=sampled,
+            new=new,
+            known_before=self.known_questions,
+            elapsed_s=time.monotonic() - started,
+        )
+        self.observations.append(observation)
+        self._sum_sampled_times_known += sampled * self.known_questions
+        self._sum_recaptured += observation.recaptured
+        self.known_questions += new
+        self.consecutive_failures = 0
+        return observation
+
+    def record_failure(self) -> None:
+        """Registra una ronda sin datos o con error al guardar."""
+        self.consecutive_failures += 1
+
+    def restore(self, rounds: List[dict], elapsed_s: float = 0.0) -> None:
+        """
+        Reproduce las rondas de un checkpoint para continuar donde se dejó.
+
+        Args:
+            rounds: Eventos "round"/"failure" del diario, en orden
+            elapsed_s: Tiempo ya consumido del presupuesto de la categoría
+        """
+        for event in rounds:
+            self.rounds_started = event["round"] - 1
+            self.start_round()
+            if event["type"] == "failure":
+                self.record_failure()
+            else:
+                self.record_round(event["sampled"], event["new"])
+        self.started_at = time.monotonic() - elapsed_s
+
+    # =================================
+    # ESTIMACIONES
+    # =================================
+    @property
+    def estimated_population(self) -> Optional[float]:
+        """Tamaño estimado del banco (None hasta tener alguna recaptura)."""
+        if not self.observations or self._sum_recaptured == 0:
+            return None
+        estimate = self._sum_sampled_times_known / (self._sum_recaptured + 1)
+        return max(estimate, float(self.known_questions))
+
+    @property
+    def coverage(self) -> Optional[float]:
+        """Fracción estimada del banco ya conocida."""
+        population = self.estimated_population
+        if not population:
+            return None
+        return min(1.0, self.known_questions / population)
+
+    @property
+    def discovery_rate(self) -> float:
+        """Proporción de preguntas nuevas en las últimas rondas (media móvil)."""
+        recent = self.observations[-3:]
+        sampled = sum(observation.sampled for observation in recent)
+        if not sampled:
+            return 1.0
+        return sum(observation.new for observation in recent) / sampled
+
+    @property
+    def mean_round_size(self) -> float:
+        """Número medio de preguntas por ronda."""
+        if not self.observations:
+            return 0.0
+        return sum(o.sampled for o in self.observations) / len(self.observations)
+
+    def expected_rounds_to_target(self) -> Optional[int]:
+        """
+        Rondas adicionales estimadas para alcanzar la cobertura objetivo.
+
+        Returns:
+            Optional[int]: None si aún no se puede estimar o el objetivo es
+                inalcanzable
+        """
+        population = self.estimated_population
+        coverage = self.coverage
+        round_size = self.mean_round_size
+        if not population or coverage is None or not round_size:
+            return None
+        if not 0 < self.coverage_target < 1:
+            return None
+        if coverage >= self.coverage_target:
+            return 0
+        unseen_per_round = 1 - min(round_size / population, 0.999999)
+        rounds = math.log((1 - self.coverage_target) / (1 - coverage)) / math.log(
+            unseen_per_round
+        )
+        return max(1, math.ceil(rounds))
+
+    @property
+    def elapsed_s(self) -> float:
+        """Segundos desde el inicio de la categoría."""
+        return time.monotonic() - self.started_at
+
+    # =================================
+    # DECISIÓN
+    # =================================
+    def should_continue(self) -> bool:
+        """Indica si hay que lanzar otra ronda (y fija `stop_reason` si no)."""
+        if self.stop_reason:
+            return False
+
+        if self.consecutive_failures >= self.max_failed_rounds:
+            self.stop_reason = f"{self.consecutive_failures} rondas fallidas seguidas"
+        elif self.rounds_started >= self.max_rounds:
+            self.stop_reason = f"máximo de {self.max_rounds} rondas alcanzado"
+        elif self.time_budget_s is not None and self.elapsed_s >= self.time_budget_s:
+            self.stop_reason = (
+                f"presupuesto de tiempo agotado ({self.time_budget_s:.0f}s)"
+            )
+        elif (
+            len(self.observations) >= self.min_rounds
+            and self.coverage is not None
+            and self.coverage >= self.coverage_target
+        ):
+            self.stop_reason = (
+                f"cobertura {self.coverage:.1%} >= objetivo {self.coverage_target:.0%}"
+            )
+
+        return self.stop_reason is None
+
+    # =================================
+    # INFORMES
+    # =================================
+    def format_status(self) -> str:
+        """Línea de estado tras una ronda."""
+        population = self.estimated_population
+        if population is None:
+            return (
+                f"📈 {self.category}: {self.known_questions} conocidas, "
+                "sin recapturas aún (banco sin estimar)"
+            )
+        remaining = self.expected_rounds_to_target()
+        remaining_text = (
+            "rondas para el objetivo sin estimar"
+            if remaining is None
+            else f"~{remaining} rondas para el objetivo"
+        )
+        return (
+            f"📈 {self.category}: {self.known_questions} conocidas de ~{population:.0f} "
+            f"estimadas (cobertura {self.coverage:.1%}, tasa de novedad "
+            f"{self.discovery_rate:.0%}, {remaining_text})"
+        )
+
+    def report(self) -> dict:
+        """Resumen serializable del estado del planificador."""
+        population = self.estimated_population
+        return {
+            "category": self.category,
+            "rounds": self.rounds_started,
+            "known_questions": self.known_questions,
+            "estimated_bank_size": round(population) if population else None,
+            "coverage": round(self.coverage, 4) if self.coverage is not None else None,
+            "discovery_rate": round(self.discovery_rate, 4),
+            "elapsed_s": round(self.elapsed_s, 2),
+            "stop_reason": self.stop_reason,
+        }
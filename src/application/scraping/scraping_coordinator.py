@@ -0,0 +1,212 @@
+"""
+Coordinador del scraping distribuido.
+
+Reparte las rondas de cada categoría entre varias máquinas a través de una
+cola con leases (`MongoRoundQueue`). El coordinador no abre ningún navegador:
+por categoría mantiene una ventana de rondas encoladas, recoge las terminadas
+y se las pasa a su `AdaptiveRoundScheduler`, que decide igual que en local
+cuándo parar. Al parar una categoría se cancelan sus rondas aún no reclamadas;
+las que ya estaban en proceso se recogen igualmente.
+
+Las preguntas las guardan los workers en el almacén compartido (único por
+fingerprint), así que las "nuevas" de cada ronda ya están deduplicadas entre
+máquinas y el estimador de cobertura sigue siendo válido.
+"""
+
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from ...domain.quiz.question_repository import QuestionRepository
+from ...infrastructure.outbound.mongo.mongo_round_queue import (
+    STATUS_DONE,
+    MongoRoundQueue,
+)
+from ...shared.metrics import MetricsRegistry
+from .round_scheduler import AdaptiveRoundScheduler
+
+DEFAULT_WINDOW = 4
+DEFAULT_POLL_S = 2.0
+
+
+def new_run_id() -> str:
+    """ID corto y ordenable de una ejecución distribuida."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+@dataclass
+class CategoryRun:
+    """Estado de una categoría en el coordinador."""
+
+    url: str
+    category: str
+    fetch_mode: str
+    scheduler: AdaptiveRoundScheduler
+    enqueued: int = 0
+    cancelled: bool = False
+
+
+class ScrapingCoordinator:
+    """Encola rondas por categoría y decide cuándo parar con sus resultados."""
+
+    def __init__(
+        self,
+        round_queue: MongoRoundQueue,
+        question_store: QuestionRepository,
+        scheduler_options: Optional[dict] = None,
+        window: int = DEFAULT_WINDOW,
+        poll_s: float = DEFAULT_POLL_S,
+        fetch_mode: str = "selenium",
+        run_id: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Inicializa el coordinador.
+
+        Args:
+            round_queue: Cola de rondas compartida con los workers
+            question_store: Almacén compartido (para las preguntas ya conocidas)
+            scheduler_options: Opciones de `AdaptiveRoundScheduler`
+            window: Rondas encoladas o en proceso por categoría (conviene que
+                sea al menos el número de workers)
+            poll_s: Segundos entre consultas a la cola
+            fetch_mode: Modo de descarga por defecto de las rondas
+            run_id: ID de la ejecución (se genera uno si no se da)
+        """
+        self.round_queue = round_queue
+        self.question_store = question_store
+        self.scheduler_options = scheduler_options or {}
+        self.window = max(1, window)
+        self.poll_s = poll_s
+        self.fetch_mode = fetch_mode
+        self.run_id = run_id or new_run_id()
+        self.metrics = metrics or MetricsRegistry("coordinator")
+
+    def run(self, target_configs: List[dict]) -> Dict[str, dict]:
+        """
+        Coordina las categorías hasta que todas paran.
+
+        Args:
+            target_configs: Configuraciones con 'url', 'category' y
+                opcionalmente 'scheduler' y 'fetch_mode'
+
+        Returns:
+            Dict[str, dict]: Informe del planificador por categoría
+        """
+        runs = [self._create_run(config) for config in target_configs]
+        print(f"🧭 Ejecución distribuida {self.run_id}: {len(runs)} categorías")
+        for category_run in runs:
+            print(
+                f"   - {category_run.category}: {category_run.scheduler.known_questions} "
+                f"preguntas ya conocidas ({category_run.url})"
+            )
+
+        reports: Dict[str, dict] = {}
+        active = list(runs)
+        while active:
+            reaped = self.round_queue.reap_expired(self.run_id)
+            self.metrics.increment("jobs_expired", reaped)
+            for category_run in list(active):
+                if self._step(category_run):
+                    reports[category_run.category] = self._finish(category_run)
+                    active.remove(category_run)
+            if active:
+                time.sleep(self.poll_s)
+        return reports
+
+    def _create_run(self, config: dict) -> CategoryRun:
+        """Crea el estado de una categoría con su planificador."""
+        category = config["category"]
+        options = {**self.scheduler_options, **config.get("scheduler", {})}
+        scheduler = AdaptiveRoundScheduler(
+            category=category,
+            known_questions=self.question_store.count(category),
+            **options,
+        )
+        return CategoryRun(
+            url=config["url"],
+            category=category,
+            fetch_mode=config.get("fetch_mode", self.fetch_mode),
+            scheduler=scheduler,
+        )
+
+    def _step(self, category_run: CategoryRun) -> bool:
+        """
+        Recoge resultados y rellena la ventana de una categoría.
+
+        Returns:
+            bool: True si la categoría ha terminado
+        """
+        scheduler = category_run.scheduler
+        for job in self.round_queue.take_finished(self.run_id, category_run.category):
+            self._record_job(scheduler, job)
+
+        if scheduler.should_continue():
+            in_flight = self.round_queue.in_flight(self.run_id, category_run.category)
+            while (
+                in_flight < self.window and category_run.enqueued < scheduler.max_rounds
+            ):
+                category_run.enqueued += 1
+                self.round_queue.enqueue(
+                    self.run_id,
+                    category_run.category,
+                    category_run.url,
+                    category_run.enqueued,
+                    category_run.fetch_mode,
+                )
+                self.metrics.increment("jobs_enqueued")
+                in_flight += 1
+            return False
+
+        if not category_run.cancelled:
+            cancelled = self.round_queue.cancel_pending(
+                self.run_id, category_run.category
+            )
+            self.metrics.increment("jobs_cancelled", cancelled)
+            category_run.cancelled = True
+        # Las rondas ya reclamadas se esperan: sus preguntas ya se están guardando
+        return self.round_queue.in_flight(self.run_id, category_run.category) == 0
+
+    def _record_job(self, scheduler: AdaptiveRoundScheduler, job: dict) -> None:
+        """Pasa al planificador el resultado de una ronda terminada."""
+        round_number = scheduler.start_round()
+        result = job.get("result") or {}
+        if job["status"] != STATUS_DONE:
+            scheduler.record_failure()
+            self.metrics.increment("jobs_failed")
+            print(
+                f"❌ Ronda {job['round']} de {job['category']} fallida: {job.get('error')}"
+            )
+            return
+
+        scheduler.record_round(
+            result.get("sampled", 0),
+            result.get("new", 0),
+            round_number,
+            time.monotonic() - result.get("duration_s", 0.0),
+        )
+        self.metrics.increment("jobs_done")
+        self.metrics.increment("questions_new", result.get("new", 0))
+        print(
+            f"📥 Ronda {job['round']} de {job['category']} ({result.get('worker')}): "
+            f"{result.get('sampled', 0)} vistas, {result.get('new', 0)} nuevas"
+        )
+        print(scheduler.format_status())
+
+    def _finish(self, category_run: CategoryRun) -> dict:
+        """Imprime y devuelve el informe final de una categoría."""
+        scheduler = category_run.scheduler
+        report = scheduler.report()
+        print(f"🛑 Fin de {scheduler.category}: {scheduler.stop_reason}")
+        if report["estimated_bank_size"] is not None:
+            print(
+                f"📚 Tamaño estimado del banco de {scheduler.category}: ~{report['estimated_bank_size']} preguntas "
+                f"({report['known_questions']} conocidas, cobertura {report['coverage']:.1%})"
+            )
+            self.metrics.set_gauge(
+                f"estimated_bank_size_{scheduler.category}",
+                report["estimated_bank_size"],
+            )
+            self.metrics.set_gauge(f"coverage_{scheduler.category}", report["coverage"])
+        return report
@@ -4,18 +4,88 @@ Este es el punto de entrada desde la capa de presentación.
 """
 
 import os
-from typing import List, Optional
-
-from dotenv import load_dotenv
-
-from ...infrastructure.scraping.data_saver import save_quiz_data_to_json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Set
+
+from ...domain.quiz.question_repository import QuestionRepository
+from ...domain.quiz.quiz_question_model import QuizQuestionModel
+from ...framework.config import load_environment
+from ...infrastructure.scraping.checkpoint_journal import (
+    CategoryCheckpoint,
+    CheckpointJournal,
+)
+from ...infrastructure.scraping.data_saver import (
+    count_saved_questions,
+    save_quiz_data_to_json,
+)
 from ...infrastructure.scraping.driver_config import (
     deny_cookies,
+    is_driver_alive,
     refresh_exam,
     setup_driver,
 )
+from ...infrastructure.scraping.fixture_recorder import RoundRecorder
+from ...infrastructure.scraping.html_element_extractor import AnswersNotRevealedError
+from ...infrastructure.scraping.http_exam_fetcher import HttpExamFetcher
+from ...infrastructure.scraping.image_downloader import (
+    download_jobs,
+    drain_failed_downloads,
+    retry_downloads,
+)
+from ...infrastructure.scraping.rate_controller import (
+    RateController,
+    set_rate_controller,
+)
 from ...shared.create_proyect_structure import create_default_structure
-from .quiz_extractor import QuizExtractionService
+from ...shared.metrics import MetricsRegistry, set_metrics
+from ...shared.profiling import snapshot_round
+from .quiz_extractor import (
+    EXTRACTION_DOM,
+    EXTRACTION_NETWORK,
+    IMAGE_SOURCE_HTTP,
+    QuizExtractionService,
+)
+from .round_pipeline import DEFAULT_PIPELINE_DEPTH, RoundPipeline
+from .round_scheduler import AdaptiveRoundScheduler
+
+# Modos de descarga de las páginas de examen
+FETCH_MODE_SELENIUM = "selenium"
+FETCH_MODE_HTTP = "http"
+FETCH_MODES = (FETCH_MODE_SELENIUM, FETCH_MODE_HTTP)
+
+# Reinicios de Chrome permitidos por categoría antes de abandonarla
+MAX_DRIVER_RESTARTS = 3
+
+
+@dataclass
+class SiteProgress:
+    """Progreso de scraping de un sitio durante la ejecución."""
+
+    url: str
+    category: str
+    scheduler: AdaptiveRoundScheduler
+    questions_found: int = 0
+    seen_fingerprints: Set[str] = field(default_factory=set)
+    pending_images: List[dict] = field(default_factory=list)
+    driver_restarts: int = 0
+    # El examen anterior sigue en pantalla (no cargó el siguiente ni al reabrir)
+    stale_exam: bool = False
+    # Protege planificador, diario y contadores cuando las rondas van en pipeline
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class CapturedRound:
+    """Ronda capturada del DOM pendiente de procesar en el pipeline."""
+
+    round_number: int
+    started_at: float  # time.monotonic() al empezar la ronda
+    raw_questions: Optional[List[dict]]
+    image_jobs: List[dict]
+    metrics_round: Optional[dict]
 
 
 class ScrapingUseCase:
@@ -24,24 +94,87 @@ class ScrapingUseCase:
     Orquesta toda la aplicación desde la perspectiva del usuario.
     """
 
-    def __init__(self):
-        """Inicializa el caso de uso con los servicios necesarios."""
-        self.quiz_extraction_service = QuizExtractionService()
+    def __init__(
+        self,
+        metrics: Optional[MetricsRegistry] = None,
+        metrics_dir: Optional[str] = "data/metrics",
+        prometheus: bool = False,
+        recorder: Optional[RoundRecorder] = None,
+        scheduler_options: Optional[dict] = None,
+        checkpoints: Optional[CheckpointJournal] = None,
+        resume: bool = False,
+        fetch_mode: str = FETCH_MODE_SELENIUM,
+        http_fetcher: Optional[HttpExamFetcher] = None,
+        question_store: Optional[QuestionRepository] = None,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        extraction: str = EXTRACTION_DOM,
+        image_source: str = IMAGE_SOURCE_HTTP,
+        rate_controller: Optional[RateController] = None,
+    ):
+        """
+        Inicializa el caso de uso con los servicios necesarios.
+
+        Args:
+            metrics: Registro de métricas de la ejecución (se crea uno si no se da)
+            metrics_dir: Directorio donde escribir el desglose final (None = no escribir)
+            prometheus: Si es True, escribe también el desglose en formato Prometheus
+            recorder: Grabador de fixtures para reproducir las rondas sin conexión
+            scheduler_options: Opciones de `AdaptiveRoundScheduler` (coverage_target,
+                time_budget_s, max_rounds...); cada sitio puede sobrescribirlas con
+                la clave 'scheduler' de su configuración
+            checkpoints: Diario de progreso por categoría (None = sin checkpoints)
+            resume: Si es True, continúa cada categoría desde su checkpoint
+            fetch_mode: Modo por defecto de descarga ("selenium" o "http"); cada
+                sitio puede elegir el suyo con la clave 'fetch_mode'
+            http_fetcher: Fetcher HTTP del modo "http" (concurrencia, timeouts)
+            question_store: Repositorio donde guardar las preguntas nuevas en lugar
+                de los ficheros JSON (p. ej. SQLite, que deduplica por fingerprint)
+            pipeline_depth: Rondas capturadas que pueden esperar a ser procesadas
+                mientras Chrome carga el siguiente examen (0 = rondas secuenciales)
+            extraction: Fuente de las preguntas en modo Selenium: "dom" o
+                "network" (respuestas de red vía CDP, con vuelta al DOM)
+            image_source: Origen de las imágenes en modo Selenium: "http" o
+                "browser" (bytes ya cargados por Chrome, con vuelta a HTTP)
+            rate_controller: Control AIMD de ritmo y concurrencia por host para
+                rondas y descargas de imágenes (None = sin límites)
+        """
+        self.metrics = metrics or MetricsRegistry("scraping")
+        self.metrics_dir = metrics_dir
+        self.prometheus = prometheus
+        self.quiz_extraction_service = QuizExtractionService(
+            self.metrics, extraction, image_source
+        )
+        self.network_capture = extraction == EXTRACTION_NETWORK
+        self.recorder = recorder
+        self.scheduler_options = scheduler_options or {}
+        self.checkpoints = checkpoints
+        self.resume = resume
+        self.fetch_mode = fetch_mode
+        self.http_fetcher = http_fetcher or HttpExamFetcher()
+        self.question_store = question_store
+        self.pipeline_depth = pipeline_depth
+        self.rate_controller = rate_controller
+        self._driver = None
 
     def execute(self, target_configs: Optional[List[dict]] = None) -> bool:
         """
         Ejecuta el proceso completo de scraping para múltiples URLs.
 
         Args:
-            target_configs: Lista de configuraciones con 'url' y 'category' (opcional)
+            target_configs: Lista de configuraciones con 'url', 'category' y
+                opcionalmente 'scheduler' (opciones del planificador de rondas) y
+                'fetch_mode' ("selenium" o "http")
 
         Returns:
             bool: True si el scraping fue exitoso, False en caso contrario
         """
+        # Las funciones instrumentadas de infraestructura usan el registro actual
+        previous_metrics = set_metrics(self.metrics)
+        previous_controller = set_rate_controller(self.rate_controller)
         try:
             # 1. Configuración inicial
             create_default_structure()
-            load_dotenv()
+            load_environment()
 
             # 2. Configurar URLs y categorías
             if not target_configs:
@@ -85,7 +218,7 @@ class ScrapingUseCase:
                 print(f"🌐 URL: {url}")
                 print(f"{'=' * 60}")
 
-                site_success = self._process_single_site(url, category)
+                site_success = self._process_single_site(url, category, config)
 
                 if site_success["success"]:
                     questions_found = site_success["questions_count"]
@@ -119,85 +252,622 @@ class ScrapingUseCase:
         except Exception as e:
             print(f"❌ Error durante el scraping general: {str(e)}")
             return False
-
-    def _process_single_site(self, url: str, category: str) -> dict:
+        finally:
+            self._close_driver()
+            self.http_fetcher.close()
+            self._report_metrics()
+            set_rate_controller(previous_controller)
+            set_metrics(previous_metrics)
+
+    def _report_metrics(self) -> None:
+        """Imprime el desglose final por etapa y lo guarda en disco."""
+        if not self.metrics.stages:
+            return
+
+        print(f"\n{'=' * 60}")
+        print("⏱️ DESGLOSE DE TIEMPOS POR ETAPA")
+        print(f"{'=' * 60}")
+        print(self.metrics.format_summary())
+        if self.rate_controller is not None:
+            print(self.rate_controller.format_report())
+
+        if self.metrics_dir:
+            try:
+                path = self.metrics.write(self.metrics_dir, self.prometheus)
+                print(f"📈 Métricas guardadas en: {path}")
+            except OSError as e:
+                print(f"⚠️ No se pudieron guardar las métricas: {e}")
+
+    def _process_single_site(
+        self, url: str, category: str, config: Optional[dict] = None
+    ) -> dict:
         """
         Procesa un solo sitio web para scraping.
 
+        El número de rondas lo decide `AdaptiveRoundScheduler` a partir de la
+        cobertura estimada del banco de la categoría. Con diario de checkpoints
+        cada ronda queda registrada en disco y, en modo `resume`, se continúa
+        desde la última ronda registrada. Si Chrome se cae durante una ronda, el
+        driver se reinicia y la ronda se repite sin contarla como fallida.
+
+        Con `fetch_mode` "http" las rondas se descargan sin navegador y en
+        paralelo; si el HTML no revela las respuestas se sigue con Selenium.
+
+        Con `--profile` se toma una instantánea de memoria al empezar el sitio
+        y al cerrar cada ronda (`snapshot_round`) para detectar fugas.
+
         Returns:
-            dict: {'success': bool, 'questions_count': int}
+            dict: {'success': bool, 'questions_count': int, 'scheduler': dict}
         """
+        progress = SiteProgress(
+            url=url,
+            category=category,
+            scheduler=self._create_scheduler(category, config or {}),
+        )
+        checkpoint = self._load_checkpoint(url, category, progress.scheduler)
+        if checkpoint is not None:
+            if checkpoint.done:
+                print(f"⏭️ {category} ya estaba completada según el checkpoint")
+                return {
+                    "success": True,
+                    "questions_count": checkpoint.new_questions,
+                    "scheduler": checkpoint.report,
+                }
+            progress.questions_found = checkpoint.new_questions
+            progress.seen_fingerprints = set(checkpoint.seen_fingerprints)
+            progress.pending_images = list(checkpoint.pending_images)
+
+        scheduler = progress.scheduler
+        fetch_mode = (config or {}).get("fetch_mode", self.fetch_mode)
+        # Con --profile, referencia de memoria para comparar las rondas
+        snapshot_round(f"{category} inicio")
+        try:
+            self._retry_pending_images(progress)
+
+            print(
+                f"🔄 Iniciando scraping adaptativo para {category} "
+                f"({scheduler.known_questions} preguntas ya conocidas, "
+                f"cobertura objetivo {scheduler.coverage_target:.0%}, modo {fetch_mode})"
+            )
+            if fetch_mode != FETCH_MODE_HTTP or not self._run_http_rounds(progress):
+                self._run_selenium_rounds(progress)
+
+            self._retry_pending_images(progress)
+
+            self._report_scheduler(scheduler)
+            report = scheduler.report()
+            if self.checkpoints is not None:
+                self.checkpoints.finish(category, report)
+            return {
+                "success": True,
+                "questions_count": progress.questions_found,
+                "scheduler": report,
+            }
+
+        except Exception as e:
+            print(f"❌ Error durante el scraping de {category}: {str(e)}")
+            if self.checkpoints is not None:
+                print(
+                    f"💾 Progreso guardado en {self.checkpoints.path(category)} (usa --resume para continuar)"
+                )
+            return {
+                "success": False,
+                "questions_count": progress.questions_found,
+                "scheduler": scheduler.report(),
+            }
+        finally:
+            self._end_round()
+
+    def _run_selenium_rounds(self, progress: SiteProgress) -> None:
+        """Ejecuta las rondas del sitio con Chrome hasta que pare el planificador."""
         driver = None
         try:
-            # 1. Configurar infraestructura (driver)
-            driver = setup_driver()
+            # 1. Configurar infraestructura (driver, compartido entre sitios)
+            with self.metrics.timer("driver_setup"):
+                driver = self._acquire_driver()
 
             # 2. Navegar y preparar página
-            driver.get(url)
-            deny_cookies(driver)
+            with self.metrics.timer("initial_navigation"):
+                driver.get(progress.url)
+                deny_cookies(driver)
 
-            # 3. Bucle principal de scraping hasta que no haya preguntas nuevas
-            consecutive_empty_rounds = 0
-            max_empty_rounds = 3
-            total_questions_found = 0
-            round_number = 1
+            # 3. Bucle principal de scraping hasta alcanzar la cobertura objetivo
+            if self.pipeline_depth > 0:
+                driver = self._run_pipelined_rounds(driver, progress)
+            else:
+                while progress.scheduler.should_continue():
+                    driver = self._run_round(driver, progress)
+        finally:
+            # El driver (quizá reiniciado) se reutiliza en el siguiente sitio
+            self._driver = driver
 
-            print(
-                f"🔄 Iniciando scraping continuo para {category} (máximo {max_empty_rounds} rondas consecutivas sin nuevas preguntas)"
+    def _run_http_rounds(self, progress: SiteProgress) -> bool:
+        """
+        Ejecuta las rondas del sitio por HTTP, varias a la vez.
+
+        Cada tanda lanza tantas rondas como la concurrencia del fetcher; las
+        rondas se guardan y se pasan al planificador según van terminando.
+
+        Returns:
+            bool: False si el HTML no revela las respuestas (hay que usar Selenium)
+        """
+        scheduler = progress.scheduler
+        category = progress.category
+        if self.recorder is not None:
+            print("⚠️ La grabación de fixtures solo está disponible en modo selenium")
+
+        def process(page) -> Optional[List[QuizQuestionModel]]:
+            return self.quiz_extraction_service.extract_quiz_data_from_html(
+                page.html, page.final_url, category
             )
 
-            while consecutive_empty_rounds < max_empty_rounds:
-                print(f"\n--- RONDA {round_number} - {category.upper()} ---")
+        try:
+            while scheduler.should_continue():
+                rounds = self.http_fetcher.fetch_rounds(
+                    progress.url, self.http_fetcher.concurrency, process
+                )
+                try:
+                    for quiz_data in rounds:
+                        if not scheduler.should_continue():
+                            break
+                        self._save_http_round(progress, quiz_data)
+                finally:
+                    rounds.close()
+        except AnswersNotRevealedError as e:
+            self._end_round()
+            print(f"↩️ {e}: se vuelve a Selenium para {category}")
+            self.metrics.increment("http_fallbacks")
+            drain_failed_downloads()
+            return False
+        return True
+
+    def _save_http_round(
+        self, progress: SiteProgress, quiz_data: Optional[List[QuizQuestionModel]]
+    ) -> None:
+        """Guarda una ronda descargada por HTTP y la registra en el planificador."""
+        scheduler = progress.scheduler
+        round_number = scheduler.start_round()
+        print(f"\n--- RONDA {round_number} - {progress.category.upper()} (HTTP) ---")
+        self.metrics.start_round(progress.category, round_number)
+        self._store_round(progress, round_number, quiz_data)
+        self._end_round()
+
+    def _save_questions(self, quiz_data: List[QuizQuestionModel], category: str) -> int:
+        """
+        Guarda una ronda en el almacén configurado.
+
+        Returns:
+            int: Número de preguntas nuevas guardadas (-1 si hay error)
+        """
+        if self.question_store is None:
+            return save_quiz_data_to_json(quiz_data, category)
+
+        try:
+            with self.metrics.timer("store_write"):
+                saved = self.question_store.add_questions(quiz_data)
+        except Exception as e:
+            print(f"❌ Error al guardar datos en {self.question_store}: {e}")
+            return -1
+        self.metrics.increment("questions_duplicate", len(quiz_data) - saved)
+        self.metrics.increment("questions_new", saved)
+        print(f"✅ Guardadas {saved} preguntas nuevas de {category}")
+        return saved
+
+    def _run_round(self, driver, progress: SiteProgress):
+        """
+        Ejecuta una ronda completa: extraer, guardar, registrar y refrescar.
+
+        Returns:
+            El driver en uso (puede ser uno nuevo si Chrome se reinició)
+        """
+        scheduler = progress.scheduler
+        category = progress.category
+        round_number = scheduler.start_round()
+        print(f"\n--- RONDA {round_number} - {category.upper()} ---")
+        self.metrics.start_round(category, round_number)
+
+        # Extraer datos usando el servicio de aplicación
+        driver, quiz_data = self._extract_round(driver, progress)
+
+        if quiz_data and self.recorder is not None:
+            with self.metrics.timer("record_fixture"):
+                self.recorder.record_round(driver, category, round_number)
+
+        # Guardar resultados (sin datos cuenta como ronda fallida)
+        self._store_round(progress, round_number, quiz_data)
+
+        if quiz_data:
+            self._next_exam(driver, progress)
+        self._end_round()
+        return driver
 
-                # Extraer datos usando el servicio de aplicación
-                quiz_data = self.quiz_extraction_service.extract_quiz_data(
-                    driver, category
+    def _run_pipelined_rounds(self, driver, progress: SiteProgress):
+        """
+        Ejecuta las rondas solapando la carga del examen con el procesado.
+
+        En cuanto se captura el DOM de una ronda, el driver pasa al siguiente
+        examen mientras el hilo de `RoundPipeline` la valida, deduplica,
+        descarga sus imágenes y la guarda. El planificador decide con las
+        rondas ya procesadas, así que puede haber hasta `pipeline_depth` rondas
+        más que en modo secuencial (nunca más de `max_rounds`).
+
+        Returns:
+            El driver en uso (puede ser uno nuevo si Chrome se reinició)
+        """
+        pipeline = RoundPipeline(
+            lambda captured: self._process_captured_round(progress, captured),
+            self.pipeline_depth,
+            self.metrics,
+            self._captured_round_scope,
+        )
+        try:
+            with pipeline:
+                while True:
+                    with progress.lock:
+                        if not progress.scheduler.should_continue():
+                            break
+                    driver, captured = self._capture_round(driver, progress)
+                    pipeline.submit(captured)
+                    if captured.raw_questions:
+                        self._next_exam(driver, progress)
+        finally:
+            self._report_pipeline(pipeline)
+        return driver
+
+    def _capture_round(self, driver, progress: SiteProgress):
+        """
+        Captura el DOM de una ronda sin procesarla (productor del pipeline).
+
+        Returns:
+            tuple: (driver en uso, CapturedRound)
+        """
+        category = progress.category
+        with progress.lock:
+            round_number = progress.scheduler.start_round()
+        started_at = time.monotonic()
+        print(f"\n--- RONDA {round_number} - {category.upper()} ---")
+        self.metrics.start_round(category, round_number)
+
+        image_jobs: List[dict] = []
+        driver, raw_questions = self._extract_round(driver, progress, image_jobs)
+        if raw_questions and self.recorder is not None:
+            with self.metrics.timer("record_fixture"):
+                self.recorder.record_round(driver, category, round_number)
+
+        captured = CapturedRound(
+            round_number=round_number,
+            started_at=started_at,
+            raw_questions=raw_questions,
+            image_jobs=image_jobs,
+            metrics_round=self.metrics.detach_round(),
+        )
+        return driver, captured
+
+    @contextmanager
+    def _captured_round_scope(self, captured: CapturedRound) -> Iterator[None]:
+        """
+        Acumula en la ronda capturada lo que el trabajador mide de ella.
+
+        Envuelve el procesado y la medida de `pipeline_process` del pipeline;
+        la ronda se cierra al final, aún dentro de su ámbito, para que nada de
+        lo medido caiga en la ronda que el productor tenga abierta.
+        """
+        with self.metrics.round_scope(captured.metrics_round):
+            yield
+            self._end_round(captured.metrics_round)
+
+    def _process_captured_round(
+        self, progress: SiteProgress, captured: CapturedRound
+    ) -> None:
+        """Valida, guarda y registra una ronda capturada (trabajador del pipeline)."""
+        quiz_data = None
+        if captured.raw_questions:
+            quiz_data = self.quiz_extraction_service.build_quiz_data(
+                captured.raw_questions, progress.category
+            )
+        if quiz_data:
+            download_jobs(captured.image_jobs)
+        self._store_round(
+            progress, captured.round_number, quiz_data, captured.started_at
+        )
+
+    def _report_pipeline(self, pipeline: RoundPipeline) -> None:
+        """Imprime y registra en métricas el solapamiento del pipeline."""
+        if not pipeline.processed:
+            return
+        print(pipeline.format_report())
+        self.metrics.increment("pipeline_overlap_s", pipeline.overlap_s)
+        self.metrics.increment("pipeline_busy_s", pipeline.busy_s)
+        total_busy = self.metrics.counters["pipeline_busy_s"]
+        self.metrics.set_gauge(
+            "pipeline_overlap_ratio",
+            self.metrics.counters["pipeline_overlap_s"] / total_busy,
+        )
+
+    def _store_round(
+        self,
+        progress: SiteProgress,
+        round_number: int,
+        quiz_data: Optional[List[QuizQuestionModel]],
+        started_at: Optional[float] = None,
+    ) -> None:
+        """Guarda una ronda y la registra; sin datos o con error cuenta como fallida."""
+        category = progress.category
+        new_questions_count = -1
+        if quiz_data:
+            with self.metrics.timer("save"):
+                new_questions_count = self._save_questions(quiz_data, category)
+
+        with progress.lock:
+            if new_questions_count >= 0:
+                self._record_saved_round(
+                    progress, round_number, quiz_data, new_questions_count, started_at
                 )
+                return
+
+            scheduler = progress.scheduler
+            scheduler.record_failure()
+            self._journal_failure(category, round_number, scheduler)
+            reason = (
+                "Error al guardar datos"
+                if quiz_data
+                else "No se pudieron extraer datos"
+            )
+            print(
+                f"⚠️ Ronda {round_number}: {reason} para {category} (intento {scheduler.consecutive_failures}/{scheduler.max_failed_rounds})"
+            )
 
-                if not quiz_data:
-                    # No se pudieron extraer datos - contar como ronda vacía
-                    consecutive_empty_rounds += 1
-                    print(
-                        f"⚠️ No se pudieron extraer datos (intento {consecutive_empty_rounds}/{max_empty_rounds})"
-                    )
-                    round_number += 1
-                    continue
+    def _record_saved_round(
+        self,
+        progress: SiteProgress,
+        round_number: int,
+        quiz_data: List[QuizQuestionModel],
+        new_questions_count: int,
+        started_at: Optional[float] = None,
+    ) -> None:
+        """Actualiza planificador, diario e índice tras guardar una ronda."""
+        scheduler = progress.scheduler
+        category = progress.category
+        scheduler.record_round(
+            len(quiz_data), new_questions_count, round_number, started_at
+        )
+        progress.questions_found += new_questions_count
+        failed_images = drain_failed_downloads()
+        progress.pending_images.extend(failed_images)
+
+        if self.checkpoints is not None:
+            fingerprints = [
+                question.fingerprint
+                for question in quiz_data
+                if question.fingerprint not in progress.seen_fingerprints
+            ]
+            progress.seen_fingerprints.update(fingerprints)
+            self.checkpoints.record_round(
+                category,
+                round_number,
+                len(quiz_data),
+                new_questions_count,
+                fingerprints,
+                failed_images,
+                scheduler.elapsed_s,
+            )
 
-                # Guardar resultados
-                new_questions_count = save_quiz_data_to_json(quiz_data, category)
+        if new_questions_count > 0:
+            print(
+                f"✅ Ronda {round_number}: {new_questions_count} preguntas nuevas encontradas para {category}"
+            )
+        else:
+            print(
+                f"ℹ️ Ronda {round_number}: No se encontraron preguntas nuevas para {category}"
+            )
+        print(scheduler.format_status())
 
-                if new_questions_count > 0:
-                    # Se encontraron preguntas nuevas - resetear contador
-                    consecutive_empty_rounds = 0
-                    total_questions_found += new_questions_count
-                    print(
-                        f"✅ Ronda {round_number}: {new_questions_count} preguntas nuevas encontradas para {category}"
-                    )
-                elif new_questions_count == 0:
-                    # No hay preguntas nuevas - incrementar contador
-                    consecutive_empty_rounds += 1
-                    print(
-                        f"ℹ️ Ronda {round_number}: No se encontraron preguntas nuevas para {category} (intento {consecutive_empty_rounds}/{max_empty_rounds})"
-                    )
-                else:
-                    # Error al guardar (-1) - contar como ronda vacía
-                    consecutive_empty_rounds += 1
-                    print(
-                        f"❌ Ronda {round_number}: Error al guardar datos para {category} (intento {consecutive_empty_rounds}/{max_empty_rounds})"
-                    )
+    def _load_checkpoint(
+        self, url: str, category: str, scheduler: AdaptiveRoundScheduler
+    ) -> Optional[CategoryCheckpoint]:
+        """
+        Prepara el diario de la categoría.
 
-                round_number += 1
-                refresh_exam(driver)
+        En modo `resume` reproduce el checkpoint existente en el planificador;
+        en otro caso empieza un diario nuevo.
+        """
+        if self.checkpoints is None:
+            return None
+
+        checkpoint = self.checkpoints.load(category) if self.resume else None
+        if checkpoint is None or checkpoint.url != url:
+            self.checkpoints.start(category, url, scheduler.known_questions)
+            return None
+        if checkpoint.done:
+            return checkpoint
+
+        saved_questions = scheduler.known_questions
+        scheduler.known_questions = checkpoint.known_at_start
+        scheduler.restore(checkpoint.rounds, checkpoint.elapsed_s)
+        if scheduler.known_questions != saved_questions:
+            print(
+                f"⚠️ El checkpoint registra {scheduler.known_questions} preguntas y el fichero tiene {saved_questions}; se usa el fichero"
+            )
+            scheduler.known_questions = saved_questions
+
+        print(
+            f"♻️ Reanudando {category} tras la ronda {checkpoint.last_round} "
+            f"({checkpoint.new_questions} preguntas nuevas, "
+            f"{len(checkpoint.seen_fingerprints)} distintas vistas, "
+            f"{checkpoint.elapsed_s:.0f}s consumidos)"
+        )
+        return checkpoint
+
+    def _extract_round(
+        self, driver, progress: SiteProgress, image_jobs: Optional[List[dict]] = None
+    ):
+        """
+        Extrae las preguntas de la ronda actual.
 
-            return {"success": True, "questions_count": total_questions_found}
+        Si la extracción falla porque Chrome ya no responde, reinicia el driver
+        en la URL del sitio y repite la extracción dentro de la misma ronda.
+        Si el examen anterior no se pudo renovar, vuelve a abrir la URL y, si
+        tampoco carga, no extrae nada (la ronda cuenta como fallida).
 
+        Args:
+            image_jobs: Si se da, solo se captura el DOM (datos en bruto) y las
+                imágenes quedan anotadas en la lista para el pipeline
+
+        Returns:
+            tuple: (driver en uso, preguntas extraídas (o en bruto) o None)
+        """
+        quiz_data = None
+        # Un examen que no se renovó repetiría las mismas preguntas: la ronda
+        # cuenta como fallida en lugar de medirse como recaptura
+        if not progress.stale_exam or self._reload_exam(driver, progress):
+            quiz_data = self._extract_once(driver, progress.category, image_jobs)
+
+        while (
+            not quiz_data
+            and progress.driver_restarts < MAX_DRIVER_RESTARTS
+            and not is_driver_alive(driver)
+        ):
+            progress.driver_restarts += 1
+            # Las descargas de la extracción abortada no pertenecen a ninguna ronda
+            # (en el pipeline los fallos pendientes son del trabajador)
+            if image_jobs is None:
+                drain_failed_downloads()
+            driver = self._restart_driver(
+                driver, progress.url, progress.driver_restarts
+            )
+            progress.stale_exam = False
+            quiz_data = self._extract_once(driver, progress.category, image_jobs)
+
+        return driver, quiz_data
+
+    def _next_exam(self, driver, progress: SiteProgress) -> None:
+        """Pasa al siguiente examen; si no carga, reabre la URL del sitio."""
+        with self.metrics.timer("refresh_exam"):
+            if refresh_exam(driver):
+                return
+            self.metrics.increment("refresh_failures")
+            self._reload_exam(driver, progress)
+
+    def _reload_exam(self, driver, progress: SiteProgress) -> bool:
+        """
+        Abre de nuevo la URL del sitio, que sirve un examen nuevo.
+
+        Returns:
+            bool: False si tampoco cargó (el examen anterior sigue en pantalla)
+        """
+        print(f"↩️ Reabriendo {progress.url} para cargar un examen nuevo...")
+        try:
+            driver.get(progress.url)
+            deny_cookies(driver)
+            progress.stale_exam = False
         except Exception as e:
-            print(f"❌ Error durante el scraping de {category}: {str(e)}")
-            return {"success": False, "questions_count": 0}
-        finally:
-            # Limpiar recursos
-            if driver:
-                driver.quit()
+            print(f"⚠️ No se pudo reabrir el examen de {progress.category}: {e}")
+            progress.stale_exam = True
+        return not progress.stale_exam
+
+    def _extract_once(
+        self, driver, category: str, image_jobs: Optional[List[dict]] = None
+    ):
+        """Un intento de extracción completa o, con `image_jobs`, de captura."""
+        with self.metrics.timer("extract_quiz"):
+            if image_jobs is None:
+                return self.quiz_extraction_service.extract_quiz_data(driver, category)
+            image_jobs.clear()
+            return self.quiz_extraction_service.capture_quiz_data(
+                driver, category, image_jobs
+            )
+
+    def _journal_failure(
+        self, category: str, round_number: int, scheduler: AdaptiveRoundScheduler
+    ) -> None:
+        """Registra una ronda fallida en el diario."""
+        if self.checkpoints is not None:
+            self.checkpoints.record_failure(category, round_number, scheduler.elapsed_s)
+
+    def _retry_pending_images(self, progress: SiteProgress) -> None:
+        """Reintenta las descargas de imágenes pendientes y actualiza el diario."""
+        if not progress.pending_images:
+            return
+        with self.metrics.timer("image_retry"):
+            progress.pending_images = retry_downloads(progress.pending_images)
+        if self.checkpoints is not None:
+            self.checkpoints.record_pending_images(
+                progress.category, progress.pending_images
+            )
+
+    def _acquire_driver(self):
+        """Devuelve el driver de la ejecución, creándolo si no existe o no responde."""
+        if self._driver is not None and is_driver_alive(self._driver):
+            return self._driver
+        self._close_driver()
+        self._driver = setup_driver(self.network_capture)
+        return self._driver
+
+    def _close_driver(self) -> None:
+        """Cierra el driver de la ejecución."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
+
+    def _restart_driver(self, driver, url: str, attempt: int):
+        """Sustituye un driver caído por uno nuevo en la misma URL."""
+        print(
+            f"♻️ Chrome no responde, reiniciando el driver ({attempt}/{MAX_DRIVER_RESTARTS})..."
+        )
+        self.metrics.increment("driver_restarts")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self.metrics.timer("driver_restart"):
+            driver = setup_driver(self.network_capture)
+            driver.get(url)
+            deny_cookies(driver)
+        return driver
+
+    def _create_scheduler(self, category: str, config: dict) -> AdaptiveRoundScheduler:
+        """Crea el planificador con las opciones globales y las del sitio."""
+        options = {**self.scheduler_options, **config.get("scheduler", {})}
+        return AdaptiveRoundScheduler(
+            category=category,
+            known_questions=(
+                count_saved_questions(category)
+                if self.question_store is None
+                else self.question_store.count(category)
+            ),
+            **options,
+        )
+
+    def _report_scheduler(self, scheduler: AdaptiveRoundScheduler) -> None:
+        """Imprime y registra en métricas el resultado del planificador."""
+        report = scheduler.report()
+        print(f"🛑 Fin de {scheduler.category}: {scheduler.stop_reason}")
+        if report["estimated_bank_size"] is not None:
+            print(
+                f"📚 Tamaño estimado del banco de {scheduler.category}: ~{report['estimated_bank_size']} preguntas "
+                f"({report['known_questions']} conocidas, cobertura {report['coverage']:.1%})"
+            )
+            self.metrics.set_gauge(
+                f"estimated_bank_size_{scheduler.category}",
+                report["estimated_bank_size"],
+            )
+            self.metrics.set_gauge(f"coverage_{scheduler.category}", report["coverage"])
+
+    def _end_round(self, round_data: Optional[dict] = None) -> None:
+        """Cierra la ronda de métricas actual (o la dada) e imprime su desglose."""
+        round_data = self.metrics.end_round(round_data)
+        if round_data:
+            snapshot_round(f"{round_data['category']} ronda {round_data['round']}")
+            print(self.metrics.format_round(round_data))
+            saved = round_data["counters"].get("wait_saved_s")
+            if saved is not None:
+                print(
+                    f"⚡ Esperas por eventos: {saved:+.2f}s frente a las pausas fijas"
+                )
 
     def _get_site_success(self, config: dict) -> bool:
         """Helper method para obtener el éxito de un sitio (placeholder)."""
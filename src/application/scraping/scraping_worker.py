@@ -0,0 +1,289 @@
+"""
+Worker del scraping distribuido.
+
+Reclama rondas de la cola compartida (`MongoRoundQueue`), las extrae con su
+propio Chrome (o por HTTP, con vuelta a Chrome si el HTML no revela las
+respuestas), guarda las preguntas en el almacén compartido y devuelve a la cola
+las estadísticas de la ronda (vistas, nuevas, duración) para el coordinador.
+
+Mientras procesa una ronda, un hilo renueva el lease cada tercio de su
+duración; si el worker muere, el lease caduca y otra máquina repite la ronda.
+Guardar es idempotente (único por fingerprint), así que repetir una ronda no
+duplica preguntas.
+
+Las imágenes se guardan en el directorio de assets de cada máquina.
+"""
+
+import os
+import socket
+import threading
+import time
+from typing import List, Optional
+
+from ...domain.quiz.question_repository import QuestionRepository
+from ...domain.quiz.quiz_question_model import QuizQuestionModel
+from ...infrastructure.outbound.mongo.mongo_round_queue import (
+    DEFAULT_LEASE_S,
+    MongoRoundQueue,
+)
+from ...infrastructure.scraping.driver_config import (
+    deny_cookies,
+    is_driver_alive,
+    setup_driver,
+)
+from ...infrastructure.scraping.html_element_extractor import AnswersNotRevealedError
+from ...infrastructure.scraping.http_exam_fetcher import HttpExamFetcher
+from ...infrastructure.scraping.image_downloader import (
+    drain_failed_downloads,
+    retry_downloads,
+)
+from ...infrastructure.scraping.rate_controller import (
+    KIND_PAGE,
+    RateController,
+    rate_limited,
+    set_rate_controller,
+)
+from ...shared.create_proyect_structure import create_default_structure
+from ...shared.metrics import MetricsRegistry, set_metrics
+from .quiz_extractor import EXTRACTION_DOM, EXTRACTION_NETWORK, QuizExtractionService
+
+DEFAULT_IDLE_TIMEOUT_S = 60.0
+DEFAULT_POLL_S = 2.0
+
+
+def default_worker_id() -> str:
+    """ID del worker: máquina y proceso."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseHeartbeat:
+    """Hilo que renueva el lease de una ronda mientras se procesa."""
+
+    def __init__(
+        self, round_queue: MongoRoundQueue, job: str, worker_id: str, lease_s: float
+    ):
+        """Prepara la renovación del lease de `job` cada `lease_s / 3` segundos."""
+        self.round_queue = round_queue
+        self.job = job
+        self.worker_id = worker_id
+        self.lease_s = lease_s
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._beat, name=f"heartbeat-{job}", daemon=True
+        )
+
+    def _beat(self) -> None:
+        """Renueva el lease hasta que se pare o se pierda."""
+        while not self._stop.wait(self.lease_s / 3):
+            try:
+                if not self.round_queue.heartbeat(
+                    self.job, self.worker_id, self.lease_s
+                ):
+                    self.lost = True
+                    return
+            except Exception as e:
+                # Un fallo puntual de red no pierde el lease hasta que caduque
+                print(f"⚠️ No se pudo renovar el lease de {self.job}: {e}")
+
+    def __enter__(self):
+        """Permite usar el latido como context manager (arranca el hilo)."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Detiene el latido al salir del contexto."""
+        self._stop.set()
+        self._thread.join()
+
+
+class ScrapingWorker:
+    """Procesa rondas de la cola compartida hasta quedarse sin trabajo."""
+
+    def __init__(
+        self,
+        round_queue: MongoRoundQueue,
+        question_store: QuestionRepository,
+        worker_id: Optional[str] = None,
+        lease_s: float = DEFAULT_LEASE_S,
+        idle_timeout_s: Optional[float] = DEFAULT_IDLE_TIMEOUT_S,
+        poll_s: float = DEFAULT_POLL_S,
+        run_id: Optional[str] = None,
+        extraction: str = EXTRACTION_DOM,
+        http_fetcher: Optional[HttpExamFetcher] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        rate_controller: Optional[RateController] = None,
+    ):
+        """
+        Inicializa el worker.
+
+        Args:
+            round_queue: Cola de rondas compartida con el coordinador
+            question_store: Almacén compartido donde guardar las preguntas
+            worker_id: ID del worker (máquina:pid si no se da)
+            lease_s: Duración del lease de cada ronda
+            idle_timeout_s: Segundos sin rondas antes de terminar (None = nunca)
+            poll_s: Segundos entre intentos de reclamar cuando no hay rondas
+            run_id: Reclamar solo rondas de esta ejecución (None = cualquiera)
+            extraction: "dom" o "network" (ver `QuizExtractionService`)
+            http_fetcher: Fetcher de las rondas con fetch_mode "http"
+            rate_controller: Control AIMD de ritmo por host (None = sin límites)
+        """
+        self.round_queue = round_queue
+        self.question_store = question_store
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_s = lease_s
+        self.idle_timeout_s = idle_timeout_s
+        self.poll_s = poll_s
+        self.run_id = run_id
+        self.metrics = metrics or MetricsRegistry("worker")
+        self.quiz_extraction_service = QuizExtractionService(self.metrics, extraction)
+        self.network_capture = extraction == EXTRACTION_NETWORK
+        self.http_fetcher = http_fetcher or HttpExamFetcher()
+        self.rate_controller = rate_controller
+        self.pending_images: List[dict] = []
+        self._driver = None
+
+    def run(self) -> int:
+        """
+        Procesa rondas hasta superar el tiempo de espera sin trabajo.
+
+        Returns:
+            int: Rondas completadas
+        """
+        previous_metrics = set_metrics(self.metrics)
+        previous_controller = set_rate_controller(self.rate_controller)
+        completed = 0
+        try:
+            create_default_structure()
+            print(f"👷 Worker {self.worker_id} esperando rondas...")
+            idle_since = time.monotonic()
+            while True:
+                job = self.round_queue.claim(self.worker_id, self.lease_s, self.run_id)
+                if job is None:
+                    if self._idle_expired(idle_since):
+                        print(
+                            f"💤 Sin rondas en {self.idle_timeout_s:.0f}s, terminando"
+                        )
+                        break
+                    time.sleep(self.poll_s)
+                    continue
+                completed += self.process_job(job)
+                idle_since = time.monotonic()
+        finally:
+            if self.pending_images:
+                with self.metrics.timer("image_retry"):
+                    self.pending_images = retry_downloads(self.pending_images)
+            self._close_driver()
+            self.http_fetcher.close()
+            set_rate_controller(previous_controller)
+            set_metrics(previous_metrics)
+        return completed
+
+    def _idle_expired(self, idle_since: float) -> bool:
+        """Indica si se superó el tiempo de espera sin rondas."""
+        return (
+            self.idle_timeout_s is not None
+            and time.monotonic() - idle_since >= self.idle_timeout_s
+        )
+
+    def process_job(self, job: dict) -> bool:
+        """
+        Extrae, guarda y completa una ronda reclamada.
+
+        Returns:
+            bool: True si la ronda se completó
+        """
+        job_id = job["_id"]
+        category = job["category"]
+        if job["attempts"] > 1:
+            self.metrics.increment("leases_reclaimed")
+        print(
+            f"\n--- RONDA {job['round']} - {category.upper()} "
+            f"(intento {job['attempts']}, {job_id}) ---"
+        )
+        self.metrics.start_round(category, job["round"])
+        start = time.monotonic()
+        try:
+            with LeaseHeartbeat(
+                self.round_queue, job_id, self.worker_id, self.lease_s
+            ) as heartbeat:
+                quiz_data = self._extract(job)
+                if not quiz_data:
+                    self.round_queue.fail(job_id, self.worker_id, "ronda sin preguntas")
+                    return False
+                with self.metrics.timer("store_write"):
+                    new = self.question_store.add_questions(quiz_data)
+                failed_images = drain_failed_downloads()
+                self.pending_images.extend(failed_images)
+            result = {
+                "worker": self.worker_id,
+                "sampled": len(quiz_data),
+                "new": new,
+                "duration_s": round(time.monotonic() - start, 3),
+                "failed_images": len(failed_images),
+            }
+            if heartbeat.lost or not self.round_queue.complete(
+                job_id, self.worker_id, result
+            ):
+                # Otra máquina repite la ronda; las preguntas ya están guardadas
+                print(f"⚠️ Lease de {job_id} perdido, se descarta el resultado")
+                self.metrics.increment("leases_lost")
+                return False
+            self.metrics.increment("questions_new", new)
+            self.metrics.increment("questions_duplicate", len(quiz_data) - new)
+            print(
+                f"✅ {len(quiz_data)} preguntas, {new} nuevas ({result['duration_s']}s)"
+            )
+            return True
+        except Exception as e:
+            print(f"❌ Error en la ronda {job_id}: {e}")
+            self.round_queue.fail(job_id, self.worker_id, str(e))
+            return False
+        finally:
+            round_data = self.metrics.end_round()
+            if round_data:
+                print(self.metrics.format_round(round_data))
+
+    def _extract(self, job: dict) -> Optional[List[QuizQuestionModel]]:
+        """Extrae las preguntas de la ronda en el modo de descarga del trabajo."""
+        if job.get("fetch_mode") == "http":
+            try:
+                page = self.http_fetcher.fetch(job["url"])
+                return self.quiz_extraction_service.extract_quiz_data_from_html(
+                    page.html, page.final_url, job["category"]
+                )
+            except AnswersNotRevealedError as e:
+                print(f"↩️ {e}: se vuelve a Selenium")
+                self.metrics.increment("http_fallbacks")
+
+        driver = self._acquire_driver()
+        with self.metrics.timer("initial_navigation"):
+            with rate_limited(job["url"], KIND_PAGE):
+                driver.get(job["url"])
+            deny_cookies(driver)
+        with self.metrics.timer("extract_quiz"):
+            return self.quiz_extraction_service.extract_quiz_data(
+                driver, job["category"]
+            )
+
+    def _acquire_driver(self):
+        """Devuelve el driver del worker, creándolo si no existe o no responde."""
+        if self._driver is not None and is_driver_alive(self._driver):
+            return self._driver
+        if self._driver is not None:
+            self.metrics.increment("driver_restarts")
+        self._close_driver()
+        with self.metrics.timer("driver_setup"):
+            self._driver = setup_driver(self.network_capture)
+        return self._driver
+
+    def _close_driver(self) -> None:
+        """Cierra el driver del worker."""
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except Exception:
+            pass
+        self._driver = None
@@ -0,0 +1,234 @@
+"""
+Motor de puntuación vectorizado para sesiones de examen.
+
+Empaqueta muchas sesiones completadas en arrays de NumPy (una fila por respuesta)
+y calcula en una sola pasada puntuaciones, aprobados, acierto por categoría y
+dificultad por pregunta (p-value: proporción de aciertos de cada pregunta).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.exam.exam_model import ExamSessionModel
+from src.domain.stats.stats_model import StatsModel
+
+# Proporción mínima de aciertos para aprobar un examen
+DEFAULT_PASS_RATIO = 0.5
+
+# Valor usado en `selected` para las preguntas sin responder
+UNANSWERED = -1
+
+
+@dataclass(frozen=True)
+class PackedSessions:
+    """Sesiones de examen empaquetadas en arrays paralelos (una fila por pregunta)."""
+
+    session_ids: List[str]
+    question_ids: List[str]
+    categories: List[str]
+
+    session_index: np.ndarray  # índice de sesión de cada fila
+    question_index: np.ndarray  # índice en `question_ids`
+    selected: np.ndarray  # opción elegida (UNANSWERED si no hay respuesta)
+    correct: np.ndarray  # opción correcta
+    category_code: np.ndarray  # índice en `categories`
+
+    @property
+    def num_sessions(self) -> int:
+        """Número de sesiones empaquetadas."""
+        return len(self.session_ids)
+
+    @property
+    def is_correct(self) -> np.ndarray:
+        """Máscara booleana de respuestas correctas."""
+        return self.selected == self.correct
+
+
+@dataclass(frozen=True)
+class ScoringResult:
+    """Resultado de puntuar un lote de sesiones."""
+
+    session_ids: List[str]
+    question_ids: List[str]
+    categories: List[str]
+
+    scores: np.ndarray  # aciertos por sesión
+    totals: np.ndarray  # preguntas por sesión
+    passed: np.ndarray  # aprobado por sesión
+    category_accuracy: np.ndarray  # (sesiones x categorías), NaN si no hay preguntas
+    question_p_values: np.ndarray  # proporción de aciertos por pregunta
+    question_attempts: np.ndarray  # veces que se presentó cada pregunta
+
+    @property
+    def ratios(self) -> np.ndarray:
+        """Proporción de aciertos por sesión."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.totals > 0, self.scores / self.totals, 0.0)
+
+    def apply_scores(self, sessions: Sequence[ExamSessionModel]) -> None:
+        """Escribe la puntuación calculada en cada `ExamSessionModel.score`."""
+        for session, score in zip(sessions, self.scores.tolist()):
+            session.score = int(score)
+
+    def category_scores(self) -> Dict[str, float]:
+        """Acierto medio por categoría (porcentaje) sobre todas las sesiones."""
+        result = {}
+        for code, category in enumerate(self.categories):
+            column = self.category_accuracy[:, code]
+            column = column[~np.isnan(column)]
+            if column.size:
+                result[category] = float(column.mean() * 100)
+        return result
+
+    def question_difficulty(self) -> Dict[str, float]:
+        """Devuelve el p-value de cada pregunta presentada al menos una vez."""
+        return {
+            question_id: float(p_value)
+            for question_id, p_value, attempts in zip(
+                self.question_ids,
+                self.question_p_values.tolist(),
+                self.question_attempts.tolist(),
+            )
+            if attempts > 0
+        }
+
+    def to_stats(self) -> StatsModel:
+        """Construye el `StatsModel` agregado de las sesiones puntuadas."""
+        return StatsModel(
+            all_exams=list(self.session_ids),
+            passed_exams=[
+                session_id
+                for session_id, passed in zip(self.session_ids, self.passed.tolist())
+                if passed
+            ],
+            category_scores=self.category_scores(),
+            total_questions=int(self.totals.sum()),
+            unique_questions=int(np.count_nonzero(self.question_attempts)),
+        )
+
+
+def pack_sessions(sessions: Sequence[ExamSessionModel]) -> PackedSessions:
+    """
+    Empaqueta las sesiones en arrays de NumPy.
+
+    Este es el único bucle en Python: recorre cada pregunta de cada sesión una vez
+    para asignar códigos enteros; todo el cálculo posterior es vectorizado.
+    """
+    question_codes: Dict[str, int] = {}
+    category_codes: Dict[str, int] = {}
+
+    total_rows = sum(len(session.questions) for session in sessions)
+    session_index = np.empty(total_rows, dtype=np.int32)
+    question_index = np.empty(total_rows, dtype=np.int32)
+    selected = np.empty(total_rows, dtype=np.int16)
+    correct = np.empty(total_rows, dtype=np.int16)
+    category_code = np.empty(total_rows, dtype=np.int16)
+
+    row = 0
+    for s_idx, session in enumerate(sessions):
+        answers = session.answers
+        for question in session.questions:
+            session_index[row] = s_idx
+            question_index[row] = question_codes.setdefault(
+                question.id, len(question_codes)
+            )
+            selected[row] = answers.get(question.id, UNANSWERED)
+            correct[row] = question.correct_option
+            category_code[row] = category_codes.setdefault(
+                question.category, len(category_codes)
+            )
+            row += 1
+
+    return PackedSessions(
+        session_ids=[session.id for session in sessions],
+        question_ids=list(question_codes),
+        categories=list(category_codes),
+        session_index=session_index,
+        question_index=question_index,
+        selected=selected,
+        correct=correct,
+        category_code=category_code,
+    )
+
+
+def score_packed_sessions(
+    packed: PackedSessions, pass_ratio: float = DEFAULT_PASS_RATIO
+) -> ScoringResult:
+    """Puntúa sesiones ya empaquetadas en una sola pasada vectorizada."""
+    n_sessions = packed.num_sessions
+    n_questions = len(packed.question_ids)
+    n_categories = len(packed.categories)
+    hits = packed.is_correct.astype(np.int64)
+
+    # Puntuación y total por sesión
+    scores = np.bincount(packed.session_index, weights=hits, minlength=n_sessions)
+    totals = np.bincount(packed.session_index, minlength=n_sessions)
+    scores = scores.astype(np.int64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(totals > 0, scores / totals, 0.0)
+    passed = (totals > 0) & (ratios >= pass_ratio)
+
+    # Acierto por (sesión, categoría) usando un índice lineal combinado
+    cell = packed.session_index.astype(np.int64) * n_categories + packed.category_code
+    cell_size = n_sessions * n_categories
+    cell_hits = np.bincount(cell, weights=hits, minlength=cell_size)
+    cell_totals = np.bincount(cell, minlength=cell_size)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        category_accuracy = np.where(
+            cell_totals > 0, cell_hits / cell_totals, np.nan
+        ).reshape(n_sessions, n_categories)
+
+    # Dificultad por pregunta (p-value clásico de la teoría de tests)
+    question_hits = np.bincount(
+        packed.question_index, weights=hits, minlength=n_questions
+    )
+    question_attempts = np.bincount(packed.question_index, minlength=n_questions)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        question_p_values = np.where(
+            question_attempts > 0, question_hits / question_attempts, np.nan
+        )
+
+    return ScoringResult(
+        session_ids=packed.session_ids,
+        question_ids=packed.question_ids,
+        categories=packed.categories,
+        scores=scores,
+        totals=totals,
+        passed=passed,
+        category_accuracy=category_accuracy,
+        question_p_values=question_p_values,
+        question_attempts=question_attempts,
+    )
+
+
+def score_sessions(
+    sessions: Sequence[ExamSessionModel],
+    pass_ratio: float = DEFAULT_PASS_RATIO,
+    apply: bool = True,
+    only_completed: bool = False,
+) -> Optional[ScoringResult]:
+    """
+    Puntúa un lote de sesiones de examen.
+
+    Args:
+        sessions: Sesiones a puntuar
+        pass_ratio: Proporción mínima de aciertos para aprobar
+        apply: Si es True, escribe la puntuación en cada sesión
+        only_completed: Si es True, ignora las sesiones no completadas
+
+    Returns:
+        ScoringResult con las métricas calculadas (None si no hay sesiones)
+    """
+    if only_completed:
+        sessions = [session for session in sessions if session.is_completed]
+
+    if not sessions:
+        return None
+
+    result = score_packed_sessions(pack_sessions(sessions), pass_ratio)
+    if apply:
+        result.apply_scores(sessions)
+    return result
@@ -0,0 +1,78 @@
+"""
+Interfaz de almacenamiento del banco de preguntas.
+
+Los casos de uso de consulta y de exámenes dependen de este protocolo y no de
+un backend concreto. Implementaciones:
+
+    - InMemoryQuestionRepository: índice en memoria (réplica local de lectura)
+    - QuestionIndex: índice en memoria sobre los ficheros JSON por categoría
+    - MongoQuestionRepository: colección de MongoDB
+
+Todas comparten la misma superficie de consulta y la misma semántica (ver
+`benchmarks/bench_repositories.py`, que comprueba la conformidad y mide la
+latencia de cada backend):
+
+    - `ids(category)` devuelve siempre el mismo orden mientras no haya cambios
+    - `get`/`get_many` ignoran los IDs desconocidos
+    - `search_ids` sigue `question_search` (sin mayúsculas ni tildes, todos
+      los términos en enunciado u opciones)
+    - `version` cambia cada vez que cambia el contenido (claves de caché, ETags)
+"""
+
+import random
+from typing import Iterable, List, Optional, Protocol, runtime_checkable
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+
+@runtime_checkable
+class QuestionRepository(Protocol):
+    """Superficie de consulta común a todos los backends del banco."""
+
+    @property
+    def version(self) -> int:
+        """Identificador que cambia cuando cambia el contenido."""
+        ...
+
+    @property
+    def categories(self) -> List[str]:
+        """Categorías con al menos una pregunta."""
+        ...
+
+    def __len__(self) -> int:
+        """Número total de preguntas."""
+        ...
+
+    def __contains__(self, question_id: str) -> bool:
+        """Indica si existe una pregunta con ese ID."""
+        ...
+
+    def count(self, category: Optional[str] = None) -> int:
+        """Cuenta las preguntas (de una categoría o en total)."""
+        ...
+
+    def ids(self, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs de una categoría (o de todo el banco) en orden estable."""
+        ...
+
+    def get(self, question_id: str) -> Optional[QuizQuestionModel]:
+        """Devuelve una pregunta o None si el ID no existe."""
+        ...
+
+    def get_many(self, question_ids: Iterable[str]) -> List[QuizQuestionModel]:
+        """Devuelve las preguntas de los IDs dados en el mismo orden."""
+        ...
+
+    def sample_ids(
+        self, category: str, k: int, rng: Optional[random.Random] = None
+    ) -> List[str]:
+        """Elige `k` IDs al azar y sin repetición de una categoría."""
+        ...
+
+    def search_ids(self, query: str, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs de las preguntas que contienen todos los términos de la búsqueda."""
+        ...
+
+    def add_questions(self, questions: Iterable[QuizQuestionModel]) -> int:
+        """Añade preguntas nuevas (las ya existentes se ignoran)."""
+        ...
@@ -0,0 +1,35 @@
+"""
+Semántica común de la búsqueda de texto sobre el banco de preguntas.
+
+Todos los repositorios deben devolver los mismos resultados para la misma
+consulta: la búsqueda no distingue mayúsculas ni tildes y exige que todos los
+términos aparezcan en el enunciado o en alguna de las opciones.
+"""
+
+import unicodedata
+from typing import List
+
+
+def normalize_text(text: str) -> str:
+    """Pasa a minúsculas y elimina tildes y diacríticos."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def searchable_text(record: dict) -> str:
+    """Texto normalizado de enunciado y opciones de un registro."""
+    parts = [(record.get("title") or {}).get("titleText") or ""]
+    parts.extend(
+        option.get("optionText") or "" for option in record.get("options") or []
+    )
+    return normalize_text(" ".join(parts))
+
+
+def search_terms(query: str) -> List[str]:
+    """Términos normalizados de una consulta."""
+    return normalize_text(query).split()
+
+
+def matches_terms(text: str, terms: List[str]) -> bool:
+    """Indica si el texto normalizado contiene todos los términos."""
+    return all(term in text for term in terms)
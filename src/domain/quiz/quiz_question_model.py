@@ -22,6 +22,19 @@ def get_options_image_dir(category: str) -> Path:
     return Path("assets") / "images" / "options" / category
 
 
+def _resolve_image_path(image_dir: Path, image: str) -> Path:
+    """
+    Ruta de una imagen a partir del valor guardado en el modelo.
+
+    El scraper guarda la ruta relativa completa (`assets/images/...`); los
+    valores antiguos con solo el nombre del fichero se resuelven en `image_dir`.
+    """
+    path = Path(image)
+    if len(path.parts) > 1:
+        return path
+    return image_dir / path
+
+
 class TitleModel(BaseModel):
     """Modelo de datos para el título de una pregunta en un quiz."""
 
@@ -32,7 +45,7 @@ class TitleModel(BaseModel):
         """Retorna la ruta completa de la imagen basada en la categoría"""
         if not self.titleImage:
             return None
-        return get_questions_image_dir(category) / self.titleImage
+        return _resolve_image_path(get_questions_image_dir(category), self.titleImage)
 
     def image_exists(self, category: str) -> bool:
         """Verifica si la imagen existe para la categoría dada"""
@@ -54,7 +67,7 @@ class OptionModel(BaseModel):
         """Retorna la ruta completa de la imagen basada en la categoría"""
         if not self.optionImage:
             return None
-        return get_options_image_dir(category) / self.optionImage
+        return _resolve_image_path(get_options_image_dir(category), self.optionImage)
 
     def image_exists(self, category: str) -> bool:
         """Verifica si la imagen existe para la categoría dada"""
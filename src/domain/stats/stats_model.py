@@ -9,7 +9,7 @@ class StatsModel(BaseModel):
     all_exams: list[str]
     passed_exams: list[str]
 
-    category_scores: dict[str, float]
+    category_scores: dict[str, float]  # Porcentaje medio de acierto por categoría
 
     total_questions: int
     unique_questions: int
@@ -24,4 +24,4 @@ class StatsModel(BaseModel):
         """Calcula la tasa de aprobados como porcentaje."""
         if self.total_exams == 0:
             return 0.0
-        return (len(self.passed_exams) / self.total_exams) * 100 * len(self.all_exams)
+        return (len(self.passed_exams) / self.total_exams) * 100
@@ -0,0 +1,457 @@
+"""
+API HTTP asíncrona (Starlette + uvicorn) para servir el banco de preguntas.
+
+Rutas:
+    GET /health
+    GET /categories                          categorías y número de preguntas
+    GET /questions?page=&page_size=&category=
+    GET /questions/{question_id}
+    GET /categories/{category}/questions?page=&page_size=
+    GET /search?q=&category=&page=&page_size=
+    GET /exam?category=&category=&size=&seed=   examen aleatorio (sin caché)
+    GET /assets/...                          imágenes (caché larga)
+
+La API depende solo del protocolo `QuestionRepository`, así que puede servir
+desde los ficheros JSON, desde una réplica en memoria o directamente desde
+MongoDB.
+
+Las respuestas JSON se guardan en una caché LRU indexada por ruta, parámetros y
+versión del repositorio: el cuerpo se serializa y se comprime con gzip una sola
+vez, y lleva un ETag para que los clientes puedan revalidar con `If-None-Match`
+(respuesta 304 sin cuerpo). Cuando el repositorio cambia (p. ej. refresco
+periódico desde los ficheros JSON) la versión cambia y las entradas antiguas
+dejan de usarse. La versión se relee como mucho una vez cada `VERSION_TTL_S`
+segundos, así que un cambio puede tardar ese tiempo en verse.
+
+Con MongoDB o SQLite las lecturas del repositorio son llamadas bloqueantes y se
+hacen en el pool de hilos de Starlette (`QuizApi.run_blocking`). El refresco
+periódico del índice JSON también se hace en un hilo, sobre una copia que luego
+sustituye al índice de una vez.
+
+Uso típico:
+    app = create_app(QuestionIndex.build())
+    uvicorn.run(app, port=8000)
+"""
+
+import asyncio
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from starlette.staticfiles import StaticFiles
+
+from src.application.exam.build_exam_use_case import BuildExamUseCase
+from src.application.quiz.get_question_by_caretegory_use_case import (
+    GetQuestionsByCategoryUseCase,
+)
+from src.application.quiz.get_question_by_id_use_case import GetQuestionByIdUseCase
+from src.application.quiz.get_questions_use_case import GetQuestionsUseCase
+from src.application.quiz.question_page import DEFAULT_PAGE_SIZE, QuestionPage
+from src.application.quiz.search_questions_use_case import SearchQuestionsUseCase
+from src.domain.quiz.question_repository import QuestionRepository
+from src.infrastructure.outbound.memory.in_memory_question_repository import (
+    InMemoryQuestionRepository,
+)
+from src.infrastructure.serialization.json_serializer import (
+    dump_questions,
+    get_serializer,
+)
+
+DEFAULT_CACHE_SIZE = 2048
+DEFAULT_ASSETS_DIR = "assets"
+GZIP_MIN_SIZE = 512
+API_CACHE_CONTROL = "public, max-age=60"
+# Cada examen es un muestreo nuevo: no se guarda ni en la caché ni en el cliente
+EXAM_CACHE_CONTROL = "no-store"
+DEFAULT_EXAM_SIZE = 30
+MAX_EXAM_SIZE = 100
+ASSETS_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Segundos durante los que se reutiliza la versión leída del repositorio
+VERSION_TTL_S = 1.0
+
+
+@dataclass
+class CachedResponse:
+    """Respuesta JSON ya serializada (y comprimida) con su ETag."""
+
+    status_code: int
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+
+
+class ResponseCache:
+    """Caché LRU de respuestas serializadas."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        """Inicializa una caché vacía con `max_entries` entradas como máximo."""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[CachedResponse]:
+        """Devuelve la entrada y la marca como usada recientemente."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: tuple, entry: CachedResponse) -> None:
+        """Guarda una entrada expulsando la menos usada si hace falta."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Número de entradas en caché."""
+        return len(self._entries)
+
+
+def build_cached_response(status_code: int, body: bytes) -> CachedResponse:
+    """Calcula ETag y versión comprimida de un cuerpo JSON."""
+    etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    gzip_body = (
+        gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_SIZE else None
+    )
+    return CachedResponse(status_code, body, gzip_body, etag)
+
+
+def page_body(page: QuestionPage) -> bytes:
+    """Serializa una página de preguntas."""
+    items = dump_questions(page.items)
+    metadata = get_serializer().dumps(page.metadata())
+    return b'{"items":' + items + b',"pagination":' + metadata + b"}"
+
+
+def error_body(message: str) -> bytes:
+    """Cuerpo JSON de un error."""
+    return get_serializer().dumps({"error": message})
+
+
+def json_response(
+    body: bytes, status_code: int = 200, headers: Optional[dict] = None
+) -> Response:
+    """Respuesta JSON sin pasar por la caché."""
+    return Response(
+        body, status_code=status_code, headers=headers, media_type="application/json"
+    )
+
+
+def int_param(request: Request, name: str, default: int) -> int:
+    """Lee un parámetro entero de la query (el valor por defecto si no es válido)."""
+    try:
+        return int(request.query_params.get(name, default))
+    except ValueError:
+        return default
+
+
+class QuizApi:
+    """Handlers de la API sobre los casos de uso de consulta."""
+
+    def __init__(
+        self,
+        repository: QuestionRepository,
+        cache: Optional[ResponseCache] = None,
+        version_ttl: float = VERSION_TTL_S,
+    ):
+        """Crea los casos de uso sobre el repositorio compartido."""
+        self.cache = cache or ResponseCache()
+        self.version_ttl = version_ttl
+        self.set_repository(repository)
+
+    def set_repository(self, repository: QuestionRepository) -> None:
+        """
+        Sustituye el repositorio (y los casos de uso que lo usan).
+
+        Las peticiones en curso terminan con el repositorio anterior.
+        """
+        self.get_questions = GetQuestionsUseCase(repository)
+        self.get_question_by_id = GetQuestionByIdUseCase(repository)
+        self.get_by_category = GetQuestionsByCategoryUseCase(repository)
+        self.search = SearchQuestionsUseCase(repository)
+        self.build_exam = BuildExamUseCase(repository)
+        self.repository = repository
+        self._in_memory = isinstance(repository, InMemoryQuestionRepository)
+        self._version: Optional[int] = None
+        self._version_read_at = 0.0
+
+    # =================================
+    # RESPUESTAS CACHEADAS
+    # =================================
+    async def cached(self, request: Request, build: Callable[[], tuple]) -> Response:
+        """
+        Responde desde la caché o construye la respuesta con `build`.
+
+        `build` devuelve (status_code, cuerpo JSON en bytes) y se ejecuta con
+        `run_blocking` junto con la serialización y la compresión.
+        """
+        key = (
+            request.url.path,
+            tuple(sorted(request.query_params.multi_items())),
+            await self.current_version(),
+        )
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = await self.run_blocking(lambda: build_cached_response(*build()))
+            self.cache.put(key, entry)
+        return self.respond(request, entry)
+
+    async def run_blocking(self, function: Callable[[], Any]) -> Any:
+        """
+        Ejecuta `function`, que lee del repositorio; en un hilo si hay E/S.
+
+        Con un repositorio en memoria se ejecuta directamente: no hay E/S que
+        esperar y en otro hilo seguiría compitiendo por el GIL, solo que con el
+        coste añadido del cambio de hilo (colas de latencia mucho más largas).
+        """
+        if self._in_memory:
+            return function()
+        return await run_in_threadpool(function)
+
+    async def current_version(self) -> int:
+        """Versión del repositorio, releída como mucho cada `version_ttl` segundos."""
+        now = time.monotonic()
+        if self._version is not None and now - self._version_read_at < self.version_ttl:
+            return self._version
+        # Las peticiones que lleguen mientras tanto usan la versión anterior
+        self._version_read_at = now
+        repository = self.repository
+        version = await self.run_blocking(lambda: repository.version)
+        if repository is self.repository:
+            self._version = version
+        return version
+
+    @staticmethod
+    def respond(request: Request, entry: CachedResponse) -> Response:
+        """Crea la respuesta HTTP con ETag, gzip y petición condicional."""
+        headers = {
+            "ETag": entry.etag,
+            "Cache-Control": API_CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if entry.status_code == 200 and entry.etag in request.headers.get(
+            "if-none-match", ""
+        ):
+            return Response(status_code=304, headers=headers)
+
+        body = entry.body
+        if entry.gzip_body is not None and "gzip" in request.headers.get(
+            "accept-encoding", ""
+        ):
+            body = entry.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(
+            body,
+            status_code=entry.status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+    # =================================
+    # HANDLERS
+    # =================================
+    async def health(self, request: Request) -> Response:
+        """Estado del servicio."""
+        repository = self.repository
+        questions, version = await self.run_blocking(
+            lambda: (len(repository), repository.version)
+        )
+        body = get_serializer().dumps(
+            {
+                "status": "ok",
+                "questions": questions,
+                "repository": type(repository).__name__,
+                "index_version": version,
+                "cache_entries": len(self.cache),
+                "cache_hits": self.cache.hits,
+                "cache_misses": self.cache.misses,
+            }
+        )
+        return json_response(body)
+
+    async def categories(self, request: Request) -> Response:
+        """Categorías disponibles y su número de preguntas."""
+        return await self.cached(
+            request,
+            lambda: (200, get_serializer().dumps(self.get_by_category.categories())),
+        )
+
+    async def list_questions(self, request: Request) -> Response:
+        """Listado paginado de preguntas."""
+
+        def build():
+            page = self.get_questions.execute(
+                page=int_param(request, "page", 1),
+                page_size=int_param(request, "page_size", DEFAULT_PAGE_SIZE),
+                category=request.query_params.get("category"),
+            )
+            return 200, page_body(page)
+
+        return await self.cached(request, build)
+
+    async def question_by_id(self, request: Request) -> Response:
+        """Una pregunta por su ID."""
+
+        def build():
+            question = self.get_question_by_id.execute(
+                request.path_params["question_id"]
+            )
+            if question is None:
+                return 404, error_body("Pregunta no encontrada")
+            return 200, question.model_dump_json().encode("utf-8")
+
+        return await self.cached(request, build)
+
+    async def questions_by_category(self, request: Request) -> Response:
+        """Listado paginado de preguntas de una categoría."""
+
+        def build():
+            page = self.get_by_category.execute(
+                request.path_params["category"],
+                page=int_param(request, "page", 1),
+                page_size=int_param(request, "page_size", DEFAULT_PAGE_SIZE),
+            )
+            if page is None:
+                return 404, error_body("Categoría no encontrada")
+            return 200, page_body(page)
+
+        return await self.cached(request, build)
+
+    async def search_questions(self, request: Request) -> Response:
+        """Búsqueda de texto paginada."""
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return json_response(error_body("Falta el parámetro q"), 400)
+
+        def build():
+            page = self.search.execute(
+                query,
+                category=request.query_params.get("category"),
+                page=int_param(request, "page", 1),
+                page_size=int_param(request, "page_size", DEFAULT_PAGE_SIZE),
+            )
+            return 200, page_body(page)
+
+        return await self.cached(request, build)
+
+    async def exam(self, request: Request) -> Response:
+        """Examen aleatorio con `size` preguntas de cada categoría pedida."""
+        categories = request.query_params.getlist("category")
+        if not categories:
+            return json_response(error_body("Falta el parámetro category"), 400)
+        size = min(max(1, int_param(request, "size", DEFAULT_EXAM_SIZE)), MAX_EXAM_SIZE)
+        seed = request.query_params.get("seed")
+        repository, build_exam = self.repository, self.build_exam
+
+        def build():
+            missing = [c for c in categories if not repository.count(c)]
+            if missing:
+                return 404, error_body(f"Categoría no encontrada: {', '.join(missing)}")
+            session = build_exam.execute(
+                {category: size for category in categories},
+                user_id=request.query_params.get("user_id"),
+                seed=int(seed) if seed and seed.lstrip("-").isdigit() else None,
+            )
+            return 200, session.model_dump_json().encode("utf-8")
+
+        status_code, body = await self.run_blocking(build)
+        headers = {"Cache-Control": EXAM_CACHE_CONTROL} if status_code == 200 else None
+        return json_response(body, status_code, headers)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Ficheros estáticos con cabeceras de caché larga."""
+
+    async def get_response(self, path: str, scope) -> Response:
+        """Añade `Cache-Control` a las respuestas de ficheros."""
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = ASSETS_CACHE_CONTROL
+        return response
+
+
+def create_app(
+    repository: QuestionRepository,
+    assets_dir: str = DEFAULT_ASSETS_DIR,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    refresh_interval: Optional[float] = None,
+) -> Starlette:
+    """
+    Crea la aplicación Starlette.
+
+    Args:
+        repository: Repositorio de preguntas (cualquier backend)
+        assets_dir: Directorio servido en /assets (imágenes de preguntas y opciones)
+        cache_size: Entradas máximas de la caché de respuestas
+        refresh_interval: Segundos entre refrescos desde disco (None = nunca; solo
+            para repositorios con `refreshed`, como `QuestionIndex`)
+    """
+    api = QuizApi(repository, ResponseCache(cache_size))
+
+    @asynccontextmanager
+    async def lifespan(app):
+        task = None
+        if refresh_interval and hasattr(repository, "refreshed"):
+            task = asyncio.create_task(_refresh_periodically(api, refresh_interval))
+        try:
+            yield
+        finally:
+            if task is not None:
+                task.cancel()
+
+    routes = [
+        Route("/health", api.health),
+        Route("/categories", api.categories),
+        Route("/categories/{category}/questions", api.questions_by_category),
+        Route("/questions", api.list_questions),
+        Route("/questions/{question_id}", api.question_by_id),
+        Route("/search", api.search_questions),
+        Route("/exam", api.exam),
+        Mount(
+            "/assets",
+            app=CachedStaticFiles(directory=assets_dir, check_dir=False),
+            name="assets",
+        ),
+    ]
+    app = Starlette(routes=routes, lifespan=lifespan)
+    app.state.api = api
+    return app
+
+
+async def _refresh_periodically(api: QuizApi, interval: float) -> None:
+    """
+    Refresca el repositorio desde los ficheros JSON cada `interval` segundos.
+
+    El refresco se hace sobre una copia en un hilo (los handlers siguen
+    leyendo el índice actual) y la copia se instala de una vez en el bucle de
+    eventos. Si ningún fichero cambió, el refresco es solo un `stat`.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            repository, added = await run_in_threadpool(api.repository.refreshed)
+        except Exception as e:
+            print(f"⚠️ Error refrescando el índice: {e}")
+            continue
+        if repository is not api.repository:
+            api.set_repository(repository)
+        if added:
+            print(f"🔄 Índice refrescado: {added} preguntas nuevas")
@@ -0,0 +1,84 @@
+"""
+Subcomando `backup`: volcado y restauración en paralelo de la colección de
+preguntas de MongoDB.
+
+    python main.py backup dump [--dir DIR] [--partitions 8]     # JSONL.gz por rango de _id
+    python main.py backup restore --dir DIR [--drop]            # bulk_write en paralelo
+
+Usa la base y la colección de `.env` (o `--collection`). Solo importa la
+librería estándar a nivel de módulo.
+"""
+
+import argparse
+
+ACTIONS = ("dump", "restore")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument("action", choices=ACTIONS, help="Volcar o restaurar")
+    parser.add_argument(
+        "--dir",
+        default=None,
+        help="Directorio del volcado (dump: data/backups/<fecha> si se omite)",
+    )
+    parser.add_argument(
+        "--collection", default=None, help="Colección (la de .env si se omite)"
+    )
+    parser.add_argument(
+        "--partitions",
+        type=int,
+        default=8,
+        help="Rangos de _id en que se reparte el volcado",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Hilos de volcado o restauración"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Documentos por bulk_write"
+    )
+    parser.add_argument(
+        "--compresslevel", type=int, default=5, help="Nivel de gzip (1-9)"
+    )
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Vaciar la colección antes de restaurar (inserta y crea índices al final)",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Ejecuta el volcado o la restauración y devuelve el código de salida."""
+    import os
+    from datetime import datetime
+
+    from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+    from src.infrastructure.outbound.mongo.mongo_dump import (
+        dump_collection,
+        restore_collection,
+    )
+
+    if args.action == "restore" and not args.dir:
+        print("❌ restore necesita --dir con un volcado")
+        return 2
+
+    connection = MongoConnection(args.collection)
+    if not connection.test_connection():
+        print("❌ No se pudo conectar a MongoDB")
+        return 1
+
+    with connection:
+        collection = connection.get_collection()
+        if args.action == "dump":
+            out_dir = args.dir or os.path.join(
+                "data", "backups", datetime.now().strftime("%Y%m%d-%H%M%S")
+            )
+            dump_collection(
+                collection, out_dir, args.partitions, args.workers, args.compresslevel
+            )
+            print(f"💾 Volcado en {out_dir}")
+        else:
+            restore_collection(
+                collection, args.dir, args.workers, args.batch_size, args.drop
+            )
+    return 0
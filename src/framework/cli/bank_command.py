@@ -0,0 +1,33 @@
+"""
+Subcomando `bank`: exporta los ficheros JSON de preguntas al banco binario.
+"""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+    parser.add_argument(
+        "--output", default="data/questions.qbank", help="Fichero de salida"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Genera el banco binario y devuelve el código de salida."""
+    from pathlib import Path
+
+    from src.infrastructure.outbound.local.question_bank import export_question_bank
+    from src.infrastructure.outbound.local.question_index import QuestionIndex
+
+    json_files = [
+        str(path) for path in QuestionIndex(Path(args.data_dir)).question_files()
+    ]
+    if not json_files:
+        print(f"❌ No hay ficheros de preguntas en {args.data_dir}")
+        return 1
+
+    export_question_bank(json_files, args.output)
+    return 0
@@ -0,0 +1,258 @@
+"""
+Subcomando `distributed`: scraping repartido entre varias máquinas.
+
+    python main.py distributed coordinator [url --category C]  # encola y decide
+    python main.py distributed worker                          # en cada máquina
+    python main.py distributed status [--run-id ID]            # resumen de la cola
+
+Coordinador y workers comparten la base de MongoDB de `.env`: la cola de
+rondas (colección `--jobs-collection`) y la colección de preguntas, única por
+fingerprint. Solo importa la librería estándar a nivel de módulo (y el tipo de
+`--coverage-target` de `scraping_command`, que tampoco importa más).
+"""
+
+import argparse
+
+from src.framework.cli.scraping_command import coverage_fraction
+
+ROLES = ("coordinator", "worker", "status")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument("role", choices=ROLES, help="Papel de este proceso")
+    parser.add_argument(
+        "url", nargs="?", help="URL a scrapear (coordinador; usa .env si se omite)"
+    )
+    parser.add_argument(
+        "--category", default=None, help="Categoría de las preguntas de la URL"
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="ID de la ejecución (coordinador: se genera; worker/status: filtra)",
+    )
+    parser.add_argument(
+        "--jobs-collection",
+        default="scraping_jobs",
+        help="Colección de MongoDB de la cola de rondas",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=120.0,
+        metavar="SECONDS",
+        help="Duración del lease de una ronda (se renueva cada tercio)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Intentos de una ronda antes de darla por fallida",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=4,
+        help="Rondas encoladas o en proceso por categoría (>= número de workers)",
+    )
+    parser.add_argument(
+        "--poll", type=float, default=2.0, help="Segundos entre consultas a la cola"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="El worker termina tras este tiempo sin rondas (0 = nunca)",
+    )
+    parser.add_argument("--worker-id", default=None, help="ID del worker (host:pid)")
+    parser.add_argument(
+        "--fetch-mode",
+        choices=("selenium", "http"),
+        default="selenium",
+        help="Modo de descarga de las rondas encoladas",
+    )
+    parser.add_argument(
+        "--extraction",
+        choices=("dom", "network"),
+        default="dom",
+        help="Fuente de las preguntas en el worker (DOM o respuestas de red)",
+    )
+    parser.add_argument(
+        "--rate-control",
+        action="store_true",
+        help="Ajustar el ritmo del worker por host (AIMD) con 429/5xx, timeouts y latencia",
+    )
+    parser.add_argument(
+        "--initial-rate",
+        type=float,
+        default=2.0,
+        metavar="RPS",
+        help="Peticiones/s iniciales por host con --rate-control",
+    )
+    parser.add_argument(
+        "--coverage-target",
+        type=coverage_fraction,
+        default=None,
+        help="Cobertura estimada del banco a alcanzar por categoría (0-1)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Tiempo máximo de scraping por categoría en segundos",
+    )
+    parser.add_argument(
+        "--max-rounds", type=int, default=None, help="Rondas máximas por categoría"
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default="data/metrics",
+        help="Directorio del desglose de tiempos por etapa (JSON)",
+    )
+    parser.add_argument(
+        "--no-metrics", action="store_true", help="No guardar el desglose en disco"
+    )
+
+
+def target_configs(args: argparse.Namespace) -> list:
+    """Lista de URLs y categorías del coordinador (argumentos o .env)."""
+    import os
+
+    from src.framework.config import load_environment
+
+    if args.url:
+        return [{"url": args.url, "category": args.category or "default"}]
+    load_environment()
+    configs = [
+        {
+            "url": os.getenv("URL_RADIOELECTRICIDAD"),
+            "category": os.getenv("CATEGORY_RADIOELECTRICIDAD", "radioelectricidad"),
+        },
+        {
+            "url": os.getenv("URL_NORMATIVA"),
+            "category": os.getenv("CATEGORY_NORMATIVA", "normativa"),
+        },
+    ]
+    return [config for config in configs if config["url"]]
+
+
+def run_coordinator(args, round_queue, question_store) -> int:
+    """Coordina la ejecución hasta que todas las categorías paran."""
+    from src.application.scraping.scraping_coordinator import ScrapingCoordinator
+
+    configs = target_configs(args)
+    if not configs:
+        print("❌ Error: No se encontraron URLs válidas para scraping")
+        return 2
+
+    scheduler_options = {
+        option: value
+        for option, value in (
+            ("coverage_target", args.coverage_target),
+            ("time_budget_s", args.time_budget),
+            ("max_rounds", args.max_rounds),
+        )
+        if value is not None
+    }
+    coordinator = ScrapingCoordinator(
+        round_queue,
+        question_store,
+        scheduler_options=scheduler_options,
+        window=args.window,
+        poll_s=args.poll,
+        fetch_mode=args.fetch_mode,
+        run_id=args.run_id,
+    )
+    coordinator.run(configs)
+    print_status(round_queue, coordinator.run_id)
+    report_metrics(args, coordinator.metrics)
+    return 0
+
+
+def run_worker(args, round_queue, question_store) -> int:
+    """Procesa rondas de la cola hasta quedarse sin trabajo."""
+    from src.application.scraping.scraping_worker import ScrapingWorker
+
+    rate_controller = None
+    if args.rate_control:
+        from src.infrastructure.scraping.rate_controller import (
+            RateController,
+            RatePolicy,
+        )
+
+        rate_controller = RateController(RatePolicy(initial_rate=args.initial_rate))
+
+    worker = ScrapingWorker(
+        round_queue,
+        question_store,
+        worker_id=args.worker_id,
+        lease_s=args.lease,
+        idle_timeout_s=args.idle_timeout or None,
+        poll_s=args.poll,
+        run_id=args.run_id,
+        extraction=args.extraction,
+        rate_controller=rate_controller,
+    )
+    completed = worker.run()
+    print(f"🏁 Worker {worker.worker_id}: {completed} rondas completadas")
+    if rate_controller is not None:
+        print(rate_controller.format_report())
+    report_metrics(args, worker.metrics)
+    return 0
+
+
+def print_status(round_queue, run_id=None) -> None:
+    """Imprime las rondas por estado y categoría de la cola."""
+    rows = round_queue.stats(run_id)
+    if not rows:
+        print("📭 La cola no tiene rondas")
+        return
+    print(
+        f"\n{'ejecución':<24} {'categoría':<20} {'estado':<10} {'rondas':>6} "
+        f"{'vistas':>7} {'nuevas':>7} workers"
+    )
+    for row in rows:
+        workers = ", ".join(worker for worker in row["workers"] if worker)
+        print(
+            f"{row['run_id']:<24} {row['category']:<20} {row['status']:<10} "
+            f"{row['rounds']:>6} {row['sampled']:>7} {row['new']:>7} {workers}"
+        )
+
+
+def report_metrics(args, metrics) -> None:
+    """Imprime el desglose de la ejecución y lo guarda en disco."""
+    if not metrics.stages and not metrics.counters:
+        return
+    print(metrics.format_summary())
+    if not args.no_metrics:
+        try:
+            print(f"📈 Métricas guardadas en: {metrics.write(args.metrics_dir)}")
+        except OSError as e:
+            print(f"⚠️ No se pudieron guardar las métricas: {e}")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Ejecuta el papel pedido y devuelve el código de salida."""
+    from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+    from src.infrastructure.outbound.mongo.mongo_question_repository import (
+        MongoQuestionRepository,
+    )
+    from src.infrastructure.outbound.mongo.mongo_round_queue import MongoRoundQueue
+
+    jobs_connection = MongoConnection(args.jobs_collection)
+    questions_connection = MongoConnection()
+    with jobs_connection, questions_connection:
+        round_queue = MongoRoundQueue(jobs_connection, args.max_attempts)
+        question_store = MongoQuestionRepository(questions_connection)
+        if args.role == "status":
+            print_status(round_queue, args.run_id)
+            return 0
+        if args.role == "worker":
+            return run_worker(args, round_queue, question_store)
+        # Solo el coordinador crea índices y rellena los fingerprints que falten
+        round_queue.create_indexes()
+        question_store.create_indexes()
+        return run_coordinator(args, round_queue, question_store)
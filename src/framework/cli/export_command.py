@@ -0,0 +1,73 @@
+"""
+Subcomando `export`: exporta el banco de preguntas a tablas para análisis.
+
+    python main.py export [--format parquet|arrow|csv] [--full]
+
+Escribe las tablas `questions` y `options` bajo `data/exports/<formato>` en
+bloques de `--chunk-size` preguntas y, en ejecuciones sucesivas, solo añade
+las preguntas nuevas. Parquet y Arrow necesitan pyarrow (extra `export`),
+que se importa dentro de `run`; CSV solo usa la librería estándar.
+"""
+
+import argparse
+
+FORMATS = ("parquet", "arrow", "csv")
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "--format", choices=FORMATS, default="parquet", help="Formato de salida"
+    )
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="Directorio de exportación (data/exports si se omite)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=20_000,
+        help="Preguntas por bloque (acota la memoria)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Descartar lo exportado y volver a exportar todo",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Exporta las preguntas nuevas y devuelve el código de salida."""
+    from pathlib import Path
+
+    from src.infrastructure.export.question_export import (
+        CsvExportWriter,
+        export_questions,
+    )
+    from src.infrastructure.scraping.config import EXPORTS_DIR
+
+    output_dir = Path(args.output_dir or EXPORTS_DIR)
+    if args.format == "csv":
+        writer = CsvExportWriter(output_dir)
+    else:
+        try:
+            from src.infrastructure.export.arrow_export import (
+                ArrowExportWriter,
+                ParquetExportWriter,
+            )
+        except ImportError as e:
+            print(f"❌ Falta una dependencia ({e.name}): instala el extra 'export'")
+            return 1
+        writer_class = (
+            ParquetExportWriter if args.format == "parquet" else ArrowExportWriter
+        )
+        writer = writer_class(output_dir)
+
+    export_questions(
+        Path(args.data_dir), output_dir, writer, args.chunk_size, args.full
+    )
+    return 0
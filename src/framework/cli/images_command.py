@@ -0,0 +1,96 @@
+"""
+Subcomando `images`: post-procesa las imágenes descargadas para servirlas.
+
+Verifica y recodifica las imágenes nuevas (WebP o PNG optimizado), genera
+miniaturas, deduplica esquemas idénticos por hash perceptual y actualiza las
+rutas de imagen de las preguntas. Pillow (extra `images`) se importa dentro
+de `run`.
+"""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "--assets-dir", default="assets", help="Directorio raíz de los assets"
+    )
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+    parser.add_argument(
+        "--sqlite-path",
+        default=None,
+        help="Actualizar también las rutas de esta base SQLite",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Procesos (def. uno por CPU)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=("webp", "png"),
+        default="webp",
+        help="Formato de las imágenes procesadas",
+    )
+    parser.add_argument(
+        "--thumbnail-size", type=int, default=320, help="Lado máximo de las miniaturas"
+    )
+    parser.add_argument(
+        "--phash-threshold",
+        type=int,
+        default=0,
+        help="Distancia máxima entre hashes perceptuales para anotar casi duplicadas (0-64)",
+    )
+    parser.add_argument(
+        "--no-update-references",
+        action="store_true",
+        help="Solo procesar las imágenes, sin tocar las preguntas",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Procesa las imágenes pendientes y devuelve el código de salida."""
+    from pathlib import Path
+
+    try:
+        from src.infrastructure.images.image_pipeline import (
+            ImagePipeline,
+            update_json_references,
+        )
+    except ImportError as e:
+        print(f"❌ Falta una dependencia ({e.name}): instala el extra 'images'")
+        return 1
+
+    pipeline = ImagePipeline(
+        Path(args.assets_dir),
+        workers=args.workers,
+        output_format=args.format,
+        thumbnail_size=args.thumbnail_size,
+        phash_threshold=args.phash_threshold,
+    )
+    report = pipeline.run()
+    saved = report["bytes_in"] - report["bytes_out"]
+    print(
+        f"🖼️ {report['processed']}/{report['pending']} imágenes nuevas procesadas en "
+        f"{report['elapsed_s']}s ({report['errors']} errores, "
+        f"{report['duplicates']} duplicadas, "
+        f"{report['near_duplicates']} casi duplicadas, "
+        f"{report['extension_mismatches']} con extensión incorrecta, "
+        f"{saved / 1024:.0f} KB ahorrados)"
+    )
+
+    if args.no_update_references:
+        return 0 if not report["errors"] else 1
+
+    mapping = pipeline.reference_map()
+    updated = update_json_references(Path(args.data_dir), mapping)
+    print(f"✅ {updated} preguntas JSON con rutas de imagen actualizadas")
+    if args.sqlite_path:
+        from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+            SqliteQuestionRepository,
+        )
+
+        with SqliteQuestionRepository(Path(args.sqlite_path)) as store:
+            updated = store.replace_image_paths(mapping)
+        print(f"✅ {updated} rutas de imagen actualizadas en {args.sqlite_path}")
+    return 0 if not report["errors"] else 1
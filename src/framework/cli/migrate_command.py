@@ -0,0 +1,34 @@
+"""
+Subcomando `migrate`: migra los ficheros JSON de preguntas a MongoDB.
+"""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Ejecuta la migración y devuelve el código de salida."""
+    from pathlib import Path
+
+    from migration import migrate_json_to_mongo
+    from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+    from src.infrastructure.outbound.mongo.mongo_question_repository import (
+        MongoQuestionRepository,
+    )
+
+    mongo_connection = MongoConnection()
+    if not mongo_connection.test_connection():
+        print("❌ No se pudo conectar a MongoDB")
+        return 1
+
+    repository = MongoQuestionRepository(mongo_connection)
+    migrated = migrate_json_to_mongo(repository, Path(args.data_dir))
+    repository.create_indexes()
+    print(f"✅ Migradas {migrated} preguntas")
+    return 0
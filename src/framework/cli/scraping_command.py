@@ -0,0 +1,245 @@
+"""
+Subcomando `scraping`: ejecuta el caso de uso de scraping.
+
+Solo importa la librería estándar a nivel de módulo; el stack de scraping
+(selenium, requests, pydantic...) se importa dentro de `run`.
+"""
+
+import argparse
+
+
+def coverage_fraction(value: str) -> float:
+    """Tipo de `--coverage-target`: fracción estrictamente entre 0 y 1."""
+    try:
+        fraction = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"no es un número: {value!r}") from None
+    if not 0 < fraction < 1:
+        raise argparse.ArgumentTypeError(
+            f"debe estar entre 0 y 1 sin incluirlos (p. ej. 0.98): {value}"
+        )
+    return fraction
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "url", nargs="?", help="URL a scrapear (usa las de .env si se omite)"
+    )
+    parser.add_argument(
+        "--category", default=None, help="Categoría de las preguntas de la URL"
+    )
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Grabar el HTML y las imágenes de cada ronda como fixtures en DIR",
+    )
+    fixtures.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Reproducir sin conexión las rondas grabadas en DIR",
+    )
+    parser.add_argument(
+        "--fetch-mode",
+        choices=("selenium", "http"),
+        default="selenium",
+        help="Descargar los exámenes con Chrome o por HTTP (con vuelta a Chrome si hace falta)",
+    )
+    parser.add_argument(
+        "--http-concurrency",
+        type=int,
+        default=8,
+        help="Rondas simultáneas en modo http",
+    )
+    parser.add_argument(
+        "--rate-control",
+        action="store_true",
+        help="Ajustar ritmo y concurrencia por host (AIMD) con 429/5xx, timeouts y latencia",
+    )
+    parser.add_argument(
+        "--initial-rate",
+        type=float,
+        default=2.0,
+        metavar="RPS",
+        help="Peticiones/s iniciales por host con --rate-control",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=50.0,
+        metavar="RPS",
+        help="Peticiones/s máximas por host con --rate-control",
+    )
+    parser.add_argument(
+        "--extraction",
+        choices=("dom", "network"),
+        default="dom",
+        help="Leer las preguntas del DOM o de las respuestas de red de Chrome (con vuelta al DOM)",
+    )
+    parser.add_argument(
+        "--image-source",
+        choices=("http", "browser"),
+        default="http",
+        help="Descargar las imágenes de nuevo o leer las que ya cargó Chrome (con vuelta a HTTP)",
+    )
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=1,
+        help="Rondas capturadas en cola mientras Chrome carga el siguiente examen (0 = secuencial)",
+    )
+    parser.add_argument(
+        "--store",
+        choices=("json", "sqlite"),
+        default="json",
+        help="Dónde guardar las preguntas nuevas (ficheros JSON o base SQLite)",
+    )
+    parser.add_argument(
+        "--sqlite-path",
+        default="data/questions.sqlite3",
+        help="Base de datos de --store sqlite",
+    )
+    parser.add_argument(
+        "--coverage-target",
+        type=coverage_fraction,
+        default=None,
+        help="Cobertura estimada del banco a alcanzar por categoría (0-1, def. 0.98)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Tiempo máximo de scraping por categoría en segundos",
+    )
+    parser.add_argument(
+        "--max-rounds",
+        type=int,
+        default=None,
+        help="Número máximo de rondas por categoría",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continuar cada categoría desde su último checkpoint",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        default="data/checkpoints",
+        help="Directorio del diario de progreso por categoría",
+    )
+    parser.add_argument(
+        "--no-checkpoints",
+        action="store_true",
+        help="No registrar el progreso en disco (no se podrá reanudar)",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default="data/metrics",
+        help="Directorio del desglose de tiempos por etapa (JSON)",
+    )
+    parser.add_argument(
+        "--no-metrics", action="store_true", help="No guardar el desglose en disco"
+    )
+    parser.add_argument(
+        "--prometheus",
+        action="store_true",
+        help="Guardar también las métricas en formato de texto Prometheus",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Ejecuta el scraping y devuelve el código de salida."""
+    print("🕷️ Ejecutando caso de uso de scraping...")
+
+    # Usar el Use Case de la capa de aplicación
+    from src.application.scraping.scraping_use_case import ScrapingUseCase
+
+    target_configs = []
+    if args.url:
+        target_configs = [{"url": args.url, "category": args.category or "default"}]
+
+    recorder = None
+    if args.record:
+        from src.infrastructure.scraping.fixture_recorder import RoundRecorder
+
+        recorder = RoundRecorder(args.record)
+
+    checkpoints = None
+    if not args.no_checkpoints:
+        from src.infrastructure.scraping.checkpoint_journal import CheckpointJournal
+
+        checkpoints = CheckpointJournal(args.checkpoint_dir)
+    elif args.resume:
+        print("❌ --resume necesita los checkpoints activados")
+        return 2
+
+    question_store = None
+    if args.store == "sqlite":
+        from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+            SqliteQuestionRepository,
+        )
+
+        question_store = SqliteQuestionRepository(args.sqlite_path)
+
+    from src.infrastructure.scraping.http_exam_fetcher import HttpExamFetcher
+
+    rate_controller = None
+    if args.rate_control:
+        from src.infrastructure.scraping.rate_controller import (
+            RateController,
+            RatePolicy,
+        )
+
+        # La concurrencia de HTTP es el techo: los hilos ya están creados
+        rate_controller = RateController(
+            RatePolicy(
+                initial_rate=args.initial_rate,
+                max_rate=args.max_rate,
+                max_concurrency=args.http_concurrency,
+            )
+        )
+
+    scheduler_options = {
+        option: value
+        for option, value in (
+            ("coverage_target", args.coverage_target),
+            ("time_budget_s", args.time_budget),
+            ("max_rounds", args.max_rounds),
+        )
+        if value is not None
+    }
+
+    # Ejecutar caso de uso
+    use_case = ScrapingUseCase(
+        metrics_dir=None if args.no_metrics else args.metrics_dir,
+        prometheus=args.prometheus,
+        recorder=recorder,
+        scheduler_options=scheduler_options,
+        checkpoints=checkpoints,
+        resume=args.resume,
+        fetch_mode=args.fetch_mode,
+        http_fetcher=HttpExamFetcher(concurrency=args.http_concurrency),
+        pipeline_depth=args.pipeline_depth,
+        extraction=args.extraction,
+        image_source=args.image_source,
+        question_store=question_store,
+        rate_controller=rate_controller,
+    )
+
+    if args.replay:
+        from src.infrastructure.scraping.fixture_server import FixtureReplayServer
+
+        with FixtureReplayServer(args.replay) as server:
+            print(f"📼 Reproduciendo fixtures de {args.replay} en {server.base_url}")
+            success = use_case.execute(server.target_configs())
+    else:
+        success = use_case.execute(target_configs)
+
+    if success:
+        print("🎉 ¡Scraping completado exitosamente!")
+        return 0
+
+    print("❌ El scraping falló. Revisa los logs para más detalles.")
+    return 1
@@ -0,0 +1,86 @@
+"""
+Subcomando `serve`: levanta la API HTTP del banco de preguntas.
+
+Solo importa la librería estándar a nivel de módulo; starlette y uvicorn
+(dependencias opcionales del extra `api`) se importan dentro de `run`.
+"""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument("--host", default="127.0.0.1", help="Interfaz de escucha")
+    parser.add_argument("--port", type=int, default=8000, help="Puerto de escucha")
+    parser.add_argument(
+        "--backend",
+        choices=("json", "mongo", "sqlite"),
+        default="json",
+        help="Repositorio de preguntas a servir",
+    )
+    parser.add_argument(
+        "--replica",
+        action="store_true",
+        help="Copia el backend en memoria al arrancar y sirve solo desde la copia",
+    )
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+    parser.add_argument(
+        "--sqlite-path",
+        default="data/questions.sqlite3",
+        help="Base de datos del backend sqlite",
+    )
+    parser.add_argument(
+        "--assets-dir",
+        default="assets",
+        help="Directorio de imágenes servido en /assets",
+    )
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=30.0,
+        help="Segundos entre refrescos del índice JSON desde disco (0 = nunca)",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=2048, help="Respuestas máximas en caché"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Abre el repositorio y sirve la API hasta que se interrumpa."""
+    from pathlib import Path
+
+    try:
+        import uvicorn
+
+        from src.framework.api.app import create_app
+    except ImportError as e:
+        print(f"❌ Falta una dependencia de la API ({e.name}): instala el extra 'api'")
+        return 1
+
+    from src.infrastructure.outbound.repository_factory import (
+        open_question_repository,
+    )
+
+    try:
+        repository = open_question_repository(
+            args.backend,
+            Path(args.data_dir),
+            replica=args.replica,
+            sqlite_path=Path(args.sqlite_path),
+        )
+    except (ConnectionError, ImportError) as e:
+        print(f"❌ No se pudo abrir el backend '{args.backend}': {e}")
+        return 1
+    print(f"📚 {repository}")
+
+    app = create_app(
+        repository,
+        assets_dir=args.assets_dir,
+        cache_size=args.cache_size,
+        refresh_interval=args.refresh_interval or None,
+    )
+    print(f"🌐 API escuchando en http://{args.host}:{args.port}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
@@ -0,0 +1,40 @@
+"""
+Subcomando `sqlite`: importa los ficheros JSON de preguntas a la base SQLite.
+
+La importación se puede repetir: las preguntas ya presentes (mismo ID o mismo
+fingerprint) se descartan en la propia base de datos.
+"""
+
+import argparse
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Registra los argumentos del subcomando."""
+    parser.add_argument(
+        "--data-dir", default="data", help="Directorio con questions_<categoria>.json"
+    )
+    parser.add_argument(
+        "--output", default="data/questions.sqlite3", help="Base de datos de salida"
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Importa los ficheros JSON y devuelve el código de salida."""
+    import time
+    from pathlib import Path
+
+    from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+        SqliteQuestionRepository,
+    )
+
+    start = time.perf_counter()
+    with SqliteQuestionRepository(Path(args.output)) as store:
+        imported = store.import_json_stores(Path(args.data_dir))
+        if not imported:
+            print(f"❌ No hay ficheros de preguntas en {args.data_dir}")
+            return 1
+        print(
+            f"✅ Importadas {sum(imported.values())} preguntas nuevas en "
+            f"{time.perf_counter() - start:.2f}s: {store}"
+        )
+    return 0
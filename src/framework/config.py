@@ -4,7 +4,8 @@ Este módulo proporciona una clase de configuración centralizada que carga vari
 de entorno para varios componentes de la aplicación, incluyendo objetivos de web scraping
 y conexiones a la base de datos MongoDB.
 La configuración se carga desde variables de entorno usando python-dotenv,
-permitiendo un despliegue flexible en diferentes entornos.
+permitiendo un despliegue flexible en diferentes entornos. El fichero .env se lee de
+forma perezosa en el primer acceso a un valor, nunca al importar el módulo.
 Clases:
     Config: Clase principal de configuración que contiene todas las configuraciones de la aplicación.
 Variables de Entorno Requeridas:
@@ -12,6 +13,7 @@ Variables de Entorno Requeridas:
     - CATEGORY_RADIOELECTRICIDAD: Categoría para el contenido de radioelectricidad
     - URL_NORMATIVA: URL para el objetivo de scraping de normativa
     - CATEGORY_NORMATIVA: Categoría para el contenido de normativa
+    - SCRAPING_*_TIMEOUT: Límites de las esperas del navegador (opcionales)
     - MONGODB_USERNAME: Nombre de usuario para autenticación en MongoDB
     - MONGODB_PASSWORD: Contraseña para autenticación en MongoDB
     - MONGODB_URI: URI de conexión a MongoDB
@@ -27,32 +29,53 @@ Ejemplo:
 
 import os
 
-from dotenv import load_dotenv
+_ENVIRONMENT_LOADED = False
 
-load_dotenv()
 
+def load_environment() -> None:
+    """Carga el fichero .env una sola vez por proceso."""
+    global _ENVIRONMENT_LOADED
+    if _ENVIRONMENT_LOADED:
+        return
 
-class Config:
-    """Configuration class for the application."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _ENVIRONMENT_LOADED = True
 
-    # =================================
-    # SCRAPING
-    # =================================
-    URL_RADIOELECTRICIDAD = os.getenv("URL_RADIOELECTRICIDAD")
-    CATEGORY_RADIOELECTRICIDAD = os.getenv("CATEGORY_RADIOELECTRICIDAD")
 
-    URL_NORMATIVA = os.getenv("URL_NORMATIVA")
-    CATEGORY_NORMATIVA = os.getenv("CATEGORY_NORMATIVA")
+class _LazyEnvConfig(type):
+    """Metaclase que resuelve los valores de entorno en el primer acceso."""
 
-    # =================================
-    # MONGODB
-    # =================================
-    MONGODB_USERNAME = os.getenv("MONGODB_USERNAME")
-    MONGODB_PASSWORD = os.getenv("MONGODB_PASSWORD")
+    def __getattr__(cls, name: str):
+        if name in cls.ENV_VARIABLES:
+            load_environment()
+            return os.getenv(name)
+        raise AttributeError(name)
 
-    MONGODB_URI = os.getenv("MONGODB_URI")
 
-    MONGODB_DATABASE_NAME = os.getenv("MONGODB_DATABASE_NAME")
-    MONGODB_COLLECTION_NAME = os.getenv("MONGODB_COLLECTION_NAME")
+class Config(metaclass=_LazyEnvConfig):
+    """Configuration class for the application."""
 
-    MY_IP = os.getenv("MY_IP")
+    ENV_VARIABLES = (
+        # =================================
+        # SCRAPING
+        # =================================
+        "URL_RADIOELECTRICIDAD",
+        "CATEGORY_RADIOELECTRICIDAD",
+        "URL_NORMATIVA",
+        "CATEGORY_NORMATIVA",
+        "SCRAPING_NAVIGATION_TIMEOUT",
+        "SCRAPING_QUESTIONS_TIMEOUT",
+        "SCRAPING_COOKIE_TIMEOUT",
+        "SCRAPING_REVEAL_TIMEOUT",
+        # =================================
+        # MONGODB
+        # =================================
+        "MONGODB_USERNAME",
+        "MONGODB_PASSWORD",
+        "MONGODB_URI",
+        "MONGODB_DATABASE_NAME",
+        "MONGODB_COLLECTION_NAME",
+        "MY_IP",
+    )
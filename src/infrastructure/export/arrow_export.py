@@ -0,0 +1,148 @@
+"""
+Escritores columnares (Parquet y Arrow IPC) para `export_questions`.
+
+Cada ejecución incremental escribe una parte nueva por tabla
+(`parquet/questions/part-00003.parquet`, ...), con un row group o record
+batch por bloque, así que la memoria queda acotada por `chunk_size`. El
+directorio de cada tabla se lee como un único dataset:
+
+    pyarrow.dataset.dataset("data/exports/parquet/questions")
+
+La categoría va codificada como diccionario, el mismo en todos los bloques y
+partes (`state["categories"]`, fijado por `export_questions` antes de
+escribir): con diccionarios distintos, pyarrow no puede agrupar ni filtrar por
+categoría el dataset completo. Las partes se escriben con un nombre temporal y
+se renombran al cerrar; el número de parte sale del estado, así que una
+ejecución interrumpida se sobrescribe en la siguiente.
+
+Requiere pyarrow (extra `export`).
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from .question_export import TABLES, TableChunks
+
+CATEGORY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+SCHEMAS = {
+    "questions": pa.schema(
+        [
+            ("id", pa.string()),
+            ("category", CATEGORY_TYPE),
+            ("title_text", pa.string()),
+            ("title_image", pa.string()),
+            ("option_count", pa.int16()),
+            ("correct_option", pa.int16()),
+            ("has_title_image", pa.bool_()),
+            ("has_option_images", pa.bool_()),
+        ]
+    ),
+    "options": pa.schema(
+        [
+            ("question_id", pa.string()),
+            ("category", CATEGORY_TYPE),
+            ("position", pa.int16()),
+            ("option_text", pa.string()),
+            ("option_image", pa.string()),
+            ("is_correct", pa.bool_()),
+        ]
+    ),
+}
+
+
+class ParquetExportWriter:
+    """Escribe cada ejecución como una parte Parquet por tabla."""
+
+    format = "parquet"
+    extension = "parquet"
+    fixed_categories = True
+
+    def __init__(self, output_dir: Path, compression: str = "zstd"):
+        """Prepara el escritor bajo `output_dir/<formato>`."""
+        self.directory = Path(output_dir) / self.format
+        self.compression = compression
+        self._writers = {}
+        self._paths: Dict[str, Path] = {}
+        self._dictionary = pa.array([], pa.string())
+        self._categories: Dict[str, int] = {}
+
+    def reset(self) -> None:
+        """Borra las partes anteriores (exportación completa)."""
+        for table in TABLES:
+            for part in (self.directory / table).glob(f"part-*.{self.extension}"):
+                part.unlink()
+
+    def open(self, state: Dict) -> None:
+        """Abre la parte siguiente de cada tabla con el diccionario del estado."""
+        categories = state.get("categories", [])
+        self._dictionary = pa.array(categories, pa.string())
+        self._categories = {
+            category: index for index, category in enumerate(categories)
+        }
+        part = state.get("parts", 0)
+        for table in TABLES:
+            table_dir = self.directory / table
+            table_dir.mkdir(parents=True, exist_ok=True)
+            self._paths[table] = table_dir / f"part-{part:05d}.{self.extension}"
+            self._writers[table] = self._open_table(
+                f"{self._paths[table]}.tmp", SCHEMAS[table]
+            )
+
+    def _open_table(self, path: str, schema: pa.Schema):
+        """Escritor de una tabla."""
+        return pq.ParquetWriter(path, schema, compression=self.compression)
+
+    def _encode_categories(self, categories: List[str]) -> pa.DictionaryArray:
+        """
+        Codifica las categorías contra el diccionario fijo de la exportación.
+
+        Raises:
+            ValueError: Si un registro tiene una categoría fuera del diccionario
+        """
+        try:
+            indices = [
+                None if category is None else self._categories[category]
+                for category in categories
+            ]
+        except KeyError as e:
+            raise ValueError(f"Categoría fuera del diccionario: {e.args[0]}") from None
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, pa.int32()), self._dictionary
+        )
+
+    def write(self, chunks: TableChunks) -> None:
+        """Escribe un bloque como un row group por tabla."""
+        for table, columns in chunks.items():
+            columns = {
+                **columns,
+                "category": self._encode_categories(columns["category"]),
+            }
+            self._writers[table].write_table(
+                pa.Table.from_pydict(columns, schema=SCHEMAS[table])
+            )
+
+    def close(self, state: Dict) -> None:
+        """Cierra las partes, las publica y avanza el número de parte."""
+        for table, writer in self._writers.items():
+            writer.close()
+            os.replace(f"{self._paths[table]}.tmp", self._paths[table])
+        state["parts"] = state.get("parts", 0) + 1
+        self._writers = {}
+        self._paths = {}
+
+
+class ArrowExportWriter(ParquetExportWriter):
+    """Como `ParquetExportWriter`, en formato Arrow IPC (Feather v2)."""
+
+    format = "arrow"
+    extension = "arrow"
+
+    def _open_table(self, path: str, schema: pa.Schema):
+        """Escritor de una tabla."""
+        return pa.ipc.new_file(path, schema)
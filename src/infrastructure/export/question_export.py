@@ -0,0 +1,325 @@
+"""
+Exportación incremental del banco de preguntas para análisis.
+
+Recorre los ficheros `questions_<categoria>.json` en streaming y escribe las
+preguntas por bloques de `chunk_size` en dos tablas planas:
+
+    questions  id, category, title_text, title_image, option_count,
+               correct_option, has_title_image, has_option_images
+    options    question_id, category, position, option_text, option_image,
+               is_correct (una fila por opción)
+
+Con ellas se analizan directamente el tamaño de cada categoría, la
+distribución del número de opciones, la proporción de imágenes o el sesgo de
+posición de la respuesta correcta.
+
+La exportación es incremental: `export_state.json` guarda por formato cuántos
+registros de cada fichero se han exportado ya y la posición en bytes del `]`
+final de cada uno (el scraper solo añade al final), y en la siguiente ejecución
+la lectura se reanuda en esa posición, así que solo se decodifican los
+registros nuevos. También guarda el inodo de cada fichero: si alguno se ha
+sustituido entero (`dump_file`, p. ej. `update_json_references` al cambiar las
+rutas de imagen), lo ya exportado puede estar desactualizado y se hace una
+exportación completa. Los formatos
+columnares codifican la categoría contra un diccionario fijo (las categorías de
+los ficheros, también en el estado) para que todas sus partes compartan
+diccionario; si aparece una categoría nueva se reexporta todo. Los formatos son
+`csv` (aquí, librería estándar) y `parquet`/`arrow` (`arrow_export`, extra
+`export`).
+
+Uso típico:
+    export_questions(Path("data"), Path(EXPORTS_DIR), CsvExportWriter(EXPORTS_DIR))
+"""
+
+import csv
+import json
+import os
+import time
+from itertools import batched
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence
+
+from src.infrastructure.outbound.local.question_index import (
+    QuestionIndex,
+    category_from_questions_file,
+)
+from src.infrastructure.serialization.json_serializer import write_bytes_atomic
+from src.infrastructure.serialization.json_stream import JsonArrayStream
+
+STATE_FILE = "export_state.json"
+DEFAULT_CHUNK_SIZE = 20_000
+
+QUESTION_COLUMNS = (
+    "id",
+    "category",
+    "title_text",
+    "title_image",
+    "option_count",
+    "correct_option",
+    "has_title_image",
+    "has_option_images",
+)
+OPTION_COLUMNS = (
+    "question_id",
+    "category",
+    "position",
+    "option_text",
+    "option_image",
+    "is_correct",
+)
+TABLES = {"questions": QUESTION_COLUMNS, "options": OPTION_COLUMNS}
+
+# Columnas por tabla: {"questions": {"id": [...], ...}, "options": {...}}
+TableChunks = Dict[str, Dict[str, List]]
+
+
+# =================================
+# APLANADO
+# =================================
+def flatten_records(records: Sequence[dict]) -> TableChunks:
+    """Aplana un bloque de registros en las columnas de cada tabla."""
+    chunks = {
+        table: {column: [] for column in columns} for table, columns in TABLES.items()
+    }
+    questions = chunks["questions"]
+    options = chunks["options"]
+    for record in records:
+        title = record.get("title") or {}
+        record_options = record.get("options") or []
+        correct = record.get("correct_option")
+        category = record.get("category")
+
+        questions["id"].append(record["id"])
+        questions["category"].append(category)
+        questions["title_text"].append(title.get("titleText"))
+        questions["title_image"].append(title.get("titleImage"))
+        questions["option_count"].append(len(record_options))
+        questions["correct_option"].append(correct)
+        questions["has_title_image"].append(bool(title.get("titleImage")))
+        questions["has_option_images"].append(
+            any(option.get("optionImage") for option in record_options)
+        )
+
+        for position, option in enumerate(record_options):
+            options["question_id"].append(record["id"])
+            options["category"].append(category)
+            options["position"].append(position)
+            options["option_text"].append(option.get("optionText"))
+            options["option_image"].append(option.get("optionImage"))
+            options["is_correct"].append(position == correct)
+    return chunks
+
+
+# =================================
+# CSV
+# =================================
+class CsvExportWriter:
+    """Añade las filas nuevas a `csv/questions.csv` y `csv/options.csv`."""
+
+    format = "csv"
+    # El CSV guarda la categoría como texto: no necesita un diccionario fijo
+    fixed_categories = False
+
+    def __init__(self, output_dir: Path):
+        """Prepara el escritor bajo `output_dir/csv`."""
+        self.directory = Path(output_dir) / self.format
+        self._files = {}
+        self._writers = {}
+
+    def reset(self) -> None:
+        """Borra las exportaciones anteriores (exportación completa)."""
+        for table in TABLES:
+            (self.directory / f"{table}.csv").unlink(missing_ok=True)
+
+    def open(self, state: Dict) -> None:
+        """
+        Abre los CSV para añadir filas.
+
+        Cada fichero se recorta al tamaño anotado en el estado, de modo que las
+        filas de una ejecución interrumpida no quedan duplicadas.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        sizes = state.get("bytes", {})
+        for table, columns in TABLES.items():
+            path = self.directory / f"{table}.csv"
+            handle = open(path, "a+", encoding="utf-8", newline="")
+            size = min(sizes.get(table, 0), path.stat().st_size)
+            handle.truncate(size)
+            self._files[table] = handle
+            self._writers[table] = csv.writer(handle)
+            if size == 0:
+                self._writers[table].writerow(columns)
+
+    def write(self, chunks: TableChunks) -> None:
+        """Escribe un bloque de filas en cada tabla."""
+        for table, columns in chunks.items():
+            self._writers[table].writerows(zip(*columns.values()))
+
+    def close(self, state: Dict) -> None:
+        """Cierra los ficheros y anota su tamaño en el estado."""
+        for handle in self._files.values():
+            handle.close()
+        state["bytes"] = {
+            table: os.path.getsize(self.directory / f"{table}.csv") for table in TABLES
+        }
+        self._files = {}
+        self._writers = {}
+
+
+# =================================
+# EXPORTACIÓN INCREMENTAL
+# =================================
+def load_state(path: Path) -> Dict:
+    """Estado de exportaciones anteriores ({} si no hay)."""
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _rewritten_files(
+    inodes: Dict[str, int], exported_inodes: Dict[str, int]
+) -> List[str]:
+    """Ficheros ya exportados que se han sustituido desde entonces."""
+    return [
+        name
+        for name, inode in inodes.items()
+        if exported_inodes.get(name, inode) != inode
+    ]
+
+
+def _new_categories(format_state: Dict, categories: List[str], writer) -> List[str]:
+    """Categorías que faltan en el diccionario de las partes ya escritas."""
+    if (
+        not getattr(writer, "fixed_categories", False)
+        or "categories" not in format_state
+    ):
+        return []
+    return sorted(set(categories) - set(format_state["categories"]))
+
+
+def _can_resume(path: Path, offset: int) -> bool:
+    """Indica si en `offset` sigue el `]` final (o la coma de un añadido)."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        return f.read(1) in (b"]", b",")
+
+
+def _iter_new_records(
+    files: Sequence[Path],
+    exported: Dict[str, int],
+    offsets: Dict[str, int],
+    counts: Dict[str, int],
+) -> Iterator[dict]:
+    """
+    Registros de cada fichero a partir de los ya exportados.
+
+    Si se conoce la posición del `]` final de la exportación anterior, la
+    lectura se reanuda ahí; si no, se recorre el fichero saltando los ya
+    exportados. Al terminar cada fichero anota su recuento y su nuevo `]`.
+    """
+    for path in files:
+        done = exported.get(path.name, 0)
+        offset = offsets.get(path.name)
+        if done and offset is not None and _can_resume(path, offset):
+            stream = JsonArrayStream(str(path), resume_offset=offset)
+            count = done
+            for count, record in enumerate(stream, done + 1):
+                yield record
+        else:
+            stream = JsonArrayStream(str(path))
+            count = 0
+            for count, record in enumerate(stream, 1):
+                if count > done:
+                    yield record
+        counts[path.name] = count
+        offsets[path.name] = stream.end_offset
+
+
+def _needs_full_export(
+    format_state: Dict, inodes: Dict[str, int], categories: List[str], writer
+) -> bool:
+    """Indica si lo ya exportado no sirve y hay que exportarlo todo de nuevo."""
+    rewritten = _rewritten_files(inodes, format_state.get("inodes", {}))
+    if rewritten:
+        print(f"🔁 Ficheros reescritos desde la última exportación: {rewritten}")
+    new_categories = _new_categories(format_state, categories, writer)
+    if new_categories:
+        print(f"🔁 Categorías nuevas en el diccionario: {new_categories}")
+    return bool(rewritten or new_categories)
+
+
+def export_questions(
+    data_dir: Path,
+    output_dir: Path,
+    writer,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    full: bool = False,
+) -> Dict:
+    """
+    Exporta las preguntas nuevas de `data_dir` con el escritor dado.
+
+    Args:
+        data_dir: Directorio con los `questions_<categoria>.json`
+        output_dir: Directorio de exportación (con `export_state.json`)
+        writer: `CsvExportWriter`, `ParquetExportWriter` o `ArrowExportWriter`
+        chunk_size: Preguntas por bloque (cota de memoria)
+        full: Descarta lo exportado y vuelve a exportar todo
+
+    Returns:
+        Dict: Preguntas nuevas y totales exportadas en el formato
+    """
+    start = time.perf_counter()
+    state_path = Path(output_dir) / STATE_FILE
+    state = load_state(state_path)
+    format_state = state.get(writer.format, {})
+    files = QuestionIndex(data_dir).question_files()
+    inodes = {path.name: path.stat().st_ino for path in files}
+    categories = sorted(category_from_questions_file(path) for path in files)
+    full = full or _needs_full_export(format_state, inodes, categories, writer)
+    if full:
+        writer.reset()
+        format_state = {}
+    exported = format_state.setdefault("files", {})
+    offsets = format_state.setdefault("offsets", {})
+    format_state["inodes"] = inodes
+    format_state["categories"] = sorted(
+        set(categories).union(format_state.get("categories", []))
+    )
+
+    counts: Dict[str, int] = {}
+    records = _iter_new_records(files, exported, offsets, counts)
+    new = 0
+    for chunk in batched(records, chunk_size):
+        if not new:
+            writer.open(format_state)
+        writer.write(flatten_records(chunk))
+        new += len(chunk)
+    if new:
+        writer.close(format_state)
+
+    shrunk = [name for name, count in counts.items() if count < exported.get(name, 0)]
+    if shrunk:
+        print(
+            f"⚠️ Ficheros con menos preguntas que las ya exportadas: {shrunk} "
+            "(usa una exportación completa)"
+        )
+    for name, count in counts.items():
+        exported[name] = max(count, exported.get(name, 0))
+    format_state["questions"] = format_state.get("questions", 0) + new
+    state[writer.format] = format_state
+    write_bytes_atomic(
+        str(state_path), json.dumps(state, ensure_ascii=False, indent=2).encode()
+    )
+
+    report = {
+        "format": writer.format,
+        "new": new,
+        "total": format_state["questions"],
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }
+    print(
+        f"📤 {writer.format}: {new} preguntas nuevas exportadas "
+        f"({report['total']} en total) en {report['elapsed_s']}s"
+    )
+    return report
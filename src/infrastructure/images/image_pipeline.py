@@ -0,0 +1,452 @@
+"""
+Post-procesado de las imágenes descargadas para servirlas.
+
+El scraper guarda las imágenes tal cual bajo
+`assets/images/{questions,options}/<categoria>` con la extensión que dedujo de
+la URL. Este módulo, para cada imagen nueva y en un `ProcessPoolExecutor`:
+
+    1. Verifica el fichero y detecta su formato real (no el de la extensión)
+    2. Lo recodifica a WebP (sin pérdida si tiene pocos colores, como los
+       esquemas) o a PNG optimizado
+    3. Genera una miniatura WebP
+    4. Calcula un hash de los píxeles decodificados y un hash perceptual
+       (pHash DCT de 64 bits)
+
+Con el hash de píxeles se detectan esquemas idénticos guardados con distintos
+IDs de pregunta: todas las copias apuntan a la primera (canónica). El pHash no
+basta para eso (esquemas que solo difieren en una etiqueta, "R1" frente a
+"R2", dan el mismo pHash), así que solo se usa para anotar casi duplicados en
+el manifiesto (`near_duplicate_of`), sin cambiar a qué imagen apuntan. Después
+`update_json_references` (y `SqliteQuestionRepository.replace_image_paths`)
+sustituyen las rutas `titleImage`/`optionImage` por las procesadas.
+
+El proceso es incremental: el manifiesto `assets/processed/manifest.json`
+guarda tamaño y fecha de modificación de cada original, y solo se procesan los
+ficheros nuevos o modificados. Las imágenes originales no se borran.
+
+Uso típico:
+    pipeline = ImagePipeline(Path("assets"))
+    report = pipeline.run()
+    update_json_references(Path("data"), pipeline.reference_map())
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from ...domain.quiz.quiz_question_model import QuizQuestionModel
+from ..serialization.json_serializer import get_serializer, write_bytes_atomic
+
+DEFAULT_ASSETS_DIR = Path("assets")
+SOURCE_SUBDIR = "images"
+PROCESSED_SUBDIR = "processed"
+THUMBNAILS_SUBDIR = "thumbs"
+MANIFEST_NAME = "manifest.json"
+IMAGE_KINDS = ("questions", "options")
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"}
+
+OUTPUT_FORMATS = ("webp", "png")
+DEFAULT_THUMBNAIL_SIZE = 320
+WEBP_QUALITY = 85
+# Imágenes con hasta este número de colores se codifican sin pérdida
+LOSSLESS_MAX_COLORS = 256
+# Distancia de Hamming máxima entre pHash para anotar dos imágenes como casi
+# duplicadas (solo informativo: las referencias solo se comparten con píxeles
+# idénticos)
+DEFAULT_PHASH_THRESHOLD = 0
+
+# Formato de Pillow -> extensiones que le corresponden
+FORMAT_SUFFIXES = {
+    "PNG": {".png"},
+    "JPEG": {".jpg", ".jpeg"},
+    "GIF": {".gif"},
+    "WEBP": {".webp"},
+    "BMP": {".bmp"},
+}
+
+
+# =================================
+# PROCESADO DE UNA IMAGEN (en los procesos del pool)
+# =================================
+@dataclass(frozen=True)
+class ImageTask:
+    """Trabajo de procesado de una imagen (serializable para el pool)."""
+
+    source: str
+    output: str
+    thumbnail: str
+    output_format: str = "webp"
+    thumbnail_size: int = DEFAULT_THUMBNAIL_SIZE
+
+
+def _dct_matrix(size: int) -> np.ndarray:
+    """Matriz de la DCT-II ortonormal de tamaño `size`."""
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    matrix = np.sqrt(2 / size) * np.cos(np.pi * (2 * n + 1) * k / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+def perceptual_hash(image: Image.Image, hash_size: int = 8) -> int:
+    """
+    Hash perceptual (pHash DCT) de una imagen como entero de `hash_size`² bits.
+
+    Se reduce la imagen a 32x32 en escala de grises, se aplica la DCT 2D y cada
+    bit indica si el coeficiente de baja frecuencia supera la mediana.
+    """
+    size = hash_size * 4
+    gray = image.convert("L").resize((size, size), Image.Resampling.LANCZOS)
+    pixels = np.asarray(gray, dtype=np.float64)
+    dct = _dct_matrix(size)
+    low = (dct @ pixels @ dct.T)[:hash_size, :hash_size].flatten()
+    bits = low > np.median(low)
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Número de bits distintos entre dos hashes."""
+    return (a ^ b).bit_count()
+
+
+def _normalize_mode(image: Image.Image) -> Image.Image:
+    """Convierte a RGB o RGBA (modos que aceptan WebP y PNG sin sorpresas)."""
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    target = "RGBA" if has_alpha else "RGB"
+    return image if image.mode == target else image.convert(target)
+
+
+def _save_encoded(image: Image.Image, path: str, output_format: str) -> None:
+    """Guarda la imagen en WebP o PNG optimizado, sin pérdida si hay pocos colores."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    few_colors = image.getcolors(LOSSLESS_MAX_COLORS) is not None
+    if output_format == "png":
+        if few_colors:
+            image = image.convert("P", palette=Image.Palette.ADAPTIVE)
+        image.save(path, "PNG", optimize=True)
+    elif few_colors:
+        image.save(path, "WEBP", lossless=True, method=6)
+    else:
+        image.save(path, "WEBP", quality=WEBP_QUALITY, method=6)
+
+
+def pixel_hash(image: Image.Image) -> str:
+    """Hash de los píxeles decodificados: igual solo si la imagen es idéntica."""
+    digest = hashlib.blake2b(f"{image.mode}:{image.size}".encode(), digest_size=16)
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def process_image(task: ImageTask) -> dict:
+    """
+    Verifica, recodifica, genera la miniatura y calcula el pHash de una imagen.
+
+    Returns:
+        dict: Entrada del manifiesto (con 'error' si el fichero no es válido)
+    """
+    start = time.perf_counter()
+    result = {"source": task.source, "bytes_in": os.path.getsize(task.source)}
+    try:
+        with Image.open(task.source) as image:
+            image.verify()
+        with Image.open(task.source) as image:
+            result["format"] = image.format
+            # Las imágenes animadas se sirven con su primer fotograma
+            image.seek(0)
+            frame = _normalize_mode(image)
+            result["width"], result["height"] = frame.size
+            result["pixel_hash"] = pixel_hash(frame)
+            result["phash"] = f"{perceptual_hash(frame):016x}"
+            _save_encoded(frame, task.output, task.output_format)
+            thumbnail = frame.copy()
+            thumbnail.thumbnail((task.thumbnail_size, task.thumbnail_size))
+            _save_encoded(thumbnail, task.thumbnail, "webp")
+    except (OSError, SyntaxError, ValueError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    suffix = Path(task.source).suffix.lower()
+    result["extension_mismatch"] = suffix not in FORMAT_SUFFIXES.get(
+        result["format"], {suffix}
+    )
+    result["output"] = task.output
+    result["thumbnail"] = task.thumbnail
+    result["bytes_out"] = os.path.getsize(task.output)
+    result["elapsed_s"] = round(time.perf_counter() - start, 4)
+    return result
+
+
+# =================================
+# PIPELINE INCREMENTAL
+# =================================
+def _as_reference(path: Path) -> str:
+    """Ruta como la guarda el modelo (relativa, con barras normales)."""
+    return str(path).replace("\\", "/")
+
+
+class ImagePipeline:
+    """Procesa de forma incremental las imágenes nuevas de `assets/images`."""
+
+    def __init__(
+        self,
+        assets_dir: Path = DEFAULT_ASSETS_DIR,
+        workers: Optional[int] = None,
+        output_format: str = "webp",
+        thumbnail_size: int = DEFAULT_THUMBNAIL_SIZE,
+        phash_threshold: int = DEFAULT_PHASH_THRESHOLD,
+    ):
+        """
+        Inicializa el pipeline y carga el manifiesto existente.
+
+        Args:
+            assets_dir: Directorio raíz de los assets (con `images/` dentro)
+            workers: Procesos del pool (por defecto, uno por CPU)
+            output_format: "webp" o "png"
+            thumbnail_size: Lado máximo de las miniaturas en píxeles
+            phash_threshold: Distancia máxima entre pHash para anotar casi
+                duplicados (no cambia las referencias)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Formato de salida no soportado: {output_format}")
+        self.assets_dir = Path(assets_dir)
+        self.source_dir = self.assets_dir / SOURCE_SUBDIR
+        self.processed_dir = self.assets_dir / PROCESSED_SUBDIR
+        self.manifest_path = self.processed_dir / MANIFEST_NAME
+        self.workers = workers
+        self.output_format = output_format
+        self.thumbnail_size = thumbnail_size
+        self.phash_threshold = phash_threshold
+        self.entries: Dict[str, dict] = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        """Entradas del manifiesto por ruta del original."""
+        if not self.manifest_path.exists():
+            return {}
+        return get_serializer().load_file(str(self.manifest_path))
+
+    def _save_manifest(self) -> None:
+        """Escribe el manifiesto de forma atómica."""
+        data = json.dumps(self.entries, ensure_ascii=False, indent=1, sort_keys=True)
+        write_bytes_atomic(str(self.manifest_path), data.encode("utf-8"))
+
+    # =================================
+    # DESCUBRIMIENTO
+    # =================================
+    def source_files(self) -> Iterator[Path]:
+        """Imágenes originales de preguntas y opciones, en orden estable."""
+        for kind in IMAGE_KINDS:
+            kind_dir = self.source_dir / kind
+            if kind_dir.exists():
+                yield from sorted(
+                    path
+                    for path in kind_dir.rglob("*")
+                    if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+                )
+
+    def _is_current(self, source: Path) -> bool:
+        """Indica si el original ya está procesado y no ha cambiado."""
+        entry = self.entries.get(_as_reference(source))
+        # Las entradas sin hash de píxeles (deduplicadas solo por pHash) se rehacen
+        if entry is None or ("pixel_hash" not in entry and "error" not in entry):
+            return False
+        stat = source.stat()
+        return entry.get("signature") == [stat.st_size, stat.st_mtime_ns]
+
+    def _task_for(self, source: Path) -> ImageTask:
+        """Rutas de salida de un original (misma estructura bajo `processed/`)."""
+        relative = source.relative_to(self.source_dir)
+        output = self.processed_dir / relative.with_suffix(f".{self.output_format}")
+        thumbnail = self.processed_dir / THUMBNAILS_SUBDIR / relative
+        return ImageTask(
+            source=_as_reference(source),
+            output=_as_reference(output),
+            thumbnail=_as_reference(thumbnail.with_suffix(".webp")),
+            output_format=self.output_format,
+            thumbnail_size=self.thumbnail_size,
+        )
+
+    def pending_tasks(self) -> List[ImageTask]:
+        """Trabajos de los originales nuevos o modificados."""
+        return [
+            self._task_for(source)
+            for source in self.source_files()
+            if not self._is_current(source)
+        ]
+
+    # =================================
+    # EJECUCIÓN
+    # =================================
+    def run(self) -> dict:
+        """
+        Procesa las imágenes pendientes, deduplica y guarda el manifiesto.
+
+        Returns:
+            dict: Resumen (procesadas, errores, duplicados, bytes...)
+        """
+        start = time.perf_counter()
+        tasks = self.pending_tasks()
+        results = []
+        if tasks:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(process_image, tasks, chunksize=8))
+
+        for result in results:
+            stat = os.stat(result["source"])
+            result["signature"] = [stat.st_size, stat.st_mtime_ns]
+            self.entries[result["source"]] = result
+        duplicates, near_duplicates = self._assign_canonicals(
+            [r for r in results if "error" not in r]
+        )
+        self._save_manifest()
+
+        ok = [r for r in results if "error" not in r]
+        return {
+            "pending": len(tasks),
+            "processed": len(ok),
+            "errors": len(results) - len(ok),
+            "duplicates": duplicates,
+            "near_duplicates": near_duplicates,
+            "extension_mismatches": sum(r["extension_mismatch"] for r in ok),
+            "bytes_in": sum(r["bytes_in"] for r in ok),
+            "bytes_out": sum(r["bytes_out"] for r in ok),
+            "elapsed_s": round(time.perf_counter() - start, 2),
+        }
+
+    def _assign_canonicals(self, new_entries: List[dict]) -> Tuple[int, int]:
+        """
+        Marca cada entrada nueva con su imagen canónica.
+
+        Dos imágenes son la misma solo si sus píxeles decodificados son
+        idénticos; la canónica es la primera procesada. Las que no lo son pero
+        tienen las mismas dimensiones y sus pHash a una distancia <=
+        `phash_threshold` se anotan con `near_duplicate_of`.
+
+        Returns:
+            tuple: (entradas nuevas duplicadas, entradas nuevas casi duplicadas)
+        """
+        new_sources = {entry["source"] for entry in new_entries}
+        canonicals = [
+            entry
+            for entry in self.entries.values()
+            if "error" not in entry
+            and "pixel_hash" in entry
+            and entry.get("canonical") == entry["source"]
+            and entry["source"] not in new_sources
+        ]
+        by_pixels = {entry["pixel_hash"]: entry for entry in canonicals}
+        duplicates = 0
+        near_duplicates = 0
+        for entry in new_entries:
+            entry.pop("near_duplicate_of", None)
+            match = by_pixels.get(entry["pixel_hash"])
+            if match is not None:
+                entry["canonical"] = match["source"]
+                duplicates += 1
+                continue
+            entry["canonical"] = entry["source"]
+            near = self._near_duplicate(entry, canonicals)
+            if near is not None:
+                entry["near_duplicate_of"] = near["source"]
+                near_duplicates += 1
+            by_pixels[entry["pixel_hash"]] = entry
+            canonicals.append(entry)
+        return duplicates, near_duplicates
+
+    def _near_duplicate(self, entry: dict, canonicals: List[dict]) -> Optional[dict]:
+        """Primera canónica de las mismas dimensiones con un pHash cercano."""
+        phash = int(entry["phash"], 16)
+        return next(
+            (
+                canonical
+                for canonical in canonicals
+                if (canonical["width"], canonical["height"])
+                == (entry["width"], entry["height"])
+                and hamming_distance(int(canonical["phash"], 16), phash)
+                <= self.phash_threshold
+            ),
+            None,
+        )
+
+    # =================================
+    # REFERENCIAS
+    # =================================
+    def reference_map(self) -> Dict[str, str]:
+        """
+        Ruta del original -> ruta procesada de su imagen canónica.
+
+        Solo se comparte la imagen de otra entrada si sus píxeles son idénticos
+        (las entradas de manifiestos antiguos, deduplicadas por pHash, apuntan
+        a su propia imagen procesada).
+        """
+        mapping = {}
+        for source, entry in self.entries.items():
+            if "error" in entry or "output" not in entry:
+                continue
+            canonical = self.entries.get(entry.get("canonical", ""))
+            if (
+                canonical is None
+                or entry.get("pixel_hash") is None
+                or canonical.get("pixel_hash") != entry["pixel_hash"]
+            ):
+                canonical = entry
+            mapping[source] = canonical["output"]
+        return mapping
+
+
+def thumbnail_reference(reference: str, assets_dir: Path = DEFAULT_ASSETS_DIR) -> str:
+    """Ruta de la miniatura de una imagen procesada."""
+    processed = Path(assets_dir) / PROCESSED_SUBDIR
+    relative = Path(reference).relative_to(processed)
+    return _as_reference(
+        (processed / THUMBNAILS_SUBDIR / relative).with_suffix(".webp")
+    )
+
+
+def _remap_record(record: dict, mapping: Dict[str, str]) -> bool:
+    """Sustituye en un registro las rutas de imagen procesadas. True si cambió."""
+    question = QuizQuestionModel(**record)
+    changed = False
+    title_path = question.title.image_full_path(question.category)
+    if title_path is not None and _as_reference(title_path) in mapping:
+        record["title"]["titleImage"] = mapping[_as_reference(title_path)]
+        changed = True
+    for option, raw_option in zip(question.options, record["options"]):
+        option_path = option.image_full_path(question.category)
+        if option_path is not None and _as_reference(option_path) in mapping:
+            raw_option["optionImage"] = mapping[_as_reference(option_path)]
+            changed = True
+    return changed
+
+
+def update_json_references(data_dir: Path, mapping: Dict[str, str]) -> int:
+    """
+    Actualiza `titleImage`/`optionImage` de los ficheros de preguntas.
+
+    Reescribe (de forma atómica) solo los ficheros con alguna ruta cambiada.
+    Debe ejecutarse con el scraper parado, ya que reescribe el fichero entero.
+    Al sustituirse el fichero cambia su inodo, y con ello `QuestionIndex` lo
+    reindexa entero y la exportación incremental vuelve a exportarlo todo.
+
+    Returns:
+        int: Número de preguntas actualizadas
+    """
+    from ..outbound.local.question_index import QuestionIndex
+
+    updated = 0
+    serializer = get_serializer()
+    for file_path in QuestionIndex(data_dir).question_files():
+        records = serializer.load_file(str(file_path))
+        changed = sum(_remap_record(record, mapping) for record in records)
+        if changed:
+            serializer.dump_file(str(file_path), records)
+            print(f"🖼️ {file_path}: {changed} preguntas con imágenes actualizadas")
+        updated += changed
+    return updated
@@ -0,0 +1,331 @@
+"""
+Formato binario de banco de preguntas legible mediante `mmap`.
+
+El fichero tiene cinco secciones consecutivas:
+
+    cabecera     struct HEADER (tamaño fijo)
+    registros    RECORD_ENTRY * record_count   (tamaño fijo por pregunta)
+    opciones     OPTION_ENTRY * option_count   (tamaño fijo por opción)
+    índice IDs   uint32 * record_count         (nº de registro ordenado por ID)
+    heap         cadenas UTF-8 sin separador, deduplicadas
+
+Las cadenas se referencian como (offset, longitud) relativos al inicio del heap;
+`NONE_LENGTH` codifica `None`. Como todo es de tamaño fijo salvo el heap, el
+acceso por índice es O(1) y la búsqueda por ID es una búsqueda binaria sobre el
+índice ordenado, sin parsear el fichero. Al abrirse con `mmap` varios procesos
+comparten las mismas páginas de la caché del sistema operativo.
+
+Uso típico:
+    export_question_bank(["data/questions_normativa.json"], "data/questions.qbank")
+    with QuestionBankReader("data/questions.qbank") as bank:
+        question = bank.get_by_id("...")
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.serialization.json_stream import iter_json_array
+
+MAGIC = b"QBNK"
+VERSION = 1
+NONE_LENGTH = 0xFFFFFFFF
+
+# magic, version, flags, record_count, option_count,
+# records_offset, options_offset, id_index_offset, heap_offset, heap_size
+HEADER = struct.Struct("<4sHHIIQQQQQ")
+
+# id, category, titleText, titleImage (offset, longitud) + correct_option,
+# primera opción y número de opciones
+RECORD_ENTRY = struct.Struct("<IIIIIIIIiII")
+
+# optionText, optionImage (offset, longitud)
+OPTION_ENTRY = struct.Struct("<IIII")
+
+ID_INDEX_ENTRY = struct.Struct("<I")
+
+
+class QuestionBankError(ValueError):
+    """Error de formato al leer un banco de preguntas binario."""
+
+
+# =================================
+# ESCRITURA
+# =================================
+class _StringHeap:
+    """Acumula cadenas UTF-8 deduplicadas y devuelve su (offset, longitud)."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._offsets: Dict[str, tuple] = {}
+
+    def add(self, value: Optional[str]) -> tuple:
+        if value is None:
+            return 0, NONE_LENGTH
+        ref = self._offsets.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.buffer), len(encoded))
+            self.buffer += encoded
+            self._offsets[value] = ref
+        return ref
+
+
+def write_question_bank(records: Iterable[dict], output_path: str) -> int:
+    """
+    Escribe un banco binario a partir de registros con el esquema de
+    `QuizQuestionModel.model_dump()`.
+
+    Returns:
+        int: Número de preguntas escritas
+    """
+    heap = _StringHeap()
+    record_table = bytearray()
+    option_table = bytearray()
+    ids: List[bytes] = []
+    option_count = 0
+
+    for record in records:
+        title = record.get("title") or {}
+        options = record.get("options") or []
+
+        record_table += RECORD_ENTRY.pack(
+            *heap.add(record["id"]),
+            *heap.add(record.get("category", "default")),
+            *heap.add(title.get("titleText", "")),
+            *heap.add(title.get("titleImage")),
+            int(record.get("correct_option", 0)),
+            option_count,
+            len(options),
+        )
+        for option in options:
+            option_table += OPTION_ENTRY.pack(
+                *heap.add(option.get("optionText")),
+                *heap.add(option.get("optionImage")),
+            )
+        option_count += len(options)
+        ids.append(record["id"].encode("utf-8"))
+
+    record_count = len(ids)
+    id_index = bytearray()
+    for record_number in sorted(range(record_count), key=ids.__getitem__):
+        id_index += ID_INDEX_ENTRY.pack(record_number)
+
+    records_offset = HEADER.size
+    options_offset = records_offset + len(record_table)
+    id_index_offset = options_offset + len(option_table)
+    heap_offset = id_index_offset + len(id_index)
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        record_count,
+        option_count,
+        records_offset,
+        options_offset,
+        id_index_offset,
+        heap_offset,
+        len(heap.buffer),
+    )
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(record_table)
+        f.write(option_table)
+        f.write(id_index)
+        f.write(heap.buffer)
+    os.replace(tmp_path, output_path)
+
+    return record_count
+
+
+def export_question_bank(json_files: Iterable[str], output_path: str) -> int:
+    """
+    Exporta uno o varios ficheros JSON de preguntas a un banco binario.
+
+    Los JSON se leen en streaming; en memoria solo quedan las tablas del banco.
+
+    Returns:
+        int: Número de preguntas exportadas
+    """
+
+    def iter_records() -> Iterator[dict]:
+        for json_file in json_files:
+            yield from iter_json_array(json_file)
+
+    count = write_question_bank(iter_records(), output_path)
+    print(f"✅ Banco binario generado: {output_path} ({count} preguntas)")
+    return count
+
+
+# =================================
+# LECTURA
+# =================================
+class QuestionBankReader:
+    """Lector de bancos binarios mediante `mmap` con acceso aleatorio."""
+
+    def __init__(self, path: str):
+        """Abre y valida el fichero; no lee ningún registro."""
+        self.path = path
+        self._mmap = None
+        self._view = None
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:
+            self._file.close()
+            raise QuestionBankError(f"Banco de preguntas vacío: {path}") from e
+        self._view = memoryview(self._mmap)
+
+        if len(self._view) < HEADER.size:
+            self.close()
+            raise QuestionBankError(f"Cabecera truncada en {path}")
+
+        (
+            magic,
+            version,
+            _flags,
+            self.record_count,
+            self.option_count,
+            self._records_offset,
+            self._options_offset,
+            self._id_index_offset,
+            self._heap_offset,
+            heap_size,
+        ) = HEADER.unpack_from(self._view, 0)
+
+        if magic != MAGIC:
+            self.close()
+            raise QuestionBankError(f"{path} no es un banco de preguntas")
+        if version != VERSION:
+            self.close()
+            raise QuestionBankError(f"Versión de banco no soportada: {version}")
+        if self._heap_offset + heap_size > len(self._view):
+            self.close()
+            raise QuestionBankError(f"Heap truncado en {path}")
+
+    def close(self) -> None:
+        """Libera el mapeo de memoria y el fichero."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        """Permite usar el lector como context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cierra el lector al salir del contexto."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Número de preguntas del banco."""
+        return self.record_count
+
+    def _string(self, offset: int, length: int) -> Optional[str]:
+        """Decodifica una cadena del heap."""
+        if length == NONE_LENGTH:
+            return None
+        start = self._heap_offset + offset
+        return str(self._view[start : start + length], "utf-8")
+
+    def _raw_id(self, record_number: int) -> bytes:
+        """Bytes del ID de un registro, sin decodificar el resto."""
+        id_offset, id_length = struct.unpack_from(
+            "<II", self._view, self._records_offset + record_number * RECORD_ENTRY.size
+        )
+        start = self._heap_offset + id_offset
+        return self._view[start : start + id_length].tobytes()
+
+    def record(self, record_number: int) -> dict:
+        """Devuelve el registro `record_number` con el esquema del JSON."""
+        if record_number < 0:
+            record_number += self.record_count
+        if not 0 <= record_number < self.record_count:
+            raise IndexError(f"Índice fuera de rango: {record_number}")
+
+        (
+            id_off,
+            id_len,
+            cat_off,
+            cat_len,
+            title_off,
+            title_len,
+            img_off,
+            img_len,
+            correct_option,
+            first_option,
+            num_options,
+        ) = RECORD_ENTRY.unpack_from(
+            self._view, self._records_offset + record_number * RECORD_ENTRY.size
+        )
+
+        options = []
+        for option_number in range(first_option, first_option + num_options):
+            text_off, text_len, opt_img_off, opt_img_len = OPTION_ENTRY.unpack_from(
+                self._view, self._options_offset + option_number * OPTION_ENTRY.size
+            )
+            options.append(
+                {
+                    "optionText": self._string(text_off, text_len),
+                    "optionImage": self._string(opt_img_off, opt_img_len),
+                }
+            )
+
+        return {
+            "id": self._string(id_off, id_len),
+            "title": {
+                "titleText": self._string(title_off, title_len),
+                "titleImage": self._string(img_off, img_len),
+            },
+            "options": options,
+            "correct_option": correct_option,
+            "category": self._string(cat_off, cat_len),
+        }
+
+    def __getitem__(self, record_number: int) -> QuizQuestionModel:
+        """Devuelve la pregunta en la posición dada como modelo de dominio."""
+        return QuizQuestionModel(**self.record(record_number))
+
+    def __iter__(self) -> Iterator[QuizQuestionModel]:
+        """Itera las preguntas en orden, creando los modelos bajo demanda."""
+        for record_number in range(self.record_count):
+            yield self[record_number]
+
+    def find_record_number(self, question_id: str) -> Optional[int]:
+        """Busca el número de registro de un ID mediante búsqueda binaria."""
+        target = question_id.encode("utf-8")
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            (record_number,) = ID_INDEX_ENTRY.unpack_from(
+                self._view, self._id_index_offset + middle * ID_INDEX_ENTRY.size
+            )
+            current = self._raw_id(record_number)
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return record_number
+        return None
+
+    def get_by_id(self, question_id: str) -> Optional[QuizQuestionModel]:
+        """Devuelve la pregunta con el ID dado (None si no existe)."""
+        record_number = self.find_record_number(question_id)
+        if record_number is None:
+            return None
+        return self[record_number]
+
+    def __str__(self):
+        """Representación en string del lector."""
+        return f"QuestionBankReader({self.path}: {self.record_count} preguntas)"
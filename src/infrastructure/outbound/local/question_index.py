@@ -0,0 +1,250 @@
+"""
+Repositorio de preguntas sobre los ficheros JSON por categoría.
+
+Se construye una vez al arrancar a partir de `data/questions_<categoria>.json`
+sobre el índice en memoria de `InMemoryQuestionRepository` y añade:
+    - ID -> posición (categoría, índice en el fichero)
+    - refresco incremental desde disco: se reanuda la lectura en el `]` final
+      de la anterior, así que solo se decodifican los registros añadidos
+
+Los registros se guardan como diccionarios y solo se validan como
+`QuizQuestionModel` cuando se piden, de forma que montar un examen no exige
+recorrer ni validar toda la categoría.
+
+Mientras otros hilos leen el índice, `refreshed` refresca una copia y la
+devuelve para sustituir el original de una vez, sin lecturas a medias.
+
+Uso típico:
+    index = QuestionIndex.build()
+    ids = index.sample_ids("normativa", 30)
+    questions = index.get_many(ids)
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.outbound.memory.in_memory_question_repository import (
+    InMemoryQuestionRepository,
+)
+from src.infrastructure.serialization.json_stream import (
+    JsonArrayStream,
+    JsonStreamError,
+)
+
+DEFAULT_DATA_DIR = Path("data")
+QUESTIONS_FILE_PREFIX = "questions_"
+# Formato antiguo: no es una categoría, se migra con `iter_question_records`
+LEGACY_QUESTIONS_FILE_NAME = "questions_legacy.json"
+
+
+def get_questions_file(category: str, data_dir: Path = DEFAULT_DATA_DIR) -> Path:
+    """Retorna la ruta del fichero JSON de preguntas para la categoría dada."""
+    return Path(data_dir) / f"{QUESTIONS_FILE_PREFIX}{category}.json"
+
+
+def category_from_questions_file(file_path: Path) -> str:
+    """Extrae la categoría del nombre de un fichero `questions_<categoria>.json`."""
+    return Path(file_path).stem[len(QUESTIONS_FILE_PREFIX) :]
+
+
+def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+    """
+    Firma de un fichero para saber si ha cambiado desde la última lectura.
+
+    El inodo cambia cuando el fichero se sustituye entero (`dump_file`, p. ej.
+    al reescribir las rutas de imagen): entonces no basta con leer el final.
+    """
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class QuestionIndex(InMemoryQuestionRepository):
+    """Índice en memoria de los ficheros JSON, con refresco incremental."""
+
+    def __init__(self, data_dir: Path = DEFAULT_DATA_DIR):
+        """Inicializa un índice vacío sobre el directorio de datos dado."""
+        super().__init__()
+        self.data_dir = Path(data_dir)
+        self._locations: Dict[str, Tuple[str, int]] = {}
+        # Estado por fichero para refrescar solo lo que ha cambiado
+        self._file_signatures: Dict[Path, Tuple[int, int, int]] = {}
+        self._file_positions: Dict[Path, int] = {}
+        # (registros leídos, posición en bytes del `]` final) de la última lectura
+        self._file_tails: Dict[Path, Tuple[int, int]] = {}
+
+    @classmethod
+    def build(cls, data_dir: Path = DEFAULT_DATA_DIR) -> "QuestionIndex":
+        """Construye el índice cargando todos los ficheros de preguntas."""
+        index = cls(data_dir)
+        index.refresh()
+        return index
+
+    # =================================
+    # CARGA Y REFRESCO
+    # =================================
+    def question_files(self) -> List[Path]:
+        """Lista los ficheros de preguntas por categoría del directorio de datos."""
+        if not self.data_dir.exists():
+            return []
+        return sorted(
+            path
+            for path in self.data_dir.glob(f"{QUESTIONS_FILE_PREFIX}*.json")
+            if path.name != LEGACY_QUESTIONS_FILE_NAME
+        )
+
+    def refresh(self, category: Optional[str] = None) -> int:
+        """
+        Refresca el índice de forma incremental.
+
+        Solo se vuelven a leer los ficheros cuyo tamaño o fecha de modificación han
+        cambiado, y de ellos solo se decodifican los registros añadidos al final
+        (el scraper siempre añade preguntas nuevas al final del array). Los
+        ficheros sustituidos enteros se reindexan completos.
+
+        Args:
+            category: Limita el refresco a una categoría (opcional)
+
+        Returns:
+            int: Número de preguntas nuevas indexadas
+        """
+        if category is not None:
+            files = [get_questions_file(category, self.data_dir)]
+        else:
+            files = self.question_files()
+
+        added = 0
+        for file_path in files:
+            added += self._refresh_file(file_path)
+        return added
+
+    def refreshed(self) -> Tuple["QuestionIndex", int]:
+        """
+        Refresca una copia del índice sin modificar este.
+
+        Returns:
+            tuple: (índice refrescado, o este mismo si ningún fichero cambió;
+                número de preguntas nuevas indexadas)
+        """
+        if not any(self._has_changed(path) for path in self.question_files()):
+            return self, 0
+        snapshot = self.copy()
+        return snapshot, snapshot.refresh()
+
+    def copy(self) -> "QuestionIndex":
+        """Copia independiente del índice y del estado de lectura de los ficheros."""
+        clone = super().copy()
+        clone._locations = dict(self._locations)
+        clone._file_signatures = dict(self._file_signatures)
+        clone._file_positions = dict(self._file_positions)
+        clone._file_tails = dict(self._file_tails)
+        return clone
+
+    def _has_changed(self, file_path: Path) -> bool:
+        """Indica si el fichero ha cambiado desde la última lectura."""
+        if not file_path.exists():
+            return False
+        return self._file_signatures.get(file_path) != _signature(file_path.stat())
+
+    def _refresh_file(self, file_path: Path) -> int:
+        """Indexa los registros nuevos de un fichero si ha cambiado."""
+        if not file_path.exists():
+            return 0
+
+        stat = file_path.stat()
+        signature = _signature(stat)
+        previous = self._file_signatures.get(file_path)
+        if previous == signature:
+            return 0
+        if previous is not None and previous[0] != stat.st_ino:
+            # Fichero sustituido: sus registros pueden haber cambiado, no solo crecido
+            self._file_tails.pop(file_path, None)
+
+        try:
+            parsed, records, end_offset = self._read_new_records(file_path, stat)
+        except Exception as e:
+            print(f"⚠️ Error cargando {file_path} en el índice: {e}")
+            return 0
+
+        category = category_from_questions_file(file_path)
+        if not parsed:
+            self._drop_category(category)
+        added = 0
+        for position, record in enumerate(records, parsed):
+            if self._index_record(record, category, position):
+                added += 1
+
+        total = parsed + len(records)
+        self._file_tails[file_path] = (total, end_offset)
+        # `add_questions` puede ir por delante si aún no se ha releído el fichero
+        if parsed:
+            total = max(total, self._file_positions.get(file_path, 0))
+        self._file_positions[file_path] = total
+        self._file_signatures[file_path] = signature
+        return added
+
+    def _read_new_records(
+        self, file_path: Path, stat: os.stat_result
+    ) -> Tuple[int, List[dict], int]:
+        """
+        Lee los registros añadidos desde el `]` final de la lectura anterior.
+
+        Si no hubo lectura anterior (o el fichero se sustituyó), ha encogido o lo
+        que hay en esa posición ya no es el final del array, se lee entero.
+
+        Returns:
+            tuple: (registros ya leídos antes, registros nuevos, posición en bytes
+                del nuevo `]` final)
+        """
+        parsed, end_offset = self._file_tails.get(file_path, (0, 0))
+        if parsed and end_offset < stat.st_size:
+            stream = JsonArrayStream(str(file_path), resume_offset=end_offset)
+            try:
+                return parsed, list(stream), stream.end_offset
+            except JsonStreamError:
+                pass
+        stream = JsonArrayStream(str(file_path))
+        return 0, list(stream), stream.end_offset
+
+    def _index_record(self, record: dict, category: str, position: int) -> bool:
+        """Añade un registro del fichero y recuerda su posición."""
+        if not self._add_record(record, category):
+            return False
+        self._locations[record["id"]] = (record.get("category") or category, position)
+        return True
+
+    def _drop_category(self, category: str) -> None:
+        """Elimina del índice todas las preguntas de una categoría."""
+        for question_id in self._ids_by_category.get(category, []):
+            self._locations.pop(question_id, None)
+        super()._drop_category(category)
+
+    def add_questions(self, questions: Iterable[QuizQuestionModel]) -> int:
+        """
+        Añade al índice preguntas recién guardadas sin releer el fichero.
+
+        Returns:
+            int: Número de preguntas añadidas
+        """
+        added = 0
+        for question in questions:
+            file_path = get_questions_file(question.category, self.data_dir)
+            position = self._file_positions.get(file_path, 0)
+            if self._index_record(question.model_dump(), question.category, position):
+                self._file_positions[file_path] = position + 1
+                added += 1
+        return added
+
+    # =================================
+    # CONSULTAS
+    # =================================
+    def location(self, question_id: str) -> Optional[Tuple[str, int]]:
+        """Devuelve (categoría, posición en el fichero) de una pregunta."""
+        return self._locations.get(question_id)
+
+    def __str__(self):
+        """Representación en string del índice."""
+        sizes = ", ".join(
+            f"{category}={len(ids)}" for category, ids in self._ids_by_category.items()
+        )
+        return f"QuestionIndex({self.data_dir}: {sizes or 'vacío'})"
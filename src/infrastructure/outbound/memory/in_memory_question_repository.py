@@ -0,0 +1,203 @@
+"""
+Repositorio de preguntas en memoria con índices por categoría e ID.
+
+Mantiene:
+    - categoría -> lista contigua de IDs (paginación y muestreo O(k))
+    - ID -> registro en bruto (búsqueda O(1))
+    - ID -> texto normalizado para búsqueda (se calcula la primera vez)
+
+Los registros se guardan como diccionarios y solo se validan como
+`QuizQuestionModel` cuando se piden. Sirve como réplica local de lectura de
+cualquier otro backend (`from_repository`), de forma que la API pueda atender
+todas las consultas sin salir del proceso.
+
+Uso típico:
+    replica = InMemoryQuestionRepository.from_repository(mongo_repository)
+    question = replica.get("...")
+"""
+
+import copy
+import random
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.quiz.question_repository import QuestionRepository
+from src.domain.quiz.question_search import (
+    matches_terms,
+    search_terms,
+    searchable_text,
+)
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+REPLICATION_BATCH_SIZE = 500
+
+
+class InMemoryQuestionRepository:
+    """Índice en memoria categoría -> IDs e ID -> registro."""
+
+    def __init__(self, records: Iterable[dict] = ()):
+        """Inicializa el repositorio con los registros dados (opcional)."""
+        self._ids_by_category: Dict[str, List[str]] = {}
+        self._records: Dict[str, dict] = {}
+        self._search_texts: Dict[str, str] = {}
+        # Se incrementa con cada cambio (claves de caché, ETags...)
+        self.version = 0
+        self.add_records(records)
+
+    @classmethod
+    def from_repository(
+        cls, source: QuestionRepository, batch_size: int = REPLICATION_BATCH_SIZE
+    ) -> "InMemoryQuestionRepository":
+        """Copia en memoria todo el contenido de otro repositorio."""
+        replica = cls()
+        for category in source.categories:
+            ids = source.ids(category)
+            for start in range(0, len(ids), batch_size):
+                replica.add_questions(source.get_many(ids[start : start + batch_size]))
+        return replica
+
+    def copy(self) -> "InMemoryQuestionRepository":
+        """
+        Copia independiente de los índices (los registros se comparten).
+
+        Permite preparar cambios sobre la copia mientras otros hilos siguen
+        leyendo el original, y sustituirlo después de una vez.
+        """
+        clone = copy.copy(self)
+        clone._ids_by_category = {
+            category: list(ids) for category, ids in self._ids_by_category.items()
+        }
+        clone._records = dict(self._records)
+        clone._search_texts = dict(self._search_texts)
+        return clone
+
+    # =================================
+    # ESCRITURA
+    # =================================
+    def _add_record(self, record: dict, category: Optional[str] = None) -> bool:
+        """Añade un registro si su ID no estaba ya indexado."""
+        question_id = record.get("id")
+        if not question_id or question_id in self._records:
+            return False
+
+        category = record.get("category") or category
+        self._records[question_id] = record
+        self._ids_by_category.setdefault(category, []).append(question_id)
+        self.version += 1
+        return True
+
+    def _drop_category(self, category: str) -> None:
+        """Elimina todas las preguntas de una categoría."""
+        for question_id in self._ids_by_category.pop(category, []):
+            self._records.pop(question_id, None)
+            self._search_texts.pop(question_id, None)
+        self.version += 1
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """
+        Añade registros en bruto (esquema de `QuizQuestionModel.model_dump()`).
+
+        Returns:
+            int: Número de registros añadidos
+        """
+        return sum(1 for record in records if self._add_record(record))
+
+    def add_questions(self, questions: Iterable[QuizQuestionModel]) -> int:
+        """
+        Añade preguntas nuevas (las ya existentes se ignoran).
+
+        Returns:
+            int: Número de preguntas añadidas
+        """
+        return self.add_records(question.model_dump() for question in questions)
+
+    # =================================
+    # CONSULTAS
+    # =================================
+    @property
+    def categories(self) -> List[str]:
+        """Categorías presentes en el repositorio."""
+        return list(self._ids_by_category)
+
+    def __len__(self) -> int:
+        """Número total de preguntas."""
+        return len(self._records)
+
+    def __contains__(self, question_id: str) -> bool:
+        """Indica si el ID existe."""
+        return question_id in self._records
+
+    def count(self, category: Optional[str] = None) -> int:
+        """Cuenta las preguntas (de una categoría o en total)."""
+        if category is None:
+            return len(self._records)
+        return len(self._ids_by_category.get(category, ()))
+
+    def ids(self, category: Optional[str] = None) -> List[str]:
+        """
+        Devuelve los IDs en orden de inserción.
+
+        Sin categoría se devuelven todos, agrupados por categoría.
+        """
+        if category is not None:
+            return list(self._ids_by_category.get(category, ()))
+        return [
+            question_id for ids in self._ids_by_category.values() for question_id in ids
+        ]
+
+    def get_record(self, question_id: str) -> Optional[dict]:
+        """Devuelve el registro en bruto de una pregunta."""
+        return self._records.get(question_id)
+
+    def get(self, question_id: str) -> Optional[QuizQuestionModel]:
+        """Devuelve una pregunta validada como modelo de dominio."""
+        record = self._records.get(question_id)
+        if record is None:
+            return None
+        return QuizQuestionModel(**record)
+
+    def get_many(self, question_ids: Iterable[str]) -> List[QuizQuestionModel]:
+        """Devuelve las preguntas de los IDs dados, ignorando los desconocidos."""
+        questions = []
+        for question_id in question_ids:
+            question = self.get(question_id)
+            if question is not None:
+                questions.append(question)
+        return questions
+
+    def sample_ids(
+        self, category: str, k: int, rng: Optional[random.Random] = None
+    ) -> List[str]:
+        """
+        Elige `k` IDs al azar y sin repetición de una categoría.
+
+        Si la categoría tiene menos de `k` preguntas se devuelven todas barajadas.
+        """
+        ids = self._ids_by_category.get(category, [])
+        rng = rng or random
+        return rng.sample(ids, min(k, len(ids)))
+
+    def _search_text(self, question_id: str) -> str:
+        """Texto normalizado de una pregunta (se calcula una sola vez)."""
+        text = self._search_texts.get(question_id)
+        if text is None:
+            text = searchable_text(self._records[question_id])
+            self._search_texts[question_id] = text
+        return text
+
+    def search_ids(self, query: str, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs de las preguntas que contienen todos los términos de la búsqueda."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        return [
+            question_id
+            for question_id in self.ids(category)
+            if matches_terms(self._search_text(question_id), terms)
+        ]
+
+    def __str__(self):
+        """Representación en string del repositorio."""
+        sizes = ", ".join(
+            f"{category}={len(ids)}" for category, ids in self._ids_by_category.items()
+        )
+        return f"{type(self).__name__}({sizes or 'vacío'})"
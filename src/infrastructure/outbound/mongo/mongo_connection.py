@@ -22,12 +22,14 @@ from src.framework.config import Config
 class MongoConnection:
     """Clase para manejar la conexión a MongoDB Atlas con context manager."""
 
-    def __init__(self, mongo_collection: str | None = Config.MONGODB_COLLECTION_NAME):
+    def __init__(self, mongo_collection: str | None = None):
         """Inicializa la configuración de la conexión con las variables de entorno."""
         self.uri = Config.MONGODB_URI
         self.client = None
         self.db = Config.MONGODB_DATABASE_NAME or "not_.env_db"
-        self.collection = mongo_collection or "not_.env_collection"
+        self.collection = (
+            mongo_collection or Config.MONGODB_COLLECTION_NAME or "not_.env_collection"
+        )
 
     def connect(self):
         """Establece la conexión a MongoDB Atlas."""
@@ -39,6 +41,7 @@ class MongoConnection:
         """Cierra la conexión a MongoDB Atlas."""
         if self.client:
             self.client.close()
+            self.client = None
         else:
             raise ConnectionError("No hay una conexión activa para cerrar.")
 
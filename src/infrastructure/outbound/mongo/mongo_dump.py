@@ -0,0 +1,302 @@
+"""
+Volcado y restauración en paralelo de una colección de MongoDB.
+
+El volcado reparte la colección en rangos de `_id` y recorre cada rango con
+su propio cursor en un hilo, escribiendo un fichero JSONL comprimido con gzip
+por partición (Extended JSON relajado de `bson.json_util`, que conserva
+fechas y ObjectId). Los puntos de corte salen de una muestra `$sample` de los
+`_id`, así que no hace falta recorrer la colección para planificar:
+
+    - un conjunto de rangos por tipo de `_id` muestreado (string u ObjectId),
+      acotados con `$type` porque las comparaciones de MongoDB no cruzan tipos
+    - una partición final con los `_id` de cualquier otro tipo, para que la
+      unión de las particiones sea siempre la colección completa
+
+Junto a los ficheros se escribe `manifest.json` con las particiones, sus
+recuentos y los índices de la colección. La restauración lee las particiones
+en paralelo y las escribe con `bulk_write` no ordenado por lotes; si se vacía
+antes la colección (`drop`) inserta y crea los índices al final, y si no, hace
+upserts por `_id` para poder repetirla.
+
+Uso típico:
+    stats = dump_collection(collection, "data/backups/20250101", partitions=8)
+    stats = restore_collection(collection, "data/backups/20250101", drop=True)
+"""
+
+import gzip
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import batched
+from typing import Any, Dict, List
+
+from bson import ObjectId, json_util
+from pymongo import InsertOne, ReplaceOne
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from src.infrastructure.outbound.mongo.mongo_question_repository import (
+    only_duplicate_keys,
+)
+
+MANIFEST_FILE = "manifest.json"
+DEFAULT_PARTITIONS = 8
+DEFAULT_WORKERS = 8
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_COMPRESSLEVEL = 5
+SAMPLES_PER_PARTITION = 32
+
+
+# =================================
+# PLANIFICACIÓN
+# =================================
+def _id_type(value: Any) -> str:
+    """Alias de `$type` del `_id` si se reparte en rangos ('' si no)."""
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, ObjectId):
+        return "objectId"
+    return ""
+
+
+def _split_points(ids: List[Any], parts: int) -> List[Any]:
+    """Cuantiles de una muestra ordenada de `_id` (sin repetidos)."""
+    ids = sorted(set(ids))
+    points = [ids[index * len(ids) // parts] for index in range(1, parts)]
+    return sorted(set(points))
+
+
+def plan_partitions(
+    collection: Collection, partitions: int = DEFAULT_PARTITIONS
+) -> List[Dict[str, Any]]:
+    """
+    Consultas que reparten la colección en unas `partitions` de tamaño similar.
+
+    Returns:
+        List[Dict]: Filtros disjuntos sobre `_id` que cubren toda la colección
+    """
+    total = collection.estimated_document_count()
+    if partitions <= 1 or total == 0:
+        return [{}]
+
+    sample_size = min(total, partitions * SAMPLES_PER_PARTITION)
+    sampled: Dict[str, List[Any]] = {}
+    for document in collection.aggregate(
+        [{"$sample": {"size": sample_size}}, {"$project": {"_id": 1}}]
+    ):
+        id_type = _id_type(document["_id"])
+        if id_type:
+            sampled.setdefault(id_type, []).append(document["_id"])
+    if not sampled:
+        return [{}]
+
+    queries = []
+    for id_type, ids in sampled.items():
+        # Particiones de cada tipo en proporción a su peso en la muestra
+        parts = max(1, round(partitions * len(ids) / sample_size))
+        edges = [None, *_split_points(ids, parts), None]
+        for low, high in zip(edges, edges[1:]):
+            condition: Dict[str, Any] = {"$type": id_type}
+            if low is not None:
+                condition["$gte"] = low
+            if high is not None:
+                condition["$lt"] = high
+            queries.append({"_id": condition})
+    queries.append({"$nor": [{"_id": {"$type": id_type}} for id_type in sampled]})
+    return queries
+
+
+# =================================
+# VOLCADO
+# =================================
+def _dump_partition(
+    collection: Collection, query: Dict, path: str, compresslevel: int
+) -> Dict[str, Any]:
+    """Escribe los documentos de una partición en un JSONL comprimido."""
+    start = time.perf_counter()
+    documents = 0
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=compresslevel) as f:
+        for document in collection.find(query, batch_size=DEFAULT_BATCH_SIZE):
+            f.write(json_util.dumps(document))
+            f.write("\n")
+            documents += 1
+    return {
+        "file": os.path.basename(path),
+        "query": json.loads(json_util.dumps(query)),
+        "documents": documents,
+        "bytes": os.path.getsize(path),
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def dump_collection(
+    collection: Collection,
+    out_dir: str,
+    partitions: int = DEFAULT_PARTITIONS,
+    workers: int = DEFAULT_WORKERS,
+    compresslevel: int = DEFAULT_COMPRESSLEVEL,
+) -> Dict[str, Any]:
+    """
+    Vuelca la colección en `out_dir` con una partición por hilo.
+
+    Returns:
+        Dict: El manifiesto escrito, con recuentos y rendimiento
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+    queries = plan_partitions(collection, partitions)
+    paths = [
+        os.path.join(out_dir, f"{collection.name}-{index:04d}.jsonl.gz")
+        for index in range(len(queries))
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda query, path: _dump_partition(
+                    collection, query, path, compresslevel
+                ),
+                queries,
+                paths,
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    manifest = {
+        "database": collection.database.name,
+        "collection": collection.name,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "documents": sum(result["documents"] for result in results),
+        "bytes": sum(result["bytes"] for result in results),
+        "elapsed_s": round(elapsed, 3),
+        "partitions": results,
+        "indexes": json.loads(json_util.dumps(collection.index_information())),
+    }
+    with open(os.path.join(out_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    current = collection.count_documents({})
+    if current != manifest["documents"]:
+        print(
+            f"⚠️ La colección tiene {current} documentos y se volcaron "
+            f"{manifest['documents']}: cambió durante el volcado"
+        )
+    print(
+        f"✅ Volcados {manifest['documents']} documentos de {collection.name} "
+        f"en {len(results)} particiones: {format_throughput(manifest)}"
+    )
+    return manifest
+
+
+# =================================
+# RESTAURACIÓN
+# =================================
+def _write_batch(collection: Collection, operations: List) -> int:
+    """Escribe un lote no ordenado. Devuelve los documentos escritos."""
+    try:
+        collection.bulk_write(operations, ordered=False)
+        return len(operations)
+    except BulkWriteError as e:
+        # Otra pregunta con el mismo contenido (índice único de fingerprint)
+        if not only_duplicate_keys(e):
+            raise
+        return len(operations) - len(e.details["writeErrors"])
+
+
+def _restore_partition(
+    collection: Collection, path: str, batch_size: int, upsert: bool
+) -> Dict[str, Any]:
+    """Restaura una partición por lotes. Devuelve sus recuentos."""
+    read = 0
+    written = 0
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        documents = (json_util.loads(line) for line in f if line.strip())
+        for batch in batched(documents, batch_size):
+            read += len(batch)
+            operations = [
+                (
+                    ReplaceOne({"_id": document["_id"]}, document, upsert=True)
+                    if upsert
+                    else InsertOne(document)
+                )
+                for document in batch
+            ]
+            written += _write_batch(collection, operations)
+    return {"documents": read, "written": written}
+
+
+def _create_indexes(collection: Collection, indexes: Dict[str, Dict]) -> None:
+    """Recrea los índices guardados en el manifiesto."""
+    for name, spec in json_util.loads(json.dumps(indexes)).items():
+        if name == "_id_":
+            continue
+        options = {
+            key: value for key, value in spec.items() if key not in ("key", "v", "ns")
+        }
+        try:
+            collection.create_index(list(map(tuple, spec["key"])), name=name, **options)
+        except OperationFailure as e:
+            print(f"⚠️ No se pudo crear el índice {name}: {e}")
+
+
+def restore_collection(
+    collection: Collection,
+    dump_dir: str,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    drop: bool = False,
+) -> Dict[str, Any]:
+    """
+    Restaura en `collection` un volcado de `dump_collection`.
+
+    Con `drop` la colección se vacía, se inserta sin índices secundarios y los
+    índices se crean al final; sin `drop` se hacen upserts por `_id`.
+
+    Returns:
+        Dict: Recuentos y rendimiento de la restauración
+    """
+    with open(os.path.join(dump_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    start = time.perf_counter()
+    if drop:
+        collection.drop()
+    paths = [
+        os.path.join(dump_dir, partition["file"])
+        for partition in manifest["partitions"]
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda path: _restore_partition(
+                    collection, path, batch_size, upsert=not drop
+                ),
+                paths,
+            )
+        )
+    _create_indexes(collection, manifest["indexes"])
+
+    stats = {
+        "collection": collection.name,
+        "documents": sum(result["documents"] for result in results),
+        "written": sum(result["written"] for result in results),
+        "bytes": manifest["bytes"],
+        "elapsed_s": round(time.perf_counter() - start, 3),
+    }
+    skipped = stats["documents"] - stats["written"]
+    print(
+        f"✅ Restaurados {stats['written']} documentos en {collection.name}"
+        f"{f' ({skipped} duplicados omitidos)' if skipped else ''}: "
+        f"{format_throughput(stats)}"
+    )
+    return stats
+
+
+def format_throughput(stats: Dict[str, Any]) -> str:
+    """Documentos/s y MB/s (comprimidos) de un volcado o restauración."""
+    elapsed = stats["elapsed_s"] or 1e-9
+    return (
+        f"{stats['elapsed_s']:.2f} s, {stats['documents'] / elapsed:,.0f} docs/s, "
+        f"{stats['bytes'] / 1e6 / elapsed:.1f} MB/s comprimidos"
+    )
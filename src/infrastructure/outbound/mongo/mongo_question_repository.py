@@ -17,6 +17,13 @@ Características principales:
 - Creación automática de índices para optimización
 - Preparación automática de documentos con timestamps
 - Manejo de errores y validaciones
+- Implementa el protocolo `QuestionRepository` (misma superficie de consulta
+  que los repositorios locales). Si la conexión ya está abierta
+  (`mongo_connection.connect()`) se reutiliza en cada llamada en lugar de
+  abrir un cliente nuevo.
+- Único por fingerprint: `add_questions` inserta por contenido, así que varios
+  workers de scraping en distintas máquinas pueden escribir a la vez sin
+  duplicar preguntas (índice único `fingerprint`).
 Dependencias:
 - pymongo: Cliente oficial de MongoDB para Python
 - MongoConnection: Clase de conexión personalizada
@@ -28,21 +35,64 @@ Uso típico:
 
 """
 
+import random
+import re
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from pymongo import ReplaceOne, UpdateOne
 from pymongo.collection import Collection
-from pymongo.results import InsertManyResult, InsertOneResult
+from pymongo.errors import BulkWriteError
+from pymongo.results import BulkWriteResult, InsertManyResult, InsertOneResult
 
+from src.domain.quiz.question_search import search_terms, searchable_text
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
 from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
 
+# Campos internos que no forman parte del modelo de dominio
+QUESTION_PROJECTION = {"_id": 0, "search_text": 0, "fingerprint": 0}
+# Con `_id`: `backfill_fingerprints` actualiza cada documento por su `_id` real
+BACKFILL_PROJECTION = {"search_text": 0, "fingerprint": 0}
+STABLE_SORT = [("category", 1), ("_id", 1)]
+DUPLICATE_KEY_ERROR = 11000
+
+
+def question_document(
+    record: Dict[str, Any], fingerprint: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Documento MongoDB de un registro de pregunta.
+
+    Usa `_id` = id de la pregunta y añade `search_text` (enunciado y opciones
+    normalizados) para que la búsqueda siga la misma semántica que los
+    repositorios locales, y `fingerprint` (calculado si no se da) para la
+    deduplicación por contenido.
+    """
+    return {
+        **record,
+        "_id": record["id"],
+        "search_text": searchable_text(record),
+        "fingerprint": fingerprint or QuizQuestionModel(**record).fingerprint,
+    }
+
+
+def only_duplicate_keys(error: BulkWriteError) -> bool:
+    """Indica si todos los fallos de un bulk_write son de clave duplicada."""
+    return all(
+        item.get("code") == DUPLICATE_KEY_ERROR
+        for item in error.details.get("writeErrors", [])
+    ) and not error.details.get("writeConcernErrors")
+
 
 def with_mongo_connection(func: Callable) -> Callable:
     """Decorator que maneja la conexión a MongoDB para el método decorado."""
 
     @wraps(func)
     def wrapper(self, *args, **kwargs):
+        if self.mongo_connection.client is not None:
+            # Conexión persistente abierta por el llamador
+            return func(self, self.mongo_connection.get_collection(), *args, **kwargs)
         with self.mongo_connection as conn:
             collection = conn.get_collection()
             return func(self, collection, *args, **kwargs)
@@ -73,6 +123,18 @@ class MongoQuestionRepository:
         result = collection.insert_many(questions_data)
         return result
 
+    @with_mongo_connection
+    def upsert_question_batch(
+        self, collection: Collection, questions_data: List[Dict[str, Any]]
+    ) -> BulkWriteResult:
+        """Inserta o reemplaza un lote de preguntas usando su `_id`."""
+        operations = [
+            ReplaceOne({"_id": question["_id"]}, question, upsert=True)
+            for question in questions_data
+        ]
+        result = collection.bulk_write(operations, ordered=False)
+        return result
+
     @with_mongo_connection
     def get_question_by_id(
         self, collection: Collection, question_id: str
@@ -105,7 +167,185 @@ class MongoQuestionRepository:
     def create_indexes(self, collection: Collection) -> None:
         """Crea los índices necesarios en la colección."""
         collection.create_index([("category", 1)])
+        collection.create_index(STABLE_SORT)
         collection.create_index([("created_at", -1)])
+        self.backfill_fingerprints()
+        # Parcial: los documentos antiguos sin fingerprint no chocan entre sí
+        collection.create_index(
+            [("fingerprint", 1)],
+            unique=True,
+            partialFilterExpression={"fingerprint": {"$type": "string"}},
+        )
+
+    @with_mongo_connection
+    def backfill_fingerprints(self, collection: Collection) -> int:
+        """
+        Añade `fingerprint` a los documentos que no lo tienen.
+
+        Si dos documentos tienen el mismo contenido, el repetido se queda sin
+        fingerprint (y fuera del índice único) en lugar de hacer fallar el índice.
+        Se filtra por el `_id` real del documento: los guardados con
+        `save_question`/`save_question_batch` tienen un ObjectId, no su `id`.
+
+        Returns:
+            int: Documentos actualizados
+        """
+        seen = set(collection.distinct("fingerprint"))
+        operations = []
+        for document in collection.find(
+            {"fingerprint": {"$exists": False}}, BACKFILL_PROJECTION
+        ):
+            document_id = document.pop("_id")
+            fingerprint = QuizQuestionModel(**document).fingerprint
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            operations.append(
+                UpdateOne({"_id": document_id}, {"$set": {"fingerprint": fingerprint}})
+            )
+        if not operations:
+            return 0
+        result = collection.bulk_write(operations, ordered=False)
+        if result.modified_count < len(operations):
+            print(
+                f"⚠️ Solo {result.modified_count} de {len(operations)} documentos "
+                "recibieron fingerprint"
+            )
+        return result.modified_count
+
+    # =================================
+    # PROTOCOLO QuestionRepository
+    # =================================
+    @property
+    def version(self) -> int:
+        """
+        Número de documentos de la colección.
+
+        El banco solo crece (las preguntas no se editan), así que basta para
+        invalidar cachés; es una estimación barata basada en metadatos.
+        """
+        return self._estimated_count()
+
+    @with_mongo_connection
+    def _estimated_count(self, collection: Collection) -> int:
+        """Número de documentos según los metadatos de la colección."""
+        return collection.estimated_document_count()
+
+    @property
+    def categories(self) -> List[str]:
+        """Categorías con al menos una pregunta."""
+        return self._distinct_categories()
+
+    @with_mongo_connection
+    def _distinct_categories(self, collection: Collection) -> List[str]:
+        """Valores distintos del campo `category`."""
+        return sorted(collection.distinct("category"))
+
+    def __len__(self) -> int:
+        """Número total de preguntas."""
+        return self.count_questions()
+
+    @with_mongo_connection
+    def __contains__(self, collection: Collection, question_id: str) -> bool:
+        """Indica si existe una pregunta con ese ID."""
+        return collection.count_documents({"_id": question_id}, limit=1) > 0
+
+    def count(self, category: Optional[str] = None) -> int:
+        """Cuenta las preguntas (de una categoría o en total)."""
+        if category is None:
+            return self.count_questions()
+        return self.count_questions_by_category(category)
+
+    @with_mongo_connection
+    def ids(self, collection: Collection, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs ordenada por categoría e ID."""
+        query = {} if category is None else {"category": category}
+        cursor = collection.find(query, {"_id": 1}).sort(STABLE_SORT)
+        return [document["_id"] for document in cursor]
+
+    @with_mongo_connection
+    def get(
+        self, collection: Collection, question_id: str
+    ) -> Optional[QuizQuestionModel]:
+        """Devuelve una pregunta validada como modelo de dominio."""
+        document = collection.find_one({"_id": question_id}, QUESTION_PROJECTION)
+        return QuizQuestionModel(**document) if document else None
+
+    @with_mongo_connection
+    def get_many(
+        self, collection: Collection, question_ids: Iterable[str]
+    ) -> List[QuizQuestionModel]:
+        """Devuelve las preguntas de los IDs dados en el mismo orden."""
+        question_ids = list(question_ids)
+        documents = {
+            document["id"]: document
+            for document in collection.find(
+                {"_id": {"$in": question_ids}}, QUESTION_PROJECTION
+            )
+        }
+        return [
+            QuizQuestionModel(**documents[question_id])
+            for question_id in question_ids
+            if question_id in documents
+        ]
+
+    def sample_ids(
+        self, category: str, k: int, rng: Optional[random.Random] = None
+    ) -> List[str]:
+        """
+        Elige `k` IDs al azar y sin repetición de una categoría.
+
+        Se muestrea en el cliente (y no con `$sample`) para que una semilla dé el
+        mismo examen en todos los backends.
+        """
+        ids = self.ids(category)
+        rng = rng or random
+        return rng.sample(ids, min(k, len(ids)))
+
+    @with_mongo_connection
+    def search_ids(
+        self, collection: Collection, query: str, category: Optional[str] = None
+    ) -> List[str]:
+        """Lista de IDs de las preguntas que contienen todos los términos de la búsqueda."""
+        terms = search_terms(query)
+        if not terms:
+            return []
+        conditions = [{"search_text": {"$regex": re.escape(term)}} for term in terms]
+        if category is not None:
+            conditions.append({"category": category})
+        cursor = collection.find({"$and": conditions}, {"_id": 1}).sort(STABLE_SORT)
+        return [document["_id"] for document in cursor]
+
+    @with_mongo_connection
+    def add_questions(
+        self, collection: Collection, questions: Iterable[QuizQuestionModel]
+    ) -> int:
+        """
+        Inserta las preguntas nuevas por fingerprint (las existentes no cambian).
+
+        Si otro escritor inserta la misma pregunta a la vez, el índice único
+        rechaza una de las dos y se cuenta como duplicada.
+        """
+        operations = [
+            UpdateOne(
+                {"fingerprint": question.fingerprint},
+                {
+                    "$setOnInsert": question_document(
+                        question.model_dump(), question.fingerprint
+                    )
+                },
+                upsert=True,
+            )
+            for question in questions
+        ]
+        if not operations:
+            return 0
+        try:
+            return collection.bulk_write(operations, ordered=False).upserted_count
+        except BulkWriteError as e:
+            if not only_duplicate_keys(e):
+                raise
+            return e.details.get("nUpserted", 0)
 
     def __prepare_question_document(
         self, question_data: Dict[str, Any]
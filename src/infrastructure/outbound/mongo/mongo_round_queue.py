@@ -0,0 +1,323 @@
+"""
+Cola de rondas de scraping con leases sobre una colección de MongoDB.
+
+Cada documento es una ronda de una categoría de una ejecución distribuida:
+
+    {_id: "<run_id>:<categoria>:<ronda>", run_id, category, url, fetch_mode,
+     round, status, attempts, lease_owner, lease_expires_at, heartbeat_at,
+     result, error, reported, created_at, finished_at}
+
+Estados: pending -> leased -> done | failed, o cancelled si el coordinador da
+la categoría por terminada antes de que alguien la reclame.
+
+Un worker reclama una ronda con `claim` (atómico con `find_one_and_update`) y
+la mantiene con `heartbeat` mientras la procesa. Si el worker muere, su lease
+caduca y la ronda vuelve a poder reclamarse; tras `max_attempts` intentos el
+coordinador la marca como fallida (`reap_expired`). Los plazos se calculan con
+la hora del servidor (`$$NOW`, MongoDB >= 4.2), así que no dependen del reloj
+de cada máquina.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.collection import Collection
+
+from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+
+DEFAULT_JOBS_COLLECTION = "scraping_jobs"
+DEFAULT_LEASE_S = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+# Condición de lease caducado (hora del servidor)
+_LEASE_EXPIRED = {"$expr": {"$lt": ["$lease_expires_at", "$$NOW"]}}
+
+
+def job_id(run_id: str, category: str, round_number: int) -> str:
+    """ID del documento de una ronda."""
+    return f"{run_id}:{category}:{round_number:05d}"
+
+
+def _literal(value: Any) -> Dict[str, Any]:
+    """
+    Valor del llamador dentro de un pipeline de actualización.
+
+    En un `$set` de agregación las cadenas con `$` se leen como rutas de campo
+    y los diccionarios como expresiones: `$literal` los guarda tal cual.
+    """
+    return {"$literal": value}
+
+
+def _lease_until(lease_s: float) -> Dict[str, Any]:
+    """Expresión de agregación con el fin del lease desde ahora."""
+    return {"$add": ["$$NOW", int(lease_s * 1000)]}
+
+
+class MongoRoundQueue:
+    """Cola de rondas con leases y heartbeats en MongoDB."""
+
+    def __init__(
+        self,
+        mongo_connection: MongoConnection,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Inicializa la cola sobre una conexión ya abierta (`connect()`).
+
+        Args:
+            mongo_connection: Conexión cuya colección es la de la cola
+            max_attempts: Reclamaciones de una ronda antes de darla por fallida
+        """
+        self.mongo_connection = mongo_connection
+        self.max_attempts = max_attempts
+
+    @property
+    def collection(self) -> Collection:
+        """Colección de la cola."""
+        return self.mongo_connection.get_collection()
+
+    def create_indexes(self) -> None:
+        """Índices para reclamar rondas y recoger resultados."""
+        self.collection.create_index([("status", 1), ("created_at", 1)])
+        self.collection.create_index(
+            [("run_id", 1), ("category", 1), ("status", 1), ("round", 1)]
+        )
+
+    # =================================
+    # COORDINADOR
+    # =================================
+    def enqueue(
+        self,
+        run_id: str,
+        category: str,
+        url: str,
+        round_number: int,
+        fetch_mode: str = "selenium",
+    ) -> str:
+        """Encola una ronda y devuelve su ID."""
+        document_id = job_id(run_id, category, round_number)
+        self.collection.insert_one(
+            {
+                "_id": document_id,
+                "run_id": run_id,
+                "category": category,
+                "url": url,
+                "fetch_mode": fetch_mode,
+                "round": round_number,
+                "status": STATUS_PENDING,
+                "attempts": 0,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "reported": False,
+                "created_at": datetime.now(timezone.utc),
+            }
+        )
+        return document_id
+
+    def take_finished(self, run_id: str, category: str) -> List[dict]:
+        """Rondas terminadas (done/failed) aún no recogidas, en orden de ronda."""
+        query = {
+            "run_id": run_id,
+            "category": category,
+            "status": {"$in": list(FINISHED_STATUSES)},
+            "reported": False,
+        }
+        jobs = list(self.collection.find(query).sort("round", 1))
+        if jobs:
+            self.collection.update_many(
+                {"_id": {"$in": [job["_id"] for job in jobs]}},
+                {"$set": {"reported": True}},
+            )
+        return jobs
+
+    def in_flight(self, run_id: str, category: str) -> int:
+        """Rondas pendientes o en proceso de una categoría."""
+        return self.collection.count_documents(
+            {
+                "run_id": run_id,
+                "category": category,
+                "status": {"$in": [STATUS_PENDING, STATUS_LEASED]},
+            }
+        )
+
+    def cancel_pending(self, run_id: str, category: str) -> int:
+        """Cancela las rondas aún no reclamadas de una categoría."""
+        return self.collection.update_many(
+            {"run_id": run_id, "category": category, "status": STATUS_PENDING},
+            {"$set": {"status": STATUS_CANCELLED}},
+        ).modified_count
+
+    def reap_expired(self, run_id: Optional[str] = None) -> int:
+        """Marca como fallidas las rondas con el lease caducado y sin intentos."""
+        query: Dict[str, Any] = {
+            "status": STATUS_LEASED,
+            "attempts": {"$gte": self.max_attempts},
+            **_LEASE_EXPIRED,
+        }
+        if run_id is not None:
+            query["run_id"] = run_id
+        return self.collection.update_many(
+            query,
+            [
+                {
+                    "$set": {
+                        "status": STATUS_FAILED,
+                        "error": "lease caducado tras el último intento",
+                        "lease_owner": None,
+                        "finished_at": "$$NOW",
+                    }
+                }
+            ],
+        ).modified_count
+
+    def stats(self, run_id: Optional[str] = None) -> List[dict]:
+        """Rondas por estado y preguntas vistas/nuevas por ejecución y categoría."""
+        match = {} if run_id is None else {"run_id": run_id}
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {
+                        "run_id": "$run_id",
+                        "category": "$category",
+                        "status": "$status",
+                    },
+                    "rounds": {"$sum": 1},
+                    "sampled": {"$sum": {"$ifNull": ["$result.sampled", 0]}},
+                    "new": {"$sum": {"$ifNull": ["$result.new", 0]}},
+                    "workers": {"$addToSet": "$result.worker"},
+                }
+            },
+            {"$sort": {"_id.run_id": 1, "_id.category": 1, "_id.status": 1}},
+        ]
+        return [
+            {**group.pop("_id"), **group}
+            for group in self.collection.aggregate(pipeline)
+        ]
+
+    # =================================
+    # WORKER
+    # =================================
+    def claim(
+        self,
+        worker_id: str,
+        lease_s: float = DEFAULT_LEASE_S,
+        run_id: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        Reclama la ronda pendiente más antigua (o una con el lease caducado).
+
+        Returns:
+            Optional[dict]: Documento de la ronda reclamada, o None si no hay
+        """
+        query: Dict[str, Any] = {
+            "$or": [
+                {"status": STATUS_PENDING},
+                {"status": STATUS_LEASED, **_LEASE_EXPIRED},
+            ],
+            "attempts": {"$lt": self.max_attempts},
+        }
+        if run_id is not None:
+            query["run_id"] = run_id
+        return self.collection.find_one_and_update(
+            query,
+            [
+                {
+                    "$set": {
+                        "status": STATUS_LEASED,
+                        "lease_owner": _literal(worker_id),
+                        "lease_expires_at": _lease_until(lease_s),
+                        "heartbeat_at": "$$NOW",
+                        "attempts": {"$add": ["$attempts", 1]},
+                    }
+                }
+            ],
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def heartbeat(
+        self, job: str, worker_id: str, lease_s: float = DEFAULT_LEASE_S
+    ) -> bool:
+        """
+        Renueva el lease de una ronda.
+
+        Returns:
+            bool: False si el lease ya no es de este worker (caducó y otro la
+                reclamó)
+        """
+        return (
+            self.collection.update_one(
+                {"_id": job, "lease_owner": worker_id, "status": STATUS_LEASED},
+                [
+                    {
+                        "$set": {
+                            "lease_expires_at": _lease_until(lease_s),
+                            "heartbeat_at": "$$NOW",
+                        }
+                    }
+                ],
+            ).matched_count
+            == 1
+        )
+
+    def complete(self, job: str, worker_id: str, result: dict) -> bool:
+        """
+        Marca la ronda como terminada con sus estadísticas.
+
+        Returns:
+            bool: False si el lease ya no era de este worker
+        """
+        return self._finish(
+            job, worker_id, {"status": STATUS_DONE, "result": _literal(result)}
+        )
+
+    def fail(self, job: str, worker_id: str, error: str) -> bool:
+        """
+        Devuelve la ronda a la cola (o la da por fallida si no quedan intentos).
+
+        Returns:
+            bool: False si el lease ya no era de este worker
+        """
+        status = {
+            "$cond": [
+                {"$lt": ["$attempts", self.max_attempts]},
+                STATUS_PENDING,
+                STATUS_FAILED,
+            ]
+        }
+        return self._finish(
+            job, worker_id, {"status": status, "error": _literal(error)}
+        )
+
+    def _finish(self, job: str, worker_id: str, fields: dict) -> bool:
+        """
+        Libera el lease de una ronda del worker con los campos dados.
+
+        `fields` son expresiones de agregación: los valores del llamador van
+        envueltos en `_literal`.
+        """
+        return (
+            self.collection.update_one(
+                {"_id": job, "lease_owner": worker_id, "status": STATUS_LEASED},
+                [
+                    {
+                        "$set": {
+                            **fields,
+                            "lease_owner": None,
+                            "lease_expires_at": None,
+                            "finished_at": "$$NOW",
+                        }
+                    }
+                ],
+            ).matched_count
+            == 1
+        )
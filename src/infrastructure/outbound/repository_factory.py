@@ -0,0 +1,97 @@
+"""
+Construcción de repositorios de preguntas por nombre de backend.
+
+Los backends se importan bajo demanda para que elegir `json` no exija tener
+instalado pymongo (y viceversa).
+
+Uso típico:
+    repository = open_question_repository("mongo", replica=True)
+"""
+
+import time
+from pathlib import Path
+
+from src.domain.quiz.question_repository import QuestionRepository
+
+BACKEND_JSON = "json"
+BACKEND_MONGO = "mongo"
+BACKEND_SQLITE = "sqlite"
+REPOSITORY_BACKENDS = (BACKEND_JSON, BACKEND_MONGO, BACKEND_SQLITE)
+DEFAULT_SQLITE_PATH = Path("data/questions.sqlite3")
+
+
+def open_question_repository(
+    backend: str = BACKEND_JSON,
+    data_dir: Path = Path("data"),
+    replica: bool = False,
+    sqlite_path: Path = DEFAULT_SQLITE_PATH,
+) -> QuestionRepository:
+    """
+    Abre el repositorio de preguntas del backend indicado.
+
+    Args:
+        backend: Uno de REPOSITORY_BACKENDS
+        data_dir: Directorio de `questions_<categoria>.json` (backend json)
+        replica: Copia todo el contenido en un `InMemoryQuestionRepository` y
+            devuelve la copia, para servir lecturas sin salir del proceso
+        sqlite_path: Fichero de la base de datos (backend sqlite)
+
+    Raises:
+        ValueError: Si el backend no existe
+        ConnectionError: Si no se puede conectar a MongoDB
+    """
+    if backend == BACKEND_JSON:
+        from src.infrastructure.outbound.local.question_index import QuestionIndex
+
+        # El índice JSON ya vive en memoria: no hace falta réplica
+        return QuestionIndex.build(Path(data_dir))
+
+    if backend == BACKEND_SQLITE:
+        from src.infrastructure.outbound.sqlite.sqlite_question_repository import (
+            SqliteQuestionRepository,
+        )
+
+        repository = SqliteQuestionRepository(Path(sqlite_path))
+        return replicate_in_memory(repository) if replica else repository
+
+    if backend != BACKEND_MONGO:
+        raise ValueError(
+            f"Backend desconocido '{backend}' (opciones: {', '.join(REPOSITORY_BACKENDS)})"
+        )
+
+    repository = _open_mongo_repository()
+    if not replica:
+        return repository
+    try:
+        return replicate_in_memory(repository)
+    finally:
+        repository.mongo_connection.disconnect()
+
+
+def replicate_in_memory(source: QuestionRepository) -> QuestionRepository:
+    """Copia un repositorio en memoria y muestra el tiempo empleado."""
+    from src.infrastructure.outbound.memory.in_memory_question_repository import (
+        InMemoryQuestionRepository,
+    )
+
+    start = time.perf_counter()
+    replica = InMemoryQuestionRepository.from_repository(source)
+    print(
+        f"📥 Réplica en memoria: {len(replica)} preguntas "
+        f"en {time.perf_counter() - start:.2f}s"
+    )
+    return replica
+
+
+def _open_mongo_repository():
+    """Repositorio MongoDB con una conexión persistente ya abierta."""
+    from src.infrastructure.outbound.mongo.mongo_connection import MongoConnection
+    from src.infrastructure.outbound.mongo.mongo_question_repository import (
+        MongoQuestionRepository,
+    )
+
+    mongo_connection = MongoConnection()
+    if not mongo_connection.test_connection():
+        raise ConnectionError("No se pudo conectar a MongoDB")
+    mongo_connection.connect()
+    return MongoQuestionRepository(mongo_connection)
@@ -0,0 +1,430 @@
+"""
+Repositorio de preguntas en SQLite (modo WAL) con búsqueda FTS5.
+
+Tablas:
+    questions      una fila por pregunta; `fingerprint` es UNIQUE, de modo que
+                   la detección de duplicados la hace la propia base de datos
+    options        opciones de cada pregunta (posición, texto, imagen)
+    images         rutas de imagen referenciadas (enunciado u opción)
+    questions_fts  FTS5 con tokenizador trigram sobre el texto normalizado de
+                   enunciado y opciones (`question_search.searchable_text`)
+    meta           contadores clave/valor; `generation` cuenta las reescrituras
+                   de filas existentes (rutas de imagen), que `max(pk)` no ve
+
+En modo WAL los lectores no bloquean al escritor ni al revés, así que la API
+puede servir desde el mismo fichero mientras el scraper inserta. Cada hilo
+usa su propia conexión; las sentencias son fijas y parametrizadas, por lo que
+el módulo `sqlite3` las prepara una vez y las reutiliza de su caché. Cada lote
+de preguntas se inserta en una sola transacción.
+
+Uso típico:
+    store = SqliteQuestionRepository("data/questions.sqlite3")
+    store.import_json_stores(Path("data"))
+    new = store.add_questions(quiz_data)
+    ids = store.search_ids("antena dipolo")
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from itertools import batched
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.quiz.question_search import search_terms, searchable_text
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+from src.infrastructure.serialization.json_stream import iter_json_array
+
+DEFAULT_SQLITE_PATH = Path("data/questions.sqlite3")
+# El tokenizador trigram solo indexa términos de 3 o más caracteres
+FTS_MIN_TERM_LENGTH = 3
+BUSY_TIMEOUT_S = 10.0
+STATEMENT_CACHE_SIZE = 256
+IMPORT_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    pk INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL,
+    fingerprint TEXT NOT NULL UNIQUE,
+    title_text TEXT NOT NULL,
+    title_image TEXT,
+    correct_option INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS questions_by_category ON questions (category, pk);
+CREATE TABLE IF NOT EXISTS options (
+    question_pk INTEGER NOT NULL REFERENCES questions (pk) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    option_text TEXT,
+    option_image TEXT,
+    PRIMARY KEY (question_pk, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS images (
+    question_pk INTEGER NOT NULL REFERENCES questions (pk) ON DELETE CASCADE,
+    path TEXT NOT NULL,
+    option_position INTEGER,
+    PRIMARY KEY (question_pk, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS images_by_path ON images (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts
+    USING fts5 (search_text, tokenize = 'trigram');
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+INSERT_QUESTION = """
+INSERT OR IGNORE INTO questions
+    (id, category, fingerprint, title_text, title_image, correct_option, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_OPTION = """
+INSERT INTO options (question_pk, position, option_text, option_image)
+VALUES (?, ?, ?, ?)
+"""
+INSERT_IMAGE = """
+INSERT OR IGNORE INTO images (question_pk, path, option_position) VALUES (?, ?, ?)
+"""
+INSERT_FTS = "INSERT INTO questions_fts (rowid, search_text) VALUES (?, ?)"
+SELECT_QUESTION = """
+SELECT pk, id, category, title_text, title_image, correct_option
+FROM questions WHERE id = ?
+"""
+BUMP_GENERATION = """
+INSERT INTO meta (key, value) VALUES ('generation', 1)
+ON CONFLICT (key) DO UPDATE SET value = value + 1
+"""
+SELECT_OPTIONS = """
+SELECT option_text, option_image FROM options WHERE question_pk = ? ORDER BY position
+"""
+
+
+def _record(row: tuple, options: Sequence[tuple]) -> dict:
+    """Registro con el esquema de `QuizQuestionModel.model_dump()`."""
+    _, question_id, category, title_text, title_image, correct_option = row
+    return {
+        "id": question_id,
+        "title": {"titleText": title_text, "titleImage": title_image},
+        "options": [
+            {"optionText": text, "optionImage": image} for text, image in options
+        ],
+        "correct_option": correct_option,
+        "category": category,
+    }
+
+
+def _fts_phrase(term: str) -> str:
+    """Término como frase FTS5 (entre comillas, con las comillas escapadas)."""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class SqliteQuestionRepository:
+    """Repositorio de preguntas sobre un fichero SQLite en modo WAL."""
+
+    def __init__(self, path: Path = DEFAULT_SQLITE_PATH):
+        """Abre (o crea) la base de datos y su esquema."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    # =================================
+    # CONEXIONES
+    # =================================
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Conexión del hilo actual (se abre bajo demanda)."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=BUSY_TIMEOUT_S,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            # En WAL, NORMAL solo sincroniza en los checkpoints: una caída del
+            # sistema puede perder la última transacción, nunca corromper el fichero
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Cierra la conexión del hilo actual."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __enter__(self):
+        """Permite usar el repositorio como context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cierra la conexión al salir del contexto."""
+        self.close()
+
+    # =================================
+    # ESCRITURA
+    # =================================
+    def _insert_question(
+        self, cursor: sqlite3.Cursor, question: QuizQuestionModel, now: float
+    ) -> bool:
+        """Inserta una pregunta y sus opciones; False si era un duplicado."""
+        title = question.title
+        cursor.execute(
+            INSERT_QUESTION,
+            (
+                question.id,
+                question.category,
+                question.fingerprint,
+                title.titleText,
+                title.titleImage,
+                question.correct_option,
+                now,
+            ),
+        )
+        if cursor.rowcount != 1:
+            return False
+
+        pk = cursor.lastrowid
+        options = question.options
+        cursor.executemany(
+            INSERT_OPTION,
+            [
+                (pk, position, option.optionText, option.optionImage)
+                for position, option in enumerate(options)
+            ],
+        )
+        images = [(pk, title.titleImage, None)] if title.titleImage else []
+        images.extend(
+            (pk, option.optionImage, position)
+            for position, option in enumerate(options)
+            if option.optionImage
+        )
+        cursor.executemany(INSERT_IMAGE, images)
+        cursor.execute(INSERT_FTS, (pk, searchable_text(question.model_dump())))
+        return True
+
+    def add_questions(self, questions: Iterable[QuizQuestionModel]) -> int:
+        """
+        Inserta un lote de preguntas en una sola transacción.
+
+        Los duplicados (mismo ID o mismo fingerprint) los descarta la restricción
+        UNIQUE sin abortar el lote.
+
+        Returns:
+            int: Número de preguntas insertadas
+        """
+        now = time.time()
+        with self._write_lock, self.connection as connection:
+            cursor = connection.cursor()
+            return sum(
+                1
+                for question in questions
+                if self._insert_question(cursor, question, now)
+            )
+
+    def add_records(self, records: Iterable[dict]) -> int:
+        """Inserta registros en bruto (esquema de `model_dump()`)."""
+        return self.add_questions(QuizQuestionModel(**record) for record in records)
+
+    def import_json_stores(self, data_dir: Path = Path("data")) -> Dict[str, int]:
+        """
+        Importa los ficheros `questions_<categoria>.json` (se puede repetir).
+
+        Returns:
+            Dict[str, int]: Preguntas nuevas importadas por fichero
+        """
+        from src.infrastructure.outbound.local.question_index import QuestionIndex
+
+        imported = {}
+        for file_path in QuestionIndex(data_dir).question_files():
+            # En streaming: en memoria solo el lote que se está insertando
+            read = 0
+            imported[file_path.name] = 0
+            for batch in batched(iter_json_array(str(file_path)), IMPORT_BATCH_SIZE):
+                read += len(batch)
+                imported[file_path.name] += self.add_records(list(batch))
+            print(f"📦 {file_path}: {imported[file_path.name]} nuevas de {read}")
+        return imported
+
+    def replace_image_paths(self, mapping: Dict[str, str]) -> int:
+        """
+        Sustituye rutas de imagen (p. ej. por las procesadas) en una transacción.
+
+        Returns:
+            int: Número de referencias actualizadas
+        """
+        pairs = [(new, old) for old, new in mapping.items() if old != new]
+        with self._write_lock, self.connection as connection:
+            referenced = set(
+                self._column("SELECT DISTINCT path FROM images")
+            ).intersection(mapping)
+            pairs = [(new, old) for new, old in pairs if old in referenced]
+            updated = 0
+            for sql in (
+                "UPDATE questions SET title_image = ? WHERE title_image = ?",
+                "UPDATE options SET option_image = ? WHERE option_image = ?",
+            ):
+                updated += connection.executemany(sql, pairs).rowcount
+            # Una pregunta puede referenciar la misma imagen canónica dos veces
+            connection.executemany(
+                "UPDATE OR IGNORE images SET path = ? WHERE path = ?", pairs
+            )
+            connection.executemany(
+                "DELETE FROM images WHERE path = ?", [(old,) for _, old in pairs]
+            )
+            if updated:
+                connection.execute(BUMP_GENERATION)
+        return updated
+
+    # =================================
+    # CONSULTAS
+    # =================================
+    def _scalar(self, sql: str, parameters: tuple = ()):
+        """Primera columna de la primera fila de una consulta."""
+        row = self.connection.execute(sql, parameters).fetchone()
+        return row[0] if row else None
+
+    def _column(self, sql: str, parameters: tuple = ()) -> List:
+        """Primera columna de todas las filas de una consulta."""
+        return [row[0] for row in self.connection.execute(sql, parameters)]
+
+    @property
+    def version(self) -> int:
+        """
+        Clave primaria más alta más el número de reescrituras.
+
+        Los dos sumandos solo crecen (con cada alta y con cada
+        `replace_image_paths`), así que la suma cambia con cualquier cambio.
+        """
+        return self._scalar(
+            "SELECT coalesce((SELECT max(pk) FROM questions), 0)"
+            " + coalesce((SELECT value FROM meta WHERE key = 'generation'), 0)"
+        )
+
+    @property
+    def categories(self) -> List[str]:
+        """Categorías en orden de primera aparición."""
+        return self._column(
+            "SELECT category FROM questions GROUP BY category ORDER BY min(pk)"
+        )
+
+    def __len__(self) -> int:
+        """Número total de preguntas."""
+        return self._scalar("SELECT count(*) FROM questions")
+
+    def __contains__(self, question_id: str) -> bool:
+        """Indica si existe una pregunta con ese ID."""
+        sql = "SELECT 1 FROM questions WHERE id = ?"
+        return self._scalar(sql, (question_id,)) is not None
+
+    def count(self, category: Optional[str] = None) -> int:
+        """Cuenta las preguntas (de una categoría o en total)."""
+        if category is None:
+            return len(self)
+        return self._scalar(
+            "SELECT count(*) FROM questions WHERE category = ?", (category,)
+        )
+
+    def ids(self, category: Optional[str] = None) -> List[str]:
+        """Lista de IDs en orden de inserción."""
+        if category is None:
+            return self._column("SELECT id FROM questions ORDER BY pk")
+        return self._column(
+            "SELECT id FROM questions WHERE category = ? ORDER BY pk", (category,)
+        )
+
+    def get_record(self, question_id: str) -> Optional[dict]:
+        """Devuelve el registro en bruto de una pregunta."""
+        row = self.connection.execute(SELECT_QUESTION, (question_id,)).fetchone()
+        if row is None:
+            return None
+        options = self.connection.execute(SELECT_OPTIONS, (row[0],)).fetchall()
+        return _record(row, options)
+
+    def get(self, question_id: str) -> Optional[QuizQuestionModel]:
+        """Devuelve una pregunta validada como modelo de dominio."""
+        record = self.get_record(question_id)
+        return QuizQuestionModel(**record) if record else None
+
+    def get_many(self, question_ids: Iterable[str]) -> List[QuizQuestionModel]:
+        """Devuelve las preguntas de los IDs dados en el mismo orden."""
+        question_ids = list(question_ids)
+        if not question_ids:
+            return []
+        placeholders = ",".join("?" * len(question_ids))
+        rows = self.connection.execute(
+            "SELECT pk, id, category, title_text, title_image, correct_option "
+            f"FROM questions WHERE id IN ({placeholders})",
+            question_ids,
+        ).fetchall()
+        options: Dict[int, List[Tuple]] = {row[0]: [] for row in rows}
+        if rows:
+            pks = ",".join("?" * len(rows))
+            for pk, text, image in self.connection.execute(
+                "SELECT question_pk, option_text, option_image FROM options "
+                f"WHERE question_pk IN ({pks}) ORDER BY question_pk, position",
+                list(options),
+            ):
+                options[pk].append((text, image))
+        records = {row[1]: _record(row, options[row[0]]) for row in rows}
+        return [
+            QuizQuestionModel(**records[question_id])
+            for question_id in question_ids
+            if question_id in records
+        ]
+
+    def sample_ids(
+        self, category: str, k: int, rng: Optional[random.Random] = None
+    ) -> List[str]:
+        """Elige `k` IDs al azar y sin repetición de una categoría."""
+        ids = self.ids(category)
+        rng = rng or random
+        return rng.sample(ids, min(k, len(ids)))
+
+    def search_ids(self, query: str, category: Optional[str] = None) -> List[str]:
+        """
+        Lista de IDs de las preguntas que contienen todos los términos de la búsqueda.
+
+        Los términos de 3 o más caracteres se resuelven con el índice trigram
+        (búsqueda de subcadenas); los más cortos se filtran con `instr` sobre
+        el texto ya acotado por el índice.
+        """
+        terms = search_terms(query)
+        if not terms:
+            return []
+        indexed = [term for term in terms if len(term) >= FTS_MIN_TERM_LENGTH]
+        short = [term for term in terms if len(term) < FTS_MIN_TERM_LENGTH]
+
+        conditions, parameters = [], []
+        if indexed:
+            conditions.append("questions_fts MATCH ?")
+            parameters.append(" AND ".join(_fts_phrase(term) for term in indexed))
+        for term in short:
+            conditions.append("instr(questions_fts.search_text, ?) > 0")
+            parameters.append(term)
+        if category is not None:
+            conditions.append("questions.category = ?")
+            parameters.append(category)
+        return self._column(
+            "SELECT questions.id FROM questions_fts "
+            "JOIN questions ON questions.pk = questions_fts.rowid "
+            f"WHERE {' AND '.join(conditions)} ORDER BY questions.pk",
+            tuple(parameters),
+        )
+
+    def image_paths(self) -> List[str]:
+        """Rutas de imagen referenciadas por alguna pregunta."""
+        return self._column("SELECT DISTINCT path FROM images ORDER BY path")
+
+    def __str__(self):
+        """Representación en string del repositorio."""
+        return f"SqliteQuestionRepository({self.path}: {len(self)} preguntas)"
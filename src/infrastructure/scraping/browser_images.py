@@ -0,0 +1,92 @@
+"""
+Obtención de las imágenes de una ronda desde la sesión de Chrome.
+
+El navegador ya descargó las imágenes para pintar la página: en lugar de
+repetir cada descarga con `requests`, un único script asíncrono pide todas las
+URLs de la ronda con `fetch(..., {cache: "force-cache"})` (servidas desde la
+caché del navegador) y devuelve los bytes en base64. Cada imagen se escribe en
+la misma ruta que produciría `download_image` (`get_image_filename`).
+
+Las imágenes que el script no puede leer (p. ej. de otro origen sin CORS) se
+devuelven como descargas pendientes para hacerlas por HTTP.
+"""
+
+import base64
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ...shared.metrics import increment, timed
+
+# Script asíncrono de Selenium: recibe las URLs y devuelve base64 (o null) por URL
+FETCH_IMAGES_SCRIPT = """
+const urls = arguments[0];
+const done = arguments[arguments.length - 1];
+const toBase64 = (buffer) => {
+    const bytes = new Uint8Array(buffer);
+    let binary = "";
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+};
+Promise.all(urls.map((url) =>
+    fetch(url, {cache: "force-cache", credentials: "include"})
+        .then((response) => response.ok ? response.arrayBuffer() : null)
+        .then((buffer) => buffer ? toBase64(buffer) : null)
+        .catch(() => null)
+)).then(done);
+"""
+
+
+@timed("browser_image_fetch")
+def fetch_images_from_browser(driver, urls: List[str]) -> Dict[str, Optional[bytes]]:
+    """
+    Bytes de las imágenes pedidas a la página en una sola llamada.
+
+    Returns:
+        Dict[str, Optional[bytes]]: URL -> bytes (None si no se pudo leer)
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+    encoded = driver.execute_async_script(FETCH_IMAGES_SCRIPT, unique_urls)
+    return {
+        url: base64.b64decode(data) if data else None
+        for url, data in zip(unique_urls, encoded or [])
+    }
+
+
+def save_browser_images(driver, image_jobs: List[dict]) -> List[dict]:
+    """
+    Escribe las imágenes de `image_jobs` con los bytes que ya tiene el navegador.
+
+    Args:
+        image_jobs: Descargas {"url", "path"} anotadas durante la captura
+
+    Returns:
+        List[dict]: Descargas que hay que hacer por HTTP
+    """
+    if not image_jobs:
+        return []
+    try:
+        images = fetch_images_from_browser(driver, [job["url"] for job in image_jobs])
+    except Exception as e:
+        print(f"⚠️ No se pudieron leer las imágenes del navegador: {e}")
+        increment("browser_image_fallbacks", len(image_jobs))
+        return list(image_jobs)
+
+    remaining = []
+    for job in image_jobs:
+        content = images.get(job["url"])
+        if not content:
+            remaining.append(job)
+            continue
+        path = Path(job["path"])
+        os.makedirs(path.parent, exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(content)
+        increment("images_from_browser")
+        increment("image_bytes_browser", len(content))
+    increment("browser_image_fallbacks", len(remaining))
+    return remaining
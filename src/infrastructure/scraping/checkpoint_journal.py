@@ -0,0 +1,183 @@
+"""
+Diario en disco del progreso de scraping por categoría.
+
+Cada categoría tiene un fichero JSONL de solo-añadir en el directorio de
+checkpoints. Cada ronda terminada escribe una línea (con `fsync`), así que un
+cierre abrupto del proceso o de Chrome pierde como mucho la ronda en curso:
+
+    {"type": "start", "category": ..., "url": ..., "known_questions": 120}
+    {"type": "round", "round": 1, "sampled": 30, "new": 4,
+     "fingerprints": [...], "failed_images": [...], "elapsed_s": 12.3}
+    {"type": "failure", "round": 2, "elapsed_s": 20.1}
+    {"type": "images", "pending": [...]}
+    {"type": "done", "report": {...}}
+
+`load` vuelve a reproducir los eventos y devuelve un `CategoryCheckpoint` con el
+número de ronda, las estadísticas de descubrimiento, el índice de fingerprints
+vistos y las descargas de imágenes pendientes.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+DEFAULT_CHECKPOINT_DIR = os.path.join("data", "checkpoints")
+
+
+@dataclass
+class CategoryCheckpoint:
+    """Estado de una categoría reconstruido a partir de su diario."""
+
+    category: str
+    url: Optional[str] = None
+    known_at_start: int = 0
+    rounds: List[dict] = field(default_factory=list)
+    seen_fingerprints: Set[str] = field(default_factory=set)
+    pending_images: List[dict] = field(default_factory=list)
+    elapsed_s: float = 0.0
+    done: bool = False
+    report: Optional[dict] = None
+
+    @property
+    def last_round(self) -> int:
+        """Número de la última ronda registrada."""
+        return self.rounds[-1]["round"] if self.rounds else 0
+
+    @property
+    def new_questions(self) -> int:
+        """Preguntas nuevas guardadas desde el inicio de la categoría."""
+        return sum(event.get("new", 0) for event in self.rounds)
+
+
+class CheckpointJournal:
+    """Diarios de progreso de scraping (uno por categoría)."""
+
+    def __init__(self, directory: str = DEFAULT_CHECKPOINT_DIR):
+        """Inicializa el diario en `directory` (se crea al escribir)."""
+        self.directory = directory
+
+    def path(self, category: str) -> str:
+        """Ruta del diario de una categoría."""
+        return os.path.join(self.directory, f"{category}.jsonl")
+
+    # =================================
+    # LECTURA
+    # =================================
+    def load(self, category: str) -> Optional[CategoryCheckpoint]:
+        """Reconstruye el estado de una categoría (None si no hay diario)."""
+        path = self.path(category)
+        if not os.path.exists(path):
+            return None
+
+        checkpoint = CategoryCheckpoint(category=category)
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Última línea truncada por un cierre abrupto: se ignora
+                    print(f"⚠️ Línea {line_number} corrupta en {path}, se descarta")
+                    continue
+                self._apply(checkpoint, event)
+        return checkpoint
+
+    @staticmethod
+    def _apply(checkpoint: CategoryCheckpoint, event: dict) -> None:
+        """Aplica un evento del diario al estado."""
+        event_type = event.get("type")
+        if event_type == "start":
+            checkpoint.url = event.get("url")
+            checkpoint.known_at_start = event.get("known_questions", 0)
+        elif event_type in ("round", "failure"):
+            checkpoint.rounds.append(event)
+            checkpoint.elapsed_s = event.get("elapsed_s", checkpoint.elapsed_s)
+            checkpoint.seen_fingerprints.update(event.get("fingerprints", []))
+            checkpoint.pending_images.extend(event.get("failed_images", []))
+        elif event_type == "images":
+            checkpoint.pending_images = list(event.get("pending", []))
+        elif event_type == "done":
+            checkpoint.done = True
+            checkpoint.report = event.get("report")
+
+    # =================================
+    # ESCRITURA
+    # =================================
+    def start(self, category: str, url: str, known_questions: int) -> None:
+        """Empieza un diario nuevo para la categoría (descarta el anterior)."""
+        self.discard(category)
+        self._append(
+            category,
+            {
+                "type": "start",
+                "category": category,
+                "url": url,
+                "known_questions": known_questions,
+            },
+        )
+
+    def record_round(
+        self,
+        category: str,
+        round_number: int,
+        sampled: int,
+        new: int,
+        fingerprints: List[str],
+        failed_images: List[dict],
+        elapsed_s: float,
+    ) -> None:
+        """Registra una ronda guardada correctamente."""
+        self._append(
+            category,
+            {
+                "type": "round",
+                "round": round_number,
+                "sampled": sampled,
+                "new": new,
+                "fingerprints": fingerprints,
+                "failed_images": failed_images,
+                "elapsed_s": round(elapsed_s, 3),
+            },
+        )
+
+    def record_failure(self, category: str, round_number: int, elapsed_s: float):
+        """Registra una ronda fallida (sin datos o con error al guardar)."""
+        self._append(
+            category,
+            {
+                "type": "failure",
+                "round": round_number,
+                "elapsed_s": round(elapsed_s, 3),
+            },
+        )
+
+    def record_pending_images(self, category: str, pending: List[dict]) -> None:
+        """Sustituye la lista de descargas de imágenes pendientes."""
+        self._append(category, {"type": "images", "pending": pending})
+
+    def finish(self, category: str, report: dict) -> None:
+        """Marca la categoría como terminada."""
+        self._append(category, {"type": "done", "report": report})
+
+    def discard(self, category: str) -> None:
+        """Elimina el diario de una categoría."""
+        try:
+            os.remove(self.path(category))
+        except FileNotFoundError:
+            pass
+
+    def _append(self, category: str, event: dict) -> None:
+        """Añade un evento al diario y lo lleva a disco."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(category)
+        with open(path, "a+b") as f:
+            # Cerrar una línea truncada por un cierre abrupto antes de seguir
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
@@ -4,8 +4,10 @@ Configuración de rutas para el proyecto Clean Architecture
 
 import os
 
-# Rutas base del proyecto
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Rutas base del proyecto (este fichero está en src/infrastructure/scraping)
+PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
 
 # Rutas de datos
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
@@ -18,7 +20,7 @@ ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
 IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
 
 
-# Crear directorios si no existen
+# Crear directorios si no existen (se llama explícitamente, nunca al importar)
 def ensure_directories():
     """Asegura que todos los directorios necesarios existan."""
     os.makedirs(DATA_DIR, exist_ok=True)
@@ -26,9 +28,6 @@ def ensure_directories():
     os.makedirs(IMAGES_DIR, exist_ok=True)
 
 
-# Ejecutar al importar
-ensure_directories()
-
 # Exportar rutas para uso en otros módulos
 __all__ = [
     "DATA_DIR",
@@ -2,13 +2,16 @@
 Módulo para guardar los datos del cuestionario en formato JSON.
 """
 
-import json
 import os
-from typing import List
-
-from domain.quiz.quiz_question_model import QuizQuestionModel
+from typing import List, Optional
 
+from ...domain.quiz.quiz_question_model import QuizQuestionModel
 from ...infrastructure.scraping.duplicate_detector import DuplicateDetector
+from ...infrastructure.serialization.json_serializer import (
+    append_questions_to_json_array,
+)
+from ...infrastructure.serialization.json_stream import count_json_array
+from ...shared.metrics import increment, timer
 
 # def save_quiz_data_to_json(quiz_data: List[QuizQuestion], filename="data/questions.json") -> bool:
 #     """
@@ -42,15 +45,22 @@ from ...infrastructure.scraping.duplicate_detector import DuplicateDetector
 
 
 def save_quiz_data_to_json(
-    quiz_data: List[QuizQuestionModel], category: str = None, file_path: str = None
+    quiz_data: List[QuizQuestionModel],
+    category: str = None,
+    file_path: str = None,
+    pretty: Optional[bool] = None,
 ) -> int:
     """
     Guarda datos del quiz en JSON con detección de duplicados.
 
+    Las preguntas nuevas se codifican en bloque y se añaden al final del array
+    existente sin volver a decodificar ni reescribir el fichero completo.
+
     Args:
         quiz_data: Lista de preguntas del quiz
         category: Categoría de las preguntas (radioelectricidad, normativa, etc.)
         file_path: Ruta del archivo (opcional, se generará automáticamente si no se proporciona)
+        pretty: Si es True, escribe JSON indentado (por defecto compacto, ver JSON_PRETTY)
 
     Returns:
         int: Número de preguntas nuevas guardadas (-1 si hay error)
@@ -67,27 +77,22 @@ def save_quiz_data_to_json(
                 file_path = "data/questions.json"
 
         print(f"🔍 Iniciando detección de duplicados para categoría: {category}")
-        duplicate_detector = DuplicateDetector(data_path=file_path)
-        unique_questions = duplicate_detector.filter_duplicates(quiz_data)
+        with timer("dedup"):
+            duplicate_detector = DuplicateDetector(data_path=file_path)
+            unique_questions = duplicate_detector.filter_duplicates(quiz_data)
+        increment("questions_duplicate", len(quiz_data) - len(unique_questions))
 
         if not unique_questions:
             print(f"ℹ️ No hay preguntas nuevas para guardar en categoría: {category}")
             return 0
 
-        existing_data = []
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-
-        new_data = [question.model_dump() for question in unique_questions]
-        all_data = existing_data + new_data
-
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
+        with timer("json_write"):
+            append_questions_to_json_array(file_path, unique_questions, pretty)
+        increment("questions_new", len(unique_questions))
 
+        total_in_file = duplicate_detector.existing_count + len(unique_questions)
         print(f"✅ Guardadas {len(unique_questions)} preguntas nuevas en: {file_path}")
-        print(f"📁 Total en archivo: {len(all_data)} preguntas")
+        print(f"📁 Total en archivo: {total_in_file} preguntas")
 
         return len(unique_questions)
 
@@ -96,6 +101,21 @@ def save_quiz_data_to_json(
         return -1
 
 
+def count_saved_questions(category: str = None, file_path: str = None) -> int:
+    """Cuenta las preguntas ya guardadas en el JSON de una categoría."""
+    if not file_path:
+        file_path = (
+            f"data/questions_{category}.json" if category else "data/questions.json"
+        )
+    if not os.path.exists(file_path):
+        return 0
+    try:
+        return count_json_array(file_path)
+    except Exception as e:
+        print(f"⚠️ Error leyendo {file_path}: {e}")
+        return 0
+
+
 def print_quiz_summary(quiz_data: List[QuizQuestionModel]):
     """Imprime un resumen de los datos extraídos."""
     if not quiz_data:
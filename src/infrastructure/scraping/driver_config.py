@@ -1,8 +1,28 @@
 """
 Módulo para configurar y manejar el driver de Chrome de forma simple.
+
+Las esperas se basan en señales concretas de la página (cambio de URL,
+nodos `.quiz-question` antiguos obsoletos, presencia del nuevo conjunto de
+preguntas) en lugar de pausas fijas. Cada espera se mide como etapa `wait_*`
+y el contador `wait_saved_s` acumula el tiempo ahorrado frente a las pausas
+fijas que sustituye (negativo si la página tardó más que la pausa original).
+La espera del banner de cookies ya era por evento, así que solo se mide.
+
+Los límites de las esperas se configuran con variables de entorno:
+    - SCRAPING_NAVIGATION_TIMEOUT: carga del nuevo examen (def. 10 s)
+    - SCRAPING_QUESTIONS_TIMEOUT: presencia de las preguntas (def. 2 s)
+    - SCRAPING_COOKIE_TIMEOUT: aparición del banner de cookies (def. 3 s)
+    - SCRAPING_REVEAL_TIMEOUT: revelado de la respuesta correcta (def. 2 s)
+
+La carga de cada nuevo examen pide turno al control de ritmo del proceso
+(`rate_limited`): sus timeouts reducen el ritmo del host.
 """
 
+import os
 import time
+import weakref
+from dataclasses import dataclass
+from typing import Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -12,15 +32,101 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+from ...shared.metrics import get_metrics, increment
+from .network_capture import enable_network_logging
+from .rate_controller import KIND_PAGE, rate_limited
+
+QUESTION_LOCATOR = (By.CLASS_NAME, "quiz-question")
+COOKIE_BUTTON_LOCATOR = (By.CSS_SELECTOR, "button.fc-cta-do-not-consent")
+NEW_EXAM_XPATH = "//a[contains(@href, '/examenes/') and .//div[@class='mio6' and contains(text(), 'Realizar nuevo examen')]]"
+
+# Pausas fijas que sustituyen las esperas por eventos (para medir el ahorro)
+LEGACY_NAVIGATION_SLEEP_S = 1.0
+LEGACY_REVEAL_SLEEP_S = 0.10
+
+
+@dataclass
+class DriverTimeouts:
+    """Límites (en segundos) de las esperas del scraping."""
+
+    navigation: float = 10.0
+    # Mismo límite que el WebDriverWait(2) original de `get_question_elements`
+    questions: float = 2.0
+    cookie_banner: float = 3.0
+    answer_reveal: float = 2.0
+    poll_frequency: float = 0.05
+
+    @classmethod
+    def from_env(cls) -> "DriverTimeouts":
+        """Crea los límites a partir de las variables de entorno."""
+        defaults = cls()
+        return cls(
+            navigation=_env_float("SCRAPING_NAVIGATION_TIMEOUT", defaults.navigation),
+            questions=_env_float("SCRAPING_QUESTIONS_TIMEOUT", defaults.questions),
+            cookie_banner=_env_float("SCRAPING_COOKIE_TIMEOUT", defaults.cookie_banner),
+            answer_reveal=_env_float("SCRAPING_REVEAL_TIMEOUT", defaults.answer_reveal),
+        )
+
+
+def _env_float(name: str, default: float) -> float:
+    """Lee una variable de entorno numérica."""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+_timeouts: Optional[DriverTimeouts] = None
+
+
+def get_timeouts() -> DriverTimeouts:
+    """Devuelve los límites actuales (leídos del entorno en el primer uso)."""
+    global _timeouts
+    if _timeouts is None:
+        _timeouts = DriverTimeouts.from_env()
+    return _timeouts
+
+
+def set_timeouts(timeouts: DriverTimeouts) -> None:
+    """Sustituye los límites de espera actuales."""
+    global _timeouts
+    _timeouts = timeouts
+
+
+def wait_for(driver, timeout: float, condition):
+    """`WebDriverWait` con la frecuencia de sondeo configurada."""
+    return WebDriverWait(
+        driver=driver,
+        timeout=timeout,
+        poll_frequency=get_timeouts().poll_frequency,
+    ).until(condition)
+
+
+def record_wait(stage: str, elapsed: float, legacy_wait: Optional[float]) -> None:
+    """
+    Registra la duración de una espera y el ahorro frente a la pausa fija.
+
+    Con `legacy_wait` None (la espera no sustituye ninguna pausa fija) solo se
+    registra la duración.
+    """
+    get_metrics().observe(stage, elapsed)
+    if legacy_wait is not None:
+        increment("wait_saved_s", legacy_wait - elapsed)
+
 
-def setup_driver():
-    """Configura y devuelve el driver de Chrome básico."""
+def setup_driver(network_capture: bool = False):
+    """
+    Configura y devuelve el driver de Chrome básico.
+
+    Con `network_capture` se registran los eventos de red de CDP para leer las
+    respuestas recibidas (ver `NetworkCapture`).
+    """
     chrome_options = Options()
 
     # Solo las configuraciones mínimas necesarias
     chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-smooth-scrolling")
+    if network_capture:
+        enable_network_logging(chrome_options)
 
     service = Service(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -28,41 +134,100 @@ def setup_driver():
     return driver
 
 
+def is_driver_alive(driver) -> bool:
+    """Comprueba si la sesión de Chrome sigue respondiendo."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+# Sesiones de Chrome en las que ya se resolvió el banner de cookies
+_cookie_checked_sessions = weakref.WeakSet()
+
+
 def deny_cookies(driver):
-    """Rechaza las cookies si el botón está presente."""
+    """
+    Rechaza las cookies si el banner aparece (solo una vez por sesión).
+
+    Espera a lo que ocurra primero: el botón de rechazo o las preguntas del
+    examen. Si las preguntas cargan sin banner no se espera más.
+    """
+    if driver in _cookie_checked_sessions:
+        return
+
+    start = time.perf_counter()
     try:
-        deny_cookie_button = WebDriverWait(driver=driver, timeout=3).until(
-            EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, "button.fc-cta-do-not-consent")
-            )
+        found = wait_for(
+            driver,
+            get_timeouts().cookie_banner,
+            EC.any_of(
+                EC.element_to_be_clickable(COOKIE_BUTTON_LOCATOR),
+                EC.presence_of_element_located(QUESTION_LOCATOR),
+            ),
         )
-        deny_cookie_button.click()
+        if found.tag_name.lower() == "button":
+            found.click()
+            print("🍪 Banner de cookies rechazado")
+        else:
+            # Comprobación inmediata por si el banner ya estaba en el DOM
+            buttons = driver.find_elements(*COOKIE_BUTTON_LOCATOR)
+            if buttons and buttons[0].is_displayed():
+                buttons[0].click()
+                print("🍪 Banner de cookies rechazado")
 
     except Exception as e:
         print(f"No se pudo hacer clic en el botón de cookies: {e}")
+    finally:
+        _cookie_checked_sessions.add(driver)
+        elapsed = time.perf_counter() - start
+        # El original también esperaba al botón con WebDriverWait: no hay ahorro
+        record_wait("wait_cookie_banner", elapsed, None)
 
 
 def refresh_exam(
     driver,
 ):
-    """Hace clic en 'Realizar nuevo examen' para refrescar la página."""
+    """
+    Hace clic en 'Realizar nuevo examen' y espera al nuevo conjunto de preguntas.
+
+    La navegación se da por terminada cuando cambia la URL o las preguntas
+    anteriores quedan obsoletas, y el nuevo conjunto de preguntas está presente.
+
+    Returns:
+        bool: True si el nuevo examen cargó a tiempo
+    """
     try:
         # Buscar el botón por su texto y clase
-        new_exam_button = driver.find_element(
-            By.XPATH,
-            "//a[contains(@href, '/examenes/') and .//div[@class='mio6' and contains(text(), 'Realizar nuevo examen')]]",
+        new_exam_button = driver.find_element(By.XPATH, NEW_EXAM_XPATH)
+        old_questions = driver.find_elements(*QUESTION_LOCATOR)
+        old_url = driver.current_url
+
+        # La carga del examen cuenta como petición al host (ritmo y timeouts)
+        with rate_limited(old_url, KIND_PAGE):
+            # Hacer clic en el botón
+            driver.execute_script("arguments[0].click();", new_exam_button)
+            print("🔄 Navegando a nuevo examen...")
+
+            # Esperar a que cargue la nueva página
+            start = time.perf_counter()
+            timeouts = get_timeouts()
+            left_page = [EC.url_changes(old_url)]
+            if old_questions:
+                left_page.append(EC.staleness_of(old_questions[0]))
+            wait_for(driver, timeouts.navigation, EC.any_of(*left_page))
+            wait_for(
+                driver,
+                timeouts.questions,
+                EC.presence_of_all_elements_located(QUESTION_LOCATOR),
+            )
+        record_wait(
+            "wait_navigation", time.perf_counter() - start, LEGACY_NAVIGATION_SLEEP_S
         )
-
-        # Hacer clic en el botón
-        driver.execute_script("arguments[0].click();", new_exam_button)
-        print("🔄 Navegando a nuevo examen...")
-
-        # Esperar a que cargue la nueva página
-        time.sleep(1)
-
-        # # Opcional: Verificar que se cargó correctamente
-        # driver.implicitly_wait(5)
+        return True
 
     except Exception as e:
         print(f"⚠️ Error al hacer clic en 'Realizar nuevo examen': {e}")
         print("⚠️ Continuando con la siguiente ronda...")
+        return False
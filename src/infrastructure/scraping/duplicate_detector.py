@@ -1,10 +1,10 @@
 """Servicio para detectar preguntas duplicadas"""
 
-import json
 import os
 from typing import Dict, List, Set
 
 from ...domain.quiz.quiz_question_model import QuizQuestionModel
+from ..serialization.json_stream import iter_json_array
 
 
 class DuplicateDetector:
@@ -14,23 +14,28 @@ class DuplicateDetector:
         """Inicializa el detector con la ruta al archivo de datos existente."""
         self.data_path = data_path
         self.existing_fingerprints: Set[str] = set()
+        self.existing_count = 0
         self._load_existing_fingerprints()
 
     def _load_existing_fingerprints(self):
-        """Carga los fingerprints de las preguntas existentes"""
+        """
+        Carga los fingerprints de las preguntas existentes.
+
+        El fichero se lee en streaming: en memoria solo quedan los fingerprints,
+        no el documento ni los registros.
+        """
         if os.path.exists(self.data_path):
             try:
-                with open(self.data_path, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-                    print(
-                        f"🔍 Cargando {len(existing_data)} preguntas existentes para detectar duplicados..."
-                    )
-                    for item in existing_data:
-                        try:
-                            question = QuizQuestionModel(**item)
-                            self.existing_fingerprints.add(question.fingerprint)
-                        except Exception as e:
-                            print(f"⚠️ Error procesando pregunta existente: {e}")
+                for item in iter_json_array(self.data_path):
+                    self.existing_count += 1
+                    try:
+                        question = QuizQuestionModel(**item)
+                        self.existing_fingerprints.add(question.fingerprint)
+                    except Exception as e:
+                        print(f"⚠️ Error procesando pregunta existente: {e}")
+                print(
+                    f"🔍 Cargadas {self.existing_count} preguntas existentes para detectar duplicados"
+                )
             except Exception as e:
                 print(f"⚠️ Error cargando fingerprints existentes: {e}")
         else:
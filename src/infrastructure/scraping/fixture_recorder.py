@@ -0,0 +1,129 @@
+"""
+Grabación de rondas de scraping como fixtures para reproducirlas sin conexión.
+
+Por cada ronda se guarda el HTML renderizado (ya con la respuesta correcta
+revelada) y los bytes de todas sus imágenes:
+
+    <fixtures_dir>/
+        manifest.json                      categoría -> ruta original y rondas
+        rounds/<categoria>/round_0001.html
+        images/<sha1 de la URL>.<ext>
+
+El HTML se normaliza para que funcione servido desde `FixtureReplayServer`:
+se eliminan los `<script>` (el DOM grabado ya es el estado final), las imágenes
+apuntan a `/fixtures-images/...` y los enlaces absolutos al sitio original se
+vuelven relativos, de modo que "Realizar nuevo examen" apunta al servidor local.
+"""
+
+import hashlib
+import json
+import os
+import re
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+IMAGES_ROUTE = "/fixtures-images/"
+MANIFEST_FILE = "manifest.json"
+
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+_IMG_SRC_RE = re.compile(r"(<img\b[^>]*?\bsrc=)([\"'])(.*?)\2", re.IGNORECASE)
+
+
+def round_file_name(round_number: int) -> str:
+    """Nombre del fichero HTML de una ronda."""
+    return f"round_{round_number:04d}.html"
+
+
+def load_manifest(fixtures_dir: str) -> Dict:
+    """Lee el manifest de un directorio de fixtures (vacío si no existe)."""
+    path = os.path.join(fixtures_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {"categories": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class RoundRecorder:
+    """Graba el HTML y las imágenes de cada ronda en un directorio de fixtures."""
+
+    def __init__(self, fixtures_dir: str, session: Optional[requests.Session] = None):
+        """Inicializa el grabador (no borra fixtures existentes)."""
+        self.fixtures_dir = fixtures_dir
+        self.session = session or requests.Session()
+        self.manifest = load_manifest(fixtures_dir)
+        os.makedirs(os.path.join(fixtures_dir, "images"), exist_ok=True)
+
+    def record_round(self, driver, category: str, round_number: int) -> str:
+        """
+        Graba la página actual del driver como ronda `round_number`.
+
+        Returns:
+            str: Ruta del HTML grabado
+        """
+        page_url = driver.current_url
+        html = self.normalize_html(driver.page_source, page_url)
+
+        category_dir = os.path.join(self.fixtures_dir, "rounds", category)
+        os.makedirs(category_dir, exist_ok=True)
+        file_name = round_file_name(round_number)
+        html_path = os.path.join(category_dir, file_name)
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+        entry = self.manifest["categories"].setdefault(
+            category, {"path": urlparse(page_url).path or "/", "rounds": []}
+        )
+        if file_name not in entry["rounds"]:
+            entry["rounds"].append(file_name)
+        self._write_manifest()
+
+        return html_path
+
+    def normalize_html(self, html: str, page_url: str) -> str:
+        """Elimina scripts, descarga imágenes y hace relativos los enlaces."""
+        html = _SCRIPT_RE.sub("", html)
+
+        def replace_image(match: re.Match) -> str:
+            image_url = urljoin(page_url, match.group(3))
+            local_name = self.save_image(image_url)
+            if local_name is None:
+                return match.group(0)
+            quote = match.group(2)
+            return f"{match.group(1)}{quote}{IMAGES_ROUTE}{local_name}{quote}"
+
+        html = _IMG_SRC_RE.sub(replace_image, html)
+
+        parsed = urlparse(page_url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        return html.replace(f'"{origin}/', '"/').replace(f"'{origin}/", "'/")
+
+    def save_image(self, image_url: str) -> Optional[str]:
+        """Descarga una imagen (una sola vez por URL) y devuelve su nombre local."""
+        if image_url.startswith("data:"):
+            return None
+
+        path = urlparse(image_url).path
+        extension = path.rsplit(".", 1)[-1] if "." in path.rsplit("/", 1)[-1] else "png"
+        local_name = f"{hashlib.sha1(image_url.encode()).hexdigest()}.{extension}"
+        local_path = os.path.join(self.fixtures_dir, "images", local_name)
+        if os.path.exists(local_path):
+            return local_name
+
+        try:
+            response = self.session.get(image_url, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"⚠️ No se pudo grabar la imagen {image_url}: {e}")
+            return None
+
+        with open(local_path, "wb") as f:
+            f.write(response.content)
+        return local_name
+
+    def _write_manifest(self) -> None:
+        """Guarda el manifest actualizado."""
+        path = os.path.join(self.fixtures_dir, MANIFEST_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,149 @@
+"""
+Servidor HTTP local que reproduce rondas grabadas por `RoundRecorder`.
+
+Cada GET a la ruta original de una categoría devuelve la siguiente ronda
+grabada (en bucle), así que `ScrapingUseCase` recorre las rondas igual que con el
+sitio real y termina cuando el planificador estima cubierto el banco grabado.
+
+Las rondas grabadas ya tienen la respuesta revelada, así que también sirven
+para el modo HTTP sin navegador (`target_configs(fetch_mode="http")`).
+
+Uso típico:
+    with FixtureReplayServer("fixtures/ure") as server:
+        ScrapingUseCase().execute(server.target_configs())
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from .fixture_recorder import IMAGES_ROUTE, load_manifest
+
+CONTENT_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "svg": "image/svg+xml",
+}
+
+
+class FixtureReplayServer:
+    """Servidor en segundo plano que sirve las rondas de un directorio de fixtures."""
+
+    def __init__(self, fixtures_dir: str, host: str = "127.0.0.1", port: int = 0):
+        """Prepara el servidor; `port=0` elige un puerto libre."""
+        self.fixtures_dir = fixtures_dir
+        self.manifest = load_manifest(fixtures_dir)
+        if not self.manifest["categories"]:
+            raise ValueError(f"No hay rondas grabadas en {fixtures_dir}")
+
+        self._routes: Dict[str, str] = {
+            entry["path"]: category
+            for category, entry in self.manifest["categories"].items()
+        }
+        self._next_round: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.requests_served = 0
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """URL base del servidor."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def target_configs(self, fetch_mode: Optional[str] = None) -> List[dict]:
+        """Configuraciones de `ScrapingUseCase` que apuntan al servidor local."""
+        configs = []
+        for category, entry in self.manifest["categories"].items():
+            config = {"url": f"{self.base_url}{entry['path']}", "category": category}
+            if fetch_mode:
+                config["fetch_mode"] = fetch_mode
+            configs.append(config)
+        return configs
+
+    def start(self) -> "FixtureReplayServer":
+        """Arranca el servidor en un hilo daemon."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fixture-replay", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        """Arranca el servidor al entrar en el contexto."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Detiene el servidor al salir del contexto."""
+        self.stop()
+
+    def next_round_path(self, category: str) -> str:
+        """Devuelve la ruta del HTML de la siguiente ronda de la categoría."""
+        rounds = self.manifest["categories"][category]["rounds"]
+        with self._lock:
+            position = self._next_round.get(category, 0)
+            self._next_round[category] = position + 1
+        return os.path.join(
+            self.fixtures_dir, "rounds", category, rounds[position % len(rounds)]
+        )
+
+    def _make_handler(self):
+        """Crea la clase handler con acceso a este servidor."""
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlparse(self.path).path
+                server.requests_served += 1
+
+                if path.startswith(IMAGES_ROUTE):
+                    name = os.path.basename(path)
+                    file_path = os.path.join(server.fixtures_dir, "images", name)
+                    extension = name.rsplit(".", 1)[-1].lower()
+                    self._send_file(
+                        file_path,
+                        CONTENT_TYPES.get(extension, "application/octet-stream"),
+                    )
+                    return
+
+                category = server._routes.get(path) or server._routes.get(
+                    path.rstrip("/") + "/"
+                )
+                if category is None:
+                    self.send_error(404)
+                    return
+                self._send_file(
+                    server.next_round_path(category), "text/html; charset=utf-8"
+                )
+
+            def _send_file(self, file_path: str, content_type: str):
+                if not os.path.exists(file_path):
+                    self.send_error(404)
+                    return
+                with open(file_path, "rb") as f:
+                    body = f.read()
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Silenciar el log por petición del servidor estándar
+                pass
+
+        return ReplayHandler
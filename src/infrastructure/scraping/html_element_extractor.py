@@ -0,0 +1,198 @@
+"""
+Extractor de preguntas sobre HTML estático con BeautifulSoup.
+
+Implementa el mismo contrato de datos en bruto que
+`WebElementExtractor.extract_raw_question_data`, pero sobre el HTML descargado
+por HTTP en lugar de un DOM vivo de Selenium. Como no se puede hacer clic para
+revelar la respuesta, solo funciona si el HTML ya trae las marcas
+`quiz-question-answer-correct`; si falta alguna se lanza
+`AnswersNotRevealedError` para que el caso de uso vuelva a Selenium.
+"""
+
+from typing import List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from ...domain.quiz.quiz_question_model import (
+    get_options_image_dir,
+    get_questions_image_dir,
+)
+from ...shared.metrics import timer
+from .image_downloader import download_or_defer, get_image_filename
+
+CORRECT_ANSWER_CLASS = "quiz-question-answer-correct"
+
+
+class AnswersNotRevealedError(Exception):
+    """El HTML no contiene las marcas de respuesta correcta."""
+
+
+def visible_text(element: Tag) -> str:
+    """
+    Texto de un elemento normalizado como `WebElement.text` de Selenium.
+
+    Los `<br>` se convierten en saltos de línea y los espacios de cada línea se
+    colapsan, para que los fingerprints coincidan con los del modo Selenium.
+    """
+    for br in element.find_all("br"):
+        br.replace_with("\n")
+    lines = (" ".join(line.split()) for line in element.get_text().split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+class HtmlElementExtractor:
+    """Extractor de preguntas del quiz a partir de HTML estático."""
+
+    @staticmethod
+    def parse(html: str) -> BeautifulSoup:
+        """Parsea el HTML de una página de examen."""
+        with timer("parse_html"):
+            return BeautifulSoup(html, "html.parser")
+
+    @staticmethod
+    def get_question_elements(soup: BeautifulSoup) -> List[Tag]:
+        """Obtiene todos los elementos de pregunta de la página."""
+        return soup.select(".quiz-question")
+
+    @staticmethod
+    def answers_revealed(question_elements: List[Tag]) -> bool:
+        """Indica si todas las preguntas traen marcada la respuesta correcta."""
+        return bool(question_elements) and all(
+            question.select_one(f".{CORRECT_ANSWER_CLASS}") is not None
+            for question in question_elements
+        )
+
+    @staticmethod
+    def extract_question_title(question_element: Tag) -> str:
+        """Extrae el título de una pregunta."""
+        title_element = question_element.select_one(".quiz-question-title")
+        return visible_text(title_element) if title_element else ""
+
+    @staticmethod
+    def is_image_question(question_element: Tag) -> bool:
+        """Determina si una pregunta tiene opciones de imagen."""
+        return "quiz-question-has-image-answer" in question_element.get("class", [])
+
+    @staticmethod
+    def extract_text_answers(question_element: Tag) -> List[str]:
+        """Extrae las respuestas de texto de una pregunta normal."""
+        return [
+            visible_text(label)
+            for label in question_element.select(".quiz-question-answer-ctrl-lbl")
+        ]
+
+    @staticmethod
+    def download_question_image(
+        question_element: Tag,
+        question_id,
+        page_url: str,
+        category: str,
+        image_jobs: Optional[List[dict]] = None,
+    ) -> Optional[str]:
+        """Descarga (o aplaza en `image_jobs`) la imagen de una pregunta si existe."""
+        image_element = question_element.select_one(".quiz-question-image img")
+        if image_element is None or not image_element.get("src"):
+            return None
+        image_url = urljoin(page_url, image_element["src"])
+        image_filename = get_image_filename(image_url, question_id)
+        questions_dir = get_questions_image_dir(category)
+        download_or_defer(image_url, image_filename, questions_dir, image_jobs)
+        return str(questions_dir / image_filename).replace("\\", "/")
+
+    @staticmethod
+    def extract_image_answers(
+        question_element: Tag,
+        question_id,
+        page_url: str,
+        category: str,
+        image_jobs: Optional[List[dict]] = None,
+    ):
+        """Extrae las respuestas de imagen de una pregunta con opciones de imagen."""
+        containers = question_element.select(".quiz-question-answer-holder")
+        answers = [f"Opción {j + 1}" for j in range(len(containers))]
+        answer_images = []
+        options_dir = get_options_image_dir(category)
+        for j, container in enumerate(containers):
+            image_element = container.select_one(".quiz-question-answer-image img")
+            if image_element is None or not image_element.get("src"):
+                answer_images.append(None)
+                continue
+            image_url = urljoin(page_url, image_element["src"])
+            option_filename = get_image_filename(image_url, question_id, "opcion", j)
+            download_or_defer(image_url, option_filename, options_dir, image_jobs)
+            answer_images.append(str(options_dir / option_filename).replace("\\", "/"))
+        return answers, answer_images
+
+    @staticmethod
+    def find_correct_answer_text(question_element: Tag, answers: List[str]):
+        """Encuentra la respuesta correcta en preguntas de texto."""
+        label = question_element.select_one(
+            f".{CORRECT_ANSWER_CLASS} .quiz-question-answer-ctrl-lbl"
+        )
+        if label is None:
+            return None, None
+        correct_answer = visible_text(label)
+        if correct_answer not in answers:
+            return correct_answer, None
+        return correct_answer, answers.index(correct_answer)
+
+    @staticmethod
+    def find_correct_answer_image(question_element: Tag, answers: List[str]):
+        """Encuentra la respuesta correcta en preguntas de imagen."""
+        containers = question_element.select(".quiz-question-answer-holder")
+        for idx, container in enumerate(containers):
+            answer_div = container.select_one(".quiz-question-answer")
+            if answer_div is not None and CORRECT_ANSWER_CLASS in answer_div.get(
+                "class", []
+            ):
+                return answers[idx], idx
+        return None, None
+
+    def extract_raw_question_data(
+        self,
+        question_element: Tag,
+        question_index: int,
+        page_url: str,
+        category: str = "default",
+        image_jobs: Optional[List[dict]] = None,
+    ) -> dict:
+        """Extrae datos en bruto de una pregunta (mismo contrato que Selenium)."""
+        if question_element.select_one(f".{CORRECT_ANSWER_CLASS}") is None:
+            raise AnswersNotRevealedError(
+                f"La pregunta {question_index + 1} no trae la respuesta correcta"
+            )
+
+        question_id = question_element.get("data-question-id")
+        question_title = self.extract_question_title(question_element)
+        is_img_question = self.is_image_question(question_element)
+
+        question_image = self.download_question_image(
+            question_element, question_id, page_url, category, image_jobs
+        )
+
+        if is_img_question:
+            answers, answer_images = self.extract_image_answers(
+                question_element, question_id, page_url, category, image_jobs
+            )
+            correct_answer, correct_index = self.find_correct_answer_image(
+                question_element, answers
+            )
+        else:
+            answers = self.extract_text_answers(question_element)
+            answer_images = None
+            correct_answer, correct_index = self.find_correct_answer_text(
+                question_element, answers
+            )
+
+        return {
+            "question_id": question_id,
+            "question_title": question_title,
+            "question_image": question_image,
+            "is_img_question": is_img_question,
+            "answers": answers,
+            "answer_images": answer_images,
+            "correct_answer": correct_answer,
+            "correct_index": correct_index,
+            "question_index": question_index,
+        }
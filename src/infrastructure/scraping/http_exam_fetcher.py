@@ -0,0 +1,124 @@
+"""
+Descarga de páginas de examen por HTTP, sin navegador.
+
+Cada ronda es un GET independiente a la URL del examen, así que se pueden
+lanzar muchas rondas a la vez: `fetch_rounds` reparte las descargas (y el
+procesado que se le pase, p. ej. parsear y descargar imágenes) entre hilos,
+cada uno con su propia `requests.Session` para reutilizar conexiones.
+
+Uso típico:
+    fetcher = HttpExamFetcher(concurrency=8)
+    for result in fetcher.fetch_rounds(url, 8, process_page):
+        ...
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+import requests
+
+from ...shared.metrics import get_metrics
+from .rate_controller import KIND_PAGE, rate_limited
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT_S = 15.0
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml",
+    "Cache-Control": "no-cache",
+}
+
+
+@dataclass
+class FetchedPage:
+    """Página de examen descargada."""
+
+    url: str
+    final_url: str
+    html: str
+    elapsed_s: float
+
+
+class HttpExamFetcher:
+    """Descarga páginas de examen por HTTP con concurrencia configurable."""
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT_S,
+        headers: Optional[dict] = None,
+    ):
+        """Inicializa el fetcher (las sesiones se crean por hilo bajo demanda)."""
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Sesión HTTP del hilo actual."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+
+    def fetch(self, url: str) -> FetchedPage:
+        """Descarga una página de examen (con turno del control de ritmo)."""
+        start = time.perf_counter()
+        with rate_limited(url, KIND_PAGE) as ticket:
+            response = self.session.get(url, timeout=self.timeout)
+            ticket.record_response(response)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - start
+        get_metrics().observe("http_fetch", elapsed)
+        get_metrics().increment("http_bytes", len(response.content))
+        return FetchedPage(
+            url=url, final_url=response.url, html=response.text, elapsed_s=elapsed
+        )
+
+    def fetch_rounds(
+        self, url: str, count: int, process: Callable[[FetchedPage], object]
+    ) -> Iterator[object]:
+        """
+        Descarga `count` rondas en paralelo y aplica `process` a cada página.
+
+        Los resultados se devuelven en orden de finalización. Las excepciones de
+        `process` (o de la descarga) se propagan al consumir el iterador.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="http-round"
+            )
+        futures = [
+            self._executor.submit(lambda: process(self.fetch(url)))
+            for _ in range(count)
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self) -> None:
+        """Libera los hilos de trabajo."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        """Permite usar el fetcher como context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cierra el fetcher al salir del contexto."""
+        self.close()
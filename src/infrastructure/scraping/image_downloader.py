@@ -1,22 +1,49 @@
-"""Módulo para manejar la descarga de imágenes del cuestionario."""
+"""
+Módulo para manejar la descarga de imágenes del cuestionario.
+
+Las descargas fallidas no se pierden: la pregunta conserva la ruta esperada de
+la imagen y la descarga queda pendiente (`drain_failed_downloads`) para que el
+caso de uso la reintente y la anote en el diario de checkpoints.
+
+Con rondas en pipeline la descarga puede aplazarse: si se pasa una lista
+`image_jobs`, solo se anota {"url", "path"} y la página queda libre para cargar
+el siguiente examen; `download_jobs` hace después las descargas.
+
+Cada descarga pide turno al control de ritmo del proceso (`rate_limited`), que
+comparte los límites del host con las rondas.
+"""
 
 import os
+import threading
+from pathlib import Path
+from typing import List, Optional
 from urllib.parse import urlparse
 
 import requests
 from selenium.webdriver.common.by import By
 
-from domain.quiz.quiz_question_model import (
+from ...domain.quiz.quiz_question_model import (
     get_options_image_dir,
     get_questions_image_dir,
 )
+from ...shared.metrics import increment, timed
+from .rate_controller import KIND_IMAGE, rate_limited
 
+IMAGE_TIMEOUT_S = 15.0
 
+# Descargas fallidas pendientes de reintento: {"url": ..., "path": ...}
+_failed_downloads: List[dict] = []
+_failed_lock = threading.Lock()
+
+
+@timed("image_download")
 def download_image(image_url, filename, target_dir):
     """Descarga una imagen desde una URL en el directorio especificado."""
     try:
-        response = requests.get(image_url)
-        response.raise_for_status()
+        with rate_limited(image_url, KIND_IMAGE) as ticket:
+            response = requests.get(image_url, timeout=IMAGE_TIMEOUT_S)
+            ticket.record_response(response)
+            response.raise_for_status()
 
         # Crear directorio si no existe
         os.makedirs(target_dir, exist_ok=True)
@@ -26,12 +53,76 @@ def download_image(image_url, filename, target_dir):
             file.write(response.content)
 
         # print(f"Imagen descargada: {filepath}")
+        increment("images_downloaded")
+        increment("image_bytes", len(response.content))
         return True
     except Exception as e:
         print(f"Error al descargar imagen {filename}: {e}")
+        increment("images_failed")
+        with _failed_lock:
+            _failed_downloads.append(
+                {"url": image_url, "path": str(Path(target_dir) / filename)}
+            )
         return False
 
 
+def download_or_defer(
+    image_url, filename, target_dir, image_jobs: Optional[List[dict]]
+) -> None:
+    """Descarga la imagen o, si se da `image_jobs`, la anota para más tarde."""
+    if image_jobs is None:
+        download_image(image_url, filename, target_dir)
+    else:
+        image_jobs.append({"url": image_url, "path": str(Path(target_dir) / filename)})
+
+
+def download_jobs(image_jobs: List[dict]) -> int:
+    """
+    Descarga las imágenes aplazadas durante la captura de una ronda.
+
+    Las que fallan quedan en `drain_failed_downloads` como cualquier otra.
+
+    Returns:
+        int: Número de imágenes descargadas
+    """
+    downloaded = 0
+    for job in image_jobs:
+        path = Path(job["path"])
+        downloaded += download_image(job["url"], path.name, path.parent)
+    return downloaded
+
+
+def drain_failed_downloads() -> List[dict]:
+    """Devuelve y vacía la lista de descargas fallidas desde la última llamada."""
+    with _failed_lock:
+        failed = list(_failed_downloads)
+        _failed_downloads.clear()
+    return failed
+
+
+def retry_downloads(pending: List[dict]) -> List[dict]:
+    """
+    Reintenta descargas pendientes.
+
+    Returns:
+        List[dict]: Descargas que siguen fallando
+    """
+    remaining = []
+    for download in pending:
+        path = Path(download["path"])
+        if path.exists():
+            continue
+        if not download_image(download["url"], path.name, path.parent):
+            remaining.append(download)
+    # Los fallos del reintento ya están en `remaining`
+    drain_failed_downloads()
+    if pending:
+        print(
+            f"🖼️ Reintentadas {len(pending)} descargas pendientes: {len(pending) - len(remaining)} recuperadas"
+        )
+    return remaining
+
+
 def get_image_filename(
     image_url, question_id, image_type="pregunta", option_index=None
 ):
@@ -47,8 +138,13 @@ def get_image_filename(
         return f"imagen_{question_id}.{file_extension}"
 
 
-def download_question_image(question, question_id, category: str = "default"):
-    """Descarga la imagen asociada a una pregunta si existe."""
+def download_question_image(
+    question,
+    question_id,
+    category: str = "default",
+    image_jobs: Optional[List[dict]] = None,
+):
+    """Descarga (o aplaza en `image_jobs`) la imagen de una pregunta si existe."""
     try:
         image_element = question.find_element(
             By.CSS_SELECTOR, ".quiz-question-image img"
@@ -58,9 +154,10 @@ def download_question_image(question, question_id, category: str = "default"):
         if image_url:
             image_filename = get_image_filename(image_url, question_id)
             questions_dir = get_questions_image_dir(category)
-            if download_image(image_url, image_filename, questions_dir):
-                # Devolver la ruta relativa completa como la espera el modelo
-                return str(questions_dir / image_filename).replace("\\", "/")
+            # Si la descarga falla queda pendiente de reintento con la misma ruta
+            download_or_defer(image_url, image_filename, questions_dir, image_jobs)
+            # Devolver la ruta relativa completa como la espera el modelo
+            return str(questions_dir / image_filename).replace("\\", "/")
     except Exception:
         # No hay imagen en esta pregunta
         pass
@@ -68,8 +165,13 @@ def download_question_image(question, question_id, category: str = "default"):
     return None
 
 
-def download_option_images(answer_containers, question_id, category: str = "default"):
-    """Descarga las imágenes de las opciones de respuesta."""
+def download_option_images(
+    answer_containers,
+    question_id,
+    category: str = "default",
+    image_jobs: Optional[List[dict]] = None,
+):
+    """Descarga (o aplaza en `image_jobs`) las imágenes de las opciones."""
     answer_images = []
 
     for j, container in enumerate(answer_containers):
@@ -82,13 +184,10 @@ def download_option_images(answer_containers, question_id, category: str = "defa
             option_filename = get_image_filename(img_url, question_id, "opcion", j)
             options_dir = get_options_image_dir(category)
 
-            if download_image(img_url, option_filename, options_dir):
-                # Devolver la ruta relativa completa para opciones
-                answer_images.append(
-                    str(options_dir / option_filename).replace("\\", "/")
-                )
-            else:
-                answer_images.append(None)
+            # Si la descarga falla queda pendiente de reintento con la misma ruta
+            download_or_defer(img_url, option_filename, options_dir, image_jobs)
+            # Devolver la ruta relativa completa para opciones
+            answer_images.append(str(options_dir / option_filename).replace("\\", "/"))
 
         except Exception:
             answer_images.append(None)
@@ -0,0 +1,137 @@
+"""
+Captura de las respuestas de red de Chrome mediante el DevTools Protocol.
+
+Con el log "performance" activado (`enable_network_logging` al crear el
+driver), chromedriver registra los eventos CDP `Network.*`. Cada ronda se leen
+los eventos pendientes, se eligen las respuestas que pueden traer preguntas
+(documentos HTML y XHR/fetch JSON) y se pide su cuerpo con
+`Network.getResponseBody`: los datos que el navegador ya recibió, sin recorrer
+el DOM ni hacer clic para revelar respuestas.
+"""
+
+import base64
+import json
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List
+
+from ...shared.metrics import increment, timed
+
+PERFORMANCE_LOG = "performance"
+
+# Tipos de recurso y contenido que pueden traer las preguntas del examen
+CAPTURED_RESOURCE_TYPES = {"Document", "XHR", "Fetch"}
+CAPTURED_MIME_TYPES = ("text/html", "application/json", "text/json", "+json")
+
+# Sesiones de Chrome en las que ya se activó el dominio Network
+_network_enabled_sessions = weakref.WeakSet()
+
+
+@dataclass
+class CapturedResponse:
+    """Respuesta de red capturada con su cuerpo."""
+
+    url: str
+    mime_type: str
+    resource_type: str
+    body: str
+
+    @property
+    def is_json(self) -> bool:
+        """Indica si el cuerpo es JSON."""
+        return "json" in self.mime_type
+
+    def json(self):
+        """Cuerpo decodificado como JSON."""
+        return json.loads(self.body)
+
+
+def enable_network_logging(chrome_options) -> None:
+    """Activa en las opciones de Chrome el log de eventos de red."""
+    chrome_options.set_capability("goog:loggingPrefs", {PERFORMANCE_LOG: "ALL"})
+
+
+def is_captured_response(response: dict, resource_type: str) -> bool:
+    """Indica si una respuesta de `Network.responseReceived` interesa."""
+    mime_type = response.get("mimeType", "")
+    return (
+        resource_type in CAPTURED_RESOURCE_TYPES
+        and response.get("status") == 200
+        and any(mime in mime_type for mime in CAPTURED_MIME_TYPES)
+    )
+
+
+def parse_network_events(log_entries: List[dict]) -> Dict[str, dict]:
+    """
+    Respuestas interesantes y completas de un lote del log "performance".
+
+    Returns:
+        Dict[str, dict]: requestId -> {"url", "mime_type", "resource_type"}, en
+            orden de llegada y solo las que terminaron de cargar
+    """
+    received: Dict[str, dict] = {}
+    finished = set()
+    for entry in log_entries:
+        message = json.loads(entry["message"])["message"]
+        params = message.get("params", {})
+        if message.get("method") == "Network.responseReceived":
+            response = params.get("response", {})
+            if is_captured_response(response, params.get("type", "")):
+                received[params["requestId"]] = {
+                    "url": response.get("url", ""),
+                    "mime_type": response.get("mimeType", ""),
+                    "resource_type": params.get("type", ""),
+                }
+        elif message.get("method") == "Network.loadingFinished":
+            finished.add(params.get("requestId"))
+    return {
+        request_id: info
+        for request_id, info in received.items()
+        if request_id in finished
+    }
+
+
+class NetworkCapture:
+    """Lee las respuestas de red recibidas por un driver desde la última lectura."""
+
+    def __init__(self, driver):
+        """Prepara la captura sobre un driver creado con `enable_network_logging`."""
+        self.driver = driver
+
+    def enable(self) -> None:
+        """Activa el dominio Network de CDP (una vez por sesión)."""
+        if self.driver in _network_enabled_sessions:
+            return
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        _network_enabled_sessions.add(self.driver)
+
+    @timed("network_capture")
+    def drain(self) -> List[CapturedResponse]:
+        """
+        Devuelve las respuestas interesantes recibidas desde la última llamada.
+
+        Las respuestas cuyo cuerpo ya no está disponible (Chrome lo descarta al
+        navegar) se omiten.
+        """
+        self.enable()
+        events = parse_network_events(self.driver.get_log(PERFORMANCE_LOG))
+        responses = []
+        for request_id, info in events.items():
+            body = self._response_body(request_id)
+            if body is not None:
+                responses.append(CapturedResponse(body=body, **info))
+        increment("network_responses", len(responses))
+        return responses
+
+    def _response_body(self, request_id: str):
+        """Cuerpo de una respuesta como texto (None si ya no está disponible)."""
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+        except Exception:
+            return None
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", errors="replace")
+        return body
@@ -0,0 +1,259 @@
+"""
+Extractor de preguntas a partir de respuestas de red capturadas.
+
+Implementa el mismo contrato de datos en bruto que
+`WebElementExtractor.extract_raw_question_data` sobre las respuestas que el
+navegador ya recibió (ver `network_capture`):
+
+    - JSON (XHR/fetch): se busca la primera lista de objetos con forma de
+      pregunta (enunciado + lista de respuestas) y se localiza la respuesta
+      correcta por índice o por marca en la respuesta. Los nombres de campo
+      admitidos están en las tuplas `*_KEYS`.
+    - HTML (documento o fragmento): se usa `HtmlElementExtractor` si todas las
+      preguntas traen ya la respuesta marcada.
+
+Si ninguna respuesta trae preguntas completas se devuelve None y el caso de
+uso sigue con la extracción del DOM. Las imágenes nunca se descargan aquí: se
+anotan en `image_jobs` y el llamador las descarga solo si acepta la ronda.
+"""
+
+from typing import Any, Iterator, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from ...domain.quiz.quiz_question_model import (
+    get_options_image_dir,
+    get_questions_image_dir,
+)
+from .html_element_extractor import HtmlElementExtractor, visible_text
+from .image_downloader import download_or_defer, get_image_filename
+from .network_capture import CapturedResponse
+
+ID_KEYS = ("id", "question_id", "questionId", "id_pregunta", "uuid")
+TITLE_KEYS = ("question", "pregunta", "title", "titulo", "enunciado", "text", "texto")
+ANSWERS_KEYS = ("answers", "respuestas", "options", "opciones", "choices")
+ANSWER_TEXT_KEYS = ("text", "texto", "answer", "respuesta", "label", "title")
+IMAGE_KEYS = ("image", "imagen", "img", "image_url", "imageUrl", "src")
+CORRECT_INDEX_KEYS = (
+    "correct_index",
+    "correctIndex",
+    "correct_option",
+    "correctOption",
+    "correcta",
+    "solucion",
+    "solution",
+)
+CORRECT_FLAG_KEYS = ("correct", "is_correct", "isCorrect", "correcta", "es_correcta")
+
+
+def _first(data: dict, keys) -> Any:
+    """Valor de la primera clave presente (None si no hay ninguna)."""
+    for key in keys:
+        if data.get(key) not in (None, ""):
+            return data[key]
+    return None
+
+
+def _clean_text(value: Any) -> str:
+    """Texto visible de un valor que puede traer HTML (como el DOM)."""
+    if isinstance(value, dict):
+        value = _first(value, ANSWER_TEXT_KEYS)
+    text = "" if value is None else str(value)
+    if "<" in text:
+        return visible_text(BeautifulSoup(text, "html.parser"))
+    return "\n".join(
+        " ".join(line.split()) for line in text.split("\n") if line.strip()
+    )
+
+
+def looks_like_question(item: Any) -> bool:
+    """Indica si un objeto JSON tiene forma de pregunta con respuestas."""
+    return (
+        isinstance(item, dict)
+        and _first(item, TITLE_KEYS) is not None
+        and isinstance(_first(item, ANSWERS_KEYS), list)
+    )
+
+
+def find_question_list(payload: Any) -> Optional[List[dict]]:
+    """Primera lista del JSON (en profundidad) cuyos elementos son preguntas."""
+    if isinstance(payload, list):
+        if payload and all(looks_like_question(item) for item in payload):
+            return payload
+        children: Iterator[Any] = iter(payload)
+    elif isinstance(payload, dict):
+        children = iter(payload.values())
+    else:
+        return None
+    for child in children:
+        found = find_question_list(child)
+        if found:
+            return found
+    return None
+
+
+def find_correct_index(item: dict, answers: List[Any]) -> Optional[int]:
+    """Índice de la respuesta correcta (por índice explícito o por marca)."""
+    for index, answer in enumerate(answers):
+        if isinstance(answer, dict) and _first(answer, CORRECT_FLAG_KEYS) is True:
+            return index
+
+    value = _first(item, CORRECT_INDEX_KEYS)
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, int):
+        return value if 0 <= value < len(answers) else None
+    # También puede venir el texto de la respuesta correcta
+    texts = [_clean_text(answer) for answer in answers]
+    text = _clean_text(value)
+    return texts.index(text) if text in texts else None
+
+
+class NetworkQuestionExtractor:
+    """Extractor de preguntas del quiz a partir de respuestas de red."""
+
+    def __init__(self):
+        """Inicializa el extractor con el de HTML para documentos y fragmentos."""
+        self.html_extractor = HtmlElementExtractor()
+
+    def extract_raw_questions(
+        self,
+        responses: List[CapturedResponse],
+        category: str,
+        image_jobs: List[dict],
+    ) -> Optional[List[dict]]:
+        """
+        Datos en bruto de la ronda a partir de la respuesta más reciente útil.
+
+        Solo las imágenes de la respuesta elegida se añaden a `image_jobs`.
+
+        Returns:
+            Optional[List[dict]]: Preguntas con la respuesta correcta, o None si
+                ninguna respuesta las trae completas
+        """
+        for response in reversed(responses):
+            # Las imágenes de una respuesta descartada no son de la ronda
+            jobs: List[dict] = []
+            if response.is_json:
+                raw_questions = self._from_json(response, category, jobs)
+            else:
+                raw_questions = self._from_html(response, category, jobs)
+            if raw_questions:
+                image_jobs.extend(jobs)
+                return raw_questions
+        return None
+
+    # =================================
+    # HTML
+    # =================================
+    def _from_html(
+        self,
+        response: CapturedResponse,
+        category: str,
+        image_jobs: List[dict],
+    ) -> Optional[List[dict]]:
+        """Preguntas de un documento HTML que ya trae las respuestas marcadas."""
+        soup = self.html_extractor.parse(response.body)
+        question_elements = self.html_extractor.get_question_elements(soup)
+        if not self.html_extractor.answers_revealed(question_elements):
+            return None
+        return [
+            self.html_extractor.extract_raw_question_data(
+                element, index, response.url, category, image_jobs
+            )
+            for index, element in enumerate(question_elements)
+        ]
+
+    # =================================
+    # JSON
+    # =================================
+    def _from_json(
+        self,
+        response: CapturedResponse,
+        category: str,
+        image_jobs: List[dict],
+    ) -> Optional[List[dict]]:
+        """Preguntas de una respuesta JSON (None si falta alguna correcta)."""
+        try:
+            items = find_question_list(response.json())
+        except ValueError:
+            return None
+        if not items:
+            return None
+        raw_questions = [
+            self._raw_from_item(item, index, response.url, category, image_jobs)
+            for index, item in enumerate(items)
+        ]
+        if any(raw["correct_index"] is None for raw in raw_questions):
+            return None
+        return raw_questions
+
+    def _raw_from_item(
+        self,
+        item: dict,
+        question_index: int,
+        page_url: str,
+        category: str,
+        image_jobs: List[dict],
+    ) -> dict:
+        """Datos en bruto de una pregunta JSON (mismo contrato que Selenium)."""
+        question_id = _first(item, ID_KEYS)
+        question_id = str(question_id) if question_id is not None else None
+        answers = _first(item, ANSWERS_KEYS)
+        texts = [_clean_text(answer) for answer in answers]
+        option_urls = [
+            _first(answer, IMAGE_KEYS) if isinstance(answer, dict) else None
+            for answer in answers
+        ]
+        is_img_question = any(option_urls) and not any(texts)
+
+        answer_images = None
+        if is_img_question:
+            texts = [f"Opción {j + 1}" for j in range(len(answers))]
+            answer_images = [
+                self._image_path(url, page_url, question_id, category, j, image_jobs)
+                for j, url in enumerate(option_urls)
+            ]
+
+        correct_index = find_correct_index(item, answers)
+        question_url = _first(item, IMAGE_KEYS)
+        return {
+            "question_id": question_id,
+            "question_title": _clean_text(_first(item, TITLE_KEYS)),
+            "question_image": self._image_path(
+                question_url, page_url, question_id, category, None, image_jobs
+            ),
+            "is_img_question": is_img_question,
+            "answers": texts,
+            "answer_images": answer_images,
+            "correct_answer": (
+                texts[correct_index] if correct_index is not None else None
+            ),
+            "correct_index": correct_index,
+            "question_index": question_index,
+        }
+
+    @staticmethod
+    def _image_path(
+        image_url: Optional[str],
+        page_url: str,
+        question_id,
+        category: str,
+        option_index: Optional[int],
+        image_jobs: List[dict],
+    ) -> Optional[str]:
+        """Anota la descarga de una imagen y devuelve su ruta como el DOM."""
+        if not isinstance(image_url, str):
+            return None
+        image_url = urljoin(page_url, image_url)
+        if option_index is None:
+            filename = get_image_filename(image_url, question_id)
+            target_dir = get_questions_image_dir(category)
+        else:
+            filename = get_image_filename(
+                image_url, question_id, "opcion", option_index
+            )
+            target_dir = get_options_image_dir(category)
+        download_or_defer(image_url, filename, target_dir, image_jobs)
+        return str(target_dir / filename).replace("\\", "/")
@@ -0,0 +1,424 @@
+"""
+Control adaptativo de ritmo y concurrencia por host (AIMD).
+
+Las rondas (HTTP o Selenium) y las descargas de imágenes piden turno al
+controlador antes de cada petición. Por host se mantiene:
+
+    - un token bucket con el ritmo máximo (peticiones/s) y una ráfaga pequeña
+    - un límite de peticiones simultáneas
+
+Ambos límites siguen la regla AIMD (additive-increase/multiplicative-decrease)
+de TCP: tras una "ventana" de peticiones correctas (tantas como el límite de
+concurrencia) suben en un paso fijo; ante una señal de saturación se
+multiplican por `decrease`. Como en el slow start de TCP, hasta la primera
+señal de saturación los límites se duplican por ventana en lugar de sumar un
+paso. Son señales de saturación:
+
+    - HTTP 429 (respetando `Retry-After`)
+    - HTTP 5xx cuando su proporción reciente (EWMA) supera
+      `server_error_threshold`; un 5xx aislado no reduce los límites
+    - timeouts de `requests` y de Selenium
+    - latencia media (EWMA) por encima de `latency_factor` veces la mejor
+      observada para ese tipo de petición (páginas e imágenes por separado)
+
+Varias peticiones de una misma ráfaga suelen fallar a la vez: solo se reduce
+una vez por intervalo de enfriamiento (la latencia media, como un RTT).
+
+Los límites actuales se publican como gauges (`rate_limit_rps_<host>`,
+`rate_concurrency_<host>`), la espera por turno como etapa `rate_wait` y cada
+back-off como contador (`rate_backoffs`, `rate_backoff_<motivo>`) y evento
+`rate_backoff` del registro de métricas actual.
+
+Existe un controlador "actual" por proceso, como el registro de métricas; sin
+controlador (`None`, por defecto) `rate_limited` no limita nada:
+
+    with rate_limited(url, "image") as ticket:
+        response = requests.get(url)
+        ticket.record_response(response)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from selenium.common.exceptions import TimeoutException
+
+from ...shared.metrics import get_metrics, record_event
+
+# Señales de una petición terminada
+SIGNAL_OK = "ok"
+SIGNAL_ERROR = "error"  # error ajeno a la carga del servidor (no cambia límites)
+SIGNAL_THROTTLED = "429"
+SIGNAL_SERVER_ERROR = "5xx"
+SIGNAL_TIMEOUT = "timeout"
+SIGNAL_SLOW = "latency"
+
+KIND_PAGE = "page"
+KIND_IMAGE = "image"
+
+MAX_RETRY_AFTER_S = 120.0
+
+
+@dataclass
+class RatePolicy:
+    """Parámetros del control AIMD (comunes a todos los hosts)."""
+
+    initial_rate: float = 2.0  # peticiones/s
+    min_rate: float = 0.2
+    max_rate: float = 50.0
+    rate_increase: float = 1.0  # peticiones/s por ventana correcta
+    burst: float = 2.0  # tokens acumulables
+    initial_concurrency: float = 2.0
+    min_concurrency: float = 1.0
+    max_concurrency: float = 16.0
+    concurrency_increase: float = 1.0  # peticiones simultáneas por ventana
+    decrease: float = 0.5
+    latency_factor: float = 2.0
+    latency_slack_s: float = 0.1  # margen absoluto sobre la mejor latencia
+    latency_alpha: float = 0.2  # peso de la última muestra en la EWMA
+    min_cooldown_s: float = 1.0
+    server_error_threshold: float = 0.05
+    server_error_alpha: float = 0.02
+
+
+def host_of(url: str) -> str:
+    """Host (con puerto) de una URL."""
+    return urlparse(url).netloc or url
+
+
+def retry_after_s(value: Optional[str]) -> Optional[float]:
+    """Segundos de una cabecera `Retry-After` (segundos o fecha HTTP)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_S)
+
+
+def signal_for_status(status: Optional[int]) -> str:
+    """Señal de un código de estado HTTP."""
+    if status == 429:
+        return SIGNAL_THROTTLED
+    if status is not None and 500 <= status < 600:
+        return SIGNAL_SERVER_ERROR
+    return SIGNAL_OK
+
+
+def signal_for_exception(error: BaseException) -> str:
+    """Señal de una excepción durante la petición."""
+    if isinstance(error, (requests.Timeout, TimeoutException, TimeoutError)):
+        return SIGNAL_TIMEOUT
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        signal = signal_for_status(error.response.status_code)
+        return SIGNAL_ERROR if signal == SIGNAL_OK else signal
+    return SIGNAL_ERROR
+
+
+@dataclass
+class RequestTicket:
+    """Turno concedido para una petición; anota su respuesta."""
+
+    status: Optional[int] = None
+    retry_after: Optional[float] = None
+
+    def record_response(self, response) -> None:
+        """Anota el estado y el `Retry-After` de una respuesta de `requests`."""
+        self.status = response.status_code
+        self.retry_after = retry_after_s(response.headers.get("Retry-After"))
+
+
+@dataclass
+class HostLimiter:
+    """Token bucket y límite de concurrencia AIMD de un host."""
+
+    host: str
+    policy: RatePolicy
+    rate: float = 0.0
+    concurrency: float = 0.0
+    tokens: float = 0.0
+    in_flight: int = 0
+    paused_until: float = 0.0
+    backoffs: int = 0
+    server_error_rate: float = 0.0  # EWMA de respuestas 5xx
+    latency: Dict[str, float] = field(default_factory=dict)  # EWMA por tipo
+    best_latency: Dict[str, float] = field(default_factory=dict)
+    slow_start: bool = True
+    _acked: int = field(default=0, init=False, repr=False)
+    _last_decrease: float = field(default=0.0, init=False, repr=False)
+    _refilled_at: float = field(default_factory=time.monotonic, repr=False)
+    _cond: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        """Toma el ritmo y la concurrencia iniciales de la política si no se dan."""
+        self.rate = self.rate or self.policy.initial_rate
+        self.concurrency = self.concurrency or self.policy.initial_concurrency
+        self.tokens = min(1.0, self.policy.burst)
+
+    # =================================
+    # TURNOS
+    # =================================
+    def acquire(self) -> float:
+        """
+        Espera turno (token y hueco de concurrencia).
+
+        Returns:
+            float: Segundos esperados
+        """
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                delay = self._delay(time.monotonic())
+                if delay == 0.0:
+                    self.tokens -= 1.0
+                    self.in_flight += 1
+                    return time.monotonic() - start
+                self._cond.wait(delay)
+
+    def _delay(self, now: float) -> float:
+        """Segundos hasta el próximo turno posible (0 = ya)."""
+        self.tokens = min(
+            self.policy.burst, self.tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= int(self.concurrency):
+            # Se despierta al liberar un hueco; el tope evita esperas perdidas
+            return 1.0
+        if self.tokens < 1.0:
+            return (1.0 - self.tokens) / self.rate
+        return 0.0
+
+    def release(
+        self,
+        signal: str,
+        latency_s: float,
+        kind: str = KIND_PAGE,
+        retry_after: Optional[float] = None,
+    ) -> Optional[str]:
+        """
+        Libera el turno y ajusta los límites según la señal.
+
+        Returns:
+            Optional[str]: Motivo del back-off aplicado (None si no hubo)
+        """
+        with self._cond:
+            self.in_flight -= 1
+            signal = self._classify(signal, kind, latency_s)
+            reason = None
+            if signal == SIGNAL_OK:
+                self._increase()
+            elif signal != SIGNAL_ERROR:
+                reason = self._decrease(signal, retry_after)
+            self._cond.notify_all()
+            return reason
+
+    # =================================
+    # AIMD
+    # =================================
+    def _classify(self, signal: str, kind: str, latency_s: float) -> str:
+        """Señal efectiva: 5xx aislados neutros y latencia alta como saturación."""
+        is_server_error = signal == SIGNAL_SERVER_ERROR
+        self.server_error_rate += self.policy.server_error_alpha * (
+            is_server_error - self.server_error_rate
+        )
+        if is_server_error:
+            if self.server_error_rate > self.policy.server_error_threshold:
+                return signal
+            return SIGNAL_ERROR
+        if signal == SIGNAL_OK and self._observe_latency(kind, latency_s):
+            return SIGNAL_SLOW
+        return signal
+
+    def _observe_latency(self, kind: str, latency_s: float) -> bool:
+        """Actualiza la EWMA del tipo e indica si la latencia es de congestión."""
+        alpha = self.policy.latency_alpha
+        previous = self.latency.get(kind)
+        average = (
+            latency_s if previous is None else previous + alpha * (latency_s - previous)
+        )
+        self.latency[kind] = average
+        best = min(self.best_latency.get(kind, latency_s), latency_s)
+        self.best_latency[kind] = best
+        threshold = max(
+            best * self.policy.latency_factor, best + self.policy.latency_slack_s
+        )
+        return average > threshold
+
+    def _increase(self) -> None:
+        """Sube los límites tras una ventana de peticiones correctas."""
+        self._acked += 1
+        if self._acked < int(self.concurrency):
+            return
+        self._acked = 0
+        policy = self.policy
+        if self.slow_start:
+            concurrency, rate = self.concurrency * 2, self.rate * 2
+        else:
+            concurrency = self.concurrency + policy.concurrency_increase
+            rate = self.rate + policy.rate_increase
+        self.concurrency = min(policy.max_concurrency, concurrency)
+        self.rate = min(policy.max_rate, rate)
+
+    def _decrease(self, signal: str, retry_after: Optional[float]) -> Optional[str]:
+        """Reduce los límites (una vez por enfriamiento) y aplica `Retry-After`."""
+        now = time.monotonic()
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+        cooldown = max(self.policy.min_cooldown_s, *self.latency.values(), 0.0)
+        if now - self._last_decrease < cooldown:
+            return None
+        policy = self.policy
+        self._last_decrease = now
+        self._acked = 0
+        self.slow_start = False
+        self.concurrency = max(
+            policy.min_concurrency, self.concurrency * policy.decrease
+        )
+        self.rate = max(policy.min_rate, self.rate * policy.decrease)
+        self.tokens = min(self.tokens, 0.0)
+        self.backoffs += 1
+        return signal
+
+    def snapshot(self) -> dict:
+        """Estado actual del host."""
+        with self._cond:
+            return {
+                "host": self.host,
+                "rate_rps": round(self.rate, 3),
+                "concurrency": int(self.concurrency),
+                "in_flight": self.in_flight,
+                "backoffs": self.backoffs,
+                "latency_s": {
+                    kind: round(value, 4) for kind, value in self.latency.items()
+                },
+            }
+
+
+class RateController:
+    """Limitadores AIMD por host compartidos por rondas y descargas."""
+
+    def __init__(self, policy: Optional[RatePolicy] = None):
+        """Inicializa el controlador con la política común a todos los hosts."""
+        self.policy = policy or RatePolicy()
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, url: str) -> HostLimiter:
+        """Limitador del host de la URL (se crea al primer uso)."""
+        host = host_of(url)
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = HostLimiter(host, self.policy)
+            return limiter
+
+    @contextmanager
+    def request(self, url: str, kind: str = KIND_PAGE) -> Iterator[RequestTicket]:
+        """Concede turno para una petición y ajusta los límites al terminar."""
+        limiter = self.limiter(url)
+        get_metrics().observe("rate_wait", limiter.acquire())
+        ticket = RequestTicket()
+        start = time.monotonic()
+        try:
+            yield ticket
+        except BaseException as e:
+            self._release(limiter, signal_for_exception(e), start, kind, ticket)
+            raise
+        self._release(limiter, signal_for_status(ticket.status), start, kind, ticket)
+
+    def _release(
+        self,
+        limiter: HostLimiter,
+        signal: str,
+        start: float,
+        kind: str,
+        ticket: RequestTicket,
+    ) -> None:
+        """Libera el turno y publica límites y back-offs en las métricas."""
+        reason = limiter.release(
+            signal, time.monotonic() - start, kind, ticket.retry_after
+        )
+        metrics = get_metrics()
+        if signal not in (SIGNAL_OK, SIGNAL_ERROR):
+            metrics.increment(f"rate_signal_{signal}")
+        if reason is not None:
+            state = limiter.snapshot()
+            metrics.increment("rate_backoffs")
+            metrics.increment(f"rate_backoff_{reason}")
+            record_event(
+                "rate_backoff",
+                host=limiter.host,
+                reason=reason,
+                kind=kind,
+                rate_rps=state["rate_rps"],
+                concurrency=state["concurrency"],
+                retry_after_s=ticket.retry_after,
+            )
+        metrics.set_gauge(f"rate_limit_rps_{limiter.host}", round(limiter.rate, 3))
+        metrics.set_gauge(f"rate_concurrency_{limiter.host}", int(limiter.concurrency))
+
+    def snapshot(self) -> list:
+        """Estado actual de todos los hosts."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.snapshot() for limiter in limiters]
+
+    def format_report(self) -> str:
+        """Resumen de los límites alcanzados por host."""
+        lines = []
+        for state in self.snapshot():
+            latency = ", ".join(
+                f"{kind} {value * 1000:.0f}ms"
+                for kind, value in state["latency_s"].items()
+            )
+            lines.append(
+                f"🚦 {state['host']}: {state['rate_rps']:.2f} pet/s, "
+                f"{state['concurrency']} simultáneas, {state['backoffs']} back-offs"
+                + (f" (latencia media {latency})" if latency else "")
+            )
+        return "\n".join(lines)
+
+
+# =================================
+# CONTROLADOR ACTUAL DEL PROCESO
+# =================================
+_current_controller: Optional[RateController] = None
+
+
+def get_rate_controller() -> Optional[RateController]:
+    """Devuelve el controlador actual (None = sin control de ritmo)."""
+    return _current_controller
+
+
+def set_rate_controller(
+    controller: Optional[RateController],
+) -> Optional[RateController]:
+    """Sustituye el controlador actual y devuelve el anterior."""
+    global _current_controller
+    previous = _current_controller
+    _current_controller = controller
+    return previous
+
+
+@contextmanager
+def rate_limited(url: str, kind: str = KIND_PAGE) -> Iterator[RequestTicket]:
+    """Turno del controlador actual para una petición (sin límite si no hay)."""
+    controller = _current_controller
+    if controller is None:
+        yield RequestTicket()
+        return
+    with controller.request(url, kind) as ticket:
+        yield ticket
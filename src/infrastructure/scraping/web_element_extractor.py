@@ -4,8 +4,15 @@ import time
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
+from ...shared.metrics import timed, timer
+from .driver_config import (
+    LEGACY_REVEAL_SLEEP_S,
+    QUESTION_LOCATOR,
+    get_timeouts,
+    record_wait,
+    wait_for,
+)
 from .image_downloader import download_option_images, download_question_image
 
 
@@ -36,13 +43,17 @@ class WebElementExtractor:
         return [label.text.strip() for label in answer_labels]
 
     @staticmethod
-    def extract_image_answers(question_element, question_id, category: str = "default"):
+    def extract_image_answers(
+        question_element, question_id, category: str = "default", image_jobs=None
+    ):
         """Extrae las respuestas de imagen de una pregunta con opciones de imagen."""
         answer_containers = question_element.find_elements(
             By.CLASS_NAME, "quiz-question-answer-holder"
         )
         answers = []
-        answer_images = download_option_images(answer_containers, question_id, category)
+        answer_images = download_option_images(
+            answer_containers, question_id, category, image_jobs
+        )
 
         for j in range(len(answer_containers)):
             answers.append(f"Opción {j + 1}")
@@ -85,6 +96,7 @@ class WebElementExtractor:
             return None, None
 
     @staticmethod
+    @timed("answer_reveal")
     def trigger_answer_reveal(question_element, driver):
         """Hace clic en la primera opción para revelar la respuesta correcta."""
         try:
@@ -92,58 +104,87 @@ class WebElementExtractor:
                 By.CLASS_NAME, "quiz-question-answer-ctrl"
             )
             driver.execute_script("arguments[0].click();", first_radio)
-            time.sleep(0.10)  # Esperar a que se procese la respuesta
+
+            # Esperar a que la página marque la respuesta correcta
+            start = time.perf_counter()
+            wait_for(
+                question_element,
+                get_timeouts().answer_reveal,
+                lambda element: element.find_elements(
+                    By.CLASS_NAME, "quiz-question-answer-correct"
+                ),
+            )
+            record_wait(
+                "wait_answer_reveal",
+                time.perf_counter() - start,
+                LEGACY_REVEAL_SLEEP_S,
+            )
         except Exception as e:
             print(f"Error al revelar respuesta: {e}")
 
     @staticmethod
+    @timed("get_question_elements")
     def get_question_elements(driver):
         """Obtiene todos los elementos de pregunta de la página."""
         try:
             # Esperar a que las preguntas se carguen
-            WebDriverWait(driver=driver, timeout=2).until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "quiz-question"))
+            return wait_for(
+                driver,
+                get_timeouts().questions,
+                EC.presence_of_all_elements_located(QUESTION_LOCATOR),
             )
-            return driver.find_elements(By.CLASS_NAME, "quiz-question")
         except Exception as e:
             print(f"❌ Error al obtener elementos de pregunta: {e}")
             return []
 
     def extract_raw_question_data(
-        self, question_element, question_index, driver, category: str = "default"
+        self,
+        question_element,
+        question_index,
+        driver,
+        category: str = "default",
+        image_jobs=None,
     ):
-        """Extrae datos en bruto de un elemento de pregunta (sin crear modelos de dominio)."""
+        """
+        Extrae datos en bruto de un elemento de pregunta (sin crear modelos de dominio).
+
+        Si se da la lista `image_jobs`, las imágenes no se descargan: se anotan
+        en ella para descargarlas cuando la página ya no haga falta.
+        """
         # Obtener información básica
-        question_id = question_element.get_attribute("data-question-id")
-        question_title = self.extract_question_title(question_element)
-        is_img_question = self.is_image_question(question_element)
+        with timer("read_question_dom"):
+            question_id = question_element.get_attribute("data-question-id")
+            question_title = self.extract_question_title(question_element)
+            is_img_question = self.is_image_question(question_element)
 
         # Descargar imagen de la pregunta si existe
         question_image = download_question_image(
-            question_element, question_id, category
+            question_element, question_id, category, image_jobs
         )
 
         # Extraer respuestas según el tipo de pregunta
         if is_img_question:
             answers, answer_images = self.extract_image_answers(
-                question_element, question_id, category
+                question_element, question_id, category, image_jobs
             )
         else:
-            answers = self.extract_text_answers(question_element)
+            with timer("read_question_dom"):
+                answers = self.extract_text_answers(question_element)
             answer_images = None
 
         # Revelar la respuesta correcta
         self.trigger_answer_reveal(question_element, driver)
 
         # Encontrar la respuesta correcta
-        if is_img_question:
-            correct_answer, correct_index = self.find_correct_answer_image(
-                question_element, answers
-            )
-        else:
-            correct_answer, correct_index = self.find_correct_answer_text(
-                question_element, answers
-            )
+        with timer("find_correct_answer"):
+            if is_img_question:
+                correct_answer, correct_index = self.find_correct_answer_image(
+                    question_element, answers
+                )
+            else:
+                correct_answer, correct_index = self.find_correct_answer_text(
+                    question_element, answers
+                )
 
         # Retornar datos en bruto (sin crear modelos de dominio aquí)
         return {
@@ -0,0 +1,247 @@
+"""
+Capa de serialización JSON intercambiable para los ficheros de preguntas.
+
+Backends disponibles (por orden de preferencia en modo automático):
+    - orjson: el más rápido, trabaja directamente con bytes UTF-8
+    - msgspec: alternativa rápida sin dependencias nativas extra
+    - json: librería estándar, siempre disponible como fallback
+
+La salida es compacta por defecto; la salida indentada solo se genera cuando se
+pide explícitamente (`pretty=True` o variable de entorno `JSON_PRETTY=1`).
+
+Variables de entorno:
+    - JSON_BACKEND: fuerza un backend ("orjson", "msgspec" o "json")
+    - JSON_PRETTY: genera JSON indentado si vale "1"
+
+Uso típico:
+    serializer = get_serializer()
+    records = serializer.load_file("data/questions_normativa.json")
+    append_questions_to_json_array("data/questions_normativa.json", questions)
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+QUESTION_LIST_ADAPTER = TypeAdapter(List[QuizQuestionModel])
+
+
+def pretty_by_default() -> bool:
+    """Indica si la salida indentada está activada por entorno."""
+    return os.getenv("JSON_PRETTY") == "1"
+
+
+class JsonSerializer:
+    """Backend basado en la librería estándar `json` (fallback)."""
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Codifica un objeto como JSON UTF-8."""
+        if pretty:
+            text = json.dumps(obj, ensure_ascii=False, indent=2)
+        else:
+            text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+        return text.encode("utf-8")
+
+    def load_file(self, path: str) -> Any:
+        """Lee y decodifica un fichero JSON."""
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+
+    def dump_file(self, path: str, obj: Any, pretty: Optional[bool] = None) -> None:
+        """Codifica y escribe un fichero JSON de forma atómica."""
+        if pretty is None:
+            pretty = pretty_by_default()
+        write_bytes_atomic(path, self.dumps(obj, pretty))
+
+    def __str__(self):
+        """Nombre del backend."""
+        return f"JsonSerializer(backend='{self.name}')"
+
+
+class OrjsonSerializer(JsonSerializer):
+    """Backend basado en `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Importa orjson (lanza ImportError si no está instalado)."""
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Codifica un objeto como JSON UTF-8."""
+        option = self._orjson.OPT_INDENT_2 if pretty else 0
+        return self._orjson.dumps(obj, option=option)
+
+
+class MsgspecSerializer(JsonSerializer):
+    """Backend basado en `msgspec.json`."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        """Importa msgspec (lanza ImportError si no está instalado)."""
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodifica un documento JSON."""
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """Codifica un objeto como JSON UTF-8."""
+        encoded = self._encoder.encode(obj)
+        if pretty:
+            return self._msgspec.json.format(encoded, indent=2)
+        return encoded
+
+
+BACKENDS = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "json": JsonSerializer,
+}
+
+
+@lru_cache(maxsize=None)
+def get_serializer(backend: Optional[str] = None) -> JsonSerializer:
+    """
+    Devuelve el serializador del backend pedido (o el más rápido disponible).
+
+    Args:
+        backend: "orjson", "msgspec", "json" o None para elegir automáticamente
+            (también configurable con JSON_BACKEND)
+
+    Returns:
+        JsonSerializer: Instancia compartida del backend
+    """
+    backend = backend or os.getenv("JSON_BACKEND")
+    if backend:
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend JSON desconocido: {backend}")
+        return BACKENDS[backend]()
+
+    for serializer_class in BACKENDS.values():
+        try:
+            return serializer_class()
+        except ImportError:
+            continue
+    return JsonSerializer()
+
+
+def available_backends() -> List[str]:
+    """Lista los backends que se pueden instanciar en este entorno."""
+    available = []
+    for name, serializer_class in BACKENDS.items():
+        try:
+            serializer_class()
+            available.append(name)
+        except ImportError:
+            continue
+    return available
+
+
+# =================================
+# CODIFICACIÓN DE PREGUNTAS
+# =================================
+def dump_questions(
+    questions: Sequence[QuizQuestionModel], pretty: Optional[bool] = None
+) -> bytes:
+    """Codifica una lista de preguntas como array JSON usando pydantic-core."""
+    if pretty is None:
+        pretty = pretty_by_default()
+    return QUESTION_LIST_ADAPTER.dump_json(
+        list(questions), indent=2 if pretty else None
+    )
+
+
+def write_bytes_atomic(path: str, data: bytes) -> None:
+    """Escribe un fichero completo mediante fichero temporal y `os.replace`."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def append_to_json_array(path: str, encoded_array: bytes) -> None:
+    """
+    Añade los elementos de un array JSON ya codificado al array de un fichero.
+
+    Solo se escribe la cola del fichero: se localiza el `]` final y se
+    sobrescribe con `,<elementos nuevos>]`, sin decodificar ni reescribir los
+    datos existentes.
+    """
+    new_items = encoded_array.strip()
+    if not new_items.startswith(b"[") or not new_items.endswith(b"]"):
+        raise ValueError("Se esperaba un array JSON codificado")
+    new_body = new_items[1:-1].strip()
+    if not new_body:
+        return
+
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        write_bytes_atomic(path, new_items)
+        return
+
+    with open(path, "r+b") as f:
+        end = _find_array_end(f)
+        if _is_empty_array(f, end):
+            # "[]": se reemplaza el array completo desde su apertura
+            f.seek(0)
+            f.write(new_items)
+        else:
+            f.seek(end)
+            f.write(b"," + new_body + b"]")
+        f.truncate()
+
+
+def _find_array_end(f) -> int:
+    """Devuelve la posición del `]` de cierre del array del fichero."""
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    chunk_size = 4096
+    while position > 0:
+        read_size = min(chunk_size, position)
+        position -= read_size
+        f.seek(position)
+        chunk = f.read(read_size)
+        stripped = chunk.rstrip()
+        if stripped:
+            if not stripped.endswith(b"]"):
+                raise ValueError("El fichero no termina en un array JSON")
+            return position + len(stripped) - 1
+    raise ValueError("Fichero JSON vacío")
+
+
+def _is_empty_array(f, end: int) -> bool:
+    """Indica si el array del fichero (cerrado en `end`) no tiene elementos."""
+    start = max(0, end - 4096)
+    f.seek(start)
+    head = f.read(end - start).rstrip()
+    return head.endswith(b"[")
+
+
+def append_questions_to_json_array(
+    path: str, questions: Sequence[QuizQuestionModel], pretty: Optional[bool] = None
+) -> None:
+    """Codifica preguntas en bloque y las añade al array JSON del fichero."""
+    append_to_json_array(path, dump_questions(questions, pretty))
@@ -0,0 +1,332 @@
+"""
+Lectura en streaming de ficheros JSON de preguntas con memoria constante.
+
+`iter_json_array` recorre el array de nivel superior de un fichero leyendo
+bloques de `chunk_size` bytes y decodificando cada elemento con el
+escáner de la librería estándar (`JSONDecoder.raw_decode`). En memoria solo
+está el bloque actual y el elemento que se está decodificando, así que el pico
+no depende del tamaño del fichero.
+
+`JsonArrayStream` anota además la posición en bytes del `]` de cierre y puede
+reanudar la lectura desde ahí: `append_to_json_array` solo reescribe el array
+a partir de ese `]`, así que en la siguiente lectura basta con decodificar los
+elementos añadidos.
+
+`iter_question_records` añade la conversión opcional del formato antiguo
+(`questions_legacy.json`) al esquema actual de `QuizQuestionModel.model_dump()`.
+Se reconocen estas variantes por registro:
+
+    - título como texto (`title`, `question`, `question_title` o `pregunta`)
+      e imagen en `titleImage`, `question_image` o `image`
+    - opciones en `options` o `answers`, como textos o como diccionarios con
+      `text`/`image`, e imágenes de opciones en `answer_images`
+    - respuesta correcta en `correct_option`, `correct_index`,
+      `correct_answer` o `correct`, como índice o como texto de la opción
+    - ID en `id` o `_id` (volcados de MongoDB); si falta se usa el
+      fingerprint, para que repetir una migración no genere IDs nuevos
+
+Uso típico:
+    for record in iter_question_records("data/questions_legacy.json", legacy=True):
+        question = QuizQuestionModel(**record)
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, List, Optional
+
+from src.domain.quiz.quiz_question_model import QuizQuestionModel
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_CATEGORY = "default"
+
+LEGACY_TITLE_KEYS = ("title", "question", "question_title", "pregunta")
+LEGACY_TITLE_IMAGE_KEYS = ("titleImage", "question_image", "image")
+LEGACY_OPTION_KEYS = ("options", "answers")
+LEGACY_CORRECT_KEYS = ("correct_option", "correct_index", "correct_answer", "correct")
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JsonStreamError(ValueError):
+    """Error de formato al leer un array JSON en streaming."""
+
+
+# =================================
+# PARSER INCREMENTAL
+# =================================
+class _ArrayReader:
+    """
+    Recorre los elementos del array de nivel superior de un fichero.
+
+    Lee bytes y los decodifica como UTF-8 de forma incremental. Con `resume` el
+    fichero está posicionado tras un elemento ya leído (en su `]` de cierre o
+    en la coma del siguiente). `end_offset` es la posición en bytes del `]` de
+    cierre, contando desde `base_offset`.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        path: str,
+        chunk_size: int,
+        resume: bool = False,
+        base_offset: int = 0,
+    ):
+        self._file = file
+        self._path = path
+        self._chunk_size = chunk_size
+        self._resume = resume
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+        self._read_bytes = base_offset
+        self.end_offset: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._resume:
+            if self._next_separator():
+                yield from self._elements()
+        else:
+            if self._peek() != "[":
+                raise JsonStreamError(f"{self._path} no contiene un array JSON")
+            self._position += 1
+            if self._peek() == "]":
+                self._close_array()
+            else:
+                yield from self._elements()
+        if self._peek():
+            raise JsonStreamError(f"Datos tras el array JSON en {self._path}")
+
+    def _elements(self) -> Iterator[Any]:
+        """Elementos separados por comas hasta el `]` de cierre."""
+        while True:
+            yield self._decode()
+            if not self._next_separator():
+                return
+
+    def _next_separator(self) -> bool:
+        """Consume ',' (True, sigue otro elemento) o el `]` de cierre (False)."""
+        separator = self._peek()
+        if separator == "]":
+            self._close_array()
+            return False
+        if separator != ",":
+            raise JsonStreamError(
+                f"Se esperaba ',' o ']' en {self._path}, encontrado {separator!r}"
+            )
+        self._position += 1
+        self._peek()
+        return True
+
+    def _close_array(self) -> None:
+        """Consume el `]` de cierre y anota su posición en bytes."""
+        # Bytes leídos menos los que quedan por consumir (en el buffer o a
+        # medias en el decodificador UTF-8)
+        pending, _ = self._utf8.getstate()
+        unread = self._buffer[self._position :].encode("utf-8")
+        self.end_offset = self._read_bytes - len(pending) - len(unread)
+        self._position += 1
+
+    def _fill(self) -> None:
+        """Descarta lo ya leído y añade el siguiente bloque al buffer."""
+        data = self._file.read(self._chunk_size)
+        self._read_bytes += len(data)
+        self._eof = not data
+        chunk = self._utf8.decode(data, final=self._eof)
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+
+    def _peek(self) -> str:
+        """Salta espacios y devuelve el siguiente carácter ('' al final)."""
+        while True:
+            buffer = self._buffer
+            position = self._position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self._position = position
+            if position < len(buffer):
+                return buffer[position]
+            if self._eof:
+                return ""
+            self._fill()
+
+    def _decode(self) -> Any:
+        """Decodifica el elemento que empieza en la posición actual."""
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # Un número cortado por el bloque ("12" de "12.5") también se
+                # decodifica: solo vale si le sigue un separador
+                if self._eof or (
+                    end < len(self._buffer) and self._buffer[end] in _DELIMITERS
+                ):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise JsonStreamError(f"JSON inválido en {self._path}: {e}") from e
+            self._fill()
+
+
+class JsonArrayStream:
+    """
+    Elementos del array JSON de un fichero, reanudables por posición en bytes.
+
+    Al terminar de recorrerlo, `end_offset` es la posición del `]` de cierre;
+    pasándola como `resume_offset` en una lectura posterior solo se decodifican
+    los elementos añadidos desde entonces con `append_to_json_array`.
+
+    Uso típico:
+        stream = JsonArrayStream(path)
+        records = list(stream)
+        ...
+        new_records = list(JsonArrayStream(path, resume_offset=stream.end_offset))
+    """
+
+    def __init__(
+        self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, resume_offset: int = 0
+    ):
+        """Prepara la lectura desde el principio o desde `resume_offset`."""
+        self.path = path
+        self.chunk_size = chunk_size
+        self.resume_offset = resume_offset
+        self.end_offset: Optional[int] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Recorre los elementos (desde `resume_offset`, los añadidos tras él).
+
+        Raises:
+            JsonStreamError: Si el fichero no es un array JSON válido o si en
+                `resume_offset` no hay un `]` ni una coma tras un elemento
+        """
+        with open(self.path, "rb") as f:
+            offset = self.resume_offset
+            f.seek(offset)
+            if not offset and f.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+                offset = len(codecs.BOM_UTF8)
+            f.seek(offset)
+            reader = _ArrayReader(
+                f,
+                self.path,
+                self.chunk_size,
+                resume=self.resume_offset > 0,
+                base_offset=offset,
+            )
+            yield from reader
+            self.end_offset = reader.end_offset
+
+
+def iter_json_array(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Recorre los elementos del array JSON de un fichero sin cargarlo entero.
+
+    Raises:
+        JsonStreamError: Si el fichero no es un array JSON válido
+    """
+    yield from JsonArrayStream(path, chunk_size)
+
+
+def count_json_array(path: str) -> int:
+    """Número de elementos del array JSON de un fichero (memoria constante)."""
+    return sum(1 for _ in iter_json_array(path))
+
+
+# =================================
+# FORMATO ANTIGUO
+# =================================
+def _first(record: dict, keys) -> Any:
+    """Primer valor no nulo de las claves dadas."""
+    for key in keys:
+        value = record.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _legacy_options(record: dict) -> List[dict]:
+    """Opciones en el esquema actual a partir de textos o diccionarios."""
+    images = record.get("answer_images") or []
+    options = []
+    for index, option in enumerate(_first(record, LEGACY_OPTION_KEYS) or []):
+        image = images[index] if index < len(images) else None
+        if isinstance(option, dict):
+            text = _first(option, ("optionText", "text"))
+            image = _first(option, ("optionImage", "image")) or image
+        else:
+            text = option
+        options.append({"optionText": text, "optionImage": image})
+    return options
+
+
+def _legacy_correct_option(record: dict, options: List[dict]) -> int:
+    """Índice de la respuesta correcta (dado como índice o como texto)."""
+    correct = _first(record, LEGACY_CORRECT_KEYS)
+    if isinstance(correct, str) and not correct.strip().isdigit():
+        texts = [(option["optionText"] or "").strip() for option in options]
+        return texts.index(correct.strip()) if correct.strip() in texts else 0
+    return int(correct or 0)
+
+
+def upgrade_legacy_record(record: dict, category: str = DEFAULT_CATEGORY) -> dict:
+    """
+    Convierte un registro antiguo al esquema de `QuizQuestionModel.model_dump()`.
+
+    Los registros que ya tienen el esquema actual se devuelven sin cambios.
+    """
+    title = record.get("title")
+    options = record.get("options")
+    if (
+        isinstance(title, dict)
+        and isinstance(options, list)
+        and all(isinstance(option, dict) for option in options)
+        and "correct_option" in record
+        and record.get("category")
+        and record.get("id")
+    ):
+        return record
+
+    if isinstance(title, dict):
+        title_text = title.get("titleText") or ""
+        title_image = title.get("titleImage")
+    else:
+        title_text = _first(record, LEGACY_TITLE_KEYS) or ""
+        title_image = _first(record, LEGACY_TITLE_IMAGE_KEYS)
+
+    upgraded_options = _legacy_options(record)
+    upgraded = {
+        "id": str(_first(record, ("id", "_id")) or ""),
+        "title": {"titleText": title_text, "titleImage": title_image},
+        "options": upgraded_options,
+        "correct_option": _legacy_correct_option(record, upgraded_options),
+        "category": record.get("category") or category,
+    }
+    if not upgraded["id"]:
+        upgraded["id"] = QuizQuestionModel(**upgraded).fingerprint
+    return upgraded
+
+
+def iter_question_records(
+    path: str,
+    legacy: bool = False,
+    category: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """
+    Recorre los registros de un fichero de preguntas con memoria constante.
+
+    Args:
+        path: Fichero con un array JSON de preguntas
+        legacy: Convierte los registros del formato antiguo al actual
+        category: Categoría de los registros antiguos que no la tienen
+        chunk_size: Bytes leídos por bloque
+    """
+    records = iter_json_array(path, chunk_size)
+    if not legacy:
+        yield from records
+        return
+    for record in records:
+        yield upgrade_legacy_record(record, category or DEFAULT_CATEGORY)
@@ -0,0 +1,403 @@
+"""
+Instrumentación ligera: temporizadores por etapa, contadores y rondas.
+
+Un `MetricsRegistry` acumula:
+    - observaciones de duración por etapa (con histograma de buckets fijos)
+    - contadores y gauges
+    - un desglose por ronda de scraping (tiempo por etapa y contadores)
+    - eventos puntuales con marca de tiempo (p. ej. back-offs del control de
+      ritmo), limitados a `MAX_EVENTS`
+
+Con rondas en pipeline, la ronda abierta se puede desacoplar del hilo que la
+inició (`detach_round`) y continuar en otro (`round_scope`) hasta cerrarla con
+`end_round(round_data)`.
+
+Existe un registro "actual" por proceso, como en `logging`, para que funciones
+sueltas (descarga de imágenes, saver...) puedan medirse sin cambiar su firma:
+
+    with timer("json_write"):
+        ...
+
+    @timed("image_download")
+    def download_image(...):
+        ...
+
+El resultado se exporta como JSON estructurado (`to_dict`/`write`) o en el
+formato de texto de Prometheus (`to_prometheus`).
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Límites superiores (segundos) de los buckets de los histogramas
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    math.inf,
+)
+
+# Eventos guardados por registro (los siguientes solo se cuentan)
+MAX_EVENTS = 1000
+
+
+@dataclass
+class StageStats:
+    """Estadísticas acumuladas de una etapa."""
+
+    buckets: tuple = DEFAULT_BUCKETS
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = 0.0
+    bucket_counts: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        """Inicializa a cero los contadores de cada bucket."""
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe(self, seconds: float) -> None:
+        """Registra una duración."""
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        for i, upper in enumerate(self.buckets):
+            if seconds <= upper:
+                self.bucket_counts[i] += 1
+                break
+
+    def to_dict(self) -> dict:
+        """Representación serializable de las estadísticas."""
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+            "min_s": round(self.min, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+            "histogram": {
+                ("+Inf" if math.isinf(upper) else str(upper)): count
+                for upper, count in zip(self.buckets, self.bucket_counts)
+            },
+        }
+
+
+class MetricsRegistry:
+    """Registro de métricas de una ejecución."""
+
+    def __init__(self, name: str = "scraping"):
+        """Inicializa un registro vacío; `name` se usa como prefijo en Prometheus."""
+        self.name = name
+        self.started_at = time.time()
+        self.stages: Dict[str, StageStats] = {}
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.rounds: List[dict] = []
+        self.events: List[dict] = []
+        self.events_dropped = 0
+        self._current_round: Optional[dict] = None
+        self._bound_rounds = threading.local()
+        self._lock = threading.RLock()
+
+    # =================================
+    # REGISTRO
+    # =================================
+    def observe(self, stage: str, seconds: float) -> None:
+        """Registra la duración de una etapa."""
+        with self._lock:
+            self.stages.setdefault(stage, StageStats()).observe(seconds)
+            current = self._round_for_thread()
+            if current is not None:
+                round_stages = current["stages"]
+                stats = round_stages.setdefault(stage, {"count": 0, "total_s": 0.0})
+                stats["count"] += 1
+                stats["total_s"] += seconds
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Context manager que mide el bloque como la etapa `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str) -> Callable:
+        """Decorador que mide cada llamada como la etapa `stage`."""
+
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def increment(self, counter: str, value: float = 1) -> None:
+        """Incrementa un contador."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+            current = self._round_for_thread()
+            if current is not None:
+                round_counters = current["counters"]
+                round_counters[counter] = round_counters.get(counter, 0) + value
+
+    def set_gauge(self, gauge: str, value: float) -> None:
+        """Fija el valor actual de un gauge."""
+        with self._lock:
+            self.gauges[gauge] = value
+
+    def record_event(self, event: str, **data) -> None:
+        """Registra un evento con su instante relativo al inicio del registro."""
+        with self._lock:
+            if len(self.events) >= MAX_EVENTS:
+                self.events_dropped += 1
+                return
+            self.events.append(
+                {
+                    "event": event,
+                    "at_s": round(time.time() - self.started_at, 3),
+                    **data,
+                }
+            )
+
+    # =================================
+    # RONDAS
+    # =================================
+    def start_round(self, category: str, round_number: int) -> None:
+        """Abre una ronda: las observaciones siguientes se acumulan en ella."""
+        with self._lock:
+            if self._current_round is not None:
+                self.end_round()
+            self._current_round = {
+                "category": category,
+                "round": round_number,
+                "started_at": time.time(),
+                "stages": {},
+                "counters": {},
+                "_start": time.perf_counter(),
+            }
+
+    def end_round(self, round_data: Optional[dict] = None) -> Optional[dict]:
+        """Cierra la ronda actual (o la ronda desacoplada dada) y la devuelve."""
+        with self._lock:
+            current = round_data if round_data is not None else self._current_round
+            if current is None or "_start" not in current:
+                return None
+            current["duration_s"] = round(
+                time.perf_counter() - current.pop("_start"), 6
+            )
+            for stats in current["stages"].values():
+                stats["total_s"] = round(stats["total_s"], 6)
+            if current is self._current_round:
+                self._current_round = None
+            self.rounds.append(current)
+            # Solo en las estadísticas globales: con rondas en pipeline, el hilo
+            # que cierra una ronda desacoplada puede tener otra ronda abierta
+            self.stages.setdefault("round", StageStats()).observe(current["duration_s"])
+            return current
+
+    def detach_round(self) -> Optional[dict]:
+        """
+        Desacopla la ronda actual sin cerrarla y la devuelve.
+
+        Las observaciones siguientes ya no se acumulan en ella salvo dentro de
+        `round_scope`; se cierra con `end_round(round_data)`.
+        """
+        with self._lock:
+            current = self._current_round
+            self._current_round = None
+            return current
+
+    @contextmanager
+    def round_scope(self, round_data: Optional[dict]) -> Iterator[None]:
+        """Acumula en `round_data` las observaciones de este hilo dentro del bloque."""
+        previous = getattr(self._bound_rounds, "round", None)
+        self._bound_rounds.round = round_data
+        try:
+            yield
+        finally:
+            self._bound_rounds.round = previous
+
+    def _round_for_thread(self) -> Optional[dict]:
+        """Ronda del hilo actual: la de `round_scope` o, si no hay, la abierta."""
+        bound = getattr(self._bound_rounds, "round", None)
+        return bound if bound is not None else self._current_round
+
+    def format_round(self, round_data: dict) -> str:
+        """Línea compacta con el desglose de una ronda."""
+        stages = sorted(
+            round_data["stages"].items(), key=lambda item: -item[1]["total_s"]
+        )
+        parts = [f"{stage}={stats['total_s']:.2f}s" for stage, stats in stages]
+        return f"⏱️ Ronda {round_data['round']} ({round_data['duration_s']:.2f}s): " + (
+            ", ".join(parts) or "sin etapas"
+        )
+
+    # =================================
+    # EXPORTACIÓN
+    # =================================
+    def to_dict(self) -> dict:
+        """Desglose final completo como diccionario serializable."""
+        with self._lock:
+            wall = time.time() - self.started_at
+            stages = {stage: stats.to_dict() for stage, stats in self.stages.items()}
+            for stage_data in stages.values():
+                stage_data["share_of_wall"] = (
+                    round(stage_data["total_s"] / wall, 4) if wall else 0.0
+                )
+            return {
+                "name": self.name,
+                "started_at": self.started_at,
+                "wall_s": round(wall, 6),
+                "stages": stages,
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "rounds": list(self.rounds),
+                "events": list(self.events),
+                "events_dropped": self.events_dropped,
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Desglose final como JSON."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Exporta las métricas en el formato de texto de Prometheus."""
+        prefix = _prometheus_name(self.name)
+        lines = []
+        with self._lock:
+            metric = f"{prefix}_stage_seconds"
+            lines.append(f"# HELP {metric} Duración de las etapas en segundos.")
+            lines.append(f"# TYPE {metric} histogram")
+            for stage, stats in sorted(self.stages.items()):
+                cumulative = 0
+                for upper, count in zip(stats.buckets, stats.bucket_counts):
+                    cumulative += count
+                    le = "+Inf" if math.isinf(upper) else repr(upper)
+                    lines.append(
+                        f'{metric}_bucket{{stage="{stage}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {stats.total}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {stats.count}')
+
+            for counter, value in sorted(self.counters.items()):
+                name = f"{prefix}_{_prometheus_name(counter)}_total"
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {value}")
+
+            for gauge, value in sorted(self.gauges.items()):
+                name = f"{prefix}_{_prometheus_name(gauge)}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: str, prometheus: bool = False) -> str:
+        """
+        Escribe el desglose JSON (y opcionalmente el .prom) en `directory`.
+
+        Returns:
+            str: Ruta del fichero JSON escrito
+        """
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        json_path = os.path.join(directory, f"{self.name}_{stamp}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+        if prometheus:
+            with open(
+                os.path.join(directory, f"{self.name}_{stamp}.prom"),
+                "w",
+                encoding="utf-8",
+            ) as f:
+                f.write(self.to_prometheus())
+        return json_path
+
+    def format_summary(self) -> str:
+        """Tabla de texto con el desglose por etapa ordenado por tiempo total."""
+        data = self.to_dict()
+        lines = [f"{'etapa':<28}{'n':>7}{'total':>10}{'media':>10}{'máx':>10}{'%':>7}"]
+        for stage, stats in sorted(
+            data["stages"].items(), key=lambda item: -item[1]["total_s"]
+        ):
+            lines.append(
+                f"{stage:<28}{stats['count']:>7}{stats['total_s']:>9.2f}s"
+                f"{stats['mean_s']:>9.3f}s{stats['max_s']:>9.2f}s"
+                f"{stats['share_of_wall'] * 100:>6.1f}%"
+            )
+        return "\n".join(lines)
+
+
+def _prometheus_name(name: str) -> str:
+    """Normaliza un nombre a los caracteres válidos en Prometheus."""
+    return "".join(char if char.isalnum() else "_" for char in name).lower()
+
+
+# =================================
+# REGISTRO ACTUAL DEL PROCESO
+# =================================
+_current_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Devuelve el registro de métricas actual."""
+    return _current_registry
+
+
+def set_metrics(registry: MetricsRegistry) -> MetricsRegistry:
+    """Sustituye el registro actual y devuelve el anterior."""
+    global _current_registry
+    previous = _current_registry
+    _current_registry = registry
+    return previous
+
+
+@contextmanager
+def timer(stage: str) -> Iterator[None]:
+    """Mide el bloque en el registro actual."""
+    with get_metrics().timer(stage):
+        yield
+
+
+def timed(stage: str) -> Callable:
+    """Decorador que mide cada llamada en el registro actual (resuelto al llamar)."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().timer(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def increment(counter: str, value: float = 1) -> None:
+    """Incrementa un contador del registro actual."""
+    get_metrics().increment(counter, value)
+
+
+def record_event(event: str, **data) -> None:
+    """Registra un evento en el registro actual."""
+    get_metrics().record_event(event, **data)
@@ -0,0 +1,445 @@
+"""
+Modo de perfilado de la CLI (`python main.py <comando> ... --profile`, con
+`--profile-mode sampling|cprofile`).
+
+Durante la ejecución del subcomando se activan:
+
+    - un muestreador de pilas de todos los hilos (`sys._current_frames` cada
+      `interval` segundos), que da el flame graph en formato colapsado
+      (`stacks.collapsed`, para flamegraph.pl o speedscope) y en el formato
+      propio de speedscope (`profile.speedscope.json`)
+    - con el modo `cprofile`, además, cProfile en el hilo principal, con
+      recuentos exactos de llamadas (`cpu.pstats`, para snakeviz o pstats)
+    - tracemalloc, para las líneas que más memoria retienen al terminar
+
+Todo se escribe en un directorio por ejecución junto con `cpu_top.txt` y
+`alloc_top.txt` (las N primeras entradas de cada informe).
+
+Además, el caso de uso de scraping llama a `snapshot_round` al cerrar cada
+ronda: con un perfilador activo se anota la memoria trazada y el número de
+objetos vivos por tipo, y al final `memory_rounds.txt` muestra lo que creció
+entre la primera y la última ronda (p. ej. WebElements que se acumulan). Sin
+perfilador activo `snapshot_round` no hace nada. Cada instantánea fuerza un
+`gc.collect()`, así que los tiempos por ronda no son comparables con los de
+una ejecución sin perfilar.
+
+Las muestras miden tiempo de pared: un hilo bloqueado en una espera también
+suma muestras, que es justo lo que interesa en un scraping dominado por E/S.
+El muestreo apenas añade coste (~6%); tracemalloc multiplica el tiempo de las
+partes con muchas asignaciones (~3x) y cProfile aún más.
+"""
+
+import cProfile
+import gc
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ("sampling", "cprofile")
+DEFAULT_PROFILE_DIR = os.path.join("data", "profiles")
+DEFAULT_INTERVAL_S = 0.005
+DEFAULT_TOP = 25
+# Los informes agrupan por línea: con un solo marco tracemalloc cuesta ~3x en
+# lugar de ~9x con 10 (exportación CSV de 50k preguntas)
+TRACEMALLOC_FRAMES = 1
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+# Marco de pila: (función, fichero, línea de la definición)
+Frame = Tuple[str, str, int]
+
+
+# =================================
+# MUESTREO DE PILAS
+# =================================
+class StackSampler:
+    """Cuenta las pilas de todos los hilos en un hilo propio."""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL_S):
+        """Prepara el muestreador (no arranca hasta `start`)."""
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._frames: Dict[object, Frame] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Arranca el hilo de muestreo."""
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreo y espera al hilo."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Bucle de muestreo."""
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    thread = names.get(ident, f"thread-{ident}")
+                    self.stacks[(thread, self._stack(frame))] += 1
+            self.samples += 1
+
+    def _stack(self, frame) -> Tuple[Frame, ...]:
+        """Pila desde la raíz hasta `frame` (marcos cacheados por código)."""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            entry = self._frames.get(code)
+            if entry is None:
+                entry = (code.co_qualname, code.co_filename, code.co_firstlineno)
+                self._frames[code] = entry
+            stack.append(entry)
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+
+def frame_label(frame: Frame) -> str:
+    """Nombre legible de un marco: `función (fichero:línea)`."""
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapsed_stacks(stacks: Counter) -> str:
+    """Pilas en formato colapsado: `hilo;raíz;...;hoja muestras` por línea."""
+    lines = []
+    for (thread, stack), count in stacks.most_common():
+        labels = [thread, *(frame_label(frame) for frame in stack)]
+        lines.append(f"{';'.join(label.replace(';', ',') for label in labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def speedscope_profile(stacks: Counter, interval: float, name: str) -> dict:
+    """Documento speedscope con un perfil muestreado por hilo."""
+    frames: Dict[Frame, int] = {}
+    profiles: Dict[str, dict] = {}
+    for (thread, stack), count in stacks.items():
+        profile = profiles.setdefault(
+            thread,
+            {
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            },
+        )
+        profile["samples"].append(
+            [frames.setdefault(frame, len(frames)) for frame in stack]
+        )
+        profile["weights"].append(count * interval)
+        profile["endValue"] += count * interval
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "main.py --profile",
+        "shared": {
+            "frames": [
+                {"name": function, "file": filename, "line": line}
+                for function, filename, line in frames
+            ]
+        },
+        "profiles": list(profiles.values()),
+    }
+
+
+def sampled_cpu_table(stacks: Counter, top: int) -> str:
+    """Funciones con más muestras propias (hoja) y totales (en la pila)."""
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for (_, stack), count in stacks.items():
+        if not stack:
+            continue
+        own[stack[-1]] += count
+        for frame in set(stack):
+            total[frame] += count
+    samples = sum(stacks.values()) or 1
+    lines = [f"{'propio':>8} {'total':>8}  función", "-" * 60]
+    for frame, count in own.most_common(top):
+        lines.append(
+            f"{count / samples:>8.1%} {total[frame] / samples:>8.1%}  {frame_label(frame)}"
+        )
+    return "\n".join(lines)
+
+
+# =================================
+# MEMORIA POR RONDA
+# =================================
+def count_objects_by_type() -> Counter:
+    """Objetos vivos seguidos por el recolector, por nombre de tipo."""
+    return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def retained_by_line(snapshot: tracemalloc.Snapshot) -> Dict[str, Tuple[int, int]]:
+    """
+    Bytes y bloques retenidos por línea de una instantánea.
+
+    Se guarda esto y no la instantánea: sus trazas son miles de tuplas que
+    aparecerían como crecimiento en el recuento de objetos de las rondas.
+    """
+    return {
+        str(stat.traceback[0]): (stat.size, stat.count)
+        for stat in snapshot.statistics("lineno")
+    }
+
+
+def format_size(size: int) -> str:
+    """Bytes en KB o MB con signo."""
+    if abs(size) >= 1024 * 1024:
+        return f"{size / (1024 * 1024):+.1f} MB"
+    return f"{size / 1024:+.1f} KB"
+
+
+class RoundMemoryTracker:
+    """Instantáneas de memoria al cerrar cada ronda."""
+
+    def __init__(self, filters: List[tracemalloc.Filter], top: int = DEFAULT_TOP):
+        """Prepara el registro; las instantáneas requieren tracemalloc activo."""
+        self.filters = filters
+        self.top = top
+        self.rounds: List[dict] = []
+        # (retenido por línea, objetos por tipo) de la primera y la última ronda
+        self._first: Optional[Tuple[Dict[str, Tuple[int, int]], Counter]] = None
+        self._last: Optional[Tuple[Dict[str, Tuple[int, int]], Counter]] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self, label: str) -> None:
+        """Anota la memoria trazada y los objetos vivos al cerrar una ronda."""
+        if not tracemalloc.is_tracing():
+            return
+        with self._lock:
+            gc.collect()
+            types = count_objects_by_type()
+            lines = retained_by_line(
+                tracemalloc.take_snapshot().filter_traces(self.filters)
+            )
+            current, peak = tracemalloc.get_traced_memory()
+            self.rounds.append(
+                {
+                    "label": label,
+                    "traced_mb": round(current / (1024 * 1024), 2),
+                    "peak_mb": round(peak / (1024 * 1024), 2),
+                    "objects": sum(types.values()),
+                }
+            )
+            if self._first is None:
+                self._first = (lines, types)
+            self._last = (lines, types)
+
+    def report(self) -> str:
+        """Evolución por ronda y lo que más creció entre la primera y la última."""
+        lines = [f"{'ronda':<30} {'trazada':>10} {'pico':>10} {'objetos':>10}"]
+        for entry in self.rounds:
+            lines.append(
+                f"{entry['label']:<30} {entry['traced_mb']:>8.2f}MB "
+                f"{entry['peak_mb']:>8.2f}MB {entry['objects']:>10}"
+            )
+        if len(self.rounds) < 2:
+            return "\n".join(lines)
+
+        (first, first_types), (last, last_types) = self._first, self._last
+        lines += ["", "Líneas cuya memoria retenida más creció (primera → última):"]
+        growth_by_line = {
+            line: (
+                size - first.get(line, (0, 0))[0],
+                count - first.get(line, (0, 0))[1],
+            )
+            for line, (size, count) in last.items()
+        }
+        top_lines = sorted(growth_by_line.items(), key=lambda item: -item[1][0])
+        for line, (size_diff, count_diff) in top_lines[: self.top]:
+            if size_diff <= 0:
+                break
+            lines.append(f"{format_size(size_diff):>12} {count_diff:>+8}  {line}")
+        lines += ["", "Tipos con más objetos nuevos (primera → última):"]
+        growth = last_types.copy()
+        growth.subtract(first_types)
+        for name, diff in growth.most_common(self.top):
+            if diff <= 0:
+                break
+            lines.append(f"{diff:>+12}  {name}")
+        return "\n".join(lines)
+
+
+# =================================
+# PERFILADOR
+# =================================
+class Profiler:
+    """Perfilado de CPU y memoria de una ejecución de la CLI."""
+
+    def __init__(
+        self,
+        mode: str = "sampling",
+        top: int = DEFAULT_TOP,
+        interval: float = DEFAULT_INTERVAL_S,
+    ):
+        """Prepara el perfilador en el modo dado ('sampling' o 'cprofile')."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfilado desconocido: {mode}")
+        self.mode = mode
+        self.top = top
+        self.sampler = StackSampler(interval)
+        self.cprofile = cProfile.Profile() if mode == "cprofile" else None
+        self.memory = RoundMemoryTracker(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ],
+            top,
+        )
+        self.elapsed_s = 0.0
+        self._start = 0.0
+        self._final_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._peak = 0
+
+    def start(self) -> None:
+        """Empieza a trazar memoria, muestrear pilas y (si aplica) cProfile."""
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.sampler.start()
+        self._start = time.perf_counter()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+
+    def stop(self) -> None:
+        """Detiene todos los perfiladores y guarda la instantánea final."""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        self.elapsed_s = time.perf_counter() - self._start
+        self.sampler.stop()
+        self._final_snapshot = tracemalloc.take_snapshot().filter_traces(
+            self.memory.filters
+        )
+        self._peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    def allocation_table(self) -> str:
+        """Líneas que retienen más memoria al terminar la ejecución."""
+        stats = self._final_snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+        lines = [
+            f"Memoria trazada al terminar: {total / (1024 * 1024):.1f} MB "
+            f"(pico {self._peak / (1024 * 1024):.1f} MB)",
+            "",
+            f"{'tamaño':>12} {'bloques':>8}  línea",
+            "-" * 60,
+        ]
+        for stat in stats[: self.top]:
+            lines.append(
+                f"{stat.size / 1024:>10.1f}KB {stat.count:>8}  {stat.traceback[0]}"
+            )
+        return "\n".join(lines)
+
+    def cpu_table(self) -> str:
+        """Tabla de CPU: muestreo y, en modo cprofile, también pstats."""
+        sections = [
+            f"Muestreo de pilas: {self.sampler.samples} muestras cada "
+            f"{self.sampler.interval * 1000:.0f} ms en {self.elapsed_s:.1f} s "
+            "(tiempo de pared de todos los hilos)",
+            "",
+            sampled_cpu_table(self.sampler.stacks, self.top),
+        ]
+        if self.cprofile is not None:
+            stream = io.StringIO()
+            stats = pstats.Stats(self.cprofile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            stats.sort_stats("tottime").print_stats(self.top)
+            sections += ["", "cProfile (hilo principal):", stream.getvalue()]
+        return "\n".join(sections)
+
+    def write(self, run_dir: str, name: str) -> List[str]:
+        """Escribe todos los informes en `run_dir` y devuelve sus rutas."""
+        os.makedirs(run_dir, exist_ok=True)
+        outputs = {
+            "stacks.collapsed": collapsed_stacks(self.sampler.stacks),
+            "profile.speedscope.json": json.dumps(
+                speedscope_profile(self.sampler.stacks, self.sampler.interval, name)
+            ),
+            "cpu_top.txt": self.cpu_table() + "\n",
+            "alloc_top.txt": self.allocation_table() + "\n",
+        }
+        if self.memory.rounds:
+            outputs["memory_rounds.txt"] = self.memory.report() + "\n"
+            outputs["memory_rounds.json"] = json.dumps(self.memory.rounds, indent=2)
+        paths = []
+        for filename, content in outputs.items():
+            path = os.path.join(run_dir, filename)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            paths.append(path)
+        if self.cprofile is not None:
+            path = os.path.join(run_dir, "cpu.pstats")
+            self.cprofile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+# =================================
+# PERFILADOR ACTUAL DEL PROCESO
+# =================================
+_current_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Devuelve el perfilador activo (None si no se está perfilando)."""
+    return _current_profiler
+
+
+def set_profiler(profiler: Optional[Profiler]) -> Optional[Profiler]:
+    """Sustituye el perfilador activo y devuelve el anterior."""
+    global _current_profiler
+    previous = _current_profiler
+    _current_profiler = profiler
+    return previous
+
+
+def snapshot_round(label: str) -> None:
+    """Instantánea de memoria de una ronda si hay un perfilador activo."""
+    profiler = _current_profiler
+    if profiler is not None:
+        profiler.memory.snapshot(label)
+
+
+def profile_run(
+    func: Callable[[], int],
+    command: str,
+    mode: str = "sampling",
+    root: str = DEFAULT_PROFILE_DIR,
+    top: int = DEFAULT_TOP,
+) -> int:
+    """
+    Ejecuta `func` perfilada y escribe los informes en `root/<comando>-<fecha>`.
+
+    Los informes se escriben también si la ejecución falla o se interrumpe.
+    """
+    run_dir = os.path.join(root, f"{command}-{datetime.now():%Y%m%d-%H%M%S}")
+    profiler = Profiler(mode, top)
+    previous = set_profiler(profiler)
+    profiler.start()
+    try:
+        return func()
+    finally:
+        profiler.stop()
+        set_profiler(previous)
+        profiler.write(run_dir, f"main.py {command}")
+        print(
+            f"🔬 Perfil ({mode}, {profiler.elapsed_s:.1f} s, "
+            f"{profiler.sampler.samples} muestras) guardado en: {run_dir}"
+        )